@@ -1,7 +1,7 @@
 #=================================================================================================
 # Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 #          Hokkaido University (2018)
-#          Last Update: Q3 2023
+#          Last Update: Q4 2026
 # ________________________________________________________________________________________________
 # Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
 #          Jun Fujima (Former Lead Developer) [2018-2021]
@@ -11,8 +11,13 @@
 # ------------------------------------------------------------------------------------------------
 # Notes:  This is one of the REST API parts of the 'analysis' interface of the website that
 #         allows serverside work for the 'custom' component.
+#         The genes are kept as integer arrays (one letter index per position) and their edit
+#         distances to the root gene are computed for all the catalysts at once, the genes having
+#         the same length. The distances and the clustering of a table are cached, so that changing
+#         the root catalyst does not recompute them.
 # ------------------------------------------------------------------------------------------------
-# References: logging libs
+# References: logging, numpy, pandas, scipy, sklearn, hashlib and collections libs and
+#             common.cache
 #=================================================================================================
 
 #-------------------------------------------------------------------------------------------------
@@ -24,8 +29,9 @@ import numpy as np
 import pandas as pd
 import json
 import string
-from nltk import edit_distance
 import itertools
+import hashlib
+from collections import Counter
 
 from scipy.cluster.hierarchy import dendrogram, linkage
 from sklearn.preprocessing import StandardScaler
@@ -33,47 +39,143 @@ from sklearn.preprocessing import Normalizer
 from sklearn.preprocessing import MaxAbsScaler
 from sklearn.preprocessing import MinMaxScaler
 
+from common.cache import LRUCache
+
 logger = logging.getLogger(__name__)
 
 #-------------------------------------------------------------------------------------------------
 
+GENE_LETTERS = np.array(list(string.ascii_uppercase))
+GENE_LEVELS = 15
+
+# Root distances and clustering (linkage) of the recent tables, shared by the requests of this process
+gene_cache = LRUCache(64 * 2**20, name='catalyst genes')
 
 #-------------------------------------------------------------------------------------------------
-def combination_wrapping(combination_list):
-    all_combination = []
-
-
-    for i in range(len(combination_list)):
-                    
-        for j in range(len(combination_list[0])):
-                        
-            if combination_list[i][j][0] == "":
-                None
-                # all_combination.append(combination_list[i][j][1])
-                            
-            elif combination_list[i][j][1] == "":
-                None
-                            
-                # all_combination.append(combination_list[i][j][0])
-                            
-            else:
 
-                all_combination.append(combination_list[i][j][0]+'/'+ combination_list[i][j][1])
 
-    u, c = np.unique(np.array(all_combination), return_counts = True)
+#-------------------------------------------------------------------------------------------------
+def get_digest(array):
+    return hashlib.sha1(np.ascontiguousarray(array).tobytes()).hexdigest() + str(array.shape)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_linkage(array_data, method):
+    """Linkage matrix of the (scaled) data, cached for the same table and method."""
+    key = ('linkage', get_digest(array_data), method)
+    linkage_matrix = gene_cache.get(key)
+    if linkage_matrix is None:
+        linkage_matrix = linkage(array_data, method = method)
+        gene_cache.set(key, linkage_matrix)
+    return linkage_matrix
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def encode_genes(areas, max_value):
+    """Integer genes (one row per catalyst) of the areas, the index of the letter of each area
+    level (GENE_LEVELS levels from 0 to max_value)."""
+    digitized = np.digitize(areas, bins = np.linspace(0, max_value, GENE_LEVELS))
+    # an area below 0 (level 0) is the last letter, as the string lookup of the gene letters gave
+    return ((digitized - 1) % len(GENE_LETTERS)).astype(np.uint8)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def gene_strings(genes):
+    """Letter strings of the integer genes."""
+    letters = np.ascontiguousarray(GENE_LETTERS[genes])
+    return letters.view('<U' + str(genes.shape[1]))[:, 0]
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def gene_distances(genes, root_gene):
+    """Edit (Levenshtein) distances of all the genes to the root gene, in one dynamic programming
+    pass over the root letters (the genes have the same length)."""
+    length = genes.shape[1]
+    letters = np.ascontiguousarray(genes.T)
+    steps = np.arange(length + 1)[:, None]
+
+    previous = np.repeat(steps, genes.shape[0], axis = 1).astype(np.int32)
+    current = np.empty_like(previous)
+    for i in range(1, length + 1):
+        current[0] = i
+        # deletion or substitution, then the insertions as a running minimum along the gene
+        np.minimum(previous[1:] + 1, previous[:-1] + (letters != root_gene[i - 1]), out = current[1:])
+        current = np.minimum.accumulate(current - steps, axis = 0) + steps
+        previous, current = current, previous
+
+    return previous[length]
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_root_distances(genes, root_index):
+    """Distances of all the genes to the gene of the root row, cached per table and root gene."""
+    key = ('distances', get_digest(genes), genes[root_index].tobytes())
+    distances = gene_cache.get(key)
+    if distances is None:
+        distances = gene_distances(genes, genes[root_index])
+        gene_cache.set(key, distances)
+    return distances
+#-------------------------------------------------------------------------------------------------
+
 
-    df_count = pd.DataFrame({"combination":u, "Counts": c})
+#-------------------------------------------------------------------------------------------------
+def count_combinations(counts):
+    """Table of the counts of the component combinations, the most frequent first."""
+    combinations = sorted(counts)
 
-    df_count = df_count[df_count["combination"] != ""]
+    df_count = pd.DataFrame({"combination": np.array(combinations), "Counts": [counts[a] for a in combinations]})
 
     df_count.sort_values(by = ["Counts"], ascending = False, inplace = True)
 
     df_count.reset_index(drop = True, inplace = True)
 
+    return df_count
+#-------------------------------------------------------------------------------------------------
 
 
-    return df_count
+#-------------------------------------------------------------------------------------------------
+def get_pattern_counts(df_compo, distances, materials = None):
+    """Counts of the component combinations (pairs of the components of a catalyst) of the
+    catalysts within each distance of the root, the rows being sorted by distance.
+
+    Arguments:
+        df_compo {DataFrame} -- The component columns ("0" or 0 for no component).
+        distances {array} -- The (sorted) distances of the rows.
+        materials {list} -- The component of each column for one-hot data, else the component is
+                            the value.
+
+    Returns:
+        dict -- the combination counts (DataFrame) of each distance
+    """
+    values = df_compo.values.astype(object)
+    empty = (values == "0") | (values == 0)
+
+    row_combinations = []
+    for raw in range(values.shape[0]):
+        atoms = [str(a) for a, e in zip(values[raw] if materials is None else materials, empty[raw]) if not e]
+        atoms = [a for a in atoms if a != ""]
+        row_combinations.append([a + '/' + b for a, b in itertools.combinations(atoms, 2)])
+
+    dict_pattern_df = {}
+    counts = Counter()
+    raw = 0
+    for distance in range(np.max(distances) + 1):
+        # the rows within a distance are the first ones
+        while raw < len(distances) and distances[raw] <= distance:
+            counts.update(row_combinations[raw])
+            raw += 1
+        dict_pattern_df[distance] = count_combinations(counts)
+
+    return dict_pattern_df
+#-------------------------------------------------------------------------------------------------
 
+
+#-------------------------------------------------------------------------------------------------
 def get_catalyst_gene(data):
 
 # ##########  data loading ###############################################################
@@ -142,7 +244,7 @@ def get_catalyst_gene(data):
 #########   clustering   #########################################################################################################################
         array_data = scaled_df.values
 
-        linkage_matrix = linkage(array_data, method = clustering_method)
+        linkage_matrix = get_linkage(array_data, clustering_method)
 
         dendrogram_result = dendrogram(linkage_matrix, labels = df_original["Catalyst"].values.tolist(), no_plot=True)
 
@@ -165,51 +267,23 @@ def get_catalyst_gene(data):
     ##########   calculate under line area  ##################################################################################################################
         scaled_df_columns = scaled_df.columns.values.tolist()
         max_in_df = np.max(scaled_df.values)
-        dict_height = {}
-
-
-        for i, column in enumerate(scaled_df_columns):
-            
-            dict_height[column] = scaled_df.loc[:, column].values.astype(float)
+        array_height = scaled_df.values.astype(float)
 
         area_columns = [f"area{a}" for a in range(1, len(scaled_df_columns))]
 
         gene_columns = [f"gene{a}" for a in range(1, len(scaled_df_columns))]
 
-        list_df_areas = []
+        array_area = (array_height[:, :-1] + array_height[:, 1:]) / 2
 
-        list_df_genes = []
+        array_gene = encode_genes(array_area, max_in_df)
 
-        gene_criteion = np.linspace(0, max_in_df, 15)
-
-        genes = string.ascii_uppercase
-
-        for i, column in enumerate(scaled_df_columns[:-1]):
-            
-            array_left, array_right = dict_height[scaled_df_columns[i]], dict_height[scaled_df_columns[i+1]]
-            
-            area = (array_left + array_right) / 2
-            
-            digitized = np.digitize(area, bins = gene_criteion)
-            
-            array_gene = np.zeros_like(array_left).astype(object)
-            
-            for raw in range(array_left.shape[0]):
-                
-                array_gene[raw] = genes[digitized[raw]-1]
-                
-            list_df_areas.append(pd.DataFrame(area, columns = [area_columns[i]]))
-            
-            list_df_genes.append(pd.DataFrame(array_gene, columns = [gene_columns[i]]))
-               
-        df_area = pd.concat(list_df_areas, axis = 1)
-        df_gene_area = pd.concat([df_original] + list_df_areas + list_df_genes, axis = 1)
+        df_area = pd.DataFrame(array_area, columns = area_columns)
+        df_gene_letters = pd.DataFrame(GENE_LETTERS[array_gene].astype(object), columns = gene_columns)
+        df_gene_area = pd.concat([df_original, df_area, df_gene_letters], axis = 1)
 
         result['areaData'] = df_area
 
-        array_for_gene = df_gene_area.loc[:, gene_columns].values
-
-        df_gene = pd.DataFrame(np.sum(array_for_gene, axis = 1), columns = ["catalyst_gene"])
+        df_gene = pd.DataFrame(gene_strings(array_gene).astype(object), columns = ["catalyst_gene"])
 
         df_gene_introduced = pd.concat([df_gene_area, df_gene], axis = 1)
 
@@ -221,23 +295,15 @@ def get_catalyst_gene(data):
 
         df_for_heatmap = df_gene_introduced.copy()
 
-        catalysts = []
         df_for_heatmap = df_for_heatmap.iloc[dendrogram_result['leaves'], :]
         df_for_heatmap.reset_index(drop= True, inplace = True)
         heat_map_columns = [a for a in df_for_heatmap.columns if "area" in a]
         array_heatmap = df_for_heatmap.loc[:, heat_map_columns].values
 
-        yData = []
-        xData = []
-        heatVal = []
-        for i in range(len(df_for_heatmap.index)):
-
-            catalysts.append(df_for_heatmap["Catalyst"].values.tolist()[i])
-
-            for j in range(len(heat_map_columns)):
-                xData.append(j)
-                yData.append(i)
-                heatVal.append(array_heatmap[i, j])  
+        catalysts = df_for_heatmap["Catalyst"].values.tolist()
+        xData = np.tile(np.arange(len(heat_map_columns)), len(catalysts)).tolist()
+        yData = np.repeat(np.arange(len(catalysts)), len(heat_map_columns)).tolist()
+        heatVal = array_heatmap.ravel().tolist()
 
         result['heatmapData'] = {}
         result['heatmapData']['xData'] = xData
@@ -249,25 +315,18 @@ def get_catalyst_gene(data):
 #############################################################################################################################################################
 ##########  edit_distance and sort data by distance from the root_catalyst_gene  ############################################################################
 
-        root_index = df_gene_introduced[df_gene_introduced["Catalyst"] == root_catalyst].index[0]
-
-        df_root_raw = df_gene_introduced[df_gene_introduced["Catalyst"] == root_catalyst].copy()
+        catalyst_names = df_gene_introduced["Catalyst"]
 
-        df_root_raw["distance"] = np.array(0)
+        root_index = np.flatnonzero(catalyst_names == root_catalyst)[0]
 
-        root_gene = df_gene_introduced[df_gene_introduced["Catalyst"] == root_catalyst]["catalyst_gene"].values
+        df_root_raw = df_gene_introduced[catalyst_names == root_catalyst].copy()
 
-        array_distance = np.zeros_like(df_gene_introduced.iloc[:, 0])
+        df_root_raw["distance"] = np.array(0)
 
-        array_distance[root_index] = 0
+        # a catalyst (name) is given the gene of its first row
+        _, first_rows, inverse = np.unique(pd.factorize(catalyst_names)[0], return_index = True, return_inverse = True)
 
-        for index in df_gene_introduced.index.tolist():
-            
-            compare_catalyst = df_gene_introduced.loc[index,"Catalyst"]
-            
-            compare_gene = df_gene_introduced[df_gene_introduced["Catalyst"] == compare_catalyst]["catalyst_gene"].values
-            
-            array_distance[index] = edit_distance(root_gene[0], compare_gene[0], substitution_cost=1, transpositions=False)
+        array_distance = get_root_distances(array_gene, root_index)[first_rows[inverse]]
 
         df_distance = pd.DataFrame(array_distance, columns = ["distance"])
 
@@ -276,7 +335,7 @@ def get_catalyst_gene(data):
         ########  ensure that the root catalyst come to the top  ###################
         df_compare_distance_introduced.drop(index=root_index, axis=0, inplace=True)
 
-        df_compare_distance_introduced.sort_values(by = ["distance"], ascending = [True], inplace = True)
+        df_compare_distance_introduced.sort_values(by = ["distance"], ascending = [True], kind = "stable", inplace = True)
 
         df_distance_introduced = pd.concat([df_root_raw, df_compare_distance_introduced], axis = 0)
         
@@ -290,18 +349,12 @@ def get_catalyst_gene(data):
 
         area_columns = [a for a in df_distance_introduced.columns if "area" in a]
 
-        dict_area_cat =  {}
-
-        for i, catalyst in enumerate(df_distance_introduced["Catalyst"]):
-
-            df_cat = df_distance_introduced.iloc[i, :]
-
-            dict_area_cat[catalyst] = df_cat[area_columns].values.tolist()
+        dict_area_cat = dict(zip(df_distance_introduced["Catalyst"], df_distance_introduced[area_columns].values.tolist()))
 
         result["parallelData"] = dict_area_cat
 
 ###########  common pattern finding    ############################################
-        dict_pattern_df = {}
+        distances = df_distance_introduced["distance"].values
 
         if data_onehot:
 
@@ -309,65 +362,18 @@ def get_catalyst_gene(data):
             last_component = data["view"]['settings']["componentLastColumn"]
 
             first_index = min(columns.index(first_component), columns.index(last_component))
-            last_index = max(columns.index(first_component), columns.index(last_component))     
-
-            for distance in range(np.max(df_distance_introduced["distance"])+1):
-
-                df_similar_gene = df_distance_introduced[df_distance_introduced['distance'] <= distance]
-                df_compo = df_similar_gene.iloc[:, first_index:last_index+1]
-                # df_compo.fillna(value = "0", inplace = True)
-
-                array_atoms = np.zeros_like(df_compo.values).astype('object')
+            last_index = max(columns.index(first_component), columns.index(last_component))
 
-                combination_list =[]
+            df_compo = df_distance_introduced.iloc[:, first_index:last_index+1]
 
-                for raw in df_compo.index:
-                
-                    for i, material in enumerate(df_compo.columns):
-                    
-                        if (df_compo.iloc[raw, i] == "0") | (df_compo.iloc[raw, i] == 0):
-                            
-                            array_atoms[raw, i] = ""
-                        else:
-                            
-                            array_atoms[raw, i] = str(material)
-                
-                    combination_list.append(list(itertools.combinations(array_atoms[raw], 2)))
-           
-                dict_pattern_df[distance] = combination_wrapping(combination_list)
-
-            result['patternCounts'] = dict_pattern_df
+            result['patternCounts'] = get_pattern_counts(df_compo, distances, df_compo.columns.tolist())
 
         else:
             componentColumns = data["view"]['settings']["compomentColumns"]
 
-            for distance in range(np.max(df_distance_introduced["distance"])+1):
-            
-                df_similar_gene = df_distance_introduced[df_distance_introduced['distance'] <= distance]
-
-                df_compo = df_similar_gene.loc[:, componentColumns]
-                df_compo.fillna(value = '0', inplace = True)
+            df_compo = df_distance_introduced.loc[:, componentColumns].fillna(value = '0')
 
-                array_atoms = np.zeros_like(df_compo.values).astype('object')
+            result['patternCounts'] = get_pattern_counts(df_compo, distances)
 
-                combination_list =[]
-
-                for raw in df_compo.index:
-                
-                    for i, material in enumerate(df_compo.columns):
-                    
-                        if (df_compo.iloc[raw, i] == "0") | (df_compo.iloc[raw, i] == 0) :
-
-                            array_atoms[raw, i] = ""
-
-                        else:
-                            array_atoms[raw, i] = str(df_compo.iloc[raw, i])
-
-                    combination_list.append(list(itertools.combinations(array_atoms[raw], 2)))
-
-                dict_pattern_df[distance] = combination_wrapping(combination_list)
-
-            result['patternCounts'] = dict_pattern_df
-        
     return result
 #-------------------------------------------------------------------------------------------------
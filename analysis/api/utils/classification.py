@@ -1,7 +1,7 @@
 #=================================================================================================
 # Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 #          Hokkaido University (2018)
-#          Last Update: Q3 2023
+#          Last Update: Q4 2026
 # ________________________________________________________________________________________________
 # Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
 #          Jun Fujima (Former Lead Developer) [2018-2021]
@@ -11,8 +11,9 @@
 # ------------------------------------------------------------------------------------------------
 # Notes:  This is one of the REST API parts of the 'analysis' interface of the website that
 #         allows serverside work for the 'classification' component.
+#         The model gets its jobs from the compute budget of the 'compute' helpers.
 # ------------------------------------------------------------------------------------------------
-# References: logging, numpy, pandas and sklearn libs
+# References: logging, numpy, pandas and sklearn libs and 'analysis' folder's 'compute'
 #=================================================================================================
 
 #-------------------------------------------------------------------------------------------------
@@ -30,6 +31,8 @@ from sklearn.linear_model import RidgeClassifier
 from sklearn.neighbors import KNeighborsClassifier
 from sklearn.neural_network import MLPClassifier
 
+from analysis.compute import set_n_jobs
+
 logger = logging.getLogger(__name__)
 
 #-------------------------------------------------------------------------------------------------
@@ -71,6 +74,7 @@ def get_classification(data):
     else: #  Ridge
         model = RidgeClassifier(alpha=float(method_args['arg1']))
 
+    set_n_jobs(model)
     model.fit(X, y)
     y_predict = model.predict(X)
     p_name = target_column + '--predicted'
@@ -1,7 +1,7 @@
 #=================================================================================================
 # Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 #          Hokkaido University (2018)
-#          Last Update: Q3 2023
+#          Last Update: Q4 2026
 # ________________________________________________________________________________________________
 # Authors:Yoshiki Hasukawa (Student Developer, Component Design and Editor of Feature Assignment 
 #         Code) [2024] 
@@ -13,8 +13,10 @@
 # ------------------------------------------------------------------------------------------------
 # Notes:  This is one of the REST API parts of the 'analysis' interface of the website that
 #         allows serverside work for the 'Feature Assignment' component.
+#         The element properties (periodic_table.json in this folder) are compiled once per
+#         process into a property matrix with an element-to-row index.
 # ------------------------------------------------------------------------------------------------
-# References: logging, numpy libs
+# References: logging, numpy, pandas, json, os and functools libs
 #=================================================================================================
 
 
@@ -26,8 +28,40 @@ import time
 import numpy as np
 import pandas as pd
 import json
+import os
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
+
+PERIODIC_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'periodic_table.json')
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def get_periodic_table():
+    """
+    Load the Periodic Table once (per process) as a float64 property matrix, with one row per
+    element ('None' being the row of zeros for empty catalyst components), together with the
+    element names index (to find the rows) and the property names.
+    """
+    with open(PERIODIC_TABLE_PATH) as f:
+        records = json.load(f)
+    properties = [k for k in records[0].keys() if k != 'index']
+    elements = pd.Index([r['index'] for r in records])
+    matrix = np.array([[float(r[k]) for k in properties] for r in records], dtype=np.float64)
+    matrix.setflags(write=False)  # shared by all the requests
+    return matrix, elements, properties
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_element_rows(elements, names):
+    """Get the property matrix rows of an array of element names, KeyError if one is unknown."""
+    rows = elements.get_indexer(np.asarray(names, dtype=object).ravel())
+    if (rows < 0).any():
+        raise KeyError('Unknown element(s)')
+    return rows.reshape(np.shape(names))
 #-------------------------------------------------------------------------------------------------
 
 
@@ -46,9 +80,7 @@ def get_feature_assignment(data):
     input_df = pd.DataFrame(dataset)
 
     #load periodic table information
-    ref_df = pd.read_json(json.dumps(periodic_table))
-    ref_df.set_index('index', inplace=True)
-    ref_dict = ref_df.T.to_dict(orient = 'list')
+    ref_matrix, ref_elements, ref_properties = get_periodic_table()
 
     #If Avalilable, Create Dataframe Of Targets
     if len(target_columns_list) != 0 and target_columns_list:
@@ -66,31 +98,28 @@ def get_feature_assignment(data):
 
         catalysts = df.values
 
-        # Information dimension setup.
-        no_rows, no_columns = catalysts.shape
-        no_properties = len(ref_dict['None'])
         try :
             """
-            The vectorized catalyst rows are flattened to be converted to the properties taken from the 
-            Periodic Table reference dictionary, then reshaped a row-column shape like catalyst list, 
-            with an additional third dimention coming from all the different Periodic Table properties. This 
-            tridimensional array is then added/collapsed over the 'column' axis, addint all the different 
-            properties for each catalyst at once. And, check the error
+            The catalyst components are converted to their rows in the Periodic Table property matrix,
+            the row-column shape like catalyst list. The properties of all the components of each catalyst
+            are then added at once by fancy-indexing the matrix with these rows and collapsing the 'column'
+            axis. And, check the error
             """
-            converted_elements = np.array([ref_dict[x] for x in catalysts.flatten()]).reshape(no_rows, no_columns, no_properties)
-            elements_number = np.array([len([y for y in x if y != 'None']) for x in catalysts])
+            element_rows = get_element_rows(ref_elements, catalysts.astype(str))
+            elements_number = (catalysts != 'None').sum(axis = 1)
             if 0 in elements_number:
                 raise ValueError()
             """ 
             A 1-D array is created that contains the number of elements in each catalyst row,
             which are the values used to calculate the simple average.
             """
-            no_elements = elements_number.reshape(no_rows, 1)
+            no_elements = elements_number.reshape(-1, 1)
             """
             The converted catalyst array is added in the direction of each catalyst's components, 
             and then divided by the number of elements in the row to calculate the simple average.
             """
-            averaged_array = np.divide(converted_elements.sum(axis = 1), no_elements)
+            summed_array = np.einsum('rcp->rp', ref_matrix[element_rows])
+            averaged_array = np.divide(summed_array, no_elements)
             averaged_array = np.around(averaged_array, decimals = 4)
         except :
             result['status'] = 'error'
@@ -106,17 +135,17 @@ def get_feature_assignment(data):
 
         try :
             # Conversion of the catalysts' components into their respective properties.
-            catalyst_components_converted = np.array([ref_dict[x] for x in df.columns.to_numpy()])
+            catalyst_components_converted = ref_matrix[get_element_rows(ref_elements, df.columns.astype(str))]
             # logger.info(catalyst_components_converted.shape)
             # Dot product between the catalyst compositions and the converted components. 
             # Each row's components' properties are automatically added.
-            averaged_array = np.dot(df.values, catalyst_components_converted)
+            averaged_array = np.dot(df.values.astype(np.float64), catalyst_components_converted)
             # logger.info(averaged_array.shape)
         except KeyError:
             result['status'] = 'error'
             result['detail'] = "Detected elements that cannot be referenced in columns. Please check format. Especially, is Element Name of catalyst component correct?"
             return result
-        except TypeError:
+        except (TypeError, ValueError):
             result['status'] = 'error'
             result['detail'] = "can't multiply sequence by non-int of type 'float'. Please enter a number for Catalyst Compositions."
             return result
@@ -131,46 +160,33 @@ def get_feature_assignment(data):
         df_catalyst_compositions.fillna(0, inplace=True)
         catalyst_compositions = df_catalyst_compositions.values
 
-        # Information dimension setup.
-
-        no_rows, no_columns = catalysts.shape
-
-        no_properties = len(ref_dict['None'])
-
         try :
             """
-            The vectorized catalyst rows are flattened to be converted to the properties taken from the Periodic 
-            Table reference dictionary, then reshaped a row-column shape like catalyst list, 
-            with an additional third dimention coming from all the different Periodic Table properties.
-            This tridimensional array is then added/collapsed over the 'column' axis, addint all the different
-            properties for each catalyst at once.
+            The catalyst components are converted to their rows in the Periodic Table property matrix, with
+            the row-column shape like catalyst list. Fancy-indexing the matrix with these rows gives a
+            tridimensional array, with the third dimention coming from all the different Periodic Table properties.
             """
-            converted_elements = np.array([ref_dict[x] for x in catalysts.flatten()]).reshape(no_rows, no_columns, no_properties)
+            element_rows = get_element_rows(ref_elements, catalysts.astype(str))
+            catalyst_compositions = catalyst_compositions.astype(np.float64)
             """
-            The catalyst composition matrix is extended to a third dimension the size of 
-            the number of Periodic Table properties the catalysts were converted
-            into, to compatibilize the dimensions in the multiplication of the converted elements with the compositions.
+            The converted elements are then multiplied by the catalyst compositions and added in the catalyst
+            components (orginal dataset columns') axis in one einsum, to complete the weighted average computation.
             """
-            extended_catalyst_compositions = np.repeat(catalyst_compositions, no_properties).reshape(no_rows, no_columns, no_properties)
-            """
-            The matrices / arrays are then multiplied and added in the catalyst components (orginal dataset columns') axis,
-            to complete the weighted averagecomputation.
-            """
-            averaged_array = np.multiply(converted_elements, extended_catalyst_compositions).sum(axis = 1)
+            averaged_array = np.einsum('rc,rcp->rp', catalyst_compositions, ref_matrix[element_rows])
         except KeyError:
             result['status'] = 'error'
             result['detail'] = "Detected elements that cannot be referenced. Please check format. Especially, is Element Name of catalyst component correct? If there is no element, assume None."
             return result
-        except TypeError:
+        except (TypeError, ValueError):
             result['status'] = 'error'
             result['detail'] = "can't multiply sequence by non-int of type 'float'. Please enter a number for Catalyst Compositions."
             return result
     # Weighted Average (Format B) Main Script------------------------------------------------------------------
 
     if len(target_columns_list) != 0 and target_columns_list:
-        output_df = pd.concat([df, pd.DataFrame(averaged_array, columns = ref_df.columns.tolist()), target_df], axis = 1)
+        output_df = pd.concat([df, pd.DataFrame(averaged_array, columns = ref_properties), target_df], axis = 1)
     else :
-        output_df = pd.concat([df, pd.DataFrame(averaged_array, columns = ref_df.columns.tolist())], axis = 1)
+        output_df = pd.concat([df, pd.DataFrame(averaged_array, columns = ref_properties)], axis = 1)
     # logger.info(output_df)
 
     #Header List and Cell Data For View Table of VisComp
@@ -192,5802 +208,3 @@ def get_feature_assignment(data):
 # If Custom Error Message is needed use the following:
 # result['status'] = 'error'
 # result['detail'] = "This is the Custom Error Message"
-
-#Periodic Data
-periodic_table = [
-    {
-        "index": "None",
-        "atomic_number": "0",
-        "atomic_radius_simple": "0",
-        "atomic_radius_rahm": "0",
-        "atomic_volume": "0",
-        "atomic_weight": "0",
-        "boiling_point": "0",
-        "bulk_modulus": "0",
-        "c6_gb": "0",
-        "covalent_radius_cordero": "0",
-        "covalent_radius_pyykko_simple": "0",
-        "covalent_radius_pyykko_double": "0",
-        "covalent_radius_pyykko_triple": "0",
-        "covalent_radius_slater": "0",
-        "density": "0",
-        "dipole_polarizability": "0",
-        "electron_negativity": "0",
-        "electron_affinity": "0",
-        "en_allen": "0",
-        "en_ghosh": "0",
-        "en_pauling": "0",
-        "first_ion_en": "0",
-        "fusion_enthalpy": "0",
-        "gs_bandgap": "0",
-        "gs_energy": "0",
-        "gs_est_bcc_latcnt": "0",
-        "gs_est_fcc_latcnt": "0",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "0",
-        "hhi_p": "0",
-        "hhi_r": "0",
-        "heat_capacity_mass": "0",
-        "heat_capacity_molar": "0",
-        "icsd_volume": "0",
-        "evaporation_heat": "0",
-        "heat_of_formation": "0",
-        "lattice_constant": "0",
-        "mendeleev_number": "0",
-        "melting_point": "0",
-        "molar_volume": "0",
-        "num_unfilled": "0",
-        "num_valence": "0",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "0",
-        "period": "0",
-        "specific_heat": "0",
-        "thermal_conductivity": "0",
-        "vdw_radius_simple": "0",
-        "vdw_radius_alvarez": "0",
-        "vdw_radius_mm3": "0",
-        "vdw_radius_uff": "0",
-        "sound_velocity": "0",
-        "Polarizability": "0"
-    },
-    {
-        "index": "H",
-        "atomic_number": "1",
-        "atomic_radius_simple": "79",
-        "atomic_radius_rahm": "154",
-        "atomic_volume": "14.1",
-        "atomic_weight": "1.008",
-        "boiling_point": "20.28",
-        "bulk_modulus": "56.79963953",
-        "c6_gb": "6.51",
-        "covalent_radius_cordero": "31",
-        "covalent_radius_pyykko_simple": "32",
-        "covalent_radius_pyykko_double": "111.4199326",
-        "covalent_radius_pyykko_triple": "113.1059062",
-        "covalent_radius_slater": "25",
-        "density": "0.0708",
-        "dipole_polarizability": "4.507107424",
-        "electron_negativity": "2.2",
-        "electron_affinity": "0.754195",
-        "en_allen": "13.61",
-        "en_ghosh": "0.2638",
-        "en_pauling": "2.2",
-        "first_ion_en": "13.598443",
-        "fusion_enthalpy": "0.06",
-        "gs_bandgap": "7.853",
-        "gs_energy": "-3.331290765",
-        "gs_est_bcc_latcnt": "2.365120549",
-        "gs_est_fcc_latcnt": "2.979865165",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "6.615",
-        "hhi_p": "3535.562136",
-        "hhi_r": "3431.551459",
-        "heat_capacity_mass": "14.304",
-        "heat_capacity_molar": "28.836",
-        "icsd_volume": "32.02",
-        "evaporation_heat": "0.904",
-        "heat_of_formation": "217.998",
-        "lattice_constant": "3.75",
-        "mendeleev_number": "103",
-        "melting_point": "14.01",
-        "molar_volume": "11.42",
-        "num_unfilled": "1",
-        "num_valence": "1",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "1",
-        "num_s_valence": "1",
-        "period": "1",
-        "specific_heat": "1.122727891",
-        "thermal_conductivity": "0.1805",
-        "vdw_radius_simple": "110",
-        "vdw_radius_alvarez": "120",
-        "vdw_radius_mm3": "162",
-        "vdw_radius_uff": "288.6",
-        "sound_velocity": "1270",
-        "Polarizability": "0.666793"
-    },
-    {
-        "index": "He",
-        "atomic_number": "2",
-        "atomic_radius_simple": "147.8326428",
-        "atomic_radius_rahm": "134",
-        "atomic_volume": "31.8",
-        "atomic_weight": "4.002602",
-        "boiling_point": "4.216",
-        "bulk_modulus": "85.10662956",
-        "c6_gb": "1.47",
-        "covalent_radius_cordero": "28",
-        "covalent_radius_pyykko_simple": "46",
-        "covalent_radius_pyykko_double": "114.7083545",
-        "covalent_radius_pyykko_triple": "105.740602",
-        "covalent_radius_slater": "122.887274",
-        "density": "0.147",
-        "dipole_polarizability": "1.3837467",
-        "electron_negativity": "4.16",
-        "electron_affinity": "-19.7",
-        "en_allen": "24.59",
-        "en_ghosh": "0.442712",
-        "en_pauling": "2.387649153",
-        "first_ion_en": "24.587387",
-        "fusion_enthalpy": "6.001797775",
-        "gs_bandgap": "18.098",
-        "gs_energy": "0.0011354",
-        "gs_est_bcc_latcnt": "2.908733088",
-        "gs_est_fcc_latcnt": "3.664774046",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "12.305",
-        "hhi_p": "3200",
-        "hhi_r": "3900",
-        "heat_capacity_mass": "5.13",
-        "heat_capacity_molar": "20.786",
-        "icsd_volume": "19.08",
-        "evaporation_heat": "0.08",
-        "heat_of_formation": "120.1781406",
-        "lattice_constant": "3.57",
-        "mendeleev_number": "1",
-        "melting_point": "0.95",
-        "molar_volume": "21",
-        "num_unfilled": "0",
-        "num_valence": "2",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "1",
-        "specific_heat": "5.188",
-        "thermal_conductivity": "0.1513",
-        "vdw_radius_simple": "140",
-        "vdw_radius_alvarez": "143",
-        "vdw_radius_mm3": "153",
-        "vdw_radius_uff": "236.2",
-        "sound_velocity": "970",
-        "Polarizability": "0.2050519"
-    },
-    {
-        "index": "Li",
-        "atomic_number": "3",
-        "atomic_radius_simple": "155",
-        "atomic_radius_rahm": "220",
-        "atomic_volume": "13.1",
-        "atomic_weight": "6.94",
-        "boiling_point": "1118.15",
-        "bulk_modulus": "11",
-        "c6_gb": "1410",
-        "covalent_radius_cordero": "128",
-        "covalent_radius_pyykko_simple": "133",
-        "covalent_radius_pyykko_double": "124",
-        "covalent_radius_pyykko_triple": "110.5913614",
-        "covalent_radius_slater": "145",
-        "density": "0.534",
-        "dipole_polarizability": "164",
-        "electron_negativity": "0.98",
-        "electron_affinity": "0.618049",
-        "en_allen": "5.392",
-        "en_ghosh": "0.105093",
-        "en_pauling": "0.98",
-        "first_ion_en": "5.391719",
-        "fusion_enthalpy": "3",
-        "gs_bandgap": "0",
-        "gs_energy": "-1.86988691",
-        "gs_est_bcc_latcnt": "3.213570838",
-        "gs_est_fcc_latcnt": "4.048845545",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "16.59333333",
-        "hhi_p": "2900",
-        "hhi_r": "4200",
-        "heat_capacity_mass": "3.582",
-        "heat_capacity_molar": "24.86",
-        "icsd_volume": "21.63",
-        "evaporation_heat": "148",
-        "heat_of_formation": "159.3",
-        "lattice_constant": "3.49",
-        "mendeleev_number": "12",
-        "melting_point": "553.69",
-        "molar_volume": "13.02",
-        "num_unfilled": "1",
-        "num_valence": "1",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "1",
-        "num_s_valence": "1",
-        "period": "2",
-        "specific_heat": "3.489",
-        "thermal_conductivity": "85",
-        "vdw_radius_simple": "182",
-        "vdw_radius_alvarez": "212",
-        "vdw_radius_mm3": "255",
-        "vdw_radius_uff": "245.1",
-        "sound_velocity": "6000",
-        "Polarizability": "24.33"
-    },
-    {
-        "index": "Be",
-        "atomic_number": "4",
-        "atomic_radius_simple": "112",
-        "atomic_radius_rahm": "219",
-        "atomic_volume": "5",
-        "atomic_weight": "9.0121831",
-        "boiling_point": "3243",
-        "bulk_modulus": "130",
-        "c6_gb": "214",
-        "covalent_radius_cordero": "96",
-        "covalent_radius_pyykko_simple": "102",
-        "covalent_radius_pyykko_double": "90",
-        "covalent_radius_pyykko_triple": "85",
-        "covalent_radius_slater": "105",
-        "density": "1.848",
-        "dipole_polarizability": "37.71",
-        "electron_negativity": "1.57",
-        "electron_affinity": "-2.4",
-        "en_allen": "9.323",
-        "en_ghosh": "0.144986",
-        "en_pauling": "1.57",
-        "first_ion_en": "9.3227",
-        "fusion_enthalpy": "7.895",
-        "gs_bandgap": "0",
-        "gs_energy": "-3.755038695",
-        "gs_est_bcc_latcnt": "2.508239481",
-        "gs_est_fcc_latcnt": "3.160183721",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "7.89",
-        "hhi_p": "8000",
-        "hhi_r": "4000",
-        "heat_capacity_mass": "1.825",
-        "heat_capacity_molar": "16.443",
-        "icsd_volume": "8.11",
-        "evaporation_heat": "309",
-        "heat_of_formation": "324",
-        "lattice_constant": "2.29",
-        "mendeleev_number": "77",
-        "melting_point": "1551",
-        "molar_volume": "4.85",
-        "num_unfilled": "0",
-        "num_valence": "2",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "2",
-        "specific_heat": "1.824",
-        "thermal_conductivity": "190",
-        "vdw_radius_simple": "153",
-        "vdw_radius_alvarez": "198",
-        "vdw_radius_mm3": "223",
-        "vdw_radius_uff": "274.5",
-        "sound_velocity": "13000",
-        "Polarizability": "5.6"
-    },
-    {
-        "index": "B",
-        "atomic_number": "5",
-        "atomic_radius_simple": "98",
-        "atomic_radius_rahm": "205",
-        "atomic_volume": "4.6",
-        "atomic_weight": "10.81",
-        "boiling_point": "3931",
-        "bulk_modulus": "320",
-        "c6_gb": "99.2",
-        "covalent_radius_cordero": "84",
-        "covalent_radius_pyykko_simple": "85",
-        "covalent_radius_pyykko_double": "78",
-        "covalent_radius_pyykko_triple": "73",
-        "covalent_radius_slater": "85",
-        "density": "2.34",
-        "dipole_polarizability": "20.53",
-        "electron_negativity": "2.04",
-        "electron_affinity": "0.279723",
-        "en_allen": "12.13",
-        "en_ghosh": "0.184886",
-        "en_pauling": "2.04",
-        "first_ion_en": "8.29802",
-        "fusion_enthalpy": "50.2",
-        "gs_bandgap": "1.524",
-        "gs_energy": "-6.677698154",
-        "gs_est_bcc_latcnt": "2.429779429",
-        "gs_est_fcc_latcnt": "3.061330249",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "7.1725",
-        "hhi_p": "2900",
-        "hhi_r": "2000",
-        "heat_capacity_mass": "1.026",
-        "heat_capacity_molar": "11.087",
-        "icsd_volume": "7.75",
-        "evaporation_heat": "504.5",
-        "heat_of_formation": "565",
-        "lattice_constant": "8.73",
-        "mendeleev_number": "86",
-        "melting_point": "2573",
-        "molar_volume": "4.39",
-        "num_unfilled": "5",
-        "num_valence": "3",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "5",
-        "num_p_valence": "1",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "2",
-        "specific_heat": "1.025",
-        "thermal_conductivity": "27",
-        "vdw_radius_simple": "192",
-        "vdw_radius_alvarez": "191",
-        "vdw_radius_mm3": "215",
-        "vdw_radius_uff": "408.3",
-        "sound_velocity": "16200",
-        "Polarizability": "3.03"
-    },
-    {
-        "index": "C",
-        "atomic_number": "6",
-        "atomic_radius_simple": "91",
-        "atomic_radius_rahm": "190",
-        "atomic_volume": "5.3",
-        "atomic_weight": "12.011",
-        "boiling_point": "5100",
-        "bulk_modulus": "33",
-        "c6_gb": "47.9",
-        "covalent_radius_cordero": "73",
-        "covalent_radius_pyykko_simple": "75",
-        "covalent_radius_pyykko_double": "67",
-        "covalent_radius_pyykko_triple": "60",
-        "covalent_radius_slater": "70",
-        "density": "2.25",
-        "dipole_polarizability": "20.53",
-        "electron_negativity": "2.55",
-        "electron_affinity": "1.262119",
-        "en_allen": "15.05",
-        "en_ghosh": "0.224776",
-        "en_pauling": "2.55",
-        "first_ion_en": "11.2603",
-        "fusion_enthalpy": "117.4",
-        "gs_bandgap": "4.496",
-        "gs_energy": "-9.209713655",
-        "gs_est_bcc_latcnt": "2.242692341",
-        "gs_est_fcc_latcnt": "2.825615289",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "5.64",
-        "hhi_p": "500",
-        "hhi_r": "500",
-        "heat_capacity_mass": "0.709",
-        "heat_capacity_molar": "8.517",
-        "icsd_volume": "5.67",
-        "evaporation_heat": "659.2820752",
-        "heat_of_formation": "716.87",
-        "lattice_constant": "3.57",
-        "mendeleev_number": "95",
-        "melting_point": "3820",
-        "molar_volume": "5.29",
-        "num_unfilled": "4",
-        "num_valence": "4",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "4",
-        "num_p_valence": "2",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "2",
-        "specific_heat": "0.711",
-        "thermal_conductivity": "140",
-        "vdw_radius_simple": "170",
-        "vdw_radius_alvarez": "177",
-        "vdw_radius_mm3": "204",
-        "vdw_radius_uff": "385.1",
-        "sound_velocity": "18350",
-        "Polarizability": "1.67"
-    },
-    {
-        "index": "N",
-        "atomic_number": "7",
-        "atomic_radius_simple": "92",
-        "atomic_radius_rahm": "179",
-        "atomic_volume": "17.3",
-        "atomic_weight": "14.007",
-        "boiling_point": "77.4",
-        "bulk_modulus": "57.36488288",
-        "c6_gb": "25.7",
-        "covalent_radius_cordero": "71",
-        "covalent_radius_pyykko_simple": "71",
-        "covalent_radius_pyykko_double": "60",
-        "covalent_radius_pyykko_triple": "54",
-        "covalent_radius_slater": "65",
-        "density": "0.808",
-        "dipole_polarizability": "7.6",
-        "electron_negativity": "3.04",
-        "electron_affinity": "-1.4",
-        "en_allen": "18.13",
-        "en_ghosh": "0.26493",
-        "en_pauling": "3.04",
-        "first_ion_en": "14.5341",
-        "fusion_enthalpy": "0.355",
-        "gs_bandgap": "6.437",
-        "gs_energy": "-8.21144121",
-        "gs_est_bcc_latcnt": "3.091182017",
-        "gs_est_fcc_latcnt": "3.894645292",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "14.76875",
-        "hhi_p": "1300",
-        "hhi_r": "500",
-        "heat_capacity_mass": "1.04",
-        "heat_capacity_molar": "29.124",
-        "icsd_volume": "22.68",
-        "evaporation_heat": "20.05585557",
-        "heat_of_formation": "472.44",
-        "lattice_constant": "4.039",
-        "mendeleev_number": "100",
-        "melting_point": "63.29",
-        "molar_volume": "13.54",
-        "num_unfilled": "3",
-        "num_valence": "5",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "3",
-        "num_p_valence": "3",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "2",
-        "specific_heat": "0.772947713",
-        "thermal_conductivity": "0.02583",
-        "vdw_radius_simple": "155",
-        "vdw_radius_alvarez": "166",
-        "vdw_radius_mm3": "193",
-        "vdw_radius_uff": "366",
-        "sound_velocity": "333.6",
-        "Polarizability": "1.1"
-    },
-    {
-        "index": "O",
-        "atomic_number": "8",
-        "atomic_radius_simple": "146.2014203",
-        "atomic_radius_rahm": "171",
-        "atomic_volume": "14",
-        "atomic_weight": "15.999",
-        "boiling_point": "90.19",
-        "bulk_modulus": "76.10604085",
-        "c6_gb": "16.7",
-        "covalent_radius_cordero": "66",
-        "covalent_radius_pyykko_simple": "63",
-        "covalent_radius_pyykko_double": "57",
-        "covalent_radius_pyykko_triple": "53",
-        "covalent_radius_slater": "60",
-        "density": "1.149",
-        "dipole_polarizability": "5.24",
-        "electron_negativity": "3.44",
-        "electron_affinity": "1.4611135",
-        "en_allen": "21.36",
-        "en_ghosh": "0.304575",
-        "en_pauling": "3.44",
-        "first_ion_en": "13.61805",
-        "fusion_enthalpy": "0.22",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.756791905",
-        "gs_est_bcc_latcnt": "2.630893787",
-        "gs_est_fcc_latcnt": "3.314718462",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "9.105",
-        "hhi_p": "500",
-        "hhi_r": "500",
-        "heat_capacity_mass": "0.918",
-        "heat_capacity_molar": "29.378",
-        "icsd_volume": "17.36",
-        "evaporation_heat": "15.57909119",
-        "heat_of_formation": "249.229",
-        "lattice_constant": "6.83",
-        "mendeleev_number": "101",
-        "melting_point": "54.8",
-        "molar_volume": "17.36",
-        "num_unfilled": "2",
-        "num_valence": "6",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "2",
-        "num_p_valence": "4",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "2",
-        "specific_heat": "1.079186637",
-        "thermal_conductivity": "0.02658",
-        "vdw_radius_simple": "152",
-        "vdw_radius_alvarez": "150",
-        "vdw_radius_mm3": "182",
-        "vdw_radius_uff": "350",
-        "sound_velocity": "317.5",
-        "Polarizability": "0.802"
-    },
-    {
-        "index": "F",
-        "atomic_number": "9",
-        "atomic_radius_simple": "134.0236142",
-        "atomic_radius_rahm": "163",
-        "atomic_volume": "17.1",
-        "atomic_weight": "18.99840316",
-        "boiling_point": "85.01",
-        "bulk_modulus": "46.7989395",
-        "c6_gb": "10.2",
-        "covalent_radius_cordero": "57",
-        "covalent_radius_pyykko_simple": "64",
-        "covalent_radius_pyykko_double": "59",
-        "covalent_radius_pyykko_triple": "53",
-        "covalent_radius_slater": "50",
-        "density": "1.108",
-        "dipole_polarizability": "3.7",
-        "electron_negativity": "3.98",
-        "electron_affinity": "3.4011897",
-        "en_allen": "24.8",
-        "en_ghosh": "0.344443",
-        "en_pauling": "3.98",
-        "first_ion_en": "17.4228",
-        "fusion_enthalpy": "0.255",
-        "gs_bandgap": "1.97",
-        "gs_energy": "-1.698060958",
-        "gs_est_bcc_latcnt": "2.687689729",
-        "gs_est_fcc_latcnt": "3.386276865",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "9.7075",
-        "hhi_p": "1500",
-        "hhi_r": "1500",
-        "heat_capacity_mass": "0.824",
-        "heat_capacity_molar": "31.304",
-        "icsd_volume": "16.42",
-        "evaporation_heat": "6.54",
-        "heat_of_formation": "79.335",
-        "lattice_constant": "5.631000059",
-        "mendeleev_number": "102",
-        "melting_point": "53.53",
-        "molar_volume": "11.2",
-        "num_unfilled": "1",
-        "num_valence": "7",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "1",
-        "num_p_valence": "5",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "2",
-        "specific_heat": "1.243845842",
-        "thermal_conductivity": "0.0277",
-        "vdw_radius_simple": "147",
-        "vdw_radius_alvarez": "146",
-        "vdw_radius_mm3": "171",
-        "vdw_radius_uff": "336.4",
-        "sound_velocity": "2826.915883",
-        "Polarizability": "0.557"
-    },
-    {
-        "index": "Ne",
-        "atomic_number": "10",
-        "atomic_radius_simple": "148.6295412",
-        "atomic_radius_rahm": "156",
-        "atomic_volume": "16.8",
-        "atomic_weight": "20.1797",
-        "boiling_point": "27.1",
-        "bulk_modulus": "75.09587912",
-        "c6_gb": "6.91",
-        "covalent_radius_cordero": "58",
-        "covalent_radius_pyykko_simple": "67",
-        "covalent_radius_pyykko_double": "96",
-        "covalent_radius_pyykko_triple": "115.5322054",
-        "covalent_radius_slater": "126.742479",
-        "density": "1.204",
-        "dipole_polarizability": "2.67",
-        "electron_negativity": "4.79",
-        "electron_affinity": "1.563227422",
-        "en_allen": "28.31",
-        "en_ghosh": "0.38439",
-        "en_pauling": "2.26542912",
-        "first_ion_en": "21.56454",
-        "fusion_enthalpy": "0.164",
-        "gs_bandgap": "13.088",
-        "gs_energy": "0.09403567",
-        "gs_est_bcc_latcnt": "2.934893568",
-        "gs_est_fcc_latcnt": "3.697734186",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "12.64",
-        "hhi_p": "3573.157067",
-        "hhi_r": "3725.088987",
-        "heat_capacity_mass": "1.03",
-        "heat_capacity_molar": "20.786",
-        "icsd_volume": "23.09",
-        "evaporation_heat": "1.74",
-        "heat_of_formation": "124.6794701",
-        "lattice_constant": "4.43",
-        "mendeleev_number": "2",
-        "melting_point": "48",
-        "molar_volume": "13.23",
-        "num_unfilled": "0",
-        "num_valence": "8",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "6",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "2",
-        "specific_heat": "1.029",
-        "thermal_conductivity": "0.0491",
-        "vdw_radius_simple": "154",
-        "vdw_radius_alvarez": "158",
-        "vdw_radius_mm3": "160",
-        "vdw_radius_uff": "324.3",
-        "sound_velocity": "936",
-        "Polarizability": "0.39432"
-    },
-    {
-        "index": "Na",
-        "atomic_number": "11",
-        "atomic_radius_simple": "190",
-        "atomic_radius_rahm": "225",
-        "atomic_volume": "23.7",
-        "atomic_weight": "22.98976928",
-        "boiling_point": "1156.1",
-        "bulk_modulus": "6.3",
-        "c6_gb": "1570",
-        "covalent_radius_cordero": "166",
-        "covalent_radius_pyykko_simple": "155",
-        "covalent_radius_pyykko_double": "160",
-        "covalent_radius_pyykko_triple": "110.0710607",
-        "covalent_radius_slater": "180",
-        "density": "0.971",
-        "dipole_polarizability": "162.7",
-        "electron_negativity": "0.93",
-        "electron_affinity": "0.547926",
-        "en_allen": "5.14",
-        "en_ghosh": "0.093214",
-        "en_pauling": "0.93",
-        "first_ion_en": "5.139076",
-        "fusion_enthalpy": "2.6",
-        "gs_bandgap": "0",
-        "gs_energy": "-1.260241383",
-        "gs_est_bcc_latcnt": "3.88167309",
-        "gs_est_fcc_latcnt": "4.890601634",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "29.24333333",
-        "hhi_p": "1100",
-        "hhi_r": "500",
-        "heat_capacity_mass": "1.228",
-        "heat_capacity_molar": "28.23",
-        "icsd_volume": "39.76",
-        "evaporation_heat": "97.9",
-        "heat_of_formation": "107.5",
-        "lattice_constant": "4.23",
-        "mendeleev_number": "11",
-        "melting_point": "370.96",
-        "molar_volume": "23.78",
-        "num_unfilled": "1",
-        "num_valence": "1",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "1",
-        "num_s_valence": "1",
-        "period": "3",
-        "specific_heat": "1.222",
-        "thermal_conductivity": "140",
-        "vdw_radius_simple": "227",
-        "vdw_radius_alvarez": "250",
-        "vdw_radius_mm3": "270",
-        "vdw_radius_uff": "298.3",
-        "sound_velocity": "3200",
-        "Polarizability": "24.11"
-    },
-    {
-        "index": "Mg",
-        "atomic_number": "12",
-        "atomic_radius_simple": "160",
-        "atomic_radius_rahm": "240",
-        "atomic_volume": "14",
-        "atomic_weight": "24.305",
-        "boiling_point": "1363",
-        "bulk_modulus": "45",
-        "c6_gb": "629",
-        "covalent_radius_cordero": "141",
-        "covalent_radius_pyykko_simple": "139",
-        "covalent_radius_pyykko_double": "132",
-        "covalent_radius_pyykko_triple": "127",
-        "covalent_radius_slater": "150",
-        "density": "1.738",
-        "dipole_polarizability": "70.89",
-        "electron_negativity": "1.31",
-        "electron_affinity": "2.113227554",
-        "en_allen": "7.646",
-        "en_ghosh": "0.121644",
-        "en_pauling": "1.31",
-        "first_ion_en": "7.646235",
-        "fusion_enthalpy": "8.48",
-        "gs_bandgap": "0",
-        "gs_energy": "-1.54227231",
-        "gs_est_bcc_latcnt": "3.577326635",
-        "gs_est_fcc_latcnt": "4.50714913",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "22.89",
-        "hhi_p": "5300",
-        "hhi_r": "500",
-        "heat_capacity_mass": "1.023",
-        "heat_capacity_molar": "24.869",
-        "icsd_volume": "23.48",
-        "evaporation_heat": "131.8",
-        "heat_of_formation": "147.1",
-        "lattice_constant": "3.21",
-        "mendeleev_number": "73",
-        "melting_point": "922",
-        "molar_volume": "14",
-        "num_unfilled": "0",
-        "num_valence": "2",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "3",
-        "specific_heat": "1.025",
-        "thermal_conductivity": "160",
-        "vdw_radius_simple": "173",
-        "vdw_radius_alvarez": "251",
-        "vdw_radius_mm3": "243",
-        "vdw_radius_uff": "302.1",
-        "sound_velocity": "4602",
-        "Polarizability": "10.6"
-    },
-    {
-        "index": "Al",
-        "atomic_number": "13",
-        "atomic_radius_simple": "143",
-        "atomic_radius_rahm": "239",
-        "atomic_volume": "10",
-        "atomic_weight": "26.9815385",
-        "boiling_point": "2740",
-        "bulk_modulus": "76",
-        "c6_gb": "520",
-        "covalent_radius_cordero": "121",
-        "covalent_radius_pyykko_simple": "126",
-        "covalent_radius_pyykko_double": "113",
-        "covalent_radius_pyykko_triple": "111",
-        "covalent_radius_slater": "125",
-        "density": "2.6989",
-        "dipole_polarizability": "46",
-        "electron_negativity": "1.61",
-        "electron_affinity": "0.43283",
-        "en_allen": "9.539",
-        "en_ghosh": "0.150078",
-        "en_pauling": "1.61",
-        "first_ion_en": "5.985768",
-        "fusion_enthalpy": "10.71",
-        "gs_bandgap": "0",
-        "gs_energy": "-3.74542312",
-        "gs_est_bcc_latcnt": "3.206237833",
-        "gs_est_fcc_latcnt": "4.039606536",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "16.48",
-        "hhi_p": "1600",
-        "hhi_r": "1000",
-        "heat_capacity_mass": "0.897",
-        "heat_capacity_molar": "24.2",
-        "icsd_volume": "16.61",
-        "evaporation_heat": "284.1",
-        "heat_of_formation": "330.9",
-        "lattice_constant": "4.05",
-        "mendeleev_number": "80",
-        "melting_point": "933.5",
-        "molar_volume": "10",
-        "num_unfilled": "5",
-        "num_valence": "3",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "5",
-        "num_p_valence": "1",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "3",
-        "specific_heat": "0.9",
-        "thermal_conductivity": "235",
-        "vdw_radius_simple": "184",
-        "vdw_radius_alvarez": "225",
-        "vdw_radius_mm3": "236",
-        "vdw_radius_uff": "449.9",
-        "sound_velocity": "5100",
-        "Polarizability": "6.8"
-    },
-    {
-        "index": "Si",
-        "atomic_number": "14",
-        "atomic_radius_simple": "132",
-        "atomic_radius_rahm": "232",
-        "atomic_volume": "12.1",
-        "atomic_weight": "28.085",
-        "boiling_point": "2628",
-        "bulk_modulus": "100",
-        "c6_gb": "308",
-        "covalent_radius_cordero": "111",
-        "covalent_radius_pyykko_simple": "116",
-        "covalent_radius_pyykko_double": "107",
-        "covalent_radius_pyykko_triple": "102",
-        "covalent_radius_slater": "110",
-        "density": "2.33",
-        "dipole_polarizability": "37.31",
-        "electron_negativity": "1.9",
-        "electron_affinity": "1.3895211",
-        "en_allen": "11.33",
-        "en_ghosh": "0.178503",
-        "en_pauling": "1.9",
-        "first_ion_en": "8.15168",
-        "fusion_enthalpy": "50.21",
-        "gs_bandgap": "0.773",
-        "gs_energy": "-5.424918005",
-        "gs_est_bcc_latcnt": "3.444849839",
-        "gs_est_fcc_latcnt": "4.340238825",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "20.44",
-        "hhi_p": "4700",
-        "hhi_r": "1000",
-        "heat_capacity_mass": "0.712",
-        "heat_capacity_molar": "19.99",
-        "icsd_volume": "20.02",
-        "evaporation_heat": "383",
-        "heat_of_formation": "450",
-        "lattice_constant": "5.43",
-        "mendeleev_number": "85",
-        "melting_point": "1683",
-        "molar_volume": "12.06",
-        "num_unfilled": "4",
-        "num_valence": "4",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "4",
-        "num_p_valence": "2",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "3",
-        "specific_heat": "0.703",
-        "thermal_conductivity": "150",
-        "vdw_radius_simple": "210",
-        "vdw_radius_alvarez": "219",
-        "vdw_radius_mm3": "229",
-        "vdw_radius_uff": "429.5",
-        "sound_velocity": "2200",
-        "Polarizability": "5.53"
-    },
-    {
-        "index": "P",
-        "atomic_number": "15",
-        "atomic_radius_simple": "128",
-        "atomic_radius_rahm": "223",
-        "atomic_volume": "17",
-        "atomic_weight": "30.973762",
-        "boiling_point": "553",
-        "bulk_modulus": "11",
-        "c6_gb": "187",
-        "covalent_radius_cordero": "107",
-        "covalent_radius_pyykko_simple": "111",
-        "covalent_radius_pyykko_double": "102",
-        "covalent_radius_pyykko_triple": "94",
-        "covalent_radius_slater": "100",
-        "density": "1.82",
-        "dipole_polarizability": "24.93",
-        "electron_negativity": "2.19",
-        "electron_affinity": "0.746607",
-        "en_allen": "13.33",
-        "en_ghosh": "0.206931",
-        "en_pauling": "2.19",
-        "first_ion_en": "10.48669",
-        "fusion_enthalpy": "18.54",
-        "gs_bandgap": "1.625",
-        "gs_energy": "-5.400509043",
-        "gs_est_bcc_latcnt": "3.560590636",
-        "gs_est_fcc_latcnt": "4.486063093",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "22.5702381",
-        "hhi_p": "2000",
-        "hhi_r": "5100",
-        "heat_capacity_mass": "0.769",
-        "heat_capacity_molar": "23.824",
-        "icsd_volume": "18.99",
-        "evaporation_heat": "49.8",
-        "heat_of_formation": "316.5",
-        "lattice_constant": "7.17",
-        "mendeleev_number": "90",
-        "melting_point": "317.3",
-        "molar_volume": "17.02",
-        "num_unfilled": "3",
-        "num_valence": "5",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "3",
-        "num_p_valence": "3",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "3",
-        "specific_heat": "0.757",
-        "thermal_conductivity": "0.236",
-        "vdw_radius_simple": "180",
-        "vdw_radius_alvarez": "190",
-        "vdw_radius_mm3": "222",
-        "vdw_radius_uff": "414.7",
-        "sound_velocity": "4050.74287",
-        "Polarizability": "3.63"
-    },
-    {
-        "index": "S",
-        "atomic_number": "16",
-        "atomic_radius_simple": "127",
-        "atomic_radius_rahm": "214",
-        "atomic_volume": "15.5",
-        "atomic_weight": "32.06",
-        "boiling_point": "717.824",
-        "bulk_modulus": "7.7",
-        "c6_gb": "140",
-        "covalent_radius_cordero": "105",
-        "covalent_radius_pyykko_simple": "103",
-        "covalent_radius_pyykko_double": "94",
-        "covalent_radius_pyykko_triple": "95",
-        "covalent_radius_slater": "100",
-        "density": "2.07",
-        "dipole_polarizability": "24.93",
-        "electron_negativity": "2.58",
-        "electron_affinity": "2.07710403",
-        "en_allen": "15.31",
-        "en_ghosh": "0.23596",
-        "en_pauling": "2.58",
-        "first_ion_en": "10.36001",
-        "fusion_enthalpy": "1.721",
-        "gs_bandgap": "2.202",
-        "gs_energy": "-4.097216719",
-        "gs_est_bcc_latcnt": "3.722284555",
-        "gs_est_fcc_latcnt": "4.689784664",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "25.786875",
-        "hhi_p": "700",
-        "hhi_r": "1000",
-        "heat_capacity_mass": "0.708",
-        "heat_capacity_molar": "22.7",
-        "icsd_volume": "25.76",
-        "evaporation_heat": "10.5",
-        "heat_of_formation": "277.17",
-        "lattice_constant": "10.47",
-        "mendeleev_number": "94",
-        "melting_point": "386",
-        "molar_volume": "15.53",
-        "num_unfilled": "2",
-        "num_valence": "6",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "2",
-        "num_p_valence": "4",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "3",
-        "specific_heat": "0.732",
-        "thermal_conductivity": "0.205",
-        "vdw_radius_simple": "180",
-        "vdw_radius_alvarez": "189",
-        "vdw_radius_mm3": "215",
-        "vdw_radius_uff": "403.5",
-        "sound_velocity": "3826.473598",
-        "Polarizability": "2.9"
-    },
-    {
-        "index": "Cl",
-        "atomic_number": "17",
-        "atomic_radius_simple": "147.3538174",
-        "atomic_radius_rahm": "206",
-        "atomic_volume": "18.7",
-        "atomic_weight": "35.45",
-        "boiling_point": "238.6",
-        "bulk_modulus": "1.1",
-        "c6_gb": "97.1",
-        "covalent_radius_cordero": "102",
-        "covalent_radius_pyykko_simple": "99",
-        "covalent_radius_pyykko_double": "95",
-        "covalent_radius_pyykko_triple": "93",
-        "covalent_radius_slater": "100",
-        "density": "1.56",
-        "dipole_polarizability": "24.93",
-        "electron_negativity": "3.16",
-        "electron_affinity": "3.612725",
-        "en_allen": "16.97",
-        "en_ghosh": "0.263803",
-        "en_pauling": "3.16",
-        "first_ion_en": "12.96763",
-        "fusion_enthalpy": "3.2",
-        "gs_bandgap": "2.493",
-        "gs_energy": "-1.784433755",
-        "gs_est_bcc_latcnt": "3.65918124",
-        "gs_est_fcc_latcnt": "4.610279469",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "24.4975",
-        "hhi_p": "1500",
-        "hhi_r": "1000",
-        "heat_capacity_mass": "0.479",
-        "heat_capacity_molar": "33.949",
-        "icsd_volume": "29.05",
-        "evaporation_heat": "20.41",
-        "heat_of_formation": "121.302",
-        "lattice_constant": "6.24",
-        "mendeleev_number": "99",
-        "melting_point": "172.2",
-        "molar_volume": "17.39",
-        "num_unfilled": "1",
-        "num_valence": "7",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "1",
-        "num_p_valence": "5",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "3",
-        "specific_heat": "0.740457626",
-        "thermal_conductivity": "0.0089",
-        "vdw_radius_simple": "175",
-        "vdw_radius_alvarez": "182",
-        "vdw_radius_mm3": "207",
-        "vdw_radius_uff": "394.7",
-        "sound_velocity": "206",
-        "Polarizability": "2.18"
-    },
-    {
-        "index": "Ar",
-        "atomic_number": "18",
-        "atomic_radius_simple": "149.3998375",
-        "atomic_radius_rahm": "197",
-        "atomic_volume": "24.2",
-        "atomic_weight": "39.948",
-        "boiling_point": "87.3",
-        "bulk_modulus": "72.15428491",
-        "c6_gb": "67.4",
-        "covalent_radius_cordero": "106",
-        "covalent_radius_pyykko_simple": "96",
-        "covalent_radius_pyykko_double": "107",
-        "covalent_radius_pyykko_triple": "96",
-        "covalent_radius_slater": "134.2557951",
-        "density": "1.4",
-        "dipole_polarizability": "11.07",
-        "electron_negativity": "3.24",
-        "electron_affinity": "-11.5",
-        "en_allen": "19.17",
-        "en_ghosh": "0.2922",
-        "en_pauling": "2.282596121",
-        "first_ion_en": "15.75961",
-        "fusion_enthalpy": "1.18",
-        "gs_bandgap": "9.26",
-        "gs_energy": "0.05854104",
-        "gs_est_bcc_latcnt": "3.850300758",
-        "gs_est_fcc_latcnt": "4.851074973",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "28.54",
-        "hhi_p": "3276.130415",
-        "hhi_r": "3884.79588",
-        "heat_capacity_mass": "0.52",
-        "heat_capacity_molar": "20.786",
-        "icsd_volume": "36.3",
-        "evaporation_heat": "6.52",
-        "heat_of_formation": "119.7446468",
-        "lattice_constant": "5.26",
-        "mendeleev_number": "3",
-        "melting_point": "83.8",
-        "molar_volume": "22.56",
-        "num_unfilled": "0",
-        "num_valence": "8",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "6",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "3",
-        "specific_heat": "0.138",
-        "thermal_conductivity": "0.01772",
-        "vdw_radius_simple": "188",
-        "vdw_radius_alvarez": "194",
-        "vdw_radius_mm3": "199",
-        "vdw_radius_uff": "386.8",
-        "sound_velocity": "319",
-        "Polarizability": "1.6411"
-    },
-    {
-        "index": "K",
-        "atomic_number": "19",
-        "atomic_radius_simple": "235",
-        "atomic_radius_rahm": "234",
-        "atomic_volume": "45.3",
-        "atomic_weight": "39.0983",
-        "boiling_point": "1047",
-        "bulk_modulus": "3.1",
-        "c6_gb": "3910",
-        "covalent_radius_cordero": "203",
-        "covalent_radius_pyykko_simple": "196",
-        "covalent_radius_pyykko_double": "193",
-        "covalent_radius_pyykko_triple": "137.2350503",
-        "covalent_radius_slater": "220",
-        "density": "0.856",
-        "dipole_polarizability": "290.6",
-        "electron_negativity": "0.82",
-        "electron_affinity": "0.50147",
-        "en_allen": "4.34",
-        "en_ghosh": "0.0981896",
-        "en_pauling": "0.82",
-        "first_ion_en": "4.3406633",
-        "fusion_enthalpy": "2.335",
-        "gs_bandgap": "0",
-        "gs_energy": "-1.097539713",
-        "gs_est_bcc_latcnt": "5.268200874",
-        "gs_est_fcc_latcnt": "6.637517176",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "73.10666667",
-        "hhi_p": "1700",
-        "hhi_r": "7200",
-        "heat_capacity_mass": "0.757",
-        "heat_capacity_molar": "29.6",
-        "icsd_volume": "75.63",
-        "evaporation_heat": "2.33",
-        "heat_of_formation": "89",
-        "lattice_constant": "5.23",
-        "mendeleev_number": "10",
-        "melting_point": "336.8",
-        "molar_volume": "45.94",
-        "num_unfilled": "1",
-        "num_valence": "1",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "1",
-        "num_s_valence": "1",
-        "period": "4",
-        "specific_heat": "0.753",
-        "thermal_conductivity": "100",
-        "vdw_radius_simple": "275",
-        "vdw_radius_alvarez": "273",
-        "vdw_radius_mm3": "309",
-        "vdw_radius_uff": "381.2",
-        "sound_velocity": "2000",
-        "Polarizability": "43.06"
-    },
-    {
-        "index": "Ca",
-        "atomic_number": "20",
-        "atomic_radius_simple": "197",
-        "atomic_radius_rahm": "270",
-        "atomic_volume": "29.9",
-        "atomic_weight": "40.078",
-        "boiling_point": "1757",
-        "bulk_modulus": "17",
-        "c6_gb": "2230",
-        "covalent_radius_cordero": "176",
-        "covalent_radius_pyykko_simple": "171",
-        "covalent_radius_pyykko_double": "147",
-        "covalent_radius_pyykko_triple": "133",
-        "covalent_radius_slater": "180",
-        "density": "1.55",
-        "dipole_polarizability": "169",
-        "electron_negativity": "1",
-        "electron_affinity": "0.02455",
-        "en_allen": "6.113",
-        "en_ghosh": "0.1154119",
-        "en_pauling": "1",
-        "first_ion_en": "6.11316",
-        "fusion_enthalpy": "8.54",
-        "gs_bandgap": "0",
-        "gs_energy": "-1.948329565",
-        "gs_est_bcc_latcnt": "4.227260324",
-        "gs_est_fcc_latcnt": "5.326014266",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "37.77",
-        "hhi_p": "3900",
-        "hhi_r": "1500",
-        "heat_capacity_mass": "0.647",
-        "heat_capacity_molar": "25.929",
-        "icsd_volume": "44.19",
-        "evaporation_heat": "153.6",
-        "heat_of_formation": "177.8",
-        "lattice_constant": "5.58",
-        "mendeleev_number": "16",
-        "melting_point": "1112",
-        "molar_volume": "26.2",
-        "num_unfilled": "0",
-        "num_valence": "2",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "4",
-        "specific_heat": "0.653",
-        "thermal_conductivity": "200",
-        "vdw_radius_simple": "231",
-        "vdw_radius_alvarez": "262",
-        "vdw_radius_mm3": "281",
-        "vdw_radius_uff": "339.9",
-        "sound_velocity": "3810",
-        "Polarizability": "25"
-    },
-    {
-        "index": "Sc",
-        "atomic_number": "21",
-        "atomic_radius_simple": "162",
-        "atomic_radius_rahm": "263",
-        "atomic_volume": "15",
-        "atomic_weight": "44.955908",
-        "boiling_point": "3104",
-        "bulk_modulus": "57",
-        "c6_gb": "1570",
-        "covalent_radius_cordero": "170",
-        "covalent_radius_pyykko_simple": "148",
-        "covalent_radius_pyykko_double": "116",
-        "covalent_radius_pyykko_triple": "114",
-        "covalent_radius_slater": "160",
-        "density": "2.99",
-        "dipole_polarizability": "142.28",
-        "electron_negativity": "1.36",
-        "electron_affinity": "0.188",
-        "en_allen": "7.042",
-        "en_ghosh": "0.1193833",
-        "en_pauling": "1.36",
-        "first_ion_en": "6.56149",
-        "fusion_enthalpy": "14.1",
-        "gs_bandgap": "0",
-        "gs_energy": "-6.28551309",
-        "gs_est_bcc_latcnt": "3.542874021",
-        "gs_est_fcc_latcnt": "4.463741557",
-        "gs_mag_moment": "0.00000635",
-        "gs_volume_per": "22.235",
-        "hhi_p": "5500",
-        "hhi_r": "4500",
-        "heat_capacity_mass": "0.568",
-        "heat_capacity_molar": "25.52",
-        "icsd_volume": "24.96",
-        "evaporation_heat": "332.7",
-        "heat_of_formation": "377.8",
-        "lattice_constant": "3.31",
-        "mendeleev_number": "19",
-        "melting_point": "1814",
-        "molar_volume": "15",
-        "num_unfilled": "9",
-        "num_valence": "3",
-        "num_d_unfilled": "9",
-        "num_d_valence": "1",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "4",
-        "specific_heat": "0.556",
-        "thermal_conductivity": "16",
-        "vdw_radius_simple": "215",
-        "vdw_radius_alvarez": "258",
-        "vdw_radius_mm3": "261",
-        "vdw_radius_uff": "329.5",
-        "sound_velocity": "5050.913351",
-        "Polarizability": "17.8"
-    },
-    {
-        "index": "Ti",
-        "atomic_number": "22",
-        "atomic_radius_simple": "147",
-        "atomic_radius_rahm": "257",
-        "atomic_volume": "10.6",
-        "atomic_weight": "47.867",
-        "boiling_point": "3560",
-        "bulk_modulus": "110",
-        "c6_gb": "1200",
-        "covalent_radius_cordero": "160",
-        "covalent_radius_pyykko_simple": "136",
-        "covalent_radius_pyykko_double": "117",
-        "covalent_radius_pyykko_triple": "108",
-        "covalent_radius_slater": "140",
-        "density": "4.54",
-        "dipole_polarizability": "114.34",
-        "electron_negativity": "1.54",
-        "electron_affinity": "0.079",
-        "en_allen": "8.17",
-        "en_ghosh": "0.1233637",
-        "en_pauling": "1.54",
-        "first_ion_en": "6.82812",
-        "fusion_enthalpy": "14.15",
-        "gs_bandgap": "0",
-        "gs_energy": "-7.77522712",
-        "gs_est_bcc_latcnt": "3.219799121",
-        "gs_est_fcc_latcnt": "4.056692689",
-        "gs_mag_moment": "0.0000225",
-        "gs_volume_per": "16.69",
-        "hhi_p": "1100",
-        "hhi_r": "1600",
-        "heat_capacity_mass": "0.524",
-        "heat_capacity_molar": "25.06",
-        "icsd_volume": "17.67",
-        "evaporation_heat": "422.6",
-        "heat_of_formation": "473",
-        "lattice_constant": "2.95",
-        "mendeleev_number": "51",
-        "melting_point": "1933",
-        "molar_volume": "10.64",
-        "num_unfilled": "8",
-        "num_valence": "4",
-        "num_d_unfilled": "8",
-        "num_d_valence": "2",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "4",
-        "specific_heat": "0.523",
-        "thermal_conductivity": "22",
-        "vdw_radius_simple": "211",
-        "vdw_radius_alvarez": "246",
-        "vdw_radius_mm3": "239",
-        "vdw_radius_uff": "317.5",
-        "sound_velocity": "4140",
-        "Polarizability": "14.6"
-    },
-    {
-        "index": "V",
-        "atomic_number": "23",
-        "atomic_radius_simple": "134",
-        "atomic_radius_rahm": "252",
-        "atomic_volume": "8.35",
-        "atomic_weight": "50.9415",
-        "boiling_point": "3650",
-        "bulk_modulus": "160",
-        "c6_gb": "955",
-        "covalent_radius_cordero": "153",
-        "covalent_radius_pyykko_simple": "134",
-        "covalent_radius_pyykko_double": "112",
-        "covalent_radius_pyykko_triple": "106",
-        "covalent_radius_slater": "135",
-        "density": "6.11",
-        "dipole_polarizability": "97.34",
-        "electron_negativity": "1.63",
-        "electron_affinity": "0.525",
-        "en_allen": "9.063",
-        "en_ghosh": "0.1273344",
-        "en_pauling": "1.63",
-        "first_ion_en": "6.74619",
-        "fusion_enthalpy": "21.5",
-        "gs_bandgap": "0",
-        "gs_energy": "-8.93926069",
-        "gs_est_bcc_latcnt": "2.963255488",
-        "gs_est_fcc_latcnt": "3.733467966",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "13.01",
-        "hhi_p": "3300",
-        "hhi_r": "3400",
-        "heat_capacity_mass": "0.489",
-        "heat_capacity_molar": "24.89",
-        "icsd_volume": "13.88",
-        "evaporation_heat": "460",
-        "heat_of_formation": "515.5",
-        "lattice_constant": "3.02",
-        "mendeleev_number": "54",
-        "melting_point": "2160",
-        "molar_volume": "8.32",
-        "num_unfilled": "7",
-        "num_valence": "5",
-        "num_d_unfilled": "7",
-        "num_d_valence": "3",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "4",
-        "specific_heat": "0.485",
-        "thermal_conductivity": "31",
-        "vdw_radius_simple": "207",
-        "vdw_radius_alvarez": "242",
-        "vdw_radius_mm3": "229",
-        "vdw_radius_uff": "314.4",
-        "sound_velocity": "4560",
-        "Polarizability": "12.4"
-    },
-    {
-        "index": "Cr",
-        "atomic_number": "24",
-        "atomic_radius_simple": "130",
-        "atomic_radius_rahm": "233",
-        "atomic_volume": "7.23",
-        "atomic_weight": "51.9961",
-        "boiling_point": "2945",
-        "bulk_modulus": "160",
-        "c6_gb": "709",
-        "covalent_radius_cordero": "139",
-        "covalent_radius_pyykko_simple": "122",
-        "covalent_radius_pyykko_double": "111",
-        "covalent_radius_pyykko_triple": "103",
-        "covalent_radius_slater": "140",
-        "density": "7.18",
-        "dipole_polarizability": "78.4",
-        "electron_negativity": "1.66",
-        "electron_affinity": "0.666",
-        "en_allen": "9.77",
-        "en_ghosh": "0.1313053",
-        "en_pauling": "1.66",
-        "first_ion_en": "6.76651",
-        "fusion_enthalpy": "21",
-        "gs_bandgap": "0",
-        "gs_energy": "-9.50571654",
-        "gs_est_bcc_latcnt": "2.818080279",
-        "gs_est_fcc_latcnt": "3.550558664",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "11.19",
-        "hhi_p": "3100",
-        "hhi_r": "4100",
-        "heat_capacity_mass": "0.449",
-        "heat_capacity_molar": "23.35",
-        "icsd_volume": "12.01",
-        "evaporation_heat": "342",
-        "heat_of_formation": "397.48",
-        "lattice_constant": "2.88",
-        "mendeleev_number": "57",
-        "melting_point": "2130",
-        "molar_volume": "7.23",
-        "num_unfilled": "6",
-        "num_valence": "6",
-        "num_d_unfilled": "5",
-        "num_d_valence": "5",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "1",
-        "num_s_valence": "1",
-        "period": "4",
-        "specific_heat": "0.488",
-        "thermal_conductivity": "94",
-        "vdw_radius_simple": "206",
-        "vdw_radius_alvarez": "245",
-        "vdw_radius_mm3": "225",
-        "vdw_radius_uff": "302.3",
-        "sound_velocity": "5940",
-        "Polarizability": "11.6"
-    },
-    {
-        "index": "Mn",
-        "atomic_number": "25",
-        "atomic_radius_simple": "135",
-        "atomic_radius_rahm": "242",
-        "atomic_volume": "7.39",
-        "atomic_weight": "54.938044",
-        "boiling_point": "2235",
-        "bulk_modulus": "120",
-        "c6_gb": "635",
-        "covalent_radius_cordero": "150",
-        "covalent_radius_pyykko_simple": "119",
-        "covalent_radius_pyykko_double": "105",
-        "covalent_radius_pyykko_triple": "103",
-        "covalent_radius_slater": "140",
-        "density": "7.21",
-        "dipole_polarizability": "66.8",
-        "electron_negativity": "1.55",
-        "electron_affinity": "2.57003082",
-        "en_allen": "10.34",
-        "en_ghosh": "0.1352844",
-        "en_pauling": "1.55",
-        "first_ion_en": "7.43402",
-        "fusion_enthalpy": "12.91",
-        "gs_bandgap": "0",
-        "gs_energy": "-9.02056525",
-        "gs_est_bcc_latcnt": "2.757836487",
-        "gs_est_fcc_latcnt": "3.474656242",
-        "gs_mag_moment": "0.000310121",
-        "gs_volume_per": "10.48758621",
-        "hhi_p": "1600",
-        "hhi_r": "1800",
-        "heat_capacity_mass": "0.479",
-        "heat_capacity_molar": "26.32",
-        "icsd_volume": "12.2",
-        "evaporation_heat": "221",
-        "heat_of_formation": "283.3",
-        "lattice_constant": "8.89",
-        "mendeleev_number": "60",
-        "melting_point": "1517",
-        "molar_volume": "7.35",
-        "num_unfilled": "5",
-        "num_valence": "7",
-        "num_d_unfilled": "5",
-        "num_d_valence": "5",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "4",
-        "specific_heat": "0.477",
-        "thermal_conductivity": "7.8",
-        "vdw_radius_simple": "205",
-        "vdw_radius_alvarez": "245",
-        "vdw_radius_mm3": "224",
-        "vdw_radius_uff": "296.1",
-        "sound_velocity": "5150",
-        "Polarizability": "9.4"
-    },
-    {
-        "index": "Fe",
-        "atomic_number": "26",
-        "atomic_radius_simple": "126",
-        "atomic_radius_rahm": "226",
-        "atomic_volume": "7.1",
-        "atomic_weight": "55.845",
-        "boiling_point": "3023",
-        "bulk_modulus": "170",
-        "c6_gb": "548",
-        "covalent_radius_cordero": "142",
-        "covalent_radius_pyykko_simple": "116",
-        "covalent_radius_pyykko_double": "109",
-        "covalent_radius_pyykko_triple": "102",
-        "covalent_radius_slater": "140",
-        "density": "7.874",
-        "dipole_polarizability": "63.93",
-        "electron_negativity": "1.83",
-        "electron_affinity": "0.151",
-        "en_allen": "10.64",
-        "en_ghosh": "0.1392532",
-        "en_pauling": "1.83",
-        "first_ion_en": "7.9024",
-        "fusion_enthalpy": "13.81",
-        "gs_bandgap": "0",
-        "gs_energy": "-8.28548436",
-        "gs_est_bcc_latcnt": "2.778923379",
-        "gs_est_fcc_latcnt": "3.501224062",
-        "gs_mag_moment": "2.1106628",
-        "gs_volume_per": "10.73",
-        "hhi_p": "2400",
-        "hhi_r": "1400",
-        "heat_capacity_mass": "0.449",
-        "heat_capacity_molar": "25.1",
-        "icsd_volume": "11.78",
-        "evaporation_heat": "340",
-        "heat_of_formation": "415.5",
-        "lattice_constant": "2.87",
-        "mendeleev_number": "61",
-        "melting_point": "1808",
-        "molar_volume": "7.09",
-        "num_unfilled": "4",
-        "num_valence": "8",
-        "num_d_unfilled": "4",
-        "num_d_valence": "6",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "4",
-        "specific_heat": "0.443",
-        "thermal_conductivity": "80",
-        "vdw_radius_simple": "204",
-        "vdw_radius_alvarez": "244",
-        "vdw_radius_mm3": "223",
-        "vdw_radius_uff": "291.2",
-        "sound_velocity": "4910",
-        "Polarizability": "8.4"
-    },
-    {
-        "index": "Co",
-        "atomic_number": "27",
-        "atomic_radius_simple": "125",
-        "atomic_radius_rahm": "222",
-        "atomic_volume": "6.7",
-        "atomic_weight": "58.933194",
-        "boiling_point": "3143",
-        "bulk_modulus": "180",
-        "c6_gb": "461",
-        "covalent_radius_cordero": "138",
-        "covalent_radius_pyykko_simple": "111",
-        "covalent_radius_pyykko_double": "103",
-        "covalent_radius_pyykko_triple": "96",
-        "covalent_radius_slater": "135",
-        "density": "8.9",
-        "dipole_polarizability": "57.71",
-        "electron_negativity": "1.88",
-        "electron_affinity": "0.66225646",
-        "en_allen": "10.86",
-        "en_ghosh": "0.1432363",
-        "en_pauling": "1.88",
-        "first_ion_en": "7.88101",
-        "fusion_enthalpy": "16.2",
-        "gs_bandgap": "0",
-        "gs_energy": "-7.080389145",
-        "gs_est_bcc_latcnt": "2.736406748",
-        "gs_est_fcc_latcnt": "3.447656463",
-        "gs_mag_moment": "1.5484712",
-        "gs_volume_per": "10.245",
-        "hhi_p": "3100",
-        "hhi_r": "2700",
-        "heat_capacity_mass": "0.421",
-        "heat_capacity_molar": "24.81",
-        "icsd_volume": "11.12",
-        "evaporation_heat": "389.1",
-        "heat_of_formation": "426.7",
-        "lattice_constant": "2.51",
-        "mendeleev_number": "64",
-        "melting_point": "1768",
-        "molar_volume": "6.67",
-        "num_unfilled": "3",
-        "num_valence": "9",
-        "num_d_unfilled": "3",
-        "num_d_valence": "7",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "4",
-        "specific_heat": "0.456",
-        "thermal_conductivity": "100",
-        "vdw_radius_simple": "200",
-        "vdw_radius_alvarez": "240",
-        "vdw_radius_mm3": "223",
-        "vdw_radius_uff": "287.2",
-        "sound_velocity": "4720",
-        "Polarizability": "7.5"
-    },
-    {
-        "index": "Ni",
-        "atomic_number": "28",
-        "atomic_radius_simple": "124",
-        "atomic_radius_rahm": "219",
-        "atomic_volume": "6.6",
-        "atomic_weight": "58.6934",
-        "boiling_point": "3005",
-        "bulk_modulus": "180",
-        "c6_gb": "393",
-        "covalent_radius_cordero": "124",
-        "covalent_radius_pyykko_simple": "110",
-        "covalent_radius_pyykko_double": "101",
-        "covalent_radius_pyykko_triple": "101",
-        "covalent_radius_slater": "135",
-        "density": "8.902",
-        "dipole_polarizability": "51.1",
-        "electron_negativity": "1.91",
-        "electron_affinity": "1.156",
-        "en_allen": "11.13",
-        "en_ghosh": "0.1472068",
-        "en_pauling": "1.91",
-        "first_ion_en": "7.6398",
-        "fusion_enthalpy": "17.48",
-        "gs_bandgap": "0",
-        "gs_energy": "-5.54632457",
-        "gs_est_bcc_latcnt": "2.74306794",
-        "gs_est_fcc_latcnt": "3.456049039",
-        "gs_mag_moment": "0.5953947",
-        "gs_volume_per": "10.32",
-        "hhi_p": "1000",
-        "hhi_r": "1500",
-        "heat_capacity_mass": "0.444",
-        "heat_capacity_molar": "26.07",
-        "icsd_volume": "10.86",
-        "evaporation_heat": "378.6",
-        "heat_of_formation": "430.1",
-        "lattice_constant": "3.52",
-        "mendeleev_number": "67",
-        "melting_point": "1726",
-        "molar_volume": "6.59",
-        "num_unfilled": "2",
-        "num_valence": "10",
-        "num_d_unfilled": "2",
-        "num_d_valence": "8",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "4",
-        "specific_heat": "0.443",
-        "thermal_conductivity": "91",
-        "vdw_radius_simple": "197",
-        "vdw_radius_alvarez": "240",
-        "vdw_radius_mm3": "222",
-        "vdw_radius_uff": "283.4",
-        "sound_velocity": "4970",
-        "Polarizability": "6.8"
-    },
-    {
-        "index": "Cu",
-        "atomic_number": "29",
-        "atomic_radius_simple": "128",
-        "atomic_radius_rahm": "217",
-        "atomic_volume": "7.1",
-        "atomic_weight": "63.546",
-        "boiling_point": "2840",
-        "bulk_modulus": "140",
-        "c6_gb": "264",
-        "covalent_radius_cordero": "132",
-        "covalent_radius_pyykko_simple": "112",
-        "covalent_radius_pyykko_double": "115",
-        "covalent_radius_pyykko_triple": "120",
-        "covalent_radius_slater": "135",
-        "density": "8.96",
-        "dipole_polarizability": "46.5",
-        "electron_negativity": "1.9",
-        "electron_affinity": "1.235",
-        "en_allen": "10.96",
-        "en_ghosh": "0.1511716",
-        "en_pauling": "1.9",
-        "first_ion_en": "7.72638",
-        "fusion_enthalpy": "13.6",
-        "gs_bandgap": "0",
-        "gs_energy": "-3.68065482",
-        "gs_est_bcc_latcnt": "2.807970487",
-        "gs_est_fcc_latcnt": "3.537821124",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "11.07",
-        "hhi_p": "1600",
-        "hhi_r": "1500",
-        "heat_capacity_mass": "0.385",
-        "heat_capacity_molar": "24.44",
-        "icsd_volume": "11.81",
-        "evaporation_heat": "304.6",
-        "heat_of_formation": "337.4",
-        "lattice_constant": "3.61",
-        "mendeleev_number": "72",
-        "melting_point": "1356.6",
-        "molar_volume": "7.11",
-        "num_unfilled": "1",
-        "num_valence": "11",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "1",
-        "num_s_valence": "1",
-        "period": "4",
-        "specific_heat": "0.385",
-        "thermal_conductivity": "400",
-        "vdw_radius_simple": "196",
-        "vdw_radius_alvarez": "238",
-        "vdw_radius_mm3": "226",
-        "vdw_radius_uff": "349.5",
-        "sound_velocity": "3570",
-        "Polarizability": "6.2"
-    },
-    {
-        "index": "Zn",
-        "atomic_number": "30",
-        "atomic_radius_simple": "138",
-        "atomic_radius_rahm": "222",
-        "atomic_volume": "9.2",
-        "atomic_weight": "65.38",
-        "boiling_point": "1180",
-        "bulk_modulus": "70",
-        "c6_gb": "276",
-        "covalent_radius_cordero": "122",
-        "covalent_radius_pyykko_simple": "118",
-        "covalent_radius_pyykko_double": "120",
-        "covalent_radius_pyykko_triple": "102.3061846",
-        "covalent_radius_slater": "135",
-        "density": "7.133",
-        "dipole_polarizability": "38.8",
-        "electron_negativity": "1.65",
-        "electron_affinity": "2.319978597",
-        "en_allen": "9.395",
-        "en_ghosh": "0.1551518",
-        "en_pauling": "1.65",
-        "first_ion_en": "9.394199",
-        "fusion_enthalpy": "7.068",
-        "gs_bandgap": "0",
-        "gs_energy": "-1.239999915",
-        "gs_est_bcc_latcnt": "3.033694224",
-        "gs_est_fcc_latcnt": "3.822215211",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "13.96",
-        "hhi_p": "1600",
-        "hhi_r": "1900",
-        "heat_capacity_mass": "0.388",
-        "heat_capacity_molar": "25.39",
-        "icsd_volume": "15.19",
-        "evaporation_heat": "114.8",
-        "heat_of_formation": "130.4",
-        "lattice_constant": "2.66",
-        "mendeleev_number": "76",
-        "melting_point": "692.73",
-        "molar_volume": "9.16",
-        "num_unfilled": "0",
-        "num_valence": "12",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "4",
-        "specific_heat": "0.388",
-        "thermal_conductivity": "120",
-        "vdw_radius_simple": "201",
-        "vdw_radius_alvarez": "239",
-        "vdw_radius_mm3": "229",
-        "vdw_radius_uff": "276.3",
-        "sound_velocity": "3700",
-        "Polarizability": "5.75"
-    },
-    {
-        "index": "Ga",
-        "atomic_number": "31",
-        "atomic_radius_simple": "141",
-        "atomic_radius_rahm": "233",
-        "atomic_volume": "11.8",
-        "atomic_weight": "69.723",
-        "boiling_point": "2676",
-        "bulk_modulus": "82.41715774",
-        "c6_gb": "456",
-        "covalent_radius_cordero": "122",
-        "covalent_radius_pyykko_simple": "124",
-        "covalent_radius_pyykko_double": "117",
-        "covalent_radius_pyykko_triple": "121",
-        "covalent_radius_slater": "130",
-        "density": "5.91",
-        "dipole_polarizability": "49.9",
-        "electron_negativity": "1.81",
-        "electron_affinity": "0.43",
-        "en_allen": "10.39",
-        "en_ghosh": "0.1723773",
-        "en_pauling": "1.81",
-        "first_ion_en": "5.999301",
-        "fusion_enthalpy": "5.585",
-        "gs_bandgap": "0",
-        "gs_energy": "-3.012255303",
-        "gs_est_bcc_latcnt": "3.353549368",
-        "gs_est_fcc_latcnt": "4.225207441",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "18.8575",
-        "hhi_p": "5500",
-        "hhi_r": "1900",
-        "heat_capacity_mass": "0.373",
-        "heat_capacity_molar": "26.03",
-        "icsd_volume": "19.6",
-        "evaporation_heat": "270.3",
-        "heat_of_formation": "271.96",
-        "lattice_constant": "4.51",
-        "mendeleev_number": "81",
-        "melting_point": "302.93",
-        "molar_volume": "11.8",
-        "num_unfilled": "5",
-        "num_valence": "13",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "5",
-        "num_p_valence": "1",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "4",
-        "specific_heat": "0.372",
-        "thermal_conductivity": "29",
-        "vdw_radius_simple": "187",
-        "vdw_radius_alvarez": "232",
-        "vdw_radius_mm3": "246",
-        "vdw_radius_uff": "438.3",
-        "sound_velocity": "2740",
-        "Polarizability": "8.12"
-    },
-    {
-        "index": "Ge",
-        "atomic_number": "32",
-        "atomic_radius_simple": "137",
-        "atomic_radius_rahm": "234",
-        "atomic_volume": "13.6",
-        "atomic_weight": "72.63",
-        "boiling_point": "3103",
-        "bulk_modulus": "96.5379387",
-        "c6_gb": "365",
-        "covalent_radius_cordero": "120",
-        "covalent_radius_pyykko_simple": "121",
-        "covalent_radius_pyykko_double": "111",
-        "covalent_radius_pyykko_triple": "114",
-        "covalent_radius_slater": "125",
-        "density": "5.323",
-        "dipole_polarizability": "39.43",
-        "electron_negativity": "2.01",
-        "electron_affinity": "1.232712",
-        "en_allen": "11.8",
-        "en_ghosh": "0.1895892",
-        "en_pauling": "2.01",
-        "first_ion_en": "7.89943",
-        "fusion_enthalpy": "36.94",
-        "gs_bandgap": "0.383",
-        "gs_energy": "-4.616039545",
-        "gs_est_bcc_latcnt": "3.583307493",
-        "gs_est_fcc_latcnt": "4.514684539",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "23.005",
-        "hhi_p": "5300",
-        "hhi_r": "1900",
-        "heat_capacity_mass": "0.32",
-        "heat_capacity_molar": "23.222",
-        "icsd_volume": "22.23",
-        "evaporation_heat": "328",
-        "heat_of_formation": "372",
-        "lattice_constant": "5.66",
-        "mendeleev_number": "84",
-        "melting_point": "1210.6",
-        "molar_volume": "13.63",
-        "num_unfilled": "4",
-        "num_valence": "14",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "4",
-        "num_p_valence": "2",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "4",
-        "specific_heat": "0.322",
-        "thermal_conductivity": "60",
-        "vdw_radius_simple": "211",
-        "vdw_radius_alvarez": "229",
-        "vdw_radius_mm3": "244",
-        "vdw_radius_uff": "428",
-        "sound_velocity": "5400",
-        "Polarizability": "5.84"
-    },
-    {
-        "index": "As",
-        "atomic_number": "33",
-        "atomic_radius_simple": "139",
-        "atomic_radius_rahm": "231",
-        "atomic_volume": "13.1",
-        "atomic_weight": "74.921595",
-        "boiling_point": "876",
-        "bulk_modulus": "22",
-        "c6_gb": "260",
-        "covalent_radius_cordero": "119",
-        "covalent_radius_pyykko_simple": "121",
-        "covalent_radius_pyykko_double": "114",
-        "covalent_radius_pyykko_triple": "106",
-        "covalent_radius_slater": "115",
-        "density": "5.73",
-        "dipole_polarizability": "29.8",
-        "electron_negativity": "2.18",
-        "electron_affinity": "0.804",
-        "en_allen": "13.08",
-        "en_ghosh": "0.2068208",
-        "en_pauling": "2.18",
-        "first_ion_en": "9.7886",
-        "fusion_enthalpy": "24.44",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.650889115",
-        "gs_est_bcc_latcnt": "3.539684396",
-        "gs_est_fcc_latcnt": "4.459722881",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "22.175",
-        "hhi_p": "3300",
-        "hhi_r": "4000",
-        "heat_capacity_mass": "0.329",
-        "heat_capacity_molar": "24.64",
-        "icsd_volume": "21.52",
-        "evaporation_heat": "32.4",
-        "heat_of_formation": "302.5",
-        "lattice_constant": "4.13",
-        "mendeleev_number": "89",
-        "melting_point": "1090",
-        "molar_volume": "12.95",
-        "num_unfilled": "3",
-        "num_valence": "15",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "3",
-        "num_p_valence": "3",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "4",
-        "specific_heat": "0.328",
-        "thermal_conductivity": "50",
-        "vdw_radius_simple": "185",
-        "vdw_radius_alvarez": "188",
-        "vdw_radius_mm3": "236",
-        "vdw_radius_uff": "423",
-        "sound_velocity": "3638.678266",
-        "Polarizability": "4.31"
-    },
-    {
-        "index": "Se",
-        "atomic_number": "34",
-        "atomic_radius_simple": "140",
-        "atomic_radius_rahm": "224",
-        "atomic_volume": "16.5",
-        "atomic_weight": "78.971",
-        "boiling_point": "958.1",
-        "bulk_modulus": "8.3",
-        "c6_gb": "233",
-        "covalent_radius_cordero": "120",
-        "covalent_radius_pyykko_simple": "116",
-        "covalent_radius_pyykko_double": "107",
-        "covalent_radius_pyykko_triple": "107",
-        "covalent_radius_slater": "115",
-        "density": "4.79",
-        "dipole_polarizability": "26.24",
-        "electron_negativity": "2.55",
-        "electron_affinity": "2.02067",
-        "en_allen": "14.34",
-        "en_ghosh": "0.2240328",
-        "en_pauling": "2.55",
-        "first_ion_en": "9.75239",
-        "fusion_enthalpy": "6.69",
-        "gs_bandgap": "0.799",
-        "gs_energy": "-3.47079191",
-        "gs_est_bcc_latcnt": "3.728679007",
-        "gs_est_fcc_latcnt": "4.697841169",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "25.92",
-        "hhi_p": "2200",
-        "hhi_r": "6000",
-        "heat_capacity_mass": "0.321",
-        "heat_capacity_molar": "25.363",
-        "icsd_volume": "29.81",
-        "evaporation_heat": "59.7",
-        "heat_of_formation": "227.2",
-        "lattice_constant": "4.36",
-        "mendeleev_number": "93",
-        "melting_point": "490",
-        "molar_volume": "16.42",
-        "num_unfilled": "2",
-        "num_valence": "16",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "2",
-        "num_p_valence": "4",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "4",
-        "specific_heat": "0.887217308",
-        "thermal_conductivity": "0.52",
-        "vdw_radius_simple": "190",
-        "vdw_radius_alvarez": "182",
-        "vdw_radius_mm3": "229",
-        "vdw_radius_uff": "420.5",
-        "sound_velocity": "3350",
-        "Polarizability": "3.77"
-    },
-    {
-        "index": "Br",
-        "atomic_number": "35",
-        "atomic_radius_simple": "157.5553081",
-        "atomic_radius_rahm": "219",
-        "atomic_volume": "23.5",
-        "atomic_weight": "79.904",
-        "boiling_point": "331.9",
-        "bulk_modulus": "1.9",
-        "c6_gb": "187",
-        "covalent_radius_cordero": "120",
-        "covalent_radius_pyykko_simple": "114",
-        "covalent_radius_pyykko_double": "109",
-        "covalent_radius_pyykko_triple": "110",
-        "covalent_radius_slater": "115",
-        "density": "3.12",
-        "dipole_polarizability": "21.8",
-        "electron_negativity": "2.96",
-        "electron_affinity": "3.3635882",
-        "en_allen": "15.88",
-        "en_ghosh": "0.2412578",
-        "en_pauling": "2.96",
-        "first_ion_en": "11.8138",
-        "fusion_enthalpy": "5.285",
-        "gs_bandgap": "1.457",
-        "gs_energy": "-1.583025338",
-        "gs_est_bcc_latcnt": "3.892116444",
-        "gs_est_fcc_latcnt": "4.903759436",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "29.48",
-        "hhi_p": "3300",
-        "hhi_r": "6900",
-        "heat_capacity_mass": "0.474",
-        "heat_capacity_molar": "75.69",
-        "icsd_volume": "65.14",
-        "evaporation_heat": "29.56",
-        "heat_of_formation": "111.85",
-        "lattice_constant": "6.67",
-        "mendeleev_number": "98",
-        "melting_point": "265.9",
-        "molar_volume": "19.78",
-        "num_unfilled": "1",
-        "num_valence": "17",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "1",
-        "num_p_valence": "5",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "4",
-        "specific_heat": "1.145907187",
-        "thermal_conductivity": "0.12",
-        "vdw_radius_simple": "185",
-        "vdw_radius_alvarez": "186",
-        "vdw_radius_mm3": "222",
-        "vdw_radius_uff": "418.9",
-        "sound_velocity": "2467.612558",
-        "Polarizability": "3.05"
-    },
-    {
-        "index": "Kr",
-        "atomic_number": "36",
-        "atomic_radius_simple": "152.937911",
-        "atomic_radius_rahm": "212",
-        "atomic_volume": "32.2",
-        "atomic_weight": "83.798",
-        "boiling_point": "120.85",
-        "bulk_modulus": "71.98581783",
-        "c6_gb": "136",
-        "covalent_radius_cordero": "116",
-        "covalent_radius_pyykko_simple": "117",
-        "covalent_radius_pyykko_double": "121",
-        "covalent_radius_pyykko_triple": "108",
-        "covalent_radius_slater": "129.8714145",
-        "density": "2.155",
-        "dipole_polarizability": "17.075",
-        "electron_negativity": "3",
-        "electron_affinity": "2.60339344",
-        "en_allen": "17.54",
-        "en_ghosh": "0.2584813",
-        "en_pauling": "2.288065621",
-        "first_ion_en": "13.99961",
-        "fusion_enthalpy": "1.164",
-        "gs_bandgap": "7.535",
-        "gs_energy": "0.08753524",
-        "gs_est_bcc_latcnt": "4.162477568",
-        "gs_est_fcc_latcnt": "5.244393107",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "36.06",
-        "hhi_p": "3320.763692",
-        "hhi_r": "4359.609835",
-        "heat_capacity_mass": "0.248",
-        "heat_capacity_molar": "20.786",
-        "icsd_volume": "44.81",
-        "evaporation_heat": "9.05",
-        "heat_of_formation": "124.5585843",
-        "lattice_constant": "5.72",
-        "mendeleev_number": "4",
-        "melting_point": "116.6",
-        "molar_volume": "27.99",
-        "num_unfilled": "0",
-        "num_valence": "18",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "6",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "4",
-        "specific_heat": "0.247",
-        "thermal_conductivity": "0.00943",
-        "vdw_radius_simple": "202",
-        "vdw_radius_alvarez": "207",
-        "vdw_radius_mm3": "215",
-        "vdw_radius_uff": "414.1",
-        "sound_velocity": "1120",
-        "Polarizability": "2.4844"
-    },
-    {
-        "index": "Rb",
-        "atomic_number": "37",
-        "atomic_radius_simple": "248",
-        "atomic_radius_rahm": "240",
-        "atomic_volume": "55.9",
-        "atomic_weight": "85.4678",
-        "boiling_point": "961",
-        "bulk_modulus": "2.5",
-        "c6_gb": "4660",
-        "covalent_radius_cordero": "220",
-        "covalent_radius_pyykko_simple": "210",
-        "covalent_radius_pyykko_double": "202",
-        "covalent_radius_pyykko_triple": "141.1461564",
-        "covalent_radius_slater": "235",
-        "density": "1.532",
-        "dipole_polarizability": "318.8",
-        "electron_negativity": "0.82",
-        "electron_affinity": "0.48592",
-        "en_allen": "4.177",
-        "en_ghosh": "0.104686",
-        "en_pauling": "0.82",
-        "first_ion_en": "4.177128",
-        "fusion_enthalpy": "2.19",
-        "gs_bandgap": "0",
-        "gs_energy": "-0.963335025",
-        "gs_est_bcc_latcnt": "5.661284779",
-        "gs_est_fcc_latcnt": "7.132771862",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "90.7225",
-        "hhi_p": "6000",
-        "hhi_r": "6000",
-        "heat_capacity_mass": "0.363",
-        "heat_capacity_molar": "31.06",
-        "icsd_volume": "93.09",
-        "evaporation_heat": "75.8",
-        "heat_of_formation": "80.9",
-        "lattice_constant": "5.59",
-        "mendeleev_number": "9",
-        "melting_point": "312.2",
-        "molar_volume": "55.76",
-        "num_unfilled": "1",
-        "num_valence": "1",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "1",
-        "num_s_valence": "1",
-        "period": "5",
-        "specific_heat": "0.36",
-        "thermal_conductivity": "58",
-        "vdw_radius_simple": "303",
-        "vdw_radius_alvarez": "321",
-        "vdw_radius_mm3": "325",
-        "vdw_radius_uff": "411.4",
-        "sound_velocity": "1300",
-        "Polarizability": "47.24"
-    },
-    {
-        "index": "Sr",
-        "atomic_number": "38",
-        "atomic_radius_simple": "215",
-        "atomic_radius_rahm": "279",
-        "atomic_volume": "33.7",
-        "atomic_weight": "87.62",
-        "boiling_point": "1657",
-        "bulk_modulus": "72.48047417",
-        "c6_gb": "3230",
-        "covalent_radius_cordero": "195",
-        "covalent_radius_pyykko_simple": "185",
-        "covalent_radius_pyykko_double": "157",
-        "covalent_radius_pyykko_triple": "139",
-        "covalent_radius_slater": "200",
-        "density": "2.54",
-        "dipole_polarizability": "186",
-        "electron_negativity": "0.95",
-        "electron_affinity": "0.048",
-        "en_allen": "5.695",
-        "en_ghosh": "0.1185082",
-        "en_pauling": "0.95",
-        "first_ion_en": "5.69485",
-        "fusion_enthalpy": "7.43",
-        "gs_bandgap": "0",
-        "gs_energy": "-1.6828136",
-        "gs_est_bcc_latcnt": "4.768954732",
-        "gs_est_fcc_latcnt": "6.008506453",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "54.23",
-        "hhi_p": "4200",
-        "hhi_r": "3000",
-        "heat_capacity_mass": "0.306",
-        "heat_capacity_molar": "26.79",
-        "icsd_volume": "56.08",
-        "evaporation_heat": "144",
-        "heat_of_formation": "164",
-        "lattice_constant": "6.08",
-        "mendeleev_number": "15",
-        "melting_point": "1042",
-        "molar_volume": "33.94",
-        "num_unfilled": "0",
-        "num_valence": "2",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "5",
-        "specific_heat": "0.301",
-        "thermal_conductivity": "35",
-        "vdw_radius_simple": "249",
-        "vdw_radius_alvarez": "284",
-        "vdw_radius_mm3": "300",
-        "vdw_radius_uff": "364.1",
-        "sound_velocity": "4504.232052",
-        "Polarizability": "27.6"
-    },
-    {
-        "index": "Y",
-        "atomic_number": "39",
-        "atomic_radius_simple": "178",
-        "atomic_radius_rahm": "274",
-        "atomic_volume": "19.8",
-        "atomic_weight": "88.90584",
-        "boiling_point": "3611",
-        "bulk_modulus": "41",
-        "c6_gb": "2600",
-        "covalent_radius_cordero": "190",
-        "covalent_radius_pyykko_simple": "163",
-        "covalent_radius_pyykko_double": "130",
-        "covalent_radius_pyykko_triple": "124",
-        "covalent_radius_slater": "180",
-        "density": "4.47",
-        "dipole_polarizability": "153",
-        "electron_negativity": "1.22",
-        "electron_affinity": "0.307",
-        "en_allen": "6.631",
-        "en_ghosh": "0.1216986",
-        "en_pauling": "1.22",
-        "first_ion_en": "6.2173",
-        "fusion_enthalpy": "11.39",
-        "gs_bandgap": "0",
-        "gs_energy": "-6.464599775",
-        "gs_est_bcc_latcnt": "4.015150874",
-        "gs_est_fcc_latcnt": "5.058773104",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "32.365",
-        "hhi_p": "9800",
-        "hhi_r": "2600",
-        "heat_capacity_mass": "0.298",
-        "heat_capacity_molar": "26.53",
-        "icsd_volume": "32.97",
-        "evaporation_heat": "367",
-        "heat_of_formation": "424.7",
-        "lattice_constant": "3.65",
-        "mendeleev_number": "25",
-        "melting_point": "1795",
-        "molar_volume": "19.88",
-        "num_unfilled": "9",
-        "num_valence": "3",
-        "num_d_unfilled": "9",
-        "num_d_valence": "1",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "5",
-        "specific_heat": "0.284",
-        "thermal_conductivity": "17",
-        "vdw_radius_simple": "232",
-        "vdw_radius_alvarez": "275",
-        "vdw_radius_mm3": "271",
-        "vdw_radius_uff": "334.5",
-        "sound_velocity": "3300",
-        "Polarizability": "22.7"
-    },
-    {
-        "index": "Zr",
-        "atomic_number": "40",
-        "atomic_radius_simple": "160",
-        "atomic_radius_rahm": "268",
-        "atomic_volume": "14.1",
-        "atomic_weight": "91.224",
-        "boiling_point": "4650",
-        "bulk_modulus": "172.5198185",
-        "c6_gb": "1360",
-        "covalent_radius_cordero": "175",
-        "covalent_radius_pyykko_simple": "154",
-        "covalent_radius_pyykko_double": "127",
-        "covalent_radius_pyykko_triple": "121",
-        "covalent_radius_slater": "155",
-        "density": "6.506",
-        "dipole_polarizability": "121",
-        "electron_negativity": "1.33",
-        "electron_affinity": "0.426",
-        "en_allen": "7.808",
-        "en_ghosh": "0.1248887",
-        "en_pauling": "1.33",
-        "first_ion_en": "6.6339",
-        "fusion_enthalpy": "21",
-        "gs_bandgap": "0",
-        "gs_energy": "-8.545958555",
-        "gs_est_bcc_latcnt": "3.593145393",
-        "gs_est_fcc_latcnt": "4.527079516",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "23.195",
-        "hhi_p": "3400",
-        "hhi_r": "2600",
-        "heat_capacity_mass": "0.278",
-        "heat_capacity_molar": "25.36",
-        "icsd_volume": "23.29",
-        "evaporation_heat": "567",
-        "heat_of_formation": "610",
-        "lattice_constant": "3.23",
-        "mendeleev_number": "49",
-        "melting_point": "2125",
-        "molar_volume": "14.02",
-        "num_unfilled": "8",
-        "num_valence": "4",
-        "num_d_unfilled": "8",
-        "num_d_valence": "2",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "5",
-        "specific_heat": "0.281",
-        "thermal_conductivity": "23",
-        "vdw_radius_simple": "223",
-        "vdw_radius_alvarez": "252",
-        "vdw_radius_mm3": "254",
-        "vdw_radius_uff": "312.4",
-        "sound_velocity": "3800",
-        "Polarizability": "17.9"
-    },
-    {
-        "index": "Nb",
-        "atomic_number": "41",
-        "atomic_radius_simple": "146",
-        "atomic_radius_rahm": "251",
-        "atomic_volume": "10.8",
-        "atomic_weight": "92.90637",
-        "boiling_point": "5015",
-        "bulk_modulus": "170",
-        "c6_gb": "1140",
-        "covalent_radius_cordero": "164",
-        "covalent_radius_pyykko_simple": "147",
-        "covalent_radius_pyykko_double": "125",
-        "covalent_radius_pyykko_triple": "116",
-        "covalent_radius_slater": "145",
-        "density": "8.57",
-        "dipole_polarizability": "106",
-        "electron_negativity": "1.6",
-        "electron_affinity": "0.917406",
-        "en_allen": "8.34",
-        "en_ghosh": "0.1280782",
-        "en_pauling": "1.6",
-        "first_ion_en": "6.75885",
-        "fusion_enthalpy": "30",
-        "gs_bandgap": "0",
-        "gs_energy": "-10.09332153",
-        "gs_est_bcc_latcnt": "3.312897187",
-        "gs_est_fcc_latcnt": "4.173988903",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "18.18",
-        "hhi_p": "8500",
-        "hhi_r": "8800",
-        "heat_capacity_mass": "0.265",
-        "heat_capacity_molar": "24.6",
-        "icsd_volume": "18.15",
-        "evaporation_heat": "680",
-        "heat_of_formation": "733",
-        "lattice_constant": "3.3",
-        "mendeleev_number": "53",
-        "melting_point": "2741",
-        "molar_volume": "10.83",
-        "num_unfilled": "7",
-        "num_valence": "5",
-        "num_d_unfilled": "6",
-        "num_d_valence": "4",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "1",
-        "num_s_valence": "1",
-        "period": "5",
-        "specific_heat": "0.268",
-        "thermal_conductivity": "54",
-        "vdw_radius_simple": "218",
-        "vdw_radius_alvarez": "256",
-        "vdw_radius_mm3": "243",
-        "vdw_radius_uff": "316.5",
-        "sound_velocity": "3480",
-        "Polarizability": "15.7"
-    },
-    {
-        "index": "Mo",
-        "atomic_number": "42",
-        "atomic_radius_simple": "139",
-        "atomic_radius_rahm": "244",
-        "atomic_volume": "9.4",
-        "atomic_weight": "95.95",
-        "boiling_point": "4885",
-        "bulk_modulus": "230",
-        "c6_gb": "1030",
-        "covalent_radius_cordero": "154",
-        "covalent_radius_pyykko_simple": "138",
-        "covalent_radius_pyykko_double": "121",
-        "covalent_radius_pyykko_triple": "113",
-        "covalent_radius_slater": "145",
-        "density": "10.22",
-        "dipole_polarizability": "72.5",
-        "electron_negativity": "2.16",
-        "electron_affinity": "0.748",
-        "en_allen": "8.71",
-        "en_ghosh": "0.1312672",
-        "en_pauling": "2.16",
-        "first_ion_en": "7.09243",
-        "fusion_enthalpy": "37.48",
-        "gs_bandgap": "0",
-        "gs_energy": "-10.84610777",
-        "gs_est_bcc_latcnt": "3.154164308",
-        "gs_est_fcc_latcnt": "3.973998007",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "15.69",
-        "hhi_p": "2400",
-        "hhi_r": "5300",
-        "heat_capacity_mass": "0.251",
-        "heat_capacity_molar": "24.06",
-        "icsd_volume": "15.59",
-        "evaporation_heat": "590",
-        "heat_of_formation": "658.98",
-        "lattice_constant": "3.15",
-        "mendeleev_number": "56",
-        "melting_point": "2890",
-        "molar_volume": "9.38",
-        "num_unfilled": "6",
-        "num_valence": "6",
-        "num_d_unfilled": "5",
-        "num_d_valence": "5",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "1",
-        "num_s_valence": "1",
-        "period": "5",
-        "specific_heat": "0.251",
-        "thermal_conductivity": "139",
-        "vdw_radius_simple": "217",
-        "vdw_radius_alvarez": "245",
-        "vdw_radius_mm3": "239",
-        "vdw_radius_uff": "305.2",
-        "sound_velocity": "6190",
-        "Polarizability": "12.8"
-    },
-    {
-        "index": "Tc",
-        "atomic_number": "43",
-        "atomic_radius_simple": "136",
-        "atomic_radius_rahm": "241",
-        "atomic_volume": "8.5",
-        "atomic_weight": "97.90721",
-        "boiling_point": "5150",
-        "bulk_modulus": "204.3977039",
-        "c6_gb": "939",
-        "covalent_radius_cordero": "147",
-        "covalent_radius_pyykko_simple": "128",
-        "covalent_radius_pyykko_double": "120",
-        "covalent_radius_pyykko_triple": "110",
-        "covalent_radius_slater": "135",
-        "density": "11.5",
-        "dipole_polarizability": "80.4",
-        "electron_negativity": "1.9",
-        "electron_affinity": "0.55",
-        "en_allen": "8.94",
-        "en_ghosh": "0.1344592",
-        "en_pauling": "2.1",
-        "first_ion_en": "7.28",
-        "fusion_enthalpy": "33.29",
-        "gs_bandgap": "0",
-        "gs_energy": "-10.3551512",
-        "gs_est_bcc_latcnt": "3.057056135",
-        "gs_est_fcc_latcnt": "3.851649375",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "14.285",
-        "hhi_p": "6064.675593",
-        "hhi_r": "4493.216997",
-        "heat_capacity_mass": "1.541156607",
-        "heat_capacity_molar": "23.04097142",
-        "icsd_volume": "14.22",
-        "evaporation_heat": "585",
-        "heat_of_formation": "678",
-        "lattice_constant": "2.74",
-        "mendeleev_number": "59",
-        "melting_point": "2445",
-        "molar_volume": "8.63",
-        "num_unfilled": "5",
-        "num_valence": "7",
-        "num_d_unfilled": "5",
-        "num_d_valence": "5",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "5",
-        "specific_heat": "0.243",
-        "thermal_conductivity": "51",
-        "vdw_radius_simple": "216",
-        "vdw_radius_alvarez": "244",
-        "vdw_radius_mm3": "236",
-        "vdw_radius_uff": "299.8",
-        "sound_velocity": "5395.118683",
-        "Polarizability": "11.4"
-    },
-    {
-        "index": "Ru",
-        "atomic_number": "44",
-        "atomic_radius_simple": "134",
-        "atomic_radius_rahm": "237",
-        "atomic_volume": "8.3",
-        "atomic_weight": "101.07",
-        "boiling_point": "4173",
-        "bulk_modulus": "220",
-        "c6_gb": "809",
-        "covalent_radius_cordero": "146",
-        "covalent_radius_pyykko_simple": "125",
-        "covalent_radius_pyykko_double": "114",
-        "covalent_radius_pyykko_triple": "103",
-        "covalent_radius_slater": "130",
-        "density": "12.41",
-        "dipole_polarizability": "65",
-        "electron_negativity": "2.2",
-        "electron_affinity": "1.05",
-        "en_allen": "9.1",
-        "en_ghosh": "0.1376494",
-        "en_pauling": "2.2",
-        "first_ion_en": "7.3605",
-        "fusion_enthalpy": "38.59",
-        "gs_bandgap": "0",
-        "gs_energy": "-9.19463357",
-        "gs_est_bcc_latcnt": "3.000740558",
-        "gs_est_fcc_latcnt": "3.780696194",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "13.51",
-        "hhi_p": "3200",
-        "hhi_r": "8000",
-        "heat_capacity_mass": "0.238",
-        "heat_capacity_molar": "24.06",
-        "icsd_volume": "14.03",
-        "evaporation_heat": "521.2774833",
-        "heat_of_formation": "650.6",
-        "lattice_constant": "2.7",
-        "mendeleev_number": "62",
-        "melting_point": "2583",
-        "molar_volume": "8.17",
-        "num_unfilled": "4",
-        "num_valence": "8",
-        "num_d_unfilled": "3",
-        "num_d_valence": "7",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "1",
-        "num_s_valence": "1",
-        "period": "5",
-        "specific_heat": "0.238",
-        "thermal_conductivity": "120",
-        "vdw_radius_simple": "213",
-        "vdw_radius_alvarez": "246",
-        "vdw_radius_mm3": "234",
-        "vdw_radius_uff": "296.3",
-        "sound_velocity": "5970",
-        "Polarizability": "9.6"
-    },
-    {
-        "index": "Rh",
-        "atomic_number": "45",
-        "atomic_radius_simple": "134",
-        "atomic_radius_rahm": "233",
-        "atomic_volume": "8.3",
-        "atomic_weight": "102.9055",
-        "boiling_point": "4000",
-        "bulk_modulus": "380",
-        "c6_gb": "708",
-        "covalent_radius_cordero": "142",
-        "covalent_radius_pyykko_simple": "125",
-        "covalent_radius_pyykko_double": "110",
-        "covalent_radius_pyykko_triple": "106",
-        "covalent_radius_slater": "135",
-        "density": "12.41",
-        "dipole_polarizability": "58",
-        "electron_negativity": "2.28",
-        "electron_affinity": "1.137",
-        "en_allen": "9.259",
-        "en_ghosh": "0.1408379",
-        "en_pauling": "2.28",
-        "first_ion_en": "7.4589",
-        "fusion_enthalpy": "26.59",
-        "gs_bandgap": "0",
-        "gs_energy": "-7.25364552",
-        "gs_est_bcc_latcnt": "3.010334727",
-        "gs_est_fcc_latcnt": "3.79278409",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "13.64",
-        "hhi_p": "3200",
-        "hhi_r": "8000",
-        "heat_capacity_mass": "0.243",
-        "heat_capacity_molar": "24.98",
-        "icsd_volume": "11.58",
-        "evaporation_heat": "494",
-        "heat_of_formation": "556",
-        "lattice_constant": "3.8",
-        "mendeleev_number": "65",
-        "melting_point": "2239",
-        "molar_volume": "8.28",
-        "num_unfilled": "3",
-        "num_valence": "9",
-        "num_d_unfilled": "2",
-        "num_d_valence": "8",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "1",
-        "num_s_valence": "1",
-        "period": "5",
-        "specific_heat": "0.244",
-        "thermal_conductivity": "150",
-        "vdw_radius_simple": "210",
-        "vdw_radius_alvarez": "244",
-        "vdw_radius_mm3": "234",
-        "vdw_radius_uff": "292.9",
-        "sound_velocity": "4700",
-        "Polarizability": "8.6"
-    },
-    {
-        "index": "Pd",
-        "atomic_number": "46",
-        "atomic_radius_simple": "137",
-        "atomic_radius_rahm": "215",
-        "atomic_volume": "8.9",
-        "atomic_weight": "106.42",
-        "boiling_point": "3413",
-        "bulk_modulus": "180",
-        "c6_gb": "628",
-        "covalent_radius_cordero": "139",
-        "covalent_radius_pyykko_simple": "120",
-        "covalent_radius_pyykko_double": "117",
-        "covalent_radius_pyykko_triple": "112",
-        "covalent_radius_slater": "140",
-        "density": "12.02",
-        "dipole_polarizability": "32",
-        "electron_negativity": "2.2",
-        "electron_affinity": "0.562",
-        "en_allen": "9.402",
-        "en_ghosh": "0.1440276",
-        "en_pauling": "2.2",
-        "first_ion_en": "8.3369",
-        "fusion_enthalpy": "16.74",
-        "gs_bandgap": "0",
-        "gs_energy": "-5.13777457",
-        "gs_est_bcc_latcnt": "3.065947111",
-        "gs_est_fcc_latcnt": "3.862851303",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "14.41",
-        "hhi_p": "3200",
-        "hhi_r": "8000",
-        "heat_capacity_mass": "0.244",
-        "heat_capacity_molar": "25.98",
-        "icsd_volume": "14.72",
-        "evaporation_heat": "372.4",
-        "heat_of_formation": "376.6",
-        "lattice_constant": "3.89",
-        "mendeleev_number": "69",
-        "melting_point": "1825",
-        "molar_volume": "8.56",
-        "num_unfilled": "0",
-        "num_valence": "10",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "0",
-        "period": "5",
-        "specific_heat": "0.244",
-        "thermal_conductivity": "72",
-        "vdw_radius_simple": "210",
-        "vdw_radius_alvarez": "215",
-        "vdw_radius_mm3": "237",
-        "vdw_radius_uff": "289.9",
-        "sound_velocity": "3070",
-        "Polarizability": "4.8"
-    },
-    {
-        "index": "Ag",
-        "atomic_number": "47",
-        "atomic_radius_simple": "144",
-        "atomic_radius_rahm": "225",
-        "atomic_volume": "10.3",
-        "atomic_weight": "107.8682",
-        "boiling_point": "2485",
-        "bulk_modulus": "100",
-        "c6_gb": "341",
-        "covalent_radius_cordero": "145",
-        "covalent_radius_pyykko_simple": "128",
-        "covalent_radius_pyykko_double": "139",
-        "covalent_radius_pyykko_triple": "137",
-        "covalent_radius_slater": "160",
-        "density": "10.5",
-        "dipole_polarizability": "52.5",
-        "electron_negativity": "1.93",
-        "electron_affinity": "1.302",
-        "en_allen": "11.05",
-        "en_ghosh": "0.1472165",
-        "en_pauling": "1.93",
-        "first_ion_en": "7.57623",
-        "fusion_enthalpy": "11.3",
-        "gs_bandgap": "0",
-        "gs_energy": "-2.76539356",
-        "gs_est_bcc_latcnt": "3.196480506",
-        "gs_est_fcc_latcnt": "4.027313074",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "16.33",
-        "hhi_p": "1200",
-        "hhi_r": "1400",
-        "heat_capacity_mass": "0.235",
-        "heat_capacity_molar": "25.35",
-        "icsd_volume": "17.05",
-        "evaporation_heat": "254.1",
-        "heat_of_formation": "284.9",
-        "lattice_constant": "4.09",
-        "mendeleev_number": "71",
-        "melting_point": "1235.1",
-        "molar_volume": "10.27",
-        "num_unfilled": "1",
-        "num_valence": "11",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "1",
-        "num_s_valence": "1",
-        "period": "5",
-        "specific_heat": "0.237",
-        "thermal_conductivity": "430",
-        "vdw_radius_simple": "211",
-        "vdw_radius_alvarez": "253",
-        "vdw_radius_mm3": "243",
-        "vdw_radius_uff": "314.8",
-        "sound_velocity": "2600",
-        "Polarizability": "6.78"
-    },
-    {
-        "index": "Cd",
-        "atomic_number": "48",
-        "atomic_radius_simple": "154",
-        "atomic_radius_rahm": "238",
-        "atomic_volume": "13.1",
-        "atomic_weight": "112.414",
-        "boiling_point": "1038",
-        "bulk_modulus": "42",
-        "c6_gb": "405",
-        "covalent_radius_cordero": "144",
-        "covalent_radius_pyykko_simple": "136",
-        "covalent_radius_pyykko_double": "144",
-        "covalent_radius_pyykko_triple": "110.6219868",
-        "covalent_radius_slater": "155",
-        "density": "8.65",
-        "dipole_polarizability": "49.65",
-        "electron_negativity": "1.69",
-        "electron_affinity": "2.550432555",
-        "en_allen": "8.995",
-        "en_ghosh": "0.1504066",
-        "en_pauling": "1.69",
-        "first_ion_en": "8.99382",
-        "fusion_enthalpy": "6.21",
-        "gs_bandgap": "0",
-        "gs_energy": "-0.812174225",
-        "gs_est_bcc_latcnt": "3.390921571",
-        "gs_est_fcc_latcnt": "4.272293466",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "19.495",
-        "hhi_p": "1700",
-        "hhi_r": "1300",
-        "heat_capacity_mass": "0.231",
-        "heat_capacity_molar": "26.02",
-        "icsd_volume": "21.59",
-        "evaporation_heat": "59.1",
-        "heat_of_formation": "111.8",
-        "lattice_constant": "2.98",
-        "mendeleev_number": "75",
-        "melting_point": "594.1",
-        "molar_volume": "13",
-        "num_unfilled": "0",
-        "num_valence": "12",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "5",
-        "specific_heat": "0.232",
-        "thermal_conductivity": "97",
-        "vdw_radius_simple": "218",
-        "vdw_radius_alvarez": "249",
-        "vdw_radius_mm3": "250",
-        "vdw_radius_uff": "284.8",
-        "sound_velocity": "2310",
-        "Polarizability": "7.36"
-    },
-    {
-        "index": "In",
-        "atomic_number": "49",
-        "atomic_radius_simple": "166",
-        "atomic_radius_rahm": "246",
-        "atomic_volume": "15.7",
-        "atomic_weight": "114.818",
-        "boiling_point": "2353",
-        "bulk_modulus": "79.19292884",
-        "c6_gb": "643",
-        "covalent_radius_cordero": "142",
-        "covalent_radius_pyykko_simple": "142",
-        "covalent_radius_pyykko_double": "136",
-        "covalent_radius_pyykko_triple": "146",
-        "covalent_radius_slater": "155",
-        "density": "7.31",
-        "dipole_polarizability": "68.7",
-        "electron_negativity": "1.78",
-        "electron_affinity": "0.3",
-        "en_allen": "9.793",
-        "en_ghosh": "0.16423",
-        "en_pauling": "1.78",
-        "first_ion_en": "5.78636",
-        "fusion_enthalpy": "3.291",
-        "gs_bandgap": "0",
-        "gs_energy": "-2.66680196",
-        "gs_est_bcc_latcnt": "3.647317727",
-        "gs_est_fcc_latcnt": "4.595332379",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "24.26",
-        "hhi_p": "3300",
-        "hhi_r": "2000",
-        "heat_capacity_mass": "0.233",
-        "heat_capacity_molar": "26.74",
-        "icsd_volume": "26.14",
-        "evaporation_heat": "225.1",
-        "heat_of_formation": "243",
-        "lattice_constant": "4.59",
-        "mendeleev_number": "79",
-        "melting_point": "429.32",
-        "molar_volume": "15.76",
-        "num_unfilled": "5",
-        "num_valence": "13",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "5",
-        "num_p_valence": "1",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "5",
-        "specific_heat": "0.234",
-        "thermal_conductivity": "82",
-        "vdw_radius_simple": "193",
-        "vdw_radius_alvarez": "243",
-        "vdw_radius_mm3": "264",
-        "vdw_radius_uff": "446.3",
-        "sound_velocity": "1215",
-        "Polarizability": "10.2"
-    },
-    {
-        "index": "Sn",
-        "atomic_number": "50",
-        "atomic_radius_simple": "162",
-        "atomic_radius_rahm": "248",
-        "atomic_volume": "16.3",
-        "atomic_weight": "118.71",
-        "boiling_point": "2543",
-        "bulk_modulus": "58",
-        "c6_gb": "715",
-        "covalent_radius_cordero": "139",
-        "covalent_radius_pyykko_simple": "140",
-        "covalent_radius_pyykko_double": "130",
-        "covalent_radius_pyykko_triple": "132",
-        "covalent_radius_slater": "145",
-        "density": "7.31",
-        "dipole_polarizability": "42.4",
-        "electron_negativity": "1.96",
-        "electron_affinity": "1.112067",
-        "en_allen": "10.79",
-        "en_ghosh": "0.178052",
-        "en_pauling": "1.96",
-        "first_ion_en": "7.34392",
-        "fusion_enthalpy": "7.15",
-        "gs_bandgap": "0",
-        "gs_energy": "-3.96104709",
-        "gs_est_bcc_latcnt": "4.052840562",
-        "gs_est_fcc_latcnt": "5.106259136",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "33.285",
-        "hhi_p": "2600",
-        "hhi_r": "1600",
-        "heat_capacity_mass": "0.227",
-        "heat_capacity_molar": "26.99",
-        "icsd_volume": "27.05",
-        "evaporation_heat": "296",
-        "heat_of_formation": "301.2",
-        "lattice_constant": "5.82",
-        "mendeleev_number": "83",
-        "melting_point": "505.1",
-        "molar_volume": "16.29",
-        "num_unfilled": "4",
-        "num_valence": "14",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "4",
-        "num_p_valence": "2",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "5",
-        "specific_heat": "0.222",
-        "thermal_conductivity": "67",
-        "vdw_radius_simple": "217",
-        "vdw_radius_alvarez": "242",
-        "vdw_radius_mm3": "259",
-        "vdw_radius_uff": "439.2",
-        "sound_velocity": "2500",
-        "Polarizability": "6.28"
-    },
-    {
-        "index": "Sb",
-        "atomic_number": "51",
-        "atomic_radius_simple": "159",
-        "atomic_radius_rahm": "246",
-        "atomic_volume": "18.4",
-        "atomic_weight": "121.76",
-        "boiling_point": "1908",
-        "bulk_modulus": "42",
-        "c6_gb": "504",
-        "covalent_radius_cordero": "139",
-        "covalent_radius_pyykko_simple": "140",
-        "covalent_radius_pyykko_double": "133",
-        "covalent_radius_pyykko_triple": "127",
-        "covalent_radius_slater": "145",
-        "density": "6.691",
-        "dipole_polarizability": "42.2",
-        "electron_negativity": "2.05",
-        "electron_affinity": "1.046",
-        "en_allen": "11.74",
-        "en_ghosh": "0.1918774",
-        "en_pauling": "2.05",
-        "first_ion_en": "8.60839",
-        "fusion_enthalpy": "19.79",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.11736234",
-        "gs_est_bcc_latcnt": "3.981581991",
-        "gs_est_fcc_latcnt": "5.016478962",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "31.56",
-        "hhi_p": "7900",
-        "hhi_r": "3400",
-        "heat_capacity_mass": "0.207",
-        "heat_capacity_molar": "25.23",
-        "icsd_volume": "30.21",
-        "evaporation_heat": "195.2",
-        "heat_of_formation": "264.4",
-        "lattice_constant": "4.51",
-        "mendeleev_number": "88",
-        "melting_point": "903.9",
-        "molar_volume": "18.19",
-        "num_unfilled": "3",
-        "num_valence": "15",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "3",
-        "num_p_valence": "3",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "5",
-        "specific_heat": "0.205",
-        "thermal_conductivity": "24",
-        "vdw_radius_simple": "206",
-        "vdw_radius_alvarez": "247",
-        "vdw_radius_mm3": "252",
-        "vdw_radius_uff": "442",
-        "sound_velocity": "3420",
-        "Polarizability": "6.6"
-    },
-    {
-        "index": "Te",
-        "atomic_number": "52",
-        "atomic_radius_simple": "160",
-        "atomic_radius_rahm": "242",
-        "atomic_volume": "20.5",
-        "atomic_weight": "127.6",
-        "boiling_point": "1263",
-        "bulk_modulus": "65",
-        "c6_gb": "471",
-        "covalent_radius_cordero": "138",
-        "covalent_radius_pyykko_simple": "136",
-        "covalent_radius_pyykko_double": "128",
-        "covalent_radius_pyykko_triple": "121",
-        "covalent_radius_slater": "140",
-        "density": "6.24",
-        "dipole_polarizability": "37",
-        "electron_negativity": "2.1",
-        "electron_affinity": "1.970876",
-        "en_allen": "12.76",
-        "en_ghosh": "0.2056992",
-        "en_pauling": "2.1",
-        "first_ion_en": "9.0096",
-        "fusion_enthalpy": "17.38",
-        "gs_bandgap": "0.464",
-        "gs_energy": "-3.141302507",
-        "gs_est_bcc_latcnt": "4.111975037",
-        "gs_est_fcc_latcnt": "5.180763906",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "34.76333333",
-        "hhi_p": "2900",
-        "hhi_r": "4900",
-        "heat_capacity_mass": "0.202",
-        "heat_capacity_molar": "25.73",
-        "icsd_volume": "33.94",
-        "evaporation_heat": "49.8",
-        "heat_of_formation": "196.6",
-        "lattice_constant": "4.45",
-        "mendeleev_number": "92",
-        "melting_point": "722.7",
-        "molar_volume": "20.46",
-        "num_unfilled": "2",
-        "num_valence": "16",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "2",
-        "num_p_valence": "4",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "5",
-        "specific_heat": "0.201",
-        "thermal_conductivity": "3",
-        "vdw_radius_simple": "206",
-        "vdw_radius_alvarez": "199",
-        "vdw_radius_mm3": "244",
-        "vdw_radius_uff": "447",
-        "sound_velocity": "2610",
-        "Polarizability": "5.5"
-    },
-    {
-        "index": "I",
-        "atomic_number": "53",
-        "atomic_radius_simple": "150.7395914",
-        "atomic_radius_rahm": "238",
-        "atomic_volume": "25.7",
-        "atomic_weight": "126.90447",
-        "boiling_point": "457.5",
-        "bulk_modulus": "7.7",
-        "c6_gb": "389",
-        "covalent_radius_cordero": "139",
-        "covalent_radius_pyykko_simple": "133",
-        "covalent_radius_pyykko_double": "129",
-        "covalent_radius_pyykko_triple": "125",
-        "covalent_radius_slater": "140",
-        "density": "4.93",
-        "dipole_polarizability": "34.6",
-        "electron_negativity": "2.66",
-        "electron_affinity": "3.0590368",
-        "en_allen": "13.95",
-        "en_ghosh": "0.2195176",
-        "en_pauling": "2.66",
-        "first_ion_en": "10.45126",
-        "fusion_enthalpy": "7.76",
-        "gs_bandgap": "1.062",
-        "gs_energy": "-1.505402418",
-        "gs_est_bcc_latcnt": "4.414518159",
-        "gs_est_fcc_latcnt": "5.561944354",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "43.015",
-        "hhi_p": "4900",
-        "hhi_r": "4800",
-        "heat_capacity_mass": "0.214",
-        "heat_capacity_molar": "54.43",
-        "icsd_volume": "42.51",
-        "evaporation_heat": "41.95",
-        "heat_of_formation": "106.757",
-        "lattice_constant": "7.72",
-        "mendeleev_number": "97",
-        "melting_point": "386.7",
-        "molar_volume": "25.72",
-        "num_unfilled": "1",
-        "num_valence": "17",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "1",
-        "num_p_valence": "5",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "5",
-        "specific_heat": "0.98181827",
-        "thermal_conductivity": "0.449",
-        "vdw_radius_simple": "198",
-        "vdw_radius_alvarez": "204",
-        "vdw_radius_mm3": "236",
-        "vdw_radius_uff": "450",
-        "sound_velocity": "3289.214936",
-        "Polarizability": "5.35"
-    },
-    {
-        "index": "Xe",
-        "atomic_number": "54",
-        "atomic_radius_simple": "147.2030054",
-        "atomic_radius_rahm": "232",
-        "atomic_volume": "42.9",
-        "atomic_weight": "131.293",
-        "boiling_point": "166.1",
-        "bulk_modulus": "56.61942174",
-        "c6_gb": "302",
-        "covalent_radius_cordero": "140",
-        "covalent_radius_pyykko_simple": "131",
-        "covalent_radius_pyykko_double": "135",
-        "covalent_radius_pyykko_triple": "122",
-        "covalent_radius_slater": "129.1374544",
-        "density": "3.52",
-        "dipole_polarizability": "27.815",
-        "electron_negativity": "2.6",
-        "electron_affinity": "-0.056",
-        "en_allen": "15.27",
-        "en_ghosh": "0.2333511",
-        "en_pauling": "2.6",
-        "first_ion_en": "12.12984",
-        "fusion_enthalpy": "2.27",
-        "gs_bandgap": "6.456",
-        "gs_energy": "0.04873128",
-        "gs_est_bcc_latcnt": "4.751892136",
-        "gs_est_fcc_latcnt": "5.987008929",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "53.65",
-        "hhi_p": "4092.88622",
-        "hhi_r": "3940.271962",
-        "heat_capacity_mass": "0.158",
-        "heat_capacity_molar": "20.786",
-        "icsd_volume": "57.83",
-        "evaporation_heat": "12.65",
-        "heat_of_formation": "134.2643812",
-        "lattice_constant": "6.2",
-        "mendeleev_number": "5",
-        "melting_point": "161.3",
-        "molar_volume": "35.92",
-        "num_unfilled": "0",
-        "num_valence": "18",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "6",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "5",
-        "specific_heat": "0.158",
-        "thermal_conductivity": "0.00565",
-        "vdw_radius_simple": "216",
-        "vdw_radius_alvarez": "228",
-        "vdw_radius_mm3": "228",
-        "vdw_radius_uff": "440.4",
-        "sound_velocity": "1090",
-        "Polarizability": "4.044"
-    },
-    {
-        "index": "Cs",
-        "atomic_number": "55",
-        "atomic_radius_simple": "267",
-        "atomic_radius_rahm": "249",
-        "atomic_volume": "70",
-        "atomic_weight": "132.905452",
-        "boiling_point": "951.6",
-        "bulk_modulus": "1.6",
-        "c6_gb": "6660",
-        "covalent_radius_cordero": "244",
-        "covalent_radius_pyykko_simple": "232",
-        "covalent_radius_pyykko_double": "209",
-        "covalent_radius_pyykko_triple": "153.2120179",
-        "covalent_radius_slater": "260",
-        "density": "1.873",
-        "dipole_polarizability": "401",
-        "electron_negativity": "0.79",
-        "electron_affinity": "0.471626",
-        "en_allen": "3.898",
-        "en_ghosh": "0.1542125",
-        "en_pauling": "0.79",
-        "first_ion_en": "3.893905",
-        "fusion_enthalpy": "2.09",
-        "gs_bandgap": "0",
-        "gs_energy": "-0.85462646",
-        "gs_est_bcc_latcnt": "6.140481453",
-        "gs_est_fcc_latcnt": "7.736521839",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "115.765",
-        "hhi_p": "6000",
-        "hhi_r": "6000",
-        "heat_capacity_mass": "0.242",
-        "heat_capacity_molar": "32.21",
-        "icsd_volume": "67.55",
-        "evaporation_heat": "68.3",
-        "heat_of_formation": "76.5",
-        "lattice_constant": "6.05",
-        "mendeleev_number": "8",
-        "melting_point": "301.6",
-        "molar_volume": "70.94",
-        "num_unfilled": "1",
-        "num_valence": "1",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "1",
-        "num_s_valence": "1",
-        "period": "6",
-        "specific_heat": "0.241",
-        "thermal_conductivity": "36",
-        "vdw_radius_simple": "343",
-        "vdw_radius_alvarez": "348",
-        "vdw_radius_mm3": "344",
-        "vdw_radius_uff": "451.7",
-        "sound_velocity": "2177.277969",
-        "Polarizability": "59.42"
-    },
-    {
-        "index": "Ba",
-        "atomic_number": "56",
-        "atomic_radius_simple": "222",
-        "atomic_radius_rahm": "293",
-        "atomic_volume": "39",
-        "atomic_weight": "137.327",
-        "boiling_point": "1910",
-        "bulk_modulus": "9.6",
-        "c6_gb": "5540",
-        "covalent_radius_cordero": "215",
-        "covalent_radius_pyykko_simple": "196",
-        "covalent_radius_pyykko_double": "161",
-        "covalent_radius_pyykko_triple": "149",
-        "covalent_radius_slater": "215",
-        "density": "3.5",
-        "dipole_polarizability": "268",
-        "electron_negativity": "0.89",
-        "electron_affinity": "0.14462",
-        "en_allen": "5.211",
-        "en_ghosh": "0.1586786",
-        "en_pauling": "0.89",
-        "first_ion_en": "5.211664",
-        "fusion_enthalpy": "7.12",
-        "gs_bandgap": "0",
-        "gs_energy": "-1.92352226",
-        "gs_est_bcc_latcnt": "5.028899311",
-        "gs_est_fcc_latcnt": "6.3360161",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "63.59",
-        "hhi_p": "3000",
-        "hhi_r": "2300",
-        "heat_capacity_mass": "0.204",
-        "heat_capacity_molar": "28.07",
-        "icsd_volume": "62.88",
-        "evaporation_heat": "142",
-        "heat_of_formation": "179.1",
-        "lattice_constant": "5.02",
-        "mendeleev_number": "14",
-        "melting_point": "1002",
-        "molar_volume": "38.16",
-        "num_unfilled": "0",
-        "num_valence": "2",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.192",
-        "thermal_conductivity": "18",
-        "vdw_radius_simple": "268",
-        "vdw_radius_alvarez": "303",
-        "vdw_radius_mm3": "307",
-        "vdw_radius_uff": "370.3",
-        "sound_velocity": "1620",
-        "Polarizability": "39.7"
-    },
-    {
-        "index": "La",
-        "atomic_number": "57",
-        "atomic_radius_simple": "187",
-        "atomic_radius_rahm": "284",
-        "atomic_volume": "22.5",
-        "atomic_weight": "138.90547",
-        "boiling_point": "3730",
-        "bulk_modulus": "28",
-        "c6_gb": "3730",
-        "covalent_radius_cordero": "207",
-        "covalent_radius_pyykko_simple": "180",
-        "covalent_radius_pyykko_double": "139",
-        "covalent_radius_pyykko_triple": "139",
-        "covalent_radius_slater": "195",
-        "density": "6.15",
-        "dipole_polarizability": "210",
-        "electron_negativity": "1.1",
-        "electron_affinity": "0.47",
-        "en_allen": "3.775246255",
-        "en_ghosh": "0.163142",
-        "en_pauling": "1.1",
-        "first_ion_en": "5.5769",
-        "fusion_enthalpy": "6.2",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.927546185",
-        "gs_est_bcc_latcnt": "4.194456026",
-        "gs_est_fcc_latcnt": "5.28468344",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "36.8975",
-        "hhi_p": "9500",
-        "hhi_r": "3100",
-        "heat_capacity_mass": "0.195",
-        "heat_capacity_molar": "27.11",
-        "icsd_volume": "37.42",
-        "evaporation_heat": "402",
-        "heat_of_formation": "431",
-        "lattice_constant": "3.75",
-        "mendeleev_number": "33",
-        "melting_point": "1194",
-        "molar_volume": "22.39",
-        "num_unfilled": "9",
-        "num_valence": "3",
-        "num_d_unfilled": "9",
-        "num_d_valence": "1",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.197",
-        "thermal_conductivity": "13",
-        "vdw_radius_simple": "243",
-        "vdw_radius_alvarez": "298",
-        "vdw_radius_mm3": "278",
-        "vdw_radius_uff": "352.2",
-        "sound_velocity": "2475",
-        "Polarizability": "31.1"
-    },
-    {
-        "index": "Ce",
-        "atomic_number": "58",
-        "atomic_radius_simple": "181",
-        "atomic_radius_rahm": "282",
-        "atomic_volume": "21",
-        "atomic_weight": "140.116",
-        "boiling_point": "3699",
-        "bulk_modulus": "22",
-        "c6_gb": "3480",
-        "covalent_radius_cordero": "204",
-        "covalent_radius_pyykko_simple": "163",
-        "covalent_radius_pyykko_double": "137",
-        "covalent_radius_pyykko_triple": "131",
-        "covalent_radius_slater": "185",
-        "density": "6.757",
-        "dipole_polarizability": "200",
-        "electron_negativity": "1.12",
-        "electron_affinity": "0.65",
-        "en_allen": "5.630338324",
-        "en_ghosh": "0.16761",
-        "en_pauling": "1.12",
-        "first_ion_en": "5.5387",
-        "fusion_enthalpy": "5.46",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.77656965",
-        "gs_est_bcc_latcnt": "4.207394381",
-        "gs_est_fcc_latcnt": "5.300984746",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "37.24",
-        "hhi_p": "9500",
-        "hhi_r": "3100",
-        "heat_capacity_mass": "0.192",
-        "heat_capacity_molar": "26.94",
-        "icsd_volume": "34.47",
-        "evaporation_heat": "398",
-        "heat_of_formation": "420.1",
-        "lattice_constant": "5.16",
-        "mendeleev_number": "32",
-        "melting_point": "1072",
-        "molar_volume": "20.69",
-        "num_unfilled": "22",
-        "num_valence": "4",
-        "num_d_unfilled": "9",
-        "num_d_valence": "1",
-        "num_f_unfilled": "13",
-        "num_f_valence": "1",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.205",
-        "thermal_conductivity": "11",
-        "vdw_radius_simple": "242",
-        "vdw_radius_alvarez": "288",
-        "vdw_radius_mm3": "274",
-        "vdw_radius_uff": "355.6",
-        "sound_velocity": "2100",
-        "Polarizability": "29.6"
-    },
-    {
-        "index": "Pr",
-        "atomic_number": "59",
-        "atomic_radius_simple": "182",
-        "atomic_radius_rahm": "286",
-        "atomic_volume": "20.8",
-        "atomic_weight": "140.90766",
-        "boiling_point": "3785",
-        "bulk_modulus": "29",
-        "c6_gb": "3760",
-        "covalent_radius_cordero": "203",
-        "covalent_radius_pyykko_simple": "176",
-        "covalent_radius_pyykko_double": "138",
-        "covalent_radius_pyykko_triple": "128",
-        "covalent_radius_slater": "185",
-        "density": "6.773",
-        "dipole_polarizability": "190",
-        "electron_negativity": "1.13",
-        "electron_affinity": "0.962",
-        "en_allen": "4.386020024",
-        "en_ghosh": "0.17208",
-        "en_pauling": "1.13",
-        "first_ion_en": "5.473",
-        "fusion_enthalpy": "6.89",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.77382996",
-        "gs_est_bcc_latcnt": "4.14761076",
-        "gs_est_fcc_latcnt": "5.225662103",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "35.675",
-        "hhi_p": "9500",
-        "hhi_r": "3100",
-        "heat_capacity_mass": "0.193",
-        "heat_capacity_molar": "27.2",
-        "icsd_volume": "34.5",
-        "evaporation_heat": "331",
-        "heat_of_formation": "356.9",
-        "lattice_constant": "3.67",
-        "mendeleev_number": "31",
-        "melting_point": "1204",
-        "molar_volume": "20.8",
-        "num_unfilled": "11",
-        "num_valence": "5",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "11",
-        "num_f_valence": "3",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.192",
-        "thermal_conductivity": "13",
-        "vdw_radius_simple": "240",
-        "vdw_radius_alvarez": "292",
-        "vdw_radius_mm3": "273",
-        "vdw_radius_uff": "360.6",
-        "sound_velocity": "2280",
-        "Polarizability": "28.2"
-    },
-    {
-        "index": "Nd",
-        "atomic_number": "60",
-        "atomic_radius_simple": "182",
-        "atomic_radius_rahm": "284",
-        "atomic_volume": "20.6",
-        "atomic_weight": "144.242",
-        "boiling_point": "3341",
-        "bulk_modulus": "32",
-        "c6_gb": "3560",
-        "covalent_radius_cordero": "201",
-        "covalent_radius_pyykko_simple": "174",
-        "covalent_radius_pyykko_double": "137",
-        "covalent_radius_pyykko_triple": "137.0574886",
-        "covalent_radius_slater": "185",
-        "density": "7.007",
-        "dipole_polarizability": "212",
-        "electron_negativity": "1.14",
-        "electron_affinity": "1.916",
-        "en_allen": "4.397303763",
-        "en_ghosh": "0.176539",
-        "en_pauling": "1.14",
-        "first_ion_en": "5.525",
-        "fusion_enthalpy": "7.14",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.76235134",
-        "gs_est_bcc_latcnt": "4.1138142",
-        "gs_est_fcc_latcnt": "5.183081107",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "34.81",
-        "hhi_p": "9500",
-        "hhi_r": "3100",
-        "heat_capacity_mass": "0.19",
-        "heat_capacity_molar": "27.45",
-        "icsd_volume": "34.2",
-        "evaporation_heat": "289",
-        "heat_of_formation": "326.9",
-        "lattice_constant": "3.66",
-        "mendeleev_number": "30",
-        "melting_point": "1294",
-        "molar_volume": "20.59",
-        "num_unfilled": "10",
-        "num_valence": "6",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "10",
-        "num_f_valence": "4",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.205",
-        "thermal_conductivity": "17",
-        "vdw_radius_simple": "239",
-        "vdw_radius_alvarez": "295",
-        "vdw_radius_mm3": "273",
-        "vdw_radius_uff": "357.5",
-        "sound_velocity": "2330",
-        "Polarizability": "31.4"
-    },
-    {
-        "index": "Pm",
-        "atomic_number": "61",
-        "atomic_radius_simple": "182.8087683",
-        "atomic_radius_rahm": "283",
-        "atomic_volume": "25.1847042",
-        "atomic_weight": "144.91276",
-        "boiling_point": "3000",
-        "bulk_modulus": "33",
-        "c6_gb": "3340",
-        "covalent_radius_cordero": "199",
-        "covalent_radius_pyykko_simple": "173",
-        "covalent_radius_pyykko_double": "135",
-        "covalent_radius_pyykko_triple": "133.4559302",
-        "covalent_radius_slater": "185",
-        "density": "7.2",
-        "dipole_polarizability": "212",
-        "electron_negativity": "1.13",
-        "electron_affinity": "2.898469499",
-        "en_allen": "4.870969222",
-        "en_ghosh": "0.1810032",
-        "en_pauling": "1.088105156",
-        "first_ion_en": "5.582",
-        "fusion_enthalpy": "15.6487277",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.744621343",
-        "gs_est_bcc_latcnt": "4.075342789",
-        "gs_est_fcc_latcnt": "5.134610166",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "33.8425",
-        "hhi_p": "9500",
-        "hhi_r": "3100",
-        "heat_capacity_mass": "1.214677378",
-        "heat_capacity_molar": "26.29868621",
-        "icsd_volume": "33.67",
-        "evaporation_heat": "298.1798181",
-        "heat_of_formation": "320.2291026",
-        "lattice_constant": "4.547807047",
-        "mendeleev_number": "29",
-        "melting_point": "1441",
-        "molar_volume": "20.23",
-        "num_unfilled": "9",
-        "num_valence": "7",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "9",
-        "num_f_valence": "5",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.185",
-        "thermal_conductivity": "15",
-        "vdw_radius_simple": "238",
-        "vdw_radius_alvarez": "293.2335143",
-        "vdw_radius_mm3": "272",
-        "vdw_radius_uff": "354.7",
-        "sound_velocity": "3933.27919",
-        "Polarizability": "30.1"
-    },
-    {
-        "index": "Sm",
-        "atomic_number": "62",
-        "atomic_radius_simple": "181",
-        "atomic_radius_rahm": "280",
-        "atomic_volume": "19.9",
-        "atomic_weight": "150.36",
-        "boiling_point": "2064",
-        "bulk_modulus": "38",
-        "c6_gb": "3130",
-        "covalent_radius_cordero": "198",
-        "covalent_radius_pyykko_simple": "172",
-        "covalent_radius_pyykko_double": "134",
-        "covalent_radius_pyykko_triple": "131.3783492",
-        "covalent_radius_slater": "185",
-        "density": "7.52",
-        "dipole_polarizability": "194",
-        "electron_negativity": "1.17",
-        "electron_affinity": "2.559413271",
-        "en_allen": "7.185921926",
-        "en_ghosh": "0.185468",
-        "en_pauling": "1.17",
-        "first_ion_en": "5.6437",
-        "fusion_enthalpy": "8.62",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.713379635",
-        "gs_est_bcc_latcnt": "4.050607032",
-        "gs_est_fcc_latcnt": "5.103445064",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "33.23",
-        "hhi_p": "9500",
-        "hhi_r": "3100",
-        "heat_capacity_mass": "0.196",
-        "heat_capacity_molar": "29.54",
-        "icsd_volume": "33.14",
-        "evaporation_heat": "165",
-        "heat_of_formation": "206.7",
-        "lattice_constant": "9",
-        "mendeleev_number": "28",
-        "melting_point": "1350",
-        "molar_volume": "19.98",
-        "num_unfilled": "8",
-        "num_valence": "8",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "8",
-        "num_f_valence": "6",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.18",
-        "thermal_conductivity": "13",
-        "vdw_radius_simple": "236",
-        "vdw_radius_alvarez": "290",
-        "vdw_radius_mm3": "271",
-        "vdw_radius_uff": "352",
-        "sound_velocity": "2130",
-        "Polarizability": "28.8"
-    },
-    {
-        "index": "Eu",
-        "atomic_number": "63",
-        "atomic_radius_simple": "199",
-        "atomic_radius_rahm": "280",
-        "atomic_volume": "28.9",
-        "atomic_weight": "151.964",
-        "boiling_point": "1870",
-        "bulk_modulus": "8.3",
-        "c6_gb": "2940",
-        "covalent_radius_cordero": "198",
-        "covalent_radius_pyykko_simple": "168",
-        "covalent_radius_pyykko_double": "134",
-        "covalent_radius_pyykko_triple": "127.8656275",
-        "covalent_radius_slater": "185",
-        "density": "5.243",
-        "dipole_polarizability": "187",
-        "electron_negativity": "1.19",
-        "electron_affinity": "0.864",
-        "en_allen": "6.999500539",
-        "en_ghosh": "0.189935",
-        "en_pauling": "1.263625091",
-        "first_ion_en": "5.67038",
-        "fusion_enthalpy": "9.21",
-        "gs_bandgap": "0",
-        "gs_energy": "-1.82958684",
-        "gs_est_bcc_latcnt": "4.177811939",
-        "gs_est_fcc_latcnt": "5.263713205",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "36.46",
-        "hhi_p": "9500",
-        "hhi_r": "3100",
-        "heat_capacity_mass": "0.182",
-        "heat_capacity_molar": "27.66",
-        "icsd_volume": "48.53",
-        "evaporation_heat": "176",
-        "heat_of_formation": "177.4",
-        "lattice_constant": "4.61",
-        "mendeleev_number": "18",
-        "melting_point": "1095",
-        "molar_volume": "28.97",
-        "num_unfilled": "7",
-        "num_valence": "9",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "7",
-        "num_f_valence": "7",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.176",
-        "thermal_conductivity": "14",
-        "vdw_radius_simple": "235",
-        "vdw_radius_alvarez": "287",
-        "vdw_radius_mm3": "294",
-        "vdw_radius_uff": "349.3",
-        "sound_velocity": "2865.150655",
-        "Polarizability": "27.7"
-    },
-    {
-        "index": "Gd",
-        "atomic_number": "64",
-        "atomic_radius_simple": "179",
-        "atomic_radius_rahm": "277",
-        "atomic_volume": "19.9",
-        "atomic_weight": "157.25",
-        "boiling_point": "3539",
-        "bulk_modulus": "38",
-        "c6_gb": "2340",
-        "covalent_radius_cordero": "196",
-        "covalent_radius_pyykko_simple": "169",
-        "covalent_radius_pyykko_double": "135",
-        "covalent_radius_pyykko_triple": "132",
-        "covalent_radius_slater": "180",
-        "density": "7.9",
-        "dipole_polarizability": "159",
-        "electron_negativity": "1.21",
-        "electron_affinity": "3.075845017",
-        "en_allen": "6.397738402",
-        "en_ghosh": "0.1944",
-        "en_pauling": "1.2",
-        "first_ion_en": "6.1498",
-        "fusion_enthalpy": "9.67",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.65442131",
-        "gs_est_bcc_latcnt": "4.002082249",
-        "gs_est_fcc_latcnt": "5.042307669",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "32.05",
-        "hhi_p": "9500",
-        "hhi_r": "3100",
-        "heat_capacity_mass": "0.235",
-        "heat_capacity_molar": "37.03",
-        "icsd_volume": "32.98",
-        "evaporation_heat": "398",
-        "heat_of_formation": "397.5",
-        "lattice_constant": "3.64",
-        "mendeleev_number": "27",
-        "melting_point": "1586",
-        "molar_volume": "19.9",
-        "num_unfilled": "16",
-        "num_valence": "10",
-        "num_d_unfilled": "9",
-        "num_d_valence": "1",
-        "num_f_unfilled": "7",
-        "num_f_valence": "7",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.23",
-        "thermal_conductivity": "11",
-        "vdw_radius_simple": "234",
-        "vdw_radius_alvarez": "283",
-        "vdw_radius_mm3": "271",
-        "vdw_radius_uff": "336.8",
-        "sound_velocity": "2680",
-        "Polarizability": "23.5"
-    },
-    {
-        "index": "Tb",
-        "atomic_number": "65",
-        "atomic_radius_simple": "180",
-        "atomic_radius_rahm": "276",
-        "atomic_volume": "19.2",
-        "atomic_weight": "158.92535",
-        "boiling_point": "3296",
-        "bulk_modulus": "38.7",
-        "c6_gb": "2590",
-        "covalent_radius_cordero": "194",
-        "covalent_radius_pyykko_simple": "168",
-        "covalent_radius_pyykko_double": "135",
-        "covalent_radius_pyykko_triple": "128.545466",
-        "covalent_radius_slater": "175",
-        "density": "8.229",
-        "dipole_polarizability": "172",
-        "electron_negativity": "1.13",
-        "electron_affinity": "1.165",
-        "en_allen": "6.901183253",
-        "en_ghosh": "0.198863",
-        "en_pauling": "1.300606449",
-        "first_ion_en": "5.8638",
-        "fusion_enthalpy": "10.15",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.629217697",
-        "gs_est_bcc_latcnt": "3.988997542",
-        "gs_est_fcc_latcnt": "5.025821971",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "31.73666667",
-        "hhi_p": "9500",
-        "hhi_r": "3100",
-        "heat_capacity_mass": "0.182",
-        "heat_capacity_molar": "28.91",
-        "icsd_volume": "31.95",
-        "evaporation_heat": "389",
-        "heat_of_formation": "388.7",
-        "lattice_constant": "3.6",
-        "mendeleev_number": "26",
-        "melting_point": "1629",
-        "molar_volume": "19.3",
-        "num_unfilled": "5",
-        "num_valence": "11",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "5",
-        "num_f_valence": "9",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.183",
-        "thermal_conductivity": "11",
-        "vdw_radius_simple": "233",
-        "vdw_radius_alvarez": "279",
-        "vdw_radius_mm3": "270",
-        "vdw_radius_uff": "345.1",
-        "sound_velocity": "2620",
-        "Polarizability": "25.5"
-    },
-    {
-        "index": "Dy",
-        "atomic_number": "66",
-        "atomic_radius_simple": "180",
-        "atomic_radius_rahm": "275",
-        "atomic_volume": "19",
-        "atomic_weight": "162.5",
-        "boiling_point": "2835",
-        "bulk_modulus": "41",
-        "c6_gb": "2430",
-        "covalent_radius_cordero": "192",
-        "covalent_radius_pyykko_simple": "167",
-        "covalent_radius_pyykko_double": "133",
-        "covalent_radius_pyykko_triple": "126.215308",
-        "covalent_radius_slater": "175",
-        "density": "8.55",
-        "dipole_polarizability": "165",
-        "electron_negativity": "1.22",
-        "electron_affinity": "0.352",
-        "en_allen": "8.239109453",
-        "en_ghosh": "0.20333",
-        "en_pauling": "1.22",
-        "first_ion_en": "5.9389",
-        "fusion_enthalpy": "11.35",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.601554453",
-        "gs_est_bcc_latcnt": "3.968079278",
-        "gs_est_fcc_latcnt": "4.99946661",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "31.24",
-        "hhi_p": "9500",
-        "hhi_r": "3100",
-        "heat_capacity_mass": "0.173",
-        "heat_capacity_molar": "28.16",
-        "icsd_volume": "31.6",
-        "evaporation_heat": "291",
-        "heat_of_formation": "290.4",
-        "lattice_constant": "3.59",
-        "mendeleev_number": "24",
-        "melting_point": "1685",
-        "molar_volume": "19.01",
-        "num_unfilled": "4",
-        "num_valence": "12",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "4",
-        "num_f_valence": "10",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.173",
-        "thermal_conductivity": "11",
-        "vdw_radius_simple": "231",
-        "vdw_radius_alvarez": "287",
-        "vdw_radius_mm3": "290",
-        "vdw_radius_uff": "342.8",
-        "sound_velocity": "2710",
-        "Polarizability": "24.5"
-    },
-    {
-        "index": "Ho",
-        "atomic_number": "67",
-        "atomic_radius_simple": "179",
-        "atomic_radius_rahm": "273",
-        "atomic_volume": "18.7",
-        "atomic_weight": "164.93033",
-        "boiling_point": "2968",
-        "bulk_modulus": "40",
-        "c6_gb": "2280",
-        "covalent_radius_cordero": "192",
-        "covalent_radius_pyykko_simple": "166",
-        "covalent_radius_pyykko_double": "133",
-        "covalent_radius_pyykko_triple": "131.5972349",
-        "covalent_radius_slater": "175",
-        "density": "8.795",
-        "dipole_polarizability": "159",
-        "electron_negativity": "1.23",
-        "electron_affinity": "2.548944836",
-        "en_allen": "8.133434469",
-        "en_ghosh": "0.207795",
-        "en_pauling": "1.23",
-        "first_ion_en": "6.0215",
-        "fusion_enthalpy": "11.76",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.577416877",
-        "gs_est_bcc_latcnt": "3.946510119",
-        "gs_est_fcc_latcnt": "4.972291172",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "30.73333333",
-        "hhi_p": "9500",
-        "hhi_r": "3100",
-        "heat_capacity_mass": "0.165",
-        "heat_capacity_molar": "27.15",
-        "icsd_volume": "31.11",
-        "evaporation_heat": "301",
-        "heat_of_formation": "300.6",
-        "lattice_constant": "3.58",
-        "mendeleev_number": "23",
-        "melting_point": "1747",
-        "molar_volume": "18.74",
-        "num_unfilled": "3",
-        "num_valence": "13",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "3",
-        "num_f_valence": "11",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.164",
-        "thermal_conductivity": "16",
-        "vdw_radius_simple": "230",
-        "vdw_radius_alvarez": "281",
-        "vdw_radius_mm3": "267",
-        "vdw_radius_uff": "340.9",
-        "sound_velocity": "2760",
-        "Polarizability": "23.6"
-    },
-    {
-        "index": "Er",
-        "atomic_number": "68",
-        "atomic_radius_simple": "178",
-        "atomic_radius_rahm": "272",
-        "atomic_volume": "18.4",
-        "atomic_weight": "167.259",
-        "boiling_point": "3136",
-        "bulk_modulus": "44",
-        "c6_gb": "2150",
-        "covalent_radius_cordero": "189",
-        "covalent_radius_pyykko_simple": "165",
-        "covalent_radius_pyykko_double": "133",
-        "covalent_radius_pyykko_triple": "125.6495157",
-        "covalent_radius_slater": "175",
-        "density": "9.06",
-        "dipole_polarizability": "153",
-        "electron_negativity": "1.24",
-        "electron_affinity": "2.237004972",
-        "en_allen": "7.650297997",
-        "en_ghosh": "0.212261",
-        "en_pauling": "1.24",
-        "first_ion_en": "6.1077",
-        "fusion_enthalpy": "19.9",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.563633745",
-        "gs_est_bcc_latcnt": "3.940150647",
-        "gs_est_fcc_latcnt": "4.964278739",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "30.585",
-        "hhi_p": "9500",
-        "hhi_r": "3100",
-        "heat_capacity_mass": "0.168",
-        "heat_capacity_molar": "28.12",
-        "icsd_volume": "30.67",
-        "evaporation_heat": "317",
-        "heat_of_formation": "316.4",
-        "lattice_constant": "3.56",
-        "mendeleev_number": "22",
-        "melting_point": "1802",
-        "molar_volume": "18.46",
-        "num_unfilled": "2",
-        "num_valence": "14",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "2",
-        "num_f_valence": "12",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.168",
-        "thermal_conductivity": "15",
-        "vdw_radius_simple": "229",
-        "vdw_radius_alvarez": "283",
-        "vdw_radius_mm3": "267",
-        "vdw_radius_uff": "339.1",
-        "sound_velocity": "2830",
-        "Polarizability": "22.7"
-    },
-    {
-        "index": "Tm",
-        "atomic_number": "69",
-        "atomic_radius_simple": "177",
-        "atomic_radius_rahm": "271",
-        "atomic_volume": "18.1",
-        "atomic_weight": "168.93422",
-        "boiling_point": "2220",
-        "bulk_modulus": "45",
-        "c6_gb": "2020",
-        "covalent_radius_cordero": "190",
-        "covalent_radius_pyykko_simple": "164",
-        "covalent_radius_pyykko_double": "131",
-        "covalent_radius_pyykko_triple": "115.1290102",
-        "covalent_radius_slater": "175",
-        "density": "9.321",
-        "dipole_polarizability": "147",
-        "electron_negativity": "1.25",
-        "electron_affinity": "1.029",
-        "en_allen": "10.0207573",
-        "en_ghosh": "0.2167244",
-        "en_pauling": "1.25",
-        "first_ion_en": "6.18431",
-        "fusion_enthalpy": "16.84",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.47387849",
-        "gs_est_bcc_latcnt": "3.905274476",
-        "gs_est_fcc_latcnt": "4.920337518",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "29.78",
-        "hhi_p": "9500",
-        "hhi_r": "3100",
-        "heat_capacity_mass": "0.16",
-        "heat_capacity_molar": "27.03",
-        "icsd_volume": "30.14",
-        "evaporation_heat": "232",
-        "heat_of_formation": "232.2",
-        "lattice_constant": "3.54",
-        "mendeleev_number": "21",
-        "melting_point": "1818",
-        "molar_volume": "19.1",
-        "num_unfilled": "1",
-        "num_valence": "15",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "1",
-        "num_f_valence": "13",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.16",
-        "thermal_conductivity": "17",
-        "vdw_radius_simple": "227",
-        "vdw_radius_alvarez": "279",
-        "vdw_radius_mm3": "267",
-        "vdw_radius_uff": "337.4",
-        "sound_velocity": "4494.936929",
-        "Polarizability": "21.8"
-    },
-    {
-        "index": "Yb",
-        "atomic_number": "70",
-        "atomic_radius_simple": "194",
-        "atomic_radius_rahm": "277",
-        "atomic_volume": "24.8",
-        "atomic_weight": "173.045",
-        "boiling_point": "1466",
-        "bulk_modulus": "31",
-        "c6_gb": "1910",
-        "covalent_radius_cordero": "187",
-        "covalent_radius_pyykko_simple": "170",
-        "covalent_radius_pyykko_double": "129",
-        "covalent_radius_pyykko_triple": "122.0090126",
-        "covalent_radius_slater": "175",
-        "density": "6.9654",
-        "dipole_polarizability": "140.7",
-        "electron_negativity": "1.26",
-        "electron_affinity": "-0.02",
-        "en_allen": "9.358341814",
-        "en_ghosh": "0.22119",
-        "en_pauling": "1.439019319",
-        "first_ion_en": "6.25416",
-        "fusion_enthalpy": "7.66",
-        "gs_bandgap": "0",
-        "gs_energy": "-1.47410408",
-        "gs_est_bcc_latcnt": "4.086451411",
-        "gs_est_fcc_latcnt": "5.148606152",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "34.12",
-        "hhi_p": "9500",
-        "hhi_r": "3100",
-        "heat_capacity_mass": "0.155",
-        "heat_capacity_molar": "26.74",
-        "icsd_volume": "41.17",
-        "evaporation_heat": "159",
-        "heat_of_formation": "155.6",
-        "lattice_constant": "5.49",
-        "mendeleev_number": "17",
-        "melting_point": "1097",
-        "molar_volume": "24.84",
-        "num_unfilled": "0",
-        "num_valence": "16",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.145",
-        "thermal_conductivity": "39",
-        "vdw_radius_simple": "226",
-        "vdw_radius_alvarez": "280",
-        "vdw_radius_mm3": "279",
-        "vdw_radius_uff": "335.5",
-        "sound_velocity": "1590",
-        "Polarizability": "20.9"
-    },
-    {
-        "index": "Lu",
-        "atomic_number": "71",
-        "atomic_radius_simple": "175",
-        "atomic_radius_rahm": "270",
-        "atomic_volume": "17.8",
-        "atomic_weight": "174.9668",
-        "boiling_point": "3668",
-        "bulk_modulus": "48",
-        "c6_gb": "2020",
-        "covalent_radius_cordero": "187",
-        "covalent_radius_pyykko_simple": "162",
-        "covalent_radius_pyykko_double": "131",
-        "covalent_radius_pyykko_triple": "131",
-        "covalent_radius_slater": "175",
-        "density": "9.8404",
-        "dipole_polarizability": "148",
-        "electron_negativity": "1.27",
-        "electron_affinity": "0.34",
-        "en_allen": "6.455",
-        "en_ghosh": "0.22565",
-        "en_pauling": "1",
-        "first_ion_en": "5.42586",
-        "fusion_enthalpy": "18.65",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.52300002",
-        "gs_est_bcc_latcnt": "3.864860763",
-        "gs_est_fcc_latcnt": "4.869419431",
-        "gs_mag_moment": "0.0022471",
-        "gs_volume_per": "28.865",
-        "hhi_p": "9500",
-        "hhi_r": "3100",
-        "heat_capacity_mass": "0.154",
-        "heat_capacity_molar": "26.86",
-        "icsd_volume": "29.52",
-        "evaporation_heat": "414",
-        "heat_of_formation": "427.6",
-        "lattice_constant": "3.51",
-        "mendeleev_number": "20",
-        "melting_point": "1936",
-        "molar_volume": "17.78",
-        "num_unfilled": "9",
-        "num_valence": "17",
-        "num_d_unfilled": "9",
-        "num_d_valence": "1",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.155",
-        "thermal_conductivity": "16",
-        "vdw_radius_simple": "224",
-        "vdw_radius_alvarez": "274",
-        "vdw_radius_mm3": "265",
-        "vdw_radius_uff": "364",
-        "sound_velocity": "4119.860704",
-        "Polarizability": "21.9"
-    },
-    {
-        "index": "Hf",
-        "atomic_number": "72",
-        "atomic_radius_simple": "167",
-        "atomic_radius_rahm": "264",
-        "atomic_volume": "13.6",
-        "atomic_weight": "178.49",
-        "boiling_point": "5470",
-        "bulk_modulus": "110",
-        "c6_gb": "1040",
-        "covalent_radius_cordero": "175",
-        "covalent_radius_pyykko_simple": "152",
-        "covalent_radius_pyykko_double": "128",
-        "covalent_radius_pyykko_triple": "122",
-        "covalent_radius_slater": "155",
-        "density": "13.31",
-        "dipole_polarizability": "109",
-        "electron_negativity": "1.3",
-        "electron_affinity": "0.014",
-        "en_allen": "6.83",
-        "en_ghosh": "0.229987",
-        "en_pauling": "1.3",
-        "first_ion_en": "6.82507",
-        "fusion_enthalpy": "27.2",
-        "gs_bandgap": "0",
-        "gs_energy": "-9.954299335",
-        "gs_est_bcc_latcnt": "3.541014105",
-        "gs_est_fcc_latcnt": "4.461398209",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "22.2",
-        "hhi_p": "3400",
-        "hhi_r": "2600",
-        "heat_capacity_mass": "0.144",
-        "heat_capacity_molar": "25.73",
-        "icsd_volume": "22.42",
-        "evaporation_heat": "575",
-        "heat_of_formation": "618.4",
-        "lattice_constant": "3.2",
-        "mendeleev_number": "50",
-        "melting_point": "2503",
-        "molar_volume": "13.44",
-        "num_unfilled": "8",
-        "num_valence": "18",
-        "num_d_unfilled": "8",
-        "num_d_valence": "2",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.146",
-        "thermal_conductivity": "23",
-        "vdw_radius_simple": "223",
-        "vdw_radius_alvarez": "263",
-        "vdw_radius_mm3": "253",
-        "vdw_radius_uff": "314.1",
-        "sound_velocity": "3010",
-        "Polarizability": "16.2"
-    },
-    {
-        "index": "Ta",
-        "atomic_number": "73",
-        "atomic_radius_simple": "149",
-        "atomic_radius_rahm": "258",
-        "atomic_volume": "10.9",
-        "atomic_weight": "180.94788",
-        "boiling_point": "5698",
-        "bulk_modulus": "200",
-        "c6_gb": "887",
-        "covalent_radius_cordero": "170",
-        "covalent_radius_pyykko_simple": "146",
-        "covalent_radius_pyykko_double": "126",
-        "covalent_radius_pyykko_triple": "119",
-        "covalent_radius_slater": "145",
-        "density": "16.654",
-        "dipole_polarizability": "88",
-        "electron_negativity": "1.5",
-        "electron_affinity": "0.322",
-        "en_allen": "7.93",
-        "en_ghosh": "0.234581",
-        "en_pauling": "1.5",
-        "first_ion_en": "7.54957",
-        "fusion_enthalpy": "36.57",
-        "gs_bandgap": "0",
-        "gs_energy": "-11.85139954",
-        "gs_est_bcc_latcnt": "3.309248619",
-        "gs_est_fcc_latcnt": "4.169391995",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "18.12",
-        "hhi_p": "2300",
-        "hhi_r": "4800",
-        "heat_capacity_mass": "0.14",
-        "heat_capacity_molar": "25.36",
-        "icsd_volume": "17.65",
-        "evaporation_heat": "758",
-        "heat_of_formation": "782",
-        "lattice_constant": "3.31",
-        "mendeleev_number": "52",
-        "melting_point": "3269",
-        "molar_volume": "10.85",
-        "num_unfilled": "7",
-        "num_valence": "19",
-        "num_d_unfilled": "7",
-        "num_d_valence": "3",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.14",
-        "thermal_conductivity": "57",
-        "vdw_radius_simple": "222",
-        "vdw_radius_alvarez": "253",
-        "vdw_radius_mm3": "243",
-        "vdw_radius_uff": "317",
-        "sound_velocity": "3400",
-        "Polarizability": "13.1"
-    },
-    {
-        "index": "W",
-        "atomic_number": "74",
-        "atomic_radius_simple": "141",
-        "atomic_radius_rahm": "253",
-        "atomic_volume": "9.53",
-        "atomic_weight": "183.84",
-        "boiling_point": "5930",
-        "bulk_modulus": "310",
-        "c6_gb": "757",
-        "covalent_radius_cordero": "162",
-        "covalent_radius_pyykko_simple": "137",
-        "covalent_radius_pyykko_double": "120",
-        "covalent_radius_pyykko_triple": "115",
-        "covalent_radius_slater": "135",
-        "density": "19.3",
-        "dipole_polarizability": "75",
-        "electron_negativity": "2.36",
-        "electron_affinity": "0.81626",
-        "en_allen": "8.67",
-        "en_ghosh": "0.2390504",
-        "en_pauling": "1.7",
-        "first_ion_en": "7.86403",
-        "fusion_enthalpy": "52.31",
-        "gs_bandgap": "0",
-        "gs_energy": "-12.95880062",
-        "gs_est_bcc_latcnt": "3.178105751",
-        "gs_est_fcc_latcnt": "4.004162334",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "16.05",
-        "hhi_p": "7000",
-        "hhi_r": "4300",
-        "heat_capacity_mass": "0.132",
-        "heat_capacity_molar": "24.27",
-        "icsd_volume": "15.85",
-        "evaporation_heat": "824",
-        "heat_of_formation": "851",
-        "lattice_constant": "3.16",
-        "mendeleev_number": "55",
-        "melting_point": "3680",
-        "molar_volume": "9.47",
-        "num_unfilled": "6",
-        "num_valence": "20",
-        "num_d_unfilled": "6",
-        "num_d_valence": "4",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.133",
-        "thermal_conductivity": "170",
-        "vdw_radius_simple": "218",
-        "vdw_radius_alvarez": "257",
-        "vdw_radius_mm3": "239",
-        "vdw_radius_uff": "309.6",
-        "sound_velocity": "5174",
-        "Polarizability": "11.1"
-    },
-    {
-        "index": "Re",
-        "atomic_number": "75",
-        "atomic_radius_simple": "137",
-        "atomic_radius_rahm": "249",
-        "atomic_volume": "8.85",
-        "atomic_weight": "186.207",
-        "boiling_point": "5900",
-        "bulk_modulus": "370",
-        "c6_gb": "663",
-        "covalent_radius_cordero": "151",
-        "covalent_radius_pyykko_simple": "131",
-        "covalent_radius_pyykko_double": "119",
-        "covalent_radius_pyykko_triple": "110",
-        "covalent_radius_slater": "135",
-        "density": "21.02",
-        "dipole_polarizability": "65",
-        "electron_negativity": "1.9",
-        "electron_affinity": "0.15",
-        "en_allen": "9.46",
-        "en_ghosh": "0.2435164",
-        "en_pauling": "1.9",
-        "first_ion_en": "7.83352",
-        "fusion_enthalpy": "34.08",
-        "gs_bandgap": "0",
-        "gs_energy": "-12.41702777",
-        "gs_est_bcc_latcnt": "3.083225384",
-        "gs_est_fcc_latcnt": "3.884620563",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "14.655",
-        "hhi_p": "3300",
-        "hhi_r": "3300",
-        "heat_capacity_mass": "0.137",
-        "heat_capacity_molar": "25.48",
-        "icsd_volume": "14.71",
-        "evaporation_heat": "704",
-        "heat_of_formation": "774",
-        "lattice_constant": "2.76",
-        "mendeleev_number": "58",
-        "melting_point": "3453",
-        "molar_volume": "8.86",
-        "num_unfilled": "5",
-        "num_valence": "21",
-        "num_d_unfilled": "5",
-        "num_d_valence": "5",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.138",
-        "thermal_conductivity": "48",
-        "vdw_radius_simple": "216",
-        "vdw_radius_alvarez": "249",
-        "vdw_radius_mm3": "237",
-        "vdw_radius_uff": "295.4",
-        "sound_velocity": "4700",
-        "Polarizability": "9.7"
-    },
-    {
-        "index": "Os",
-        "atomic_number": "76",
-        "atomic_radius_simple": "135",
-        "atomic_radius_rahm": "244",
-        "atomic_volume": "8.43",
-        "atomic_weight": "190.23",
-        "boiling_point": "5300",
-        "bulk_modulus": "284.8478671",
-        "c6_gb": "584",
-        "covalent_radius_cordero": "144",
-        "covalent_radius_pyykko_simple": "129",
-        "covalent_radius_pyykko_double": "116",
-        "covalent_radius_pyykko_triple": "109",
-        "covalent_radius_slater": "130",
-        "density": "22.57",
-        "dipole_polarizability": "57",
-        "electron_negativity": "2.2",
-        "electron_affinity": "1.1",
-        "en_allen": "9.78",
-        "en_ghosh": "0.2479845",
-        "en_pauling": "2.2",
-        "first_ion_en": "8.43823",
-        "fusion_enthalpy": "57.85",
-        "gs_bandgap": "0",
-        "gs_energy": "-11.22070399",
-        "gs_est_bcc_latcnt": "3.043082054",
-        "gs_est_fcc_latcnt": "3.834043137",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "14.09",
-        "hhi_p": "5500",
-        "hhi_r": "9100",
-        "heat_capacity_mass": "0.13",
-        "heat_capacity_molar": "24.7",
-        "icsd_volume": "13.8",
-        "evaporation_heat": "738",
-        "heat_of_formation": "787",
-        "lattice_constant": "2.74",
-        "mendeleev_number": "63",
-        "melting_point": "3327",
-        "molar_volume": "8.42",
-        "num_unfilled": "4",
-        "num_valence": "22",
-        "num_d_unfilled": "4",
-        "num_d_valence": "6",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.131",
-        "thermal_conductivity": "88",
-        "vdw_radius_simple": "216",
-        "vdw_radius_alvarez": "248",
-        "vdw_radius_mm3": "235",
-        "vdw_radius_uff": "312",
-        "sound_velocity": "4940",
-        "Polarizability": "8.5"
-    },
-    {
-        "index": "Ir",
-        "atomic_number": "77",
-        "atomic_radius_simple": "136",
-        "atomic_radius_rahm": "233",
-        "atomic_volume": "8.54",
-        "atomic_weight": "192.217",
-        "boiling_point": "4403",
-        "bulk_modulus": "320",
-        "c6_gb": "522",
-        "covalent_radius_cordero": "141",
-        "covalent_radius_pyykko_simple": "122",
-        "covalent_radius_pyykko_double": "115",
-        "covalent_radius_pyykko_triple": "107",
-        "covalent_radius_slater": "135",
-        "density": "22.42",
-        "dipole_polarizability": "51",
-        "electron_negativity": "2.2",
-        "electron_affinity": "1.5638",
-        "en_allen": "9.96",
-        "en_ghosh": "0.25106",
-        "en_pauling": "2.2",
-        "first_ion_en": "8.96702",
-        "fusion_enthalpy": "41.12",
-        "gs_bandgap": "0",
-        "gs_energy": "-8.84851145",
-        "gs_est_bcc_latcnt": "3.051696628",
-        "gs_est_fcc_latcnt": "3.84489682",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "14.21",
-        "hhi_p": "5500",
-        "hhi_r": "9100",
-        "heat_capacity_mass": "0.131",
-        "heat_capacity_molar": "25.1",
-        "icsd_volume": "13.88",
-        "evaporation_heat": "604",
-        "heat_of_formation": "669",
-        "lattice_constant": "3.84",
-        "mendeleev_number": "66",
-        "melting_point": "2683",
-        "molar_volume": "8.52",
-        "num_unfilled": "3",
-        "num_valence": "23",
-        "num_d_unfilled": "3",
-        "num_d_valence": "7",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.133",
-        "thermal_conductivity": "150",
-        "vdw_radius_simple": "213",
-        "vdw_radius_alvarez": "241",
-        "vdw_radius_mm3": "236",
-        "vdw_radius_uff": "284",
-        "sound_velocity": "4825",
-        "Polarizability": "7.6"
-    },
-    {
-        "index": "Pt",
-        "atomic_number": "78",
-        "atomic_radius_simple": "139",
-        "atomic_radius_rahm": "230",
-        "atomic_volume": "9.1",
-        "atomic_weight": "195.084",
-        "boiling_point": "4100",
-        "bulk_modulus": "230",
-        "c6_gb": "470",
-        "covalent_radius_cordero": "136",
-        "covalent_radius_pyykko_simple": "123",
-        "covalent_radius_pyykko_double": "112",
-        "covalent_radius_pyykko_triple": "110",
-        "covalent_radius_slater": "135",
-        "density": "21.45",
-        "dipole_polarizability": "44",
-        "electron_negativity": "2.28",
-        "electron_affinity": "2.128",
-        "en_allen": "10.16",
-        "en_ghosh": "0.25691",
-        "en_pauling": "2.2",
-        "first_ion_en": "8.9588",
-        "fusion_enthalpy": "22.175",
-        "gs_bandgap": "0",
-        "gs_energy": "-6.02850968",
-        "gs_est_bcc_latcnt": "3.108612885",
-        "gs_est_fcc_latcnt": "3.91660681",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "15.02",
-        "hhi_p": "5500",
-        "hhi_r": "9100",
-        "heat_capacity_mass": "0.133",
-        "heat_capacity_molar": "25.86",
-        "icsd_volume": "15.1",
-        "evaporation_heat": "470",
-        "heat_of_formation": "565.7",
-        "lattice_constant": "3.92",
-        "mendeleev_number": "68",
-        "melting_point": "2045",
-        "molar_volume": "9.09",
-        "num_unfilled": "2",
-        "num_valence": "24",
-        "num_d_unfilled": "1",
-        "num_d_valence": "9",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "1",
-        "num_s_valence": "1",
-        "period": "6",
-        "specific_heat": "0.133",
-        "thermal_conductivity": "72",
-        "vdw_radius_simple": "213",
-        "vdw_radius_alvarez": "229",
-        "vdw_radius_mm3": "239",
-        "vdw_radius_uff": "275.4",
-        "sound_velocity": "2680",
-        "Polarizability": "6.5"
-    },
-    {
-        "index": "Au",
-        "atomic_number": "79",
-        "atomic_radius_simple": "146",
-        "atomic_radius_rahm": "226",
-        "atomic_volume": "10.2",
-        "atomic_weight": "196.966569",
-        "boiling_point": "3080",
-        "bulk_modulus": "220",
-        "c6_gb": "427",
-        "covalent_radius_cordero": "136",
-        "covalent_radius_pyykko_simple": "124",
-        "covalent_radius_pyykko_double": "121",
-        "covalent_radius_pyykko_triple": "123",
-        "covalent_radius_slater": "135",
-        "density": "19.3",
-        "dipole_polarizability": "36.1",
-        "electron_negativity": "2.54",
-        "electron_affinity": "2.30863",
-        "en_allen": "11.33",
-        "en_ghosh": "0.26137",
-        "en_pauling": "2.4",
-        "first_ion_en": "9.22553",
-        "fusion_enthalpy": "12.55",
-        "gs_bandgap": "0",
-        "gs_energy": "-3.20969261",
-        "gs_est_bcc_latcnt": "3.220442052",
-        "gs_est_fcc_latcnt": "4.057502731",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "16.7",
-        "hhi_p": "1100",
-        "hhi_r": "1000",
-        "heat_capacity_mass": "0.129",
-        "heat_capacity_molar": "25.418",
-        "icsd_volume": "16.96",
-        "evaporation_heat": "340",
-        "heat_of_formation": "368.2",
-        "lattice_constant": "4.08",
-        "mendeleev_number": "70",
-        "melting_point": "1337.58",
-        "molar_volume": "10.21",
-        "num_unfilled": "1",
-        "num_valence": "25",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "1",
-        "num_s_valence": "1",
-        "period": "6",
-        "specific_heat": "0.129",
-        "thermal_conductivity": "320",
-        "vdw_radius_simple": "214",
-        "vdw_radius_alvarez": "232",
-        "vdw_radius_mm3": "243",
-        "vdw_radius_uff": "329.3",
-        "sound_velocity": "1740",
-        "Polarizability": "5.8"
-    },
-    {
-        "index": "Hg",
-        "atomic_number": "80",
-        "atomic_radius_simple": "157",
-        "atomic_radius_rahm": "229",
-        "atomic_volume": "14.8",
-        "atomic_weight": "200.592",
-        "boiling_point": "629.73",
-        "bulk_modulus": "25",
-        "c6_gb": "268",
-        "covalent_radius_cordero": "132",
-        "covalent_radius_pyykko_simple": "133",
-        "covalent_radius_pyykko_double": "142",
-        "covalent_radius_pyykko_triple": "114.7742102",
-        "covalent_radius_slater": "150",
-        "density": "13.546",
-        "dipole_polarizability": "33.91",
-        "electron_negativity": "2",
-        "electron_affinity": "2.225676743",
-        "en_allen": "10.44",
-        "en_ghosh": "0.169",
-        "en_pauling": "1.9",
-        "first_ion_en": "10.4375",
-        "fusion_enthalpy": "2.295",
-        "gs_bandgap": "0",
-        "gs_energy": "-0.250105562",
-        "gs_est_bcc_latcnt": "3.695665057",
-        "gs_est_fcc_latcnt": "4.656246199",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "25.23758621",
-        "hhi_p": "5500",
-        "hhi_r": "3100",
-        "heat_capacity_mass": "0.14",
-        "heat_capacity_molar": "27.983",
-        "icsd_volume": "23.82",
-        "evaporation_heat": "58.5",
-        "heat_of_formation": "61.38",
-        "lattice_constant": "2.99",
-        "mendeleev_number": "74",
-        "melting_point": "234.28",
-        "molar_volume": "14.09",
-        "num_unfilled": "0",
-        "num_valence": "26",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.138",
-        "thermal_conductivity": "8.3",
-        "vdw_radius_simple": "223",
-        "vdw_radius_alvarez": "245",
-        "vdw_radius_mm3": "253",
-        "vdw_radius_uff": "270.5",
-        "sound_velocity": "1407",
-        "Polarizability": "5.02"
-    },
-    {
-        "index": "Tl",
-        "atomic_number": "81",
-        "atomic_radius_simple": "171",
-        "atomic_radius_rahm": "242",
-        "atomic_volume": "17.2",
-        "atomic_weight": "204.38",
-        "boiling_point": "1730",
-        "bulk_modulus": "43",
-        "c6_gb": "509",
-        "covalent_radius_cordero": "145",
-        "covalent_radius_pyykko_simple": "144",
-        "covalent_radius_pyykko_double": "142",
-        "covalent_radius_pyykko_triple": "150",
-        "covalent_radius_slater": "190",
-        "density": "11.85",
-        "dipole_polarizability": "51.7",
-        "electron_negativity": "1.62",
-        "electron_affinity": "0.377",
-        "en_allen": "12.64039003",
-        "en_ghosh": "0.173447",
-        "en_pauling": "1.8",
-        "first_ion_en": "6.108194",
-        "fusion_enthalpy": "4.142",
-        "gs_bandgap": "0",
-        "gs_energy": "-2.27267753",
-        "gs_est_bcc_latcnt": "3.775558738",
-        "gs_est_fcc_latcnt": "4.756905929",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "26.91",
-        "hhi_p": "6500",
-        "hhi_r": "6500",
-        "heat_capacity_mass": "0.129",
-        "heat_capacity_molar": "26.32",
-        "icsd_volume": "28.53",
-        "evaporation_heat": "162.4",
-        "heat_of_formation": "182.2",
-        "lattice_constant": "3.46",
-        "mendeleev_number": "78",
-        "melting_point": "576.6",
-        "molar_volume": "17.22",
-        "num_unfilled": "5",
-        "num_valence": "27",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "5",
-        "num_p_valence": "1",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.128",
-        "thermal_conductivity": "46",
-        "vdw_radius_simple": "196",
-        "vdw_radius_alvarez": "247",
-        "vdw_radius_mm3": "259",
-        "vdw_radius_uff": "434.7",
-        "sound_velocity": "818",
-        "Polarizability": "7.6"
-    },
-    {
-        "index": "Pb",
-        "atomic_number": "82",
-        "atomic_radius_simple": "175",
-        "atomic_radius_rahm": "249",
-        "atomic_volume": "18.3",
-        "atomic_weight": "207.2",
-        "boiling_point": "2013",
-        "bulk_modulus": "46",
-        "c6_gb": "534",
-        "covalent_radius_cordero": "146",
-        "covalent_radius_pyykko_simple": "144",
-        "covalent_radius_pyykko_double": "135",
-        "covalent_radius_pyykko_triple": "137",
-        "covalent_radius_slater": "143.4662685",
-        "density": "11.35",
-        "dipole_polarizability": "47.1",
-        "electron_negativity": "2.33",
-        "electron_affinity": "0.35674316",
-        "en_allen": "10.97",
-        "en_ghosh": "0.177911",
-        "en_pauling": "1.8",
-        "first_ion_en": "7.41663",
-        "fusion_enthalpy": "4.774",
-        "gs_bandgap": "0",
-        "gs_energy": "-3.62902961",
-        "gs_est_bcc_latcnt": "3.830865877",
-        "gs_est_fcc_latcnt": "4.826588558",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "28.11",
-        "hhi_p": "2700",
-        "hhi_r": "1800",
-        "heat_capacity_mass": "0.13",
-        "heat_capacity_molar": "24.7",
-        "icsd_volume": "30.32",
-        "evaporation_heat": "177.8",
-        "heat_of_formation": "195.2",
-        "lattice_constant": "4.95",
-        "mendeleev_number": "82",
-        "melting_point": "600.65",
-        "molar_volume": "18.26",
-        "num_unfilled": "4",
-        "num_valence": "28",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "4",
-        "num_p_valence": "2",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.159",
-        "thermal_conductivity": "35",
-        "vdw_radius_simple": "202",
-        "vdw_radius_alvarez": "260",
-        "vdw_radius_mm3": "274",
-        "vdw_radius_uff": "429.7",
-        "sound_velocity": "1260",
-        "Polarizability": "6.98"
-    },
-    {
-        "index": "Bi",
-        "atomic_number": "83",
-        "atomic_radius_simple": "170",
-        "atomic_radius_rahm": "250",
-        "atomic_volume": "21.3",
-        "atomic_weight": "208.9804",
-        "boiling_point": "1883",
-        "bulk_modulus": "31",
-        "c6_gb": "513",
-        "covalent_radius_cordero": "148",
-        "covalent_radius_pyykko_simple": "151",
-        "covalent_radius_pyykko_double": "141",
-        "covalent_radius_pyykko_triple": "135",
-        "covalent_radius_slater": "160",
-        "density": "9.747",
-        "dipole_polarizability": "50",
-        "electron_negativity": "2.02",
-        "electron_affinity": "0.942362",
-        "en_allen": "11.9",
-        "en_ghosh": "0.182377",
-        "en_pauling": "1.9",
-        "first_ion_en": "7.2855",
-        "fusion_enthalpy": "11.106",
-        "gs_bandgap": "0",
-        "gs_energy": "-3.9736944",
-        "gs_est_bcc_latcnt": "4.039197959",
-        "gs_est_fcc_latcnt": "5.089070533",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "32.95",
-        "hhi_p": "5300",
-        "hhi_r": "6000",
-        "heat_capacity_mass": "0.122",
-        "heat_capacity_molar": "25.52",
-        "icsd_volume": "35.38",
-        "evaporation_heat": "172",
-        "heat_of_formation": "209.6",
-        "lattice_constant": "4.75",
-        "mendeleev_number": "87",
-        "melting_point": "544.5",
-        "molar_volume": "21.31",
-        "num_unfilled": "3",
-        "num_valence": "29",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "3",
-        "num_p_valence": "3",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.124",
-        "thermal_conductivity": "8",
-        "vdw_radius_simple": "207",
-        "vdw_radius_alvarez": "254",
-        "vdw_radius_mm3": "266",
-        "vdw_radius_uff": "437",
-        "sound_velocity": "1790",
-        "Polarizability": "7.4"
-    },
-    {
-        "index": "Po",
-        "atomic_number": "84",
-        "atomic_radius_simple": "176",
-        "atomic_radius_rahm": "250",
-        "atomic_volume": "22.7",
-        "atomic_weight": "209",
-        "boiling_point": "1235",
-        "bulk_modulus": "75.79360664",
-        "c6_gb": "424",
-        "covalent_radius_cordero": "140",
-        "covalent_radius_pyykko_simple": "145",
-        "covalent_radius_pyykko_double": "135",
-        "covalent_radius_pyykko_triple": "129",
-        "covalent_radius_slater": "190",
-        "density": "9.32",
-        "dipole_polarizability": "46",
-        "electron_negativity": "2",
-        "electron_affinity": "1.9",
-        "en_allen": "13",
-        "en_ghosh": "0.186842",
-        "en_pauling": "2",
-        "first_ion_en": "8.414",
-        "fusion_enthalpy": "10",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.039348349",
-        "gs_est_bcc_latcnt": "4.262821718",
-        "gs_est_fcc_latcnt": "5.370818814",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "38.73125",
-        "hhi_p": "4272.884763",
-        "hhi_r": "3871.180773",
-        "heat_capacity_mass": "1.510047822",
-        "heat_capacity_molar": "27.06603795",
-        "icsd_volume": "37.38",
-        "evaporation_heat": "102.9",
-        "heat_of_formation": "214.7722147",
-        "lattice_constant": "3.35",
-        "mendeleev_number": "91",
-        "melting_point": "527",
-        "molar_volume": "22.97",
-        "num_unfilled": "2",
-        "num_valence": "30",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "2",
-        "num_p_valence": "4",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.125",
-        "thermal_conductivity": "20",
-        "vdw_radius_simple": "197",
-        "vdw_radius_alvarez": "214.2720439",
-        "vdw_radius_mm3": "259",
-        "vdw_radius_uff": "470.9",
-        "sound_velocity": "3106.852008",
-        "Polarizability": "6.8"
-    },
-    {
-        "index": "At",
-        "atomic_number": "85",
-        "atomic_radius_simple": "147.6649331",
-        "atomic_radius_rahm": "247",
-        "atomic_volume": "20.93191635",
-        "atomic_weight": "210",
-        "boiling_point": "610",
-        "bulk_modulus": "63.40060618",
-        "c6_gb": "351",
-        "covalent_radius_cordero": "150",
-        "covalent_radius_pyykko_simple": "147",
-        "covalent_radius_pyykko_double": "138",
-        "covalent_radius_pyykko_triple": "138",
-        "covalent_radius_slater": "128.3707671",
-        "density": "6.052295855",
-        "dipole_polarizability": "43",
-        "electron_negativity": "2.22",
-        "electron_affinity": "2.8",
-        "en_allen": "14.1",
-        "en_ghosh": "0.19131",
-        "en_pauling": "2.2",
-        "first_ion_en": "11.14651481",
-        "fusion_enthalpy": "11.05330931",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.039348349",
-        "gs_est_bcc_latcnt": "4.262821718",
-        "gs_est_fcc_latcnt": "5.370818814",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "38.73125",
-        "hhi_p": "4650.134553",
-        "hhi_r": "3891.224606",
-        "heat_capacity_mass": "1.940848188",
-        "heat_capacity_molar": "28.09965104",
-        "icsd_volume": "39.49",
-        "evaporation_heat": "63.47648768",
-        "heat_of_formation": "175.0344973",
-        "lattice_constant": "4.945939271",
-        "mendeleev_number": "96",
-        "melting_point": "575",
-        "molar_volume": "19.27534038",
-        "num_unfilled": "1",
-        "num_valence": "31",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "1",
-        "num_p_valence": "5",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.968225194",
-        "thermal_conductivity": "2",
-        "vdw_radius_simple": "202",
-        "vdw_radius_alvarez": "203.0523628",
-        "vdw_radius_mm3": "251",
-        "vdw_radius_uff": "475",
-        "sound_velocity": "3852.278359",
-        "Polarizability": "6"
-    },
-    {
-        "index": "Rn",
-        "atomic_number": "86",
-        "atomic_radius_simple": "150.1755466",
-        "atomic_radius_rahm": "243",
-        "atomic_volume": "22.89551985",
-        "atomic_weight": "222",
-        "boiling_point": "211.4",
-        "bulk_modulus": "56.49968798",
-        "c6_gb": "408",
-        "covalent_radius_cordero": "150",
-        "covalent_radius_pyykko_simple": "142",
-        "covalent_radius_pyykko_double": "145",
-        "covalent_radius_pyykko_triple": "133",
-        "covalent_radius_slater": "135.1541836",
-        "density": "4.4",
-        "dipole_polarizability": "33.18",
-        "electron_negativity": "2.43",
-        "electron_affinity": "1.9293313",
-        "en_allen": "15.4",
-        "en_ghosh": "0.195772",
-        "en_pauling": "2.043894281",
-        "first_ion_en": "10.7485",
-        "fusion_enthalpy": "7.728805588",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.039348349",
-        "gs_est_bcc_latcnt": "4.262821718",
-        "gs_est_fcc_latcnt": "5.370818814",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "38.73125",
-        "hhi_p": "3952.462219",
-        "hhi_r": "3551.133878",
-        "heat_capacity_mass": "0.094",
-        "heat_capacity_molar": "20.786",
-        "icsd_volume": "41.71",
-        "evaporation_heat": "18.1",
-        "heat_of_formation": "119.7846809",
-        "lattice_constant": "4.960327852",
-        "mendeleev_number": "6",
-        "melting_point": "202",
-        "molar_volume": "50.5",
-        "num_unfilled": "0",
-        "num_valence": "32",
-        "num_d_unfilled": "0",
-        "num_d_valence": "10",
-        "num_f_unfilled": "0",
-        "num_f_valence": "14",
-        "num_p_unfilled": "0",
-        "num_p_valence": "6",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "6",
-        "specific_heat": "0.094",
-        "thermal_conductivity": "0.00361",
-        "vdw_radius_simple": "220",
-        "vdw_radius_alvarez": "240",
-        "vdw_radius_mm3": "243",
-        "vdw_radius_uff": "476.5",
-        "sound_velocity": "2710.612715",
-        "Polarizability": "5.3"
-    },
-    {
-        "index": "Fr",
-        "atomic_number": "87",
-        "atomic_radius_simple": "174.6738109",
-        "atomic_radius_rahm": "258",
-        "atomic_volume": "29.45258293",
-        "atomic_weight": "223",
-        "boiling_point": "950",
-        "bulk_modulus": "72.52774081",
-        "c6_gb": "1953.869773",
-        "covalent_radius_cordero": "260",
-        "covalent_radius_pyykko_simple": "223",
-        "covalent_radius_pyykko_double": "218",
-        "covalent_radius_pyykko_triple": "133.3763528",
-        "covalent_radius_slater": "165.398625",
-        "density": "5.473797742",
-        "dipole_polarizability": "311.5",
-        "electron_negativity": "0.71",
-        "electron_affinity": "0.486",
-        "en_allen": "9.523200702",
-        "en_ghosh": "0.08731",
-        "en_pauling": "0.7",
-        "first_ion_en": "4.072741",
-        "fusion_enthalpy": "7.297893185",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.039348349",
-        "gs_est_bcc_latcnt": "4.262821718",
-        "gs_est_fcc_latcnt": "5.370818814",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "38.73125",
-        "hhi_p": "5016.385915",
-        "hhi_r": "3155.972012",
-        "heat_capacity_mass": "1.443329276",
-        "heat_capacity_molar": "31.20169117",
-        "icsd_volume": "79.69",
-        "evaporation_heat": "55.17810083",
-        "heat_of_formation": "142.9444811",
-        "lattice_constant": "5.31935914",
-        "mendeleev_number": "7",
-        "melting_point": "300",
-        "molar_volume": "30.6174396",
-        "num_unfilled": "1",
-        "num_valence": "1",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "1",
-        "num_s_valence": "1",
-        "period": "7",
-        "specific_heat": "0.864490927",
-        "thermal_conductivity": "69.93748069",
-        "vdw_radius_simple": "348",
-        "vdw_radius_alvarez": "247.9600442",
-        "vdw_radius_mm3": "364",
-        "vdw_radius_uff": "490",
-        "sound_velocity": "2864.360861",
-        "Polarizability": "48.6"
-    },
-    {
-        "index": "Ra",
-        "atomic_number": "88",
-        "atomic_radius_simple": "170.2553601",
-        "atomic_radius_rahm": "292",
-        "atomic_volume": "45",
-        "atomic_weight": "226",
-        "boiling_point": "1413",
-        "bulk_modulus": "80.25391694",
-        "c6_gb": "1959.613051",
-        "covalent_radius_cordero": "221",
-        "covalent_radius_pyykko_simple": "201",
-        "covalent_radius_pyykko_double": "173",
-        "covalent_radius_pyykko_triple": "159",
-        "covalent_radius_slater": "215",
-        "density": "5.5",
-        "dipole_polarizability": "242.8",
-        "electron_negativity": "0.92",
-        "electron_affinity": "0.1",
-        "en_allen": "10.31150272",
-        "en_ghosh": "0.09789",
-        "en_pauling": "0.9",
-        "first_ion_en": "5.278423",
-        "fusion_enthalpy": "7.7",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.039348349",
-        "gs_est_bcc_latcnt": "4.262821718",
-        "gs_est_fcc_latcnt": "5.370818814",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "38.73125",
-        "hhi_p": "4798.615716",
-        "hhi_r": "3678.21981",
-        "heat_capacity_mass": "1.41882459",
-        "heat_capacity_molar": "26.96763441",
-        "icsd_volume": "68.22",
-        "evaporation_heat": "113",
-        "heat_of_formation": "159",
-        "lattice_constant": "4.893697566",
-        "mendeleev_number": "13",
-        "melting_point": "973",
-        "molar_volume": "41.09",
-        "num_unfilled": "0",
-        "num_valence": "2",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "7",
-        "specific_heat": "0.12",
-        "thermal_conductivity": "19",
-        "vdw_radius_simple": "283",
-        "vdw_radius_alvarez": "248.9334266",
-        "vdw_radius_mm3": "327",
-        "vdw_radius_uff": "367.7",
-        "sound_velocity": "4596.620587",
-        "Polarizability": "38.3"
-    },
-    {
-        "index": "Ac",
-        "atomic_number": "89",
-        "atomic_radius_simple": "188",
-        "atomic_radius_rahm": "293",
-        "atomic_volume": "22.54",
-        "atomic_weight": "227",
-        "boiling_point": "3470",
-        "bulk_modulus": "109.7992991",
-        "c6_gb": "2178.590739",
-        "covalent_radius_cordero": "215",
-        "covalent_radius_pyykko_simple": "186",
-        "covalent_radius_pyykko_double": "153",
-        "covalent_radius_pyykko_triple": "140",
-        "covalent_radius_slater": "195",
-        "density": "9.756749058",
-        "dipole_polarizability": "217",
-        "electron_negativity": "1.09",
-        "electron_affinity": "0.35",
-        "en_allen": "8.039883612",
-        "en_ghosh": "0.10033",
-        "en_pauling": "1.1",
-        "first_ion_en": "5.17",
-        "fusion_enthalpy": "12",
-        "gs_bandgap": "0",
-        "gs_energy": "-4.105002298",
-        "gs_est_bcc_latcnt": "4.465163104",
-        "gs_est_fcc_latcnt": "5.625752986",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "44.5125",
-        "hhi_p": "6777.447304",
-        "hhi_r": "4454.383934",
-        "heat_capacity_mass": "0.12",
-        "heat_capacity_molar": "27.2",
-        "icsd_volume": "37.45",
-        "evaporation_heat": "292.9",
-        "heat_of_formation": "406",
-        "lattice_constant": "5.31",
-        "mendeleev_number": "48",
-        "melting_point": "1320",
-        "molar_volume": "22.55",
-        "num_unfilled": "9",
-        "num_valence": "3",
-        "num_d_unfilled": "9",
-        "num_d_valence": "1",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "7",
-        "specific_heat": "0.716726031",
-        "thermal_conductivity": "12",
-        "vdw_radius_simple": "247",
-        "vdw_radius_alvarez": "280",
-        "vdw_radius_mm3": "308",
-        "vdw_radius_uff": "347.8",
-        "sound_velocity": "3633.642953",
-        "Polarizability": "32.1"
-    },
-    {
-        "index": "Th",
-        "atomic_number": "90",
-        "atomic_radius_simple": "180",
-        "atomic_radius_rahm": "289",
-        "atomic_volume": "19.8",
-        "atomic_weight": "232.0377",
-        "boiling_point": "5060",
-        "bulk_modulus": "54",
-        "c6_gb": "2513.278129",
-        "covalent_radius_cordero": "206",
-        "covalent_radius_pyykko_simple": "175",
-        "covalent_radius_pyykko_double": "143",
-        "covalent_radius_pyykko_triple": "136",
-        "covalent_radius_slater": "180",
-        "density": "11.78",
-        "dipole_polarizability": "217",
-        "electron_negativity": "1.32",
-        "electron_affinity": "2.918971078",
-        "en_allen": "5.619315079",
-        "en_ghosh": "0.10277",
-        "en_pauling": "1.3",
-        "first_ion_en": "6.3067",
-        "fusion_enthalpy": "13.81",
-        "gs_bandgap": "0",
-        "gs_energy": "-7.41254306",
-        "gs_est_bcc_latcnt": "4.015357627",
-        "gs_est_fcc_latcnt": "5.059033597",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "32.37",
-        "hhi_p": "7607.018787",
-        "hhi_r": "4738.331772",
-        "heat_capacity_mass": "0.118",
-        "heat_capacity_molar": "27.32",
-        "icsd_volume": "32.86",
-        "evaporation_heat": "513.7",
-        "heat_of_formation": "602",
-        "lattice_constant": "5.08",
-        "mendeleev_number": "47",
-        "melting_point": "2028",
-        "molar_volume": "19.8",
-        "num_unfilled": "8",
-        "num_valence": "4",
-        "num_d_unfilled": "8",
-        "num_d_valence": "2",
-        "num_f_unfilled": "0",
-        "num_f_valence": "0",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "7",
-        "specific_heat": "0.113",
-        "thermal_conductivity": "54",
-        "vdw_radius_simple": "245",
-        "vdw_radius_alvarez": "293",
-        "vdw_radius_mm3": "274",
-        "vdw_radius_uff": "339.6",
-        "sound_velocity": "2490",
-        "Polarizability": "32.1"
-    },
-    {
-        "index": "Pa",
-        "atomic_number": "91",
-        "atomic_radius_simple": "161",
-        "atomic_radius_rahm": "285",
-        "atomic_volume": "15",
-        "atomic_weight": "231.03588",
-        "boiling_point": "4300",
-        "bulk_modulus": "145.3996842",
-        "c6_gb": "2039.299326",
-        "covalent_radius_cordero": "200",
-        "covalent_radius_pyykko_simple": "169",
-        "covalent_radius_pyykko_double": "138",
-        "covalent_radius_pyykko_triple": "129",
-        "covalent_radius_slater": "180",
-        "density": "15.37",
-        "dipole_polarizability": "171",
-        "electron_negativity": "1.54",
-        "electron_affinity": "2.885456144",
-        "en_allen": "6.557193021",
-        "en_ghosh": "0.12149",
-        "en_pauling": "1.5",
-        "first_ion_en": "5.89",
-        "fusion_enthalpy": "12.34",
-        "gs_bandgap": "0",
-        "gs_energy": "-9.49741247",
-        "gs_est_bcc_latcnt": "3.692852039",
-        "gs_est_fcc_latcnt": "4.652702018",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "25.18",
-        "hhi_p": "5931.48079",
-        "hhi_r": "4534.898531",
-        "heat_capacity_mass": "1.345172426",
-        "heat_capacity_molar": "23.74970846",
-        "icsd_volume": "24.94",
-        "evaporation_heat": "481.2",
-        "heat_of_formation": "563",
-        "lattice_constant": "3.92",
-        "mendeleev_number": "46",
-        "melting_point": "2113",
-        "molar_volume": "15.18",
-        "num_unfilled": "21",
-        "num_valence": "5",
-        "num_d_unfilled": "9",
-        "num_d_valence": "1",
-        "num_f_unfilled": "12",
-        "num_f_valence": "2",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "7",
-        "specific_heat": "0.121",
-        "thermal_conductivity": "47",
-        "vdw_radius_simple": "243",
-        "vdw_radius_alvarez": "288",
-        "vdw_radius_mm3": "264",
-        "vdw_radius_uff": "342.4",
-        "sound_velocity": "5621.547555",
-        "Polarizability": "25.4"
-    },
-    {
-        "index": "U",
-        "atomic_number": "92",
-        "atomic_radius_simple": "138",
-        "atomic_radius_rahm": "283",
-        "atomic_volume": "12.5",
-        "atomic_weight": "238.02891",
-        "boiling_point": "4018",
-        "bulk_modulus": "100",
-        "c6_gb": "2491.29258",
-        "covalent_radius_cordero": "196",
-        "covalent_radius_pyykko_simple": "170",
-        "covalent_radius_pyykko_double": "134",
-        "covalent_radius_pyykko_triple": "118",
-        "covalent_radius_slater": "175",
-        "density": "19.05",
-        "dipole_polarizability": "137",
-        "electron_negativity": "1.38",
-        "electron_affinity": "3.112282786",
-        "en_allen": "5.594914253",
-        "en_ghosh": "0.13207",
-        "en_pauling": "1.7",
-        "first_ion_en": "6.1941",
-        "fusion_enthalpy": "9.14",
-        "gs_bandgap": "0",
-        "gs_energy": "-11.29233996",
-        "gs_est_bcc_latcnt": "3.42137628",
-        "gs_est_fcc_latcnt": "4.310663995",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "20.025",
-        "hhi_p": "8060.265334",
-        "hhi_r": "4021.325327",
-        "heat_capacity_mass": "0.116",
-        "heat_capacity_molar": "27.665",
-        "icsd_volume": "21.18",
-        "evaporation_heat": "417",
-        "heat_of_formation": "533",
-        "lattice_constant": "2.85",
-        "mendeleev_number": "45",
-        "melting_point": "1405.5",
-        "molar_volume": "12.49",
-        "num_unfilled": "20",
-        "num_valence": "6",
-        "num_d_unfilled": "9",
-        "num_d_valence": "1",
-        "num_f_unfilled": "11",
-        "num_f_valence": "3",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "7",
-        "specific_heat": "0.115",
-        "thermal_conductivity": "27",
-        "vdw_radius_simple": "241",
-        "vdw_radius_alvarez": "271",
-        "vdw_radius_mm3": "252",
-        "vdw_radius_uff": "339.5",
-        "sound_velocity": "3155",
-        "Polarizability": "24.9"
-    },
-    {
-        "index": "Np",
-        "atomic_number": "93",
-        "atomic_radius_simple": "130",
-        "atomic_radius_rahm": "280",
-        "atomic_volume": "21.1",
-        "atomic_weight": "237",
-        "boiling_point": "4175",
-        "bulk_modulus": "124.1017144",
-        "c6_gb": "2398.576467",
-        "covalent_radius_cordero": "190",
-        "covalent_radius_pyykko_simple": "171",
-        "covalent_radius_pyykko_double": "136",
-        "covalent_radius_pyykko_triple": "116",
-        "covalent_radius_slater": "175",
-        "density": "20.25",
-        "dipole_polarizability": "167",
-        "electron_negativity": "1.36",
-        "electron_affinity": "3.380670609",
-        "en_allen": "6.515828492",
-        "en_ghosh": "0.14265",
-        "en_pauling": "1.3",
-        "first_ion_en": "6.2657",
-        "fusion_enthalpy": "3.2",
-        "gs_bandgap": "0",
-        "gs_energy": "-12.94031436",
-        "gs_est_bcc_latcnt": "3.329442683",
-        "gs_est_fcc_latcnt": "4.194834921",
-        "gs_mag_moment": "0",
-        "gs_volume_per": "18.45375",
-        "hhi_p": "7658.348671",
-        "hhi_r": "4222.775527",
-        "heat_capacity_mass": "1.525300465",
-        "heat_capacity_molar": "26.7653742",
-        "icsd_volume": "19.22",
-        "evaporation_heat": "336",
-        "heat_of_formation": "464.8",
-        "lattice_constant": "4.72",
-        "mendeleev_number": "44",
-        "melting_point": "913",
-        "molar_volume": "11.59",
-        "num_unfilled": "19",
-        "num_valence": "7",
-        "num_d_unfilled": "9",
-        "num_d_valence": "1",
-        "num_f_unfilled": "10",
-        "num_f_valence": "4",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "7",
-        "specific_heat": "0.543388225",
-        "thermal_conductivity": "6",
-        "vdw_radius_simple": "239",
-        "vdw_radius_alvarez": "282",
-        "vdw_radius_mm3": "252",
-        "vdw_radius_uff": "342.4",
-        "sound_velocity": "2999.089592",
-        "Polarizability": "24.8"
-    },
-    {
-        "index": "Pu",
-        "atomic_number": "94",
-        "atomic_radius_simple": "151",
-        "atomic_radius_rahm": "278",
-        "atomic_volume": "21.15659415",
-        "atomic_weight": "244",
-        "boiling_point": "3505",
-        "bulk_modulus": "90.47093768",
-        "c6_gb": "2294.423315",
-        "covalent_radius_cordero": "187",
-        "covalent_radius_pyykko_simple": "172",
-        "covalent_radius_pyykko_double": "135",
-        "covalent_radius_pyykko_triple": "135.2516505",
-        "covalent_radius_slater": "175",
-        "density": "19.84",
-        "dipole_polarizability": "165",
-        "electron_negativity": "1.28",
-        "electron_affinity": "2.841452899",
-        "en_allen": "6.637731448",
-        "en_ghosh": "0.16137",
-        "en_pauling": "1.3",
-        "first_ion_en": "6.026",
-        "fusion_enthalpy": "2.824",
-        "gs_bandgap": "0",
-        "gs_energy": "-14.32663431",
-        "gs_est_bcc_latcnt": "3.306811764",
-        "gs_est_fcc_latcnt": "4.166321749",
-        "gs_mag_moment": "0.318003638",
-        "gs_volume_per": "18.08",
-        "hhi_p": "7747.714809",
-        "hhi_r": "4069.620141",
-        "heat_capacity_mass": "0.988076988",
-        "heat_capacity_molar": "27.86135998",
-        "icsd_volume": "20.04",
-        "evaporation_heat": "343.5",
-        "heat_of_formation": "345",
-        "lattice_constant": "4.221422036",
-        "mendeleev_number": "43",
-        "melting_point": "914",
-        "molar_volume": "12.29",
-        "num_unfilled": "8",
-        "num_valence": "8",
-        "num_d_unfilled": "0",
-        "num_d_valence": "0",
-        "num_f_unfilled": "8",
-        "num_f_valence": "6",
-        "num_p_unfilled": "0",
-        "num_p_valence": "0",
-        "num_s_unfilled": "0",
-        "num_s_valence": "2",
-        "period": "7",
-        "specific_heat": "0.646076854",
-        "thermal_conductivity": "6",
-        "vdw_radius_simple": "243",
-        "vdw_radius_alvarez": "281",
-        "vdw_radius_mm3": "252",
-        "vdw_radius_uff": "342.4",
-        "sound_velocity": "2260",
-        "Polarizability": "24.5"
-    }
-]
\ No newline at end of file
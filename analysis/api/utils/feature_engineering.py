@@ -1,7 +1,7 @@
 #=================================================================================================
 # Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 #          Hokkaido University (2018)
-#          Last Update: Q3 2023
+#          Last Update: Q4 2026
 # ________________________________________________________________________________________________
 # Authors:Yoshiki Hasukawa (Student Developer and Component Design) [2024] 
 #         Fernando Garcia-Escobar, (Developer Of Feature Engineering Code) [2024] 
@@ -12,8 +12,10 @@
 # ------------------------------------------------------------------------------------------------
 # Notes:  This is one of the REST API parts of the 'data processing' interface of the website that
 #         allows serverside work for the 'Feature Engineerign' component.
+#         All the first order descriptors are computed in one float64 block, and the invariant or
+#         non-finite ones are dropped with masks before the result DataFrame is built.
 # ------------------------------------------------------------------------------------------------
-# References: logging, numpy libs
+# References: logging, numpy, pandas libs and 'common' folder's 'renderers'
 #=================================================================================================
 
 #-------------------------------------------------------------------------------------------------
@@ -25,6 +27,8 @@ import time
 import numpy as np
 import pandas as pd
 
+from common.renderers import TableRows
+
 logger = logging.getLogger(__name__)
 #-------------------------------------------------------------------------------------------------
 
@@ -68,6 +72,45 @@ def ln_value(descriptor):
 def inverse_ln(descriptor):
     return(np.log(descriptor)**-1)
 
+first_order_transforms = {'x': [simple_value, '', ''],
+                          '1/(x)': [inverse_value, '1/(', ')'],
+                          '(x)^2': [squared_value, '(', ')^2'],
+                          '1/(x)^2': [inverse_square, '1/(', ')^2'],
+                          '(x)^3': [cubic_value, '(', ')^3'],
+                          '1/(x)^3': [inverse_cube, '1/(', ')^3'],
+                          'sqrt(x)': [sqrt_value, 'sqrt(', ')'],
+                          '1/sqrt(x)': [inverse_sqrt, '1/sqrt(', ')'],
+                          'exp(x)': [exponential_value, 'exp(', ')'],
+                          '1/exp(x)': [inverse_exponential, '1/exp(', ')'],
+                          'ln(x)': [ln_value, 'ln(', ')'],
+                          '1/ln(x)': [inverse_ln, '1/ln(', ')']
+                          }
+
+"""
+'compute_first_order_descriptors' applies every selected transform to every descriptor column at once, in one
+float64 block (rows x columns*transforms, ordered by column and then by transform), rounded to 8 decimals.
+The columns with infinite or nan values (divisions by zero, logarithms or square roots of negative values...) and
+the invariant columns are then dropped with masks.
+"""
+
+def compute_first_order_descriptors(values, names, transforms):
+    no_rows, no_columns = values.shape
+    no_transforms = len(transforms)
+    block = np.empty((no_rows, no_columns * no_transforms), dtype = np.float64)
+    with np.errstate(all = 'ignore'):
+        for k, transform in enumerate(transforms):
+            block[:, k::no_transforms] = first_order_transforms[transform][0](values)
+        np.round(block, 8, out = block)
+
+    block_names = np.array([first_order_transforms[t][1] + x + first_order_transforms[t][2]
+                            for x in names for t in transforms], dtype = object)
+
+    keep = np.isfinite(block).all(axis = 0)
+    if no_rows:
+        keep &= (block != block[0]).any(axis = 0)
+
+    return block[:, keep], block_names[keep].tolist()
+
 #-------------------------------------------------------------------------------------------------
 
 #-------------------------------------------------------------------------------------------------
@@ -110,47 +153,24 @@ def get_feature_engineering(data):
         else :
             descriptors = df[descriptor_columns_list]
 
-    # Dropping invariant columns
-    descriptors.drop(columns = [x for x in descriptors.loc[:,descriptors.nunique() == 1].columns], inplace = True)
-    # logger.info(descriptors)
-
-    first_order_descriptors = {'x': [simple_value],
-                           '1/(x)': [inverse_value, '1/(', ')'],
-                           '(x)^2': [squared_value, '(', ')^2'],
-                           '1/(x)^2': [inverse_square, '1/(', ')^2'],
-                           '(x)^3': [cubic_value, '(', ')^3'],
-                           '1/(x)^3': [inverse_cube, '1/(', ')^3'],
-                           'sqrt(x)': [sqrt_value, 'sqrt(', ')'],
-                           '1/sqrt(x)': [inverse_sqrt, '1/sqrt(', ')'],
-                           'exp(x)': [exponential_value, 'exp(', ')'],
-                           '1/exp(x)': [inverse_exponential, '1/exp(', ')'],
-                           'ln(x)': [ln_value, 'ln(', ')'],
-                           '1/ln(x)': [inverse_ln, '1/ln(', ')']
-                           }
-    
-    descriptor_placeholder_list = []
-    descriptor_placeholder_names = []
-    for x in descriptors.columns.tolist():
-        for descriptor_to_operate in first_order_descriptors_list:
-            descriptor_placeholder_list.append(first_order_descriptors[descriptor_to_operate][0](descriptors[x]).tolist())
-            if descriptor_to_operate == 'x':
-                descriptor_placeholder_names.append(x)
-            else:
-                descriptor_placeholder_names.append(first_order_descriptors[descriptor_to_operate][1] + x + first_order_descriptors[descriptor_to_operate][2])
-
-    first_order_descriptors = pd.DataFrame(np.array(descriptor_placeholder_list).T, columns = descriptor_placeholder_names).round(8)
-    # logger.info(first_order_descriptors)
+    try :
+        values = descriptors.to_numpy(dtype = np.float64)
+    except (TypeError, ValueError):
+        result['status'] = 'error'
+        result['detail'] = "could not convert string to float. Data contains strings. Please enter a numerical value."
+        return result
+    names = descriptors.columns.tolist()
 
-    # Dropping invariant columns
+    # Dropping invariant columns (their first order descriptors would be invariant too)
+    if len(values):
+        varying = (values != values[0]).any(axis = 0)
+        values = values[:, varying]
+        names = [x for x, keep in zip(names, varying) if keep]
 
-    first_order_descriptors.drop(columns = [x for x in first_order_descriptors.loc[:, first_order_descriptors.nunique() == 1].columns], inplace = True)
+    first_order_descriptors, first_order_names = compute_first_order_descriptors(values, names, first_order_descriptors_list)
 
-    # Replacing infinite values with nan values
-
-    first_order_descriptors.replace(to_replace = [-np.inf, np.inf], value = np.nan, inplace = True)
-
-    # Dropping columns with nan values
-    first_order_descriptors.dropna(axis = 1, inplace = True)
+    first_order_descriptors = pd.DataFrame(first_order_descriptors, columns = first_order_names)
+    # logger.info(first_order_descriptors)
 
     first_order_descriptors = pd.concat([first_order_descriptors, targets], axis = 1)
     # logger.info(first_order_descriptors)
@@ -158,8 +178,8 @@ def get_feature_engineering(data):
     #Header List and Cell Data For View Table of VisComp
     header = first_order_descriptors.columns
     result['header'] = header
-    data = first_order_descriptors.T.to_dict(orient='list')
-    result['data'] = data
+    # the rows stay a DataFrame until rendered (as JSON rows or as binary columns)
+    result['data'] = TableRows(first_order_descriptors)
     # logger.info(header)
     # logger.info(data)
     
@@ -1,7 +1,7 @@
 #=================================================================================================
 # Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 #          Hokkaido University (2018)
-#          Last Update: Q3 2023
+#          Last Update: Q4 2026
 # ________________________________________________________________________________________________
 # Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
 #          Jun Fujima (Former Lead Developer) [2018-2021]
@@ -12,7 +12,7 @@
 # Notes:  This is one of the REST API parts of the 'analysis' interface of the website that
 #         allows serverside work for the 'feature importance' component.
 # ------------------------------------------------------------------------------------------------
-# References: logging, numpy, pandas and sklearn libs
+# References: logging, numpy, pandas and sklearn libs and 'analysis' folder's 'compute'
 #=================================================================================================
 
 #-------------------------------------------------------------------------------------------------
@@ -25,6 +25,8 @@ from sklearn.ensemble import RandomForestClassifier
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.model_selection import train_test_split
 
+from analysis.compute import get_n_jobs
+
 logger = logging.getLogger(__name__)
 
 #-------------------------------------------------------------------------------------------------
@@ -50,10 +52,10 @@ def get_feature_importance(data):
 
     model = None
     try:
-        model = RandomForestClassifier(n_estimators=10, random_state=0)
+        model = RandomForestClassifier(n_estimators=10, random_state=0, n_jobs=get_n_jobs())
         model.fit(X_train, y_train)
     except ValueError:
-        model = RandomForestRegressor(n_estimators=10, random_state=0)
+        model = RandomForestRegressor(n_estimators=10, random_state=0, n_jobs=get_n_jobs())
         model.fit(X_train, y_train)
 
     fti = model.feature_importances_
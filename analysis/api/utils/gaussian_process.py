@@ -1,7 +1,7 @@
 #=================================================================================================
 # Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 #          Hokkaido University (2018)
-#          Last Update: Q3 2023
+#          Last Update: Q4 2026
 # ________________________________________________________________________________________________
 # Authors: Yoshiki Hasukawa (Student Developer and Component Design) [2023]
 #          Mikael Nicander Kuwahara (Lead Developer) [2021-]
@@ -11,13 +11,22 @@
 # ------------------------------------------------------------------------------------------------
 # Notes:  This is one of the REST API parts of the 'analysis' interface of the website that
 #         allows serverside work for the 'GaussianProcess' component.
+#         The validation splits are fitted in parallel, within the compute budget of the 'compute'
+#         helpers, each one on its training rows only (so their scores are the same as a serial
+#         loop over the splits). The optional optimizer restarts ('optimizerRestarts' setting, at
+#         most GP_MAX_OPTIMIZER_RESTARTS) start from random hyperparameters, and the fit with the
+#         best log marginal likelihood is kept. The prediction grid is evaluated in bounded memory
+#         blocks, and the Expected Improvement on whole arrays.
 # ------------------------------------------------------------------------------------------------
-# References: logging, numpy, pandas and sklearn libs
+# References: Django settings, logging, math, numpy, pandas, joblib, scipy and sklearn libs and
+#             'analysis' folder's 'compute'
 #=================================================================================================
 
 #-------------------------------------------------------------------------------------------------
 # Import required Libraries
 #-------------------------------------------------------------------------------------------------
+from django.conf import settings
+
 import logging
 import math
 import numpy as np
@@ -30,32 +39,272 @@ from sklearn.gaussian_process import GaussianProcessRegressor
 from sklearn.gaussian_process import kernels as sk_kern
 from sklearn.gaussian_process.kernels import ConstantKernel, RBF, WhiteKernel, DotProduct, Matern
 from sklearn.preprocessing import StandardScaler
+from scipy.linalg import cholesky, cho_solve, solve_triangular
 from scipy.stats import norm
+from joblib import Parallel, delayed
+
+from analysis.compute import get_n_jobs
 
 logger = logging.getLogger(__name__)
 
 #-------------------------------------------------------------------------------------------------
 
+PREDICT_BLOCK_BYTES = 64 * 2**20  # max size of the (grid block x training points) kernel matrix
+
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_optimizer_restarts(view_settings):
+    """Number of optimizer restarts asked for by a view ('optimizerRestarts' setting), capped by
+    the GP_MAX_OPTIMIZER_RESTARTS setting."""
+    restarts = int(view_settings.get('optimizerRestarts', 0) or 0)
+    if restarts < 0:
+        raise ValueError('The number of optimizer restarts can not be negative')
+    return min(restarts, settings.GP_MAX_OPTIMIZER_RESTARTS)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def fit_restart(kernel, x, y, seed):
+    """Fit a model with the kernel hyperparameters optimized from a random start within their
+    bounds (from the kernel's own values for seed 0)."""
+    if seed:
+        bounds = kernel.bounds
+        kernel = kernel.clone_with_theta(np.random.RandomState(seed).uniform(bounds[:, 0], bounds[:, 1]))
+    model = GaussianProcessRegressor(kernel)
+    model.fit(x, y)
+    return model
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def fit_best_model(kernel, x, y, restarts=0):
+    """Fit a model on all the data, the optimizer restarts (if any) being run in parallel, and keep
+    the one with the best log marginal likelihood."""
+    if not restarts:
+        return fit_restart(kernel, x, y, 0)
+    models = Parallel(n_jobs=get_n_jobs())(delayed(fit_restart)(kernel, x, y, seed) for seed in range(restarts + 1))
+    return max(models, key=lambda m: m.log_marginal_likelihood_value_)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def score_validation_split(kernel, x, y, seed, restarts=0):
+    """Score a model fitted on the training rows of a split only (with its own restarts)."""
+    X_train, X_test, y_train, y_test = train_test_split(x, y, test_size=0.2, random_state=seed)
+    model = fit_best_model(kernel, X_train, y_train, restarts)
+    return model.score(X_test, y_test)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def grid_points(axes, flat_indices):
+    """Get points of the grid np.meshgrid(*axes) would give (flattened), from their indices, without
+    building the whole grid.
+
+    Arguments:
+        axes {list} -- The values of each feature along the grid.
+        flat_indices {array} -- Indices of the points in the flattened grid.
+
+    Returns:
+        array -- the points (one row per index, one column per feature)
+    """
+    shape = [len(a) for a in axes]
+    if len(axes) > 1: # the first two axes are swapped by the default ('xy') indexing of meshgrid
+        shape[0], shape[1] = shape[1], shape[0]
+    indices = np.unravel_index(flat_indices, shape)
+    if len(axes) > 1:
+        indices = (indices[1], indices[0]) + indices[2:]
+    return np.column_stack([a[i] for a, i in zip(axes, indices)])
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def grid_columns(axes, block=None):
+    """Get the flattened np.meshgrid(*axes) arrays (one per feature), filled block by block from
+    the point indices, without building the dense meshgrid.
+
+    Arguments:
+        axes {list} -- The values of each feature along the grid.
+        block {int} -- Number of points per block (within PREDICT_BLOCK_BYTES if None).
+
+    Returns:
+        list -- the values of each feature at all the points of the grid
+    """
+    size = int(np.prod([len(a) for a in axes]))
+    block = block or max(1, PREDICT_BLOCK_BYTES // (8 * len(axes)))
+    columns = [np.empty(size, dtype=np.asarray(a).dtype) for a in axes]
+    for start in range(0, size, block):
+        stop = min(start + block, size)
+        points = grid_points(axes, np.arange(start, stop))
+        for column, values in zip(columns, points.T):
+            column[start:stop] = values
+    return columns
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def predict_grid(model, axes, no_train):
+    """Predict (mean and standard deviation) all the points of a grid, block by block so that the
+    kernel matrix between the grid points and the training points stays within PREDICT_BLOCK_BYTES.
+
+    Arguments:
+        model {GaussianProcessRegressor} -- The fitted model.
+        axes {list} -- The values of each feature along the grid.
+        no_train {int} -- Number of training points of the model.
+
+    Returns:
+        pred, std  -- the predictions in the order of the flattened np.meshgrid(*axes) grid
+    """
+    size = int(np.prod([len(a) for a in axes]))
+    block = max(1, PREDICT_BLOCK_BYTES // (8 * max(no_train, 1)))
+    pred = np.empty(size)
+    std = np.empty(size)
+    for start in range(0, size, block):
+        stop = min(start + block, size)
+        pred[start:stop], std[start:stop] = model.predict(grid_points(axes, np.arange(start, stop)), return_std=True)
+    return pred, std
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def extend_fit(model, axes, pred, var, x, y):
+    """Condition a fitted model on new observations with its kernel hyperparameters kept, and
+    update its prediction of a grid accordingly, without fitting or predicting all over again:
+    the Cholesky factor of the training kernel matrix is extended by the new rows (a rank-k
+    update), and the grid mean and variance get the change brought by the new observations only.
+    The model is the same as one fitted on all the observations without optimizer.
+
+    Arguments:
+        model {GaussianProcessRegressor} -- The fitted model (without normalize_y), updated.
+        axes {list} -- The values of each feature along the grid.
+        pred {array} -- The predicted mean of the grid points, updated.
+        var {array} -- The predicted variance of the grid points, updated.
+        x {array} -- The new observations (one row per observation).
+        y {array} -- Their targets.
+
+    Raises:
+        LinAlgError -- if the new kernel matrix is not positive definite (the model should then
+                       be fitted again)
+    """
+    kernel = model.kernel_
+    x_train = model.X_train_
+    # the old posterior at the new points, and their kernel matrix given the old observations
+    residuals = y - model.predict(x)
+    B = kernel(x_train, x)
+    C = kernel(x)
+    C[np.diag_indices_from(C)] += model.alpha
+    L21 = solve_triangular(model.L_, B, lower=True).T
+    L22 = cholesky(C - L21 @ L21.T, lower=True)
+    W = solve_triangular(model.L_, L21.T, lower=True, trans='T')  # K^-1 B
+    z = solve_triangular(L22, residuals, lower=True)
+
+    size = len(pred)
+    block = max(1, PREDICT_BLOCK_BYTES // (8 * max(len(x_train), 1)))
+    for start in range(0, size, block):
+        stop = min(start + block, size)
+        points = grid_points(axes, np.arange(start, stop))
+        # covariance of the grid points and the new points given the old observations
+        u = solve_triangular(L22, (kernel(points, x) - kernel(points, x_train) @ W).T, lower=True)
+        pred[start:stop] += u.T @ z
+        var[start:stop] = np.maximum(var[start:stop] - (u**2).sum(axis=0), 0)
+
+    n = len(x_train)
+    L = np.zeros((n + len(x), n + len(x)))
+    L[:n, :n] = model.L_
+    L[n:, :n] = L21
+    L[n:, n:] = L22
+    model.X_train_ = np.vstack([x_train, x])
+    model.y_train_ = np.concatenate([model.y_train_, y])
+    model.L_ = L
+    model.alpha_ = cho_solve((L, True), model.y_train_, check_finite=False)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def top_indices(values, count):
+    """Indices of the count largest values (all of them if there are fewer), largest first."""
+    count = min(count, len(values))
+    if count <= 0:
+        return np.array([], dtype=np.intp)
+    top = np.argpartition(values, len(values) - count)[len(values) - count:]
+    return top[np.argsort(values[top])[::-1]]
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_kernel(name, no_features):
+    """Build one of the predefined kernels from its name."""
+    if name == 'ConstantKernel() * RBF() + WhiteKernel()':
+        return ConstantKernel() * RBF() + WhiteKernel()
+    elif name == 'ConstantKernel() * DotProduct() + WhiteKernel()':
+        return ConstantKernel() * DotProduct() + WhiteKernel()
+    elif name == 'ConstantKernel() * RBF() + WhiteKernel() + ConstantKernel() * DotProduct()':
+        return ConstantKernel() * RBF() + WhiteKernel() + ConstantKernel() * DotProduct()
+    elif name == 'ConstantKernel() * RBF(np.ones()) + WhiteKernel()':
+        return ConstantKernel() * RBF(np.ones(no_features)) + WhiteKernel()
+    elif name == 'ConstantKernel() * RBF(np.ones()) + WhiteKernel() + ConstantKernel() * DotProduct()':
+        return ConstantKernel() * RBF(np.ones(no_features)) + WhiteKernel() + ConstantKernel() * DotProduct()
+    raise ValueError('Unknown kernel: ' + str(name))
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_grid_axes(feature_columns, number_of_elements):
+    """Values of each feature ({'column', 'min', 'max'}) along the candidate grid, which has about
+    number_of_elements points."""
+    elements = math.floor(math.pow(int(number_of_elements), 1 / len(feature_columns)))
+    return [np.linspace(float(i['min']), float(i['max']), elements) for i in feature_columns]
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def expected_improvement(pred, std, y, target_EI):
+    """Expected Improvement of the predicted points over the observed targets y ('Maximization' or
+    'Minimization'), 0 where the standard deviation is 0."""
+    Xi = np.std(y) * 0.01
+    EI = np.zeros(len(pred))
+    ind = std != 0
+    pred = pred[ind]
+    std = std[ind]
+    if target_EI == 'Maximization':
+        Z = (np.max(y) + pred - Xi) / std
+    else :
+        Z = (np.min(y) - pred - Xi) / std
+    EI[ind] = std * Z * norm.cdf(Z) + std * norm.pdf(Z)
+    return EI
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_suggestions(axes, EI, count, columns):
+    """Table (header_values and column values) of the count grid points with the largest EI."""
+    max_index = top_indices(EI, count)
+    header_values = [["<b>rank</b>"], ["<b>EI</b>"]]
+    for i in columns:
+        header_values.append(["<b>" + i + "</b>"])
+
+    values = []
+    values.append([i + 1 for i in range(len(max_index))])
+    values.append(np.round(EI[max_index], 10).tolist())
+    for i in grid_points(axes, max_index).T:
+        values.append(i)
+
+    return {'header_values': header_values, 'values': values}
+#-------------------------------------------------------------------------------------------------
+
 
 #-------------------------------------------------------------------------------------------------
 def get_gaussian_process(data):
+    view_settings = data['view']['settings']
     feature_columns = data['view']['settings']['featureColumns']
     target_column = data['view']['settings']['targetColumn']
-    kernel = data['view']['settings']['kernel']
+    kernel = get_kernel(data['view']['settings']['kernel'], len(feature_columns))
     dataset = data['data']
-    #---------------------------------------------------------------------------------------------
-    #kernel
-    if kernel == 'ConstantKernel() * RBF() + WhiteKernel()':
-        kernel = ConstantKernel() * RBF() + WhiteKernel()
-    elif kernel == 'ConstantKernel() * DotProduct() + WhiteKernel()':
-        kernel = ConstantKernel() * DotProduct() + WhiteKernel()
-    elif kernel == 'ConstantKernel() * RBF() + WhiteKernel() + ConstantKernel() * DotProduct()':
-        kernel = ConstantKernel() * RBF() + WhiteKernel() + ConstantKernel() * DotProduct()
-    elif kernel == 'ConstantKernel() * RBF(np.ones()) + WhiteKernel()':
-        kernel = ConstantKernel() * RBF(np.ones(len(feature_columns))) + WhiteKernel()
-    elif kernel == 'ConstantKernel() * RBF(np.ones()) + WhiteKernel() + ConstantKernel() * DotProduct()':
-        kernel = ConstantKernel() * RBF(np.ones(len(feature_columns))) + WhiteKernel() + ConstantKernel() * DotProduct()
-    #----------------------------------------------------------------------------------------------
+
+    # Optional optimizer restarts (from random hyperparameters) of each fit
+    restarts = get_optimizer_restarts(view_settings)
 
     result = {}
 
@@ -67,14 +316,9 @@ def get_gaussian_process(data):
         y = np.array(df_target)
 
         num_validation = 10
-        total_score = 0
-        for i in range(num_validation):
-            X_train, X_test, y_train, y_test = train_test_split(x, y, test_size=0.2, random_state=i)
-            model = GaussianProcessRegressor(kernel)
-            model.fit(X_train, y_train)
-            score = model.score(X_test, y_test)
-            total_score += score
-        mean_score = total_score / num_validation
+        scores = Parallel(n_jobs=get_n_jobs())(delayed(score_validation_split)(kernel, x, y, i, restarts)
+                                               for i in range(num_validation))
+        mean_score = sum(scores) / num_validation
 
         if(math.isnan(mean_score)):
             mean_score = "Score Calculation Failed - The data set is too small (<=5)."
@@ -82,7 +326,6 @@ def get_gaussian_process(data):
         result = {'serverReply': mean_score}
     else:
         target_EI = data['view']['settings']['targetEI']
-        elements = math.floor(math.pow(int(data['view']['settings']['numberOfElements']), 1 / len(feature_columns)))
 
         dataset = data['data']
         df = pd.DataFrame(dataset)
@@ -93,63 +336,31 @@ def get_gaussian_process(data):
 
         #---------------------------------------------------------------------------------------------
         #machine learning (gaussian process regression)
-        model = GaussianProcessRegressor(kernel)
-        model.fit(x, y)
+        model = fit_best_model(kernel, x, y, restarts)
 
         data = {}
-        d1 = {}
         d2 = {}
-        step = []
-        for i in feature_columns :
-            d1[i['column']] = np.linspace(float(i['min']), float(i['max']), elements)
-            step.append( len(d1[i['column']]) )
+        axes = get_grid_axes(feature_columns, view_settings['numberOfElements'])
+        d1 = {i['column']: a for i, a in zip(feature_columns, axes)}
+        step = [len(a) for a in axes]
 
         #--------------------------------------------------------------------------------------------
         #prediction
         number_variables = len(d1)
-        if number_variables == 1 :
-            pred_values = pd.DataFrame(d1).values
-            pred,std = model.predict(pred_values, return_std=True)
-            d2['Prediction'] = pred
-            d2['Standard Deviation'] = std
-
-        elif number_variables == 2 :
-            mesh_values = [d1[keys] for keys in d1]
-            meshgrid = []
-            for k, i in zip(d1, np.meshgrid(*mesh_values)):
-                meshgrid.append(i.reshape(-1))
+        pred, std = predict_grid(model, axes, len(x))
+        d2['Prediction'] = pred
+        d2['Standard Deviation'] = std
+        if number_variables == 2 :
+            for k, i in zip(d1, np.meshgrid(*axes)):
                 d1[k] = i
-            pred_values = np.column_stack(meshgrid)
-            pred, std = model.predict(pred_values,return_std=True)
             d2['Prediction'] = np.reshape(pred, (step[1], step[0]))
             d2['Standard Deviation'] = np.reshape(std, (step[1], step[0]))
-
-        else :
-            mesh_values = [d1[keys] for keys in d1]
-            meshgrid = []
-            for k, i in zip(d1, np.meshgrid(*mesh_values)):
-                meshgrid.append(i.reshape(-1))
-                d1[k] = i.reshape(-1)
-            pred_values = np.column_stack(meshgrid)
-            pred, std = model.predict(pred_values,return_std=True)
-            d2['Prediction'] = pred
-            d2['Standard Deviation'] = std
+        elif number_variables > 2 :
+            for k, i in zip(d1, grid_columns(axes)):
+                d1[k] = i
 
         #Acquisition function
-        y_std = np.std(y)
-
-        Xi = y_std * 0.01
-        EI = np.zeros(len(pred))
-        ind = np.where(std != 0)[0]
-        pred = pred[ind]
-        std = std[ind]
-        if target_EI == 'Maximization':
-            y_max = np.max(y)
-            Z = (y_max + pred - Xi) / std
-        else :
-            y_min = np.min(y)
-            Z = (y_min - pred - Xi) / std
-        EI.flat[ind] = std * Z * np.array([norm.cdf(z) for z in Z]) + std * np.array([norm.pdf(z) for z in Z])
+        EI = expected_improvement(pred, std, y, target_EI)
         if number_variables == 2:
             d2['Expected Improvement'] = np.reshape(EI, (step[1], step[0]))
         else:
@@ -158,23 +369,8 @@ def get_gaussian_process(data):
         data[target_column] = d2
 
         #Bayesian optimization
-        size = len(EI)
-        top_ten_percent = int(size * 0.1)
-        max_index = np.argsort(EI)[::-1][:top_ten_percent]
-        top_ten_percent_EI = [round(num, 10) for num in EI[max_index]]
-        top_ten_percent_feature = pred_values[max_index]
-        header_values = [["<b>rank</b>"], ["<b>EI</b>"]]
-        for i in feature_columns:
-            header_values.append(["<b>" + i['column'] + "</b>"])
-
-        values = []
-        rank = [ i + 1 for i in range(top_ten_percent)]
-        values.append(rank)
-        values.append(top_ten_percent_EI)
-        for i in top_ten_percent_feature.T:
-            values.append(i)
-
-        data['bayesian_optimization'] = {'header_values': header_values, 'values': values}
+        top_ten_percent = int(len(EI) * 0.1)
+        data['bayesian_optimization'] = get_suggestions(axes, EI, top_ten_percent, [i['column'] for i in feature_columns])
         # logger.info(data)
 
         result = data
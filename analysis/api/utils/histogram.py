@@ -1,7 +1,7 @@
 #=================================================================================================
 # Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 #          Hokkaido University (2018)
-#          Last Update: Q3 2023
+#          Last Update: Q4 2026
 # ________________________________________________________________________________________________
 # Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
 #          Jun Fujima (Former Lead Developer) [2018-2021]
@@ -11,8 +11,10 @@
 # ------------------------------------------------------------------------------------------------
 # Notes:  This is one of the REST API parts of the 'analysis' interface of the website that
 #         allows serverside work for the 'histogram' component.
+#         The bin membership of all the values is found in one sorted search ('bin_values'), nan
+#         values being masked out.
 # ------------------------------------------------------------------------------------------------
-# References: logging, numpy libs
+# References: logging, numpy, pandas libs
 #=================================================================================================
 
 #-------------------------------------------------------------------------------------------------
@@ -27,39 +29,49 @@ logger = logging.getLogger(__name__)
 #-------------------------------------------------------------------------------------------------
 
 
+#-------------------------------------------------------------------------------------------------
+def bin_values(x, bins):
+    """Histogram of the values (nan values excluded) together with the indices of the values that
+    fall in each bin, from one sorted search of all the values instead of one scan per bin.
+
+    Arguments:
+        x {array like} -- The values.
+        bins {int or array} -- Same as the numpy.histogram bins.
+
+    Returns:
+        hist, bin_edges, indices  -- same as numpy.histogram, and the list of value indices per bin
+    """
+    x = np.asarray(x, dtype=np.float64).ravel()
+    valid = ~np.isnan(x)
+    bin_edges = np.histogram_bin_edges(x[valid], bins=bins)
+    no_bins = len(bin_edges) - 1
+
+    # bins are [left, right) except the last one, which is [left, right]
+    bin_ids = np.searchsorted(bin_edges, x, side='right') - 1
+    bin_ids[x == bin_edges[-1]] = no_bins - 1
+    valid &= (bin_ids >= 0) & (bin_ids < no_bins)
+
+    rows = np.flatnonzero(valid)
+    bin_ids = bin_ids[rows]
+    hist = np.bincount(bin_ids, minlength=no_bins)
+    grouped_rows = rows[np.argsort(bin_ids, kind='stable')]
+    indices = [ids.tolist() for ids in np.split(grouped_rows, np.cumsum(hist)[:-1])]
+
+    return hist, bin_edges, indices
+#-------------------------------------------------------------------------------------------------
+
+
 #-------------------------------------------------------------------------------------------------
 def get_histogram(data):
     # logger.info(data)
-    dummy_value = 999999999999
     x = data['data']
     bins = data['view']['settings']['bins']
 
-    x_df = pd.DataFrame(x, dtype="float64")
-    x_dropna = x_df.dropna()
-
-    hist, bin_edges = np.histogram(x_dropna.values, bins=bins)
+    hist, bin_edges, indices = bin_values(x, bins)
 
     result = {}
     result['hist'] = hist
     result['binEdges'] = bin_edges
-
-    x_replace_na = x_df.fillna(dummy_value)
-    x_array = x_replace_na.values
-    indices = []
-
-    l = len(bin_edges)
-    for i in range(l - 1):
-        left = bin_edges[i]
-        right = bin_edges[i + 1]
-        # logger.info(left)
-        # logger.info(right)
-        ids = []
-        if i == l - 2:
-            ids = list(np.where((left <= x_array) & (x_array <= right))[0])
-        else:
-            ids = list(np.where((left <= x_array) & (x_array < right))[0])
-        indices.append(ids)
-
     result['indices'] = indices
 
     return result
@@ -72,17 +84,12 @@ def get_histograms(data):
     df = pd.DataFrame(dataset , dtype="float64")
     df = df[selected_columns]
     result = {"data":{}}
-    count = 0
-    for i in selected_columns:
-        for j in selected_columns:
-            if i == j:
-                t_df = df[i].dropna()
-                target_data = {"view":{"settings":{}}}
-                target_data["data"] = df[i]
-                target_data["view"]["settings"]["bins"] = data["view"]["settings"]["bins"]
-                result["data"][count] = get_histogram(target_data)
-                # logger.info(result["data"][count])
-                count += 1
+    for count, i in enumerate(selected_columns):
+        target_data = {"view":{"settings":{}}}
+        target_data["data"] = df[i].to_numpy()
+        target_data["view"]["settings"]["bins"] = data["view"]["settings"]["bins"]
+        result["data"][count] = get_histogram(target_data)
+        # logger.info(result["data"][count])
     result["columns"] = selected_columns
 
     return result
@@ -1,7 +1,7 @@
 #=================================================================================================
 # Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 #          Hokkaido University (2018)
-#          Last Update: Q3 2023
+#          Last Update: Q4 2026
 # ________________________________________________________________________________________________
 # Authors:Yoshiki Hasukawa (Student Developer, Component Design and Editor of Monte Cat Code) [2024] 
 #         Fernando Garcia-Escobar, (Developer Of Monte Cat Code) [2024] 
@@ -13,7 +13,8 @@
 # Notes:  This is one of the REST API parts of the 'analysis' interface of the website that
 #         allows serverside work for the 'cads_component_template' component.
 # ------------------------------------------------------------------------------------------------
-# References: logging, numpy libs
+# References: Django platform libraries, logging, numpy, pandas, joblib and sklearn libs and
+#             'analysis' folder's 'progress' and 'compute' and 'common' folder's 'renderers'
 #=================================================================================================
 
 #-------------------------------------------------------------------------------------------------
@@ -26,12 +27,19 @@ import numpy as np
 from statistics import mean
 import random
 
+from joblib import Parallel, delayed
+from analysis.compute import get_n_jobs
+from analysis.progress import report_progress, stop_requested
+from common.renderers import TableRows
+from sklearn.base import clone
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LinearRegression
 from sklearn.svm import SVR
 from sklearn.ensemble import RandomForestRegressor
 
 logger = logging.getLogger(__name__)
+
+SCORING_SPLITS = 10  # number of random train/test splits a descriptor set is scored on
 #-------------------------------------------------------------------------------------------------
 
 def get_monte_cat(data):
@@ -95,6 +103,11 @@ def get_monte_cat(data):
 
     model_tested = model_dictionary[model_to_tested]
 
+    # Scores of the already tested descriptor sets (removals and additions often undo each other)
+    score_cache = {'model': model_to_tested, 'scores': {}, 'hits': 0, 'misses': 0}
+    # Linear models are scored in closed form
+    score_cache['linear'] = LinearScorer(df_descriptors, df_target) if model_to_tested == 'Linear' else None
+
     ##Main script
 
     s_time = round(time.time(), 5)
@@ -119,17 +132,22 @@ def get_monte_cat(data):
     # First iteration, where the first addition is always Greedy
 
     descriptors_in_model, descriptors_bank, result_package = greedy_addition(df_descriptors, df_target, descriptors_in_model, descriptors_bank, 
-                                                                                    model_tested, result_package, reference_dictionary)
+                                                                                    model_tested, result_package, reference_dictionary, score_cache)
     counter += 1
 
+    stopped = False
     for i in range(iterations):
+        if stop_requested(): # The client asked to stop, the best model found so far is returned
+            stopped = True
+            break
+
         if len(descriptors_bank) > 0: # Addition proposals do not occur if there are no Descriptors in the bank
-            addition_result = random_addition(df_descriptors, df_target, descriptors_in_model, descriptors_bank, model_tested)
+            addition_result = random_addition(df_descriptors, df_target, descriptors_in_model, descriptors_bank, model_tested, score_cache)
         else:
             addition_result = None
 
         if len(descriptors_in_model) > 1: # Removal proposals do not occur if there is one or less Descriptors
-            removal_result = random_removal(df_descriptors, df_target, descriptors_in_model, descriptors_bank, model_tested) 
+            removal_result = random_removal(df_descriptors, df_target, descriptors_in_model, descriptors_bank, model_tested, score_cache)
         else:
             removal_result = None
 
@@ -181,6 +199,10 @@ def get_monte_cat(data):
 
         counter += 1
 
+        report_progress(iteration = i + 1, iterations = iterations, score = result_package['Score'][-1],
+                        best_score = max(result_package['Score']), descriptor = result_package['Descriptor'][-1],
+                        event = result_package['Event'][-1], descriptors_in_model = len(descriptors_in_model))
+
     process_df = pd.DataFrame(data = zip(result_package['Descriptor'], result_package['Score'], result_package['Event']), 
                             columns = ['Descriptor', 'Score', 'Outcome'])
 
@@ -192,13 +214,17 @@ def get_monte_cat(data):
 
     ## ===================================================================================================================
     process_header = process_df.columns
-    process_data = process_df.T.to_dict(orient='list')
+    process_data = TableRows(process_df)
     output_header = output_df.columns
-    output_data = output_df.T.to_dict(orient='list')
+    output_data = TableRows(output_df)
     result['process']['header'] = process_header
     result['process']['data'] = process_data
     result['output']['header'] = output_header
     result['output']['data'] = output_data
+    # the process and output members are only the tables the component shows and downloads
+    result['stopped'] = stopped
+    logger.info('monte cat scores: ' + str(score_cache['hits']) + ' cache hits, ' + str(score_cache['misses']) +
+                ' misses' + (' (stopped early)' if stopped else ''))
 
 
     return result
@@ -303,35 +329,161 @@ def analogue_operation(analogue, reference_dict, list_to_modify, type_of_movemen
 """
 'train_model' is the basic function to train a regression model and return the test data's r2 mean score after 10
 random data splits. In case there is an error during training, conditional clauses are present to return a score of 0.
+Each split has its own fixed seed (its number). The splits of one set are scored serially (their fits are too small
+to pay for dispatching them to processes), only the many candidate sets of 'greedy_addition' are scored in parallel.
 """
 
+def score_split(descriptors, target, model, seed):
+    X_train, X_test, y_train, y_test = train_test_split(descriptors, target, test_size = 0.2, random_state = seed)
+    try:
+        split_model = clone(model)
+        split_model.fit(X_train, y_train)
+        return split_model.score(X_test, y_test)
+    except:
+        return 0
+
 def train_model(descriptors, target, model):
-    placeholder_scores = []
-    for j in range(10):
-        X_train, X_test, y_train, y_test = train_test_split(descriptors, target, test_size = 0.2, random_state = j)
-        try:
-            model.fit(X_train, y_train.values.ravel())
-            placeholder_scores.append(model.score(X_test, y_test))
-        except:
-            placeholder_scores.append(0)
+    target = np.asarray(target).ravel()
+    placeholder_scores = [score_split(descriptors, target, model, j) for j in range(SCORING_SPLITS)]
     model_score = mean(placeholder_scores)
     return model_score
 
+"""
+'cached_train_model' returns the score of a set of Descriptors from the score cache if this set (in any order) was
+already scored with the same model type, and trains the model otherwise. Hits and misses are counted in the cache.
+"""
+
+def get_score_key(descriptors, score_cache):
+    return (frozenset(descriptors), score_cache['model'])
+
+def cached_train_model(df_descriptors, df_target, descriptors, model, score_cache = None):
+    if score_cache is not None:
+        key = get_score_key(descriptors, score_cache)
+        if key in score_cache['scores']:
+            score_cache['hits'] += 1
+            return score_cache['scores'][key]
+        score_cache['misses'] += 1
+        if score_cache.get('linear') is not None:
+            model_score = score_cache['linear'].score(df_descriptors.columns.get_indexer(descriptors))
+            score_cache['scores'][key] = model_score
+            return model_score
+    model_score = train_model(np.array(df_descriptors[descriptors]), df_target, model)
+    if score_cache is not None:
+        score_cache['scores'][key] = model_score
+    return model_score
+
+"""
+'LinearScorer' gives the same scores as 'train_model' with a LinearRegression model, in closed form. The (globally
+centered) Gram matrix of all the Descriptors and their cross-products with the target are computed once, and the
+training part of each of the 10 splits is the whole minus its test rows. The score of a set of Descriptors then only
+needs the test rows of its columns and a small least squares solve per split. 'score_additions' scores a set plus
+each one of many candidate Descriptors at once, by bordering the solution of the set (a rank-one update per candidate,
+with an exact solve for the candidates that are collinear with the set).
+"""
+
+class LinearScorer:
+    def __init__(self, descriptors, target, splits = SCORING_SPLITS):
+        descriptors = np.asarray(descriptors, dtype = np.float64)
+        target = np.asarray(target, dtype = np.float64).ravel()
+        self.X = descriptors - descriptors.mean(axis = 0)
+        self.y = target - target.mean()
+        self.G = self.X.T @ self.X
+        self.gy = self.X.T @ self.y
+        self.x_sum = self.X.sum(axis = 0)
+        self.y_sum = self.y.sum()
+        rows = np.arange(len(self.y))
+        self.splits = []
+        for seed in range(splits):
+            train_rows, test_rows = train_test_split(rows, test_size = 0.2, random_state = seed)
+            n_train = len(train_rows)
+            X_test, y_test = self.X[test_rows], self.y[test_rows]
+            split = {'n_train': n_train, 'X_test': X_test, 'y_test': y_test,
+                     'mu': (self.x_sum - X_test.sum(axis = 0)) / n_train,
+                     'y_mean': (self.y_sum - y_test.sum()) / n_train,
+                     'sst': ((y_test - y_test.mean())**2).sum()}
+            self.splits.append(split)
+
+    def gram(self, split, a, b):
+        a, b = np.asarray(a, dtype = np.intp), np.asarray(b, dtype = np.intp)
+        return (self.G[np.ix_(a, b)] - split['X_test'][:, a].T @ split['X_test'][:, b]
+                - split['n_train'] * np.outer(split['mu'][a], split['mu'][b]))
+
+    def cross(self, split, a):
+        a = np.asarray(a, dtype = np.intp)
+        return (self.gy[a] - split['X_test'][:, a].T @ split['y_test']
+                - split['n_train'] * split['mu'][a] * split['y_mean'])
+
+    def r2(self, split, sse):
+        if split['sst'] == 0:
+            return np.where(sse == 0, 1.0, 0.0)
+        return 1 - sse / split['sst']
+
+    def score(self, columns):
+        if len(columns) == 0:
+            return 0
+        columns = list(columns)
+        scores = []
+        for split in self.splits:
+            beta = np.linalg.lstsq(self.gram(split, columns, columns), self.cross(split, columns), rcond = None)[0]
+            residuals = split['y_test'] - split['y_mean'] - (split['X_test'][:, columns] - split['mu'][columns]) @ beta
+            scores.append(self.r2(split, (residuals**2).sum()))
+        return float(np.mean(scores))
+
+    def score_additions(self, columns, candidates):
+        columns, candidates = list(columns), list(candidates)
+        scores = np.zeros((len(self.splits), len(candidates)))
+        for n, split in enumerate(self.splits):
+            C_SJ = self.gram(split, columns, candidates)
+            b_S, b_J = self.cross(split, columns), self.cross(split, candidates)
+            c_JJ = (np.diag(self.G)[candidates] - (split['X_test'][:, candidates]**2).sum(axis = 0)
+                    - split['n_train'] * split['mu'][candidates]**2)
+            P = np.linalg.pinv(self.gram(split, columns, columns))
+            U = P @ C_SJ
+            schur = c_JJ - (C_SJ * U).sum(axis = 0)
+            beta_S = P @ b_S
+            D_S = split['X_test'][:, columns] - split['mu'][columns]
+            D_J = split['X_test'][:, candidates] - split['mu'][candidates]
+            with np.errstate(divide = 'ignore', invalid = 'ignore'): # the collinear candidates are redone below
+                beta_J = (b_J - C_SJ.T @ beta_S) / schur
+                residuals = ((split['y_test'] - split['y_mean'] - D_S @ beta_S)[:, None]
+                             - (D_J - D_S @ U) * beta_J)
+                sse = (residuals**2).sum(axis = 0)
+            collinear = ~(np.abs(schur) > 1e-10 * np.maximum(np.abs(c_JJ), 1e-300))
+            for j in np.flatnonzero(collinear):
+                subset = list(columns) + [candidates[j]]
+                beta = np.linalg.lstsq(self.gram(split, subset, subset), self.cross(split, subset), rcond = None)[0]
+                r = split['y_test'] - split['y_mean'] - (split['X_test'][:, subset] - split['mu'][subset]) @ beta
+                sse[j] = (r**2).sum()
+            scores[n] = self.r2(split, sse)
+        return scores.mean(axis = 0).tolist()
+
 """
 'greedy_addition' is the basic building block in a greedy Forward Descriptor Addition process. It tests all
 Descriptors not added to a regression model, and adds the one that increases the Score the most.
 In MonteCatV2, however, entire descriptor families are removed from the remaining available Descriptors in the bank,
-drastically reducing the number of tested descriptors
+drastically reducing the number of tested descriptors.
+The tested Descriptors are scored in parallel (the processes of the request, see analysis/compute.py), in the
+bank order, so the first best one is kept as before.
 """
 
-def greedy_addition(df_descriptors, df_target, descriptors_in_model, descriptors_bank, model, result_package, reference_dict):
-    tested_descriptors = []
-    placeholder_scores = []
-    for i in descriptors_bank:
-        descriptors_in_model.append(i)
-        placeholder_scores.append(train_model(np.array(df_descriptors[descriptors_in_model]), df_target, model))
-        tested_descriptors.append(i)
-        descriptors_in_model.remove(i)
+def greedy_addition(df_descriptors, df_target, descriptors_in_model, descriptors_bank, model, result_package, reference_dict,
+                    score_cache = None):
+    all_descriptors = np.array(df_descriptors)
+    target = np.asarray(df_target).ravel()
+    column_index = {c: n for n, c in enumerate(df_descriptors.columns)}
+    model_columns = [column_index[d] for d in descriptors_in_model]
+    tested_descriptors = list(descriptors_bank)
+    if score_cache is not None and score_cache.get('linear') is not None:
+        placeholder_scores = score_cache['linear'].score_additions(model_columns,
+                                                                   [column_index[i] for i in tested_descriptors])
+    else:
+        placeholder_scores = Parallel(n_jobs = get_n_jobs())(
+            delayed(train_model)(all_descriptors[:, model_columns + [column_index[i]]], target, model)
+            for i in tested_descriptors)
+    if score_cache is not None:
+        score_cache['misses'] += len(tested_descriptors)
+        for i, score in zip(tested_descriptors, placeholder_scores):
+            score_cache['scores'][get_score_key(descriptors_in_model + [i], score_cache)] = score
     best_score = max(placeholder_scores)
     best_descriptor = tested_descriptors[placeholder_scores.index(best_score)]
     descriptors_in_model.append(best_descriptor)
@@ -346,10 +498,10 @@ def greedy_addition(df_descriptors, df_target, descriptors_in_model, descriptors
 the model's Score is calculated.
 """
 
-def random_addition(df_descriptors, df_target, descriptors_in_model, descriptors_bank, model):
+def random_addition(df_descriptors, df_target, descriptors_in_model, descriptors_bank, model, score_cache = None):
     chosen_descriptor = random.choice(descriptors_bank)
     descriptors_in_model.append(chosen_descriptor)
-    model_score = train_model(np.array(df_descriptors[descriptors_in_model]), df_target, model)
+    model_score = cached_train_model(df_descriptors, df_target, descriptors_in_model, model, score_cache)
     descriptors_in_model.remove(chosen_descriptor)
     proposal_result = {'Descriptor': chosen_descriptor,
                        'Score': model_score}
@@ -360,10 +512,10 @@ def random_addition(df_descriptors, df_target, descriptors_in_model, descriptors
 the model's Score is calculated.
 """
 
-def random_removal(df_descriptors, df_target, descriptors_in_model, descriptors_bank, model):
+def random_removal(df_descriptors, df_target, descriptors_in_model, descriptors_bank, model, score_cache = None):
     chosen_descriptor = random.choice(descriptors_in_model)
     descriptors_in_model.remove(chosen_descriptor)
-    model_score = train_model(np.array(df_descriptors[descriptors_in_model]), df_target, model)
+    model_score = cached_train_model(df_descriptors, df_target, descriptors_in_model, model, score_cache)
     descriptors_in_model.append(chosen_descriptor)
     proposal_result = {'Descriptor': chosen_descriptor,
                        'Score': model_score}
@@ -1,7 +1,7 @@
 #=================================================================================================
 # Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 #          Hokkaido University (2018)
-#          Last Update: Q2 2025
+#          Last Update: Q4 2026
 # ________________________________________________________________________________________________
 # Authors: Philippe Gantzer [2024-]
 #          Pavel Sidorov [2024-]
@@ -12,30 +12,46 @@
 # Notes:  This is one of the REST API parts of the 'analysis' interface of the website that
 #         allows serverside work for the DOPtools' 'optimizer' components.
 # ------------------------------------------------------------------------------------------------
-# References: doptools, logging, numpy, pandas and sklearn libs
+# References: Django platform libraries, doptools, hashlib, json, logging, numpy, pandas and sklearn
+#             libs, optuna, threading, common.cache, common.molecules and 'analysis' folder's 'fitted_models' and
+#             'progress'
 #=================================================================================================
 
 #-------------------------------------------------------------------------------------------------
 # Import required Libraries
 #-------------------------------------------------------------------------------------------------
+from django.conf import settings
+from contextlib import contextmanager
+import hashlib
+import json
 import logging
 import numpy as np
+import optuna
 from doptools.optimizer import launch_study, calculate_descriptor_table, get_raw_model
 from doptools.chem.solvents import available_solvents
 from doptools.cli.plotter import prepare_classification_plot
-from chython import smiles
 import pandas as pd
+from analysis.progress import get_progress
+from analysis.fitted_models import get_fitted_model_key, load_fitted_model, store_fitted_model
+from common.cache import DiskLRUCache
+from common.molecules import parse_values
 from scipy.sparse import csr_matrix
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import MinMaxScaler, LabelEncoder
 from sklearn.feature_selection import VarianceThreshold
 import re
+import threading
 
 logger = logging.getLogger(__name__)
 #-------------------------------------------------------------------------------------------------
 
 
 #-------------------------------------------------------------------------------------------------
+# Computed descriptor tables (and fitted calculators), shared by all the server processes (web and
+# celery) through DESCRIPTOR_CACHE_DIR
+descriptors_cache = DiskLRUCache(settings.DESCRIPTOR_CACHE_DIR, settings.DESCRIPTOR_CACHE_SIZE,
+                                 name='descriptor tables')
+
 methods_dict = {'Morgan_fingerprints': {'name': 'morgan',
                                         'args': {'nBits': 1024, 'radius': 2},
                                         'args_parse': {'arg1': 'nBits', 'arg2': 'radius'}},
@@ -88,13 +104,11 @@ def get_descriptors_and_transformer(data, df, df_target):
     if 'lower' in parameters_dict and 'upper' in parameters_dict and int(method_args['arg1']) > int(method_args['arg1']):
         raise ValueError("Lower value is higher than Upper value in Descriptors settings")
 
-    mols = pd.DataFrame({x: smiles2mols(df[x].to_list()) for x in data['view']['settings']['featureColumns']})
     indices = list(df_target[pd.notnull(df_target)].index)
     df_target = np.array(df_target)
-    if len(indices) != len(mols):
+    if len(indices) != len(df):
         raise ValueError("Some molecule don't have a property value")
-    input_dict = {'structures': mols,
-                  'prop1': {'indices': indices,
+    input_dict = {'prop1': {'indices': indices,
                             'property': df_target,
                             'property_name': data['view']['settings']['targetColumn']}}
     if 'numericalFeatureColumns' in data['view']['settings'] and data['view']['settings']['numericalFeatureColumns']:
@@ -115,8 +129,35 @@ def get_descriptors_and_transformer(data, df, df_target):
             raise ValueError(f"Unknown solvent(s): {display_solvents}. Please refer to solvents supported in DOPtools.")
         input_dict['solvents'] = df_sc
 
+    input_columns = (list(data['view']['settings']['featureColumns']) + list(input_dict.get('passthrough', pd.DataFrame()).columns)
+                     + ([data['view']['settings']['solventColumn']] if 'solvents' in input_dict else []))
+    key = get_descriptors_cache_key(df[input_columns], method, parameters_dict, 'passthrough' in input_dict)
+    cached = descriptors_cache.get(key)
+    if cached is not None:
+        table = pd.DataFrame(cached['table'].toarray(), columns=cached['columns'], index=cached['index'])
+        return table, cached['transformer']
+
+    input_dict['structures'] = pd.DataFrame({x: smiles2mols(df[x].to_list()) for x in data['view']['settings']['featureColumns']})
     result = calculate_descriptor_table(input_dict, methods_dict[method]['name'], parameters_dict)
-    return result['prop1']['table'], result['prop1']['calculator']  # descriptors, transformer
+    table, transformer = result['prop1']['table'], result['prop1']['calculator']
+
+    try:
+        descriptors_cache.set(key, {'table': csr_matrix(table.values), 'columns': table.columns,
+                                    'index': table.index, 'transformer': transformer})
+    except (TypeError, ValueError) as e:  # non numerical descriptors are not cached
+        logger.info('descriptor table not cached: ' + str(e))
+
+    return table, transformer  # descriptors, transformer
+
+
+def get_descriptors_cache_key(df, method, parameters_dict, passthrough):
+    """Hash the input values (SMILES, passthrough and solvent columns), the descriptors method
+    and its parameters into the key of a descriptor table."""
+    h = hashlib.sha256()
+    h.update(json.dumps([method, sorted(parameters_dict.items()), [str(c) for c in df.columns], passthrough],
+                        default=str).encode('utf-8'))
+    h.update(pd.util.hash_pandas_object(df.astype(str), index=False).values.tobytes())
+    return h.hexdigest()
 
 
 def split_dataset(data):
@@ -136,23 +177,66 @@ def split_dataset(data):
 
 
 def smiles2mols(smiles_list):
-    mols = []
-    for x in smiles_list:
-        try:
-            mol = smiles(x)
-            if mol:
-                try:
-                    mol.canonicalize(fix_tautomers=False)
-                except:  # Magic trick of chython
-                    mol.canonicalize(fix_tautomers=False)
-                mols.append(mol)
-            else:
-                raise ValueError()
-        except:
-            raise ValueError("The SMILES string " + str(x) + " could not be parsed")
+    mols, errors = parse_values(smiles_list)
+    for error in errors:
+        if error:
+            raise ValueError(error)
     return mols
 
 
+# The progress callback of the study launched by each thread. As launch_study does not take optuna
+# callbacks, optuna.create_study is wrapped (once, for the whole process) to add the callback of
+# the calling thread to the studies it creates, so studies of other threads are left untouched.
+_study_callback = threading.local()
+
+
+def _create_study_with_progress(create_study):
+    def create_study_with_progress(*args, **kwargs):
+        study = create_study(*args, **kwargs)
+        callback = getattr(_study_callback, 'callback', None)
+        if callback is not None:
+            optimize = study.optimize
+
+            def optimize_with_progress(*opt_args, callbacks=None, **opt_kwargs):
+                return optimize(*opt_args, callbacks=list(callbacks or []) + [callback], **opt_kwargs)
+            study.optimize = optimize_with_progress
+        return study
+    create_study_with_progress.with_progress = True
+    return create_study_with_progress
+
+
+if not getattr(optuna.create_study, 'with_progress', False):
+    optuna.create_study = _create_study_with_progress(optuna.create_study)
+
+
+@contextmanager
+def study_progress(trials):
+    """Report the progress of the optuna study launched by this thread within this context after
+    each trial, and stop it (keeping the finished trials) when the client asks to."""
+    progress = get_progress()
+    if progress is None:
+        yield
+        return
+
+    # the callbacks are run by the optuna worker threads, so the progress is given to them
+    def callback(study, trial):
+        try:
+            best = study.best_trial
+            progress.report({'trial': len(study.trials), 'trials': trials, 'score': trial.value,
+                             'best_score': best.value, 'best_params': best.params})
+        except ValueError:  # no trial completed yet
+            progress.report({'trial': len(study.trials), 'trials': trials, 'score': None, 'best_score': None})
+        if progress.should_stop():
+            study.stop()
+
+    previous = getattr(_study_callback, 'callback', None)
+    _study_callback.callback = callback
+    try:
+        yield
+    finally:
+        _study_callback.callback = previous
+
+
 def get_model(data):
     ml_method = data['view']['settings']['MLmethod']
     if ml_method not in ["SVR", "RFR", "SVC", "RFC"]:  # "XGBR"]:
@@ -161,6 +245,7 @@ def get_model(data):
     target_column = data['view']['settings']['targetColumn']
     p_name = target_column + '--Predicted'
     p_target = None
+    model_key = get_fitted_model_key(data)  # before the target is label encoded
 
     if ml_method.endswith('C'):
         LE = LabelEncoder()
@@ -188,8 +273,9 @@ def get_model(data):
     trials = int(data['view']['settings']['trials'])
 
     try:
-        st, stats = launch_study(for_opt, pd.DataFrame(df_target), "", ml_method, trials, cv_splits,
-                                 cv_repeats, 5, 60, (0, 1), False)
+        with study_progress(trials):
+            st, stats = launch_study(for_opt, pd.DataFrame(df_target), "", ml_method, trials, cv_splits,
+                                     cv_repeats, 5, 60, (0, 1), False)
         if not len(stats):
             raise StopIteration() #StopIteration can also be raised by launch_study above
     except StopIteration:
@@ -232,6 +318,7 @@ def get_model(data):
         result['d1'] = list(preds.to_dict(orient='index').values())
 
     # Test set if specified
+    model = None
     if df_test is None:
         result['d2'] = {target_column: [], p_name: [], } if ml_method.endswith("R") else []
         result['first_test'] = len(y_train)
@@ -239,7 +326,8 @@ def get_model(data):
     else:
         data_rebuild = data.copy()
         data_rebuild['view']['params'] = params.copy()
-        _, model = get_model_rebuild(data_rebuild)
+        # a model fitted on encoded labels is not the one a save request (with raw labels) fits
+        _, model = get_model_rebuild(data_rebuild, None if LE_is_required else model_key)
         dict_pred = {x: smiles2mols(df_test[x].to_list()) for x in data['view']['settings']['featureColumns']}
         if len(dict_pred.keys()) == 1 and not data['view']['settings']['numericalFeatureColumns'] and not data['view']['settings']['solventColumn']:
             _, df_pred = next(iter(dict_pred.items()))
@@ -260,10 +348,16 @@ def get_model(data):
             df_test[target_column + ".predicted"] = LE.inverse_transform(res)
             result['d2'] = list(df_test.to_dict(orient='index').values())
 
-    return result, None
+    return result, (None if LE_is_required else model)
+
 
+def get_model_rebuild(data, model_key=None):
+    # the pipeline fitted for the validation of the same study is reused when saving the model
+    model_key = model_key or get_fitted_model_key(data)
+    pipeline = load_fitted_model(model_key, data['view']['params'])
+    if pipeline is not None:
+        return None, pipeline
 
-def get_model_rebuild(data):
     params = data['view']['params'].copy()
     method = params.pop('method')
     scaling = params.pop('scaling')
@@ -287,6 +381,7 @@ def get_model_rebuild(data):
     pipeline = Pipeline(pipeline_steps)
 
     pipeline[1:].fit(raw_desc, y_train)
+    store_fitted_model(model_key, pipeline, data['view']['params'])
 
     return None, pipeline
 
@@ -1,7 +1,7 @@
 #=================================================================================================
 # Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 #          Hokkaido University (2018)
-#          Last Update: Q3 2023
+#          Last Update: Q4 2026
 # ________________________________________________________________________________________________
 # Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
 # ________________________________________________________________________________________________
@@ -11,7 +11,7 @@
 # Notes:  This is one of the REST API parts of the 'analysis' interface of the website that
 #         allows serverside work for the 'pie' component.
 # ------------------------------------------------------------------------------------------------
-# References: logging, numpy libs
+# References: logging, numpy libs and 'histogram'
 #=================================================================================================
 
 #-------------------------------------------------------------------------------------------------
@@ -20,6 +20,8 @@
 import logging
 import numpy as np
 
+from .histogram import bin_values
+
 logger = logging.getLogger(__name__)
 #-------------------------------------------------------------------------------------------------
 
@@ -52,7 +54,7 @@ def get_pie(data):
             result['values'] = counts_elements
             result['dimensions'] = [str(ue) for ue in unique_elements]
         else:
-            hist, bin_edges = np.histogram(data['data'], bins=bins)
+            hist, bin_edges, indices = bin_values(data['data'], bins)
             result['values'] = hist
 
             floatsExists = False
@@ -65,18 +67,6 @@ def get_pie(data):
             else:
                 result['dimensions'] = ["{:0.0f}".format(x) for x in bin_edges]
 
-            x_array = np.array(data['data'])
-            indices = []
-            l = len(bin_edges)
-            for i in range(l - 1):
-                left = bin_edges[i]
-                right = bin_edges[i + 1]
-                ids = []
-                if i == l - 2:
-                    ids = list(np.where((left <= x_array) & (x_array <= right))[0])
-                else:
-                    ids = list(np.where((left <= x_array) & (x_array < right))[0])
-                indices.append(ids)
             result['indices'] = indices
 
     return result
@@ -1,7 +1,7 @@
 #=================================================================================================
 # Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 #          Hokkaido University (2018)
-#          Last Update: Q3 2023
+#          Last Update: Q4 2026
 # ________________________________________________________________________________________________
 # Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
 #          Jun Fujima (Former Lead Developer) [2018-2021]
@@ -12,7 +12,8 @@
 # Notes:  This is sort of the entry of the REST API parts of the 'analysis' interface of the
 #         website that allows serverside work for the available components.
 # ------------------------------------------------------------------------------------------------
-# References: logging libs and all connected serverside available components
+# References: logging libs, all connected serverside available components, 'datamanagement'
+#             folder's 'dataframes' and 'analysis' folder's 'fitted_models' and 'compute'
 #=================================================================================================
 
 #-------------------------------------------------------------------------------------------------
@@ -43,6 +44,10 @@ from .catalyst_gene import get_catalyst_gene
 
 from .cads_component_template import get_cads_component_template_stuff
 
+from analysis.compute import compute_budget
+from analysis.fitted_models import get_fitted_model_key, store_model_token
+from datamanagement.dataframes import resolve_data_source
+
 
 import logging
 
@@ -87,10 +92,19 @@ def process_view(data):
 
     result = {'status': 'error: data is incorrect'}
 
-    if data['view']['type'] in ['regression', 'classification', 'optimizer', 'optimizerClassification']:
-        result, _ = processor_map[data['view']['type']](data)
-    else:
-        result = processor_map[data['view']['type']](data)
+    # The data can be referred to by a stored DataSource handle instead of being sent in full
+    if 'dataSource' in data and data['dataSource']:
+        data['data'] = resolve_data_source(data['dataSource'])
+
+    with compute_budget():
+        if data['view']['type'] in ['regression', 'classification', 'optimizer', 'optimizerClassification']:
+            data_key = get_fitted_model_key(data)  # before the components modify the request
+            result, model = processor_map[data['view']['type']](data)
+            # the fitted model is kept, so saving it does not require to train it again
+            if model is not None and isinstance(result, dict):
+                result['model_token'] = store_model_token(data, model, data_key)
+        else:
+            result = processor_map[data['view']['type']](data)
 
     return result
 #-------------------------------------------------------------------------------------------------
@@ -101,7 +115,8 @@ def get_model(data):
     # logger.info(data['view']['type'])
     if data['view']['type'] in ['optimizer', 'optimizerClassification']:
         data['view']['type'] = "optimizer_model"
-    _, model = processor_map[data['view']['type']](data)
+    with compute_budget():
+        _, model = processor_map[data['view']['type']](data)
 
     return model
 #-------------------------------------------------------------------------------------------------
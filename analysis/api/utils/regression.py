@@ -1,7 +1,7 @@
 #=================================================================================================
 # Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 #          Hokkaido University (2018)
-#          Last Update: Q3 2023
+#          Last Update: Q4 2026
 # ________________________________________________________________________________________________
 # Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
 #          Jun Fujima (Former Lead Developer) [2018-2021]
@@ -11,8 +11,11 @@
 # ------------------------------------------------------------------------------------------------
 # Notes:  This is one of the REST API parts of the 'analysis' interface of the website that
 #         allows serverside work for the 'regression' component.
+#         Predictions are made with one batched predict call per set, and the cross validation
+#         folds (fitted on clones of the model) are run in parallel, within the compute budget
+#         of the 'compute' helpers.
 # ------------------------------------------------------------------------------------------------
-# References: logging, numpy, pandas and sklearn libs
+# References: logging, numpy, pandas and sklearn libs and 'analysis' folder's 'compute'
 #=================================================================================================
 
 #-------------------------------------------------------------------------------------------------
@@ -28,8 +31,11 @@ from sklearn.ensemble import ExtraTreesRegressor
 from sklearn.neural_network import MLPRegressor
 from sklearn.kernel_ridge import KernelRidge
 from sklearn.svm import SVR
+from sklearn.base import clone
 from sklearn.model_selection import cross_validate, train_test_split, KFold
 
+from analysis.compute import get_n_jobs, set_n_jobs
+
 logger = logging.getLogger(__name__)
 #-------------------------------------------------------------------------------------------------
 
@@ -51,29 +57,22 @@ def get_regression(data):
     y = df_target.values
 
     reg = None
-    cv_model = None
 
     if method == 'Linear':
         reg = LinearRegression(fit_intercept=True)
-        cv_model = LinearRegression(fit_intercept=True)
     elif method == 'Lasso':
         reg = Lasso()
-        cv_model = Lasso()
     elif method == 'SVR':
         reg = SVR(C=float(method_args['arg1']), gamma=float(method_args['arg2']))
-        cv_model = SVR(C=float(method_args['arg1']), gamma=float(method_args['arg2']))
     elif method == 'RandomForest':
         reg = RandomForestRegressor(random_state=int(method_args['arg1']), n_estimators=int(method_args['arg2']))
-        cv_model = RandomForestRegressor(random_state=int(method_args['arg1']), n_estimators=int(method_args['arg2']))
     elif method == 'ExtraTrees':
         reg = ExtraTreesRegressor(random_state=int(method_args['arg1']), n_estimators=int(method_args['arg2']))
-        cv_model = ExtraTreesRegressor(random_state=int(method_args['arg1']), n_estimators=int(method_args['arg2']))
     elif method == 'MLP':
         reg = MLPRegressor(random_state=int(method_args['arg1']), max_iter=int(method_args['arg2']))
-        cv_model = MLPRegressor(random_state=int(method_args['arg1']), max_iter=int(method_args['arg2']))
     else: # KernelRidge
         reg = KernelRidge(alpha=float(method_args['arg1']))
-        cv_model = KernelRidge(alpha=float(method_args['arg1']))
+    set_n_jobs(reg)
 
     data = {}
     d1 = {}
@@ -90,23 +89,13 @@ def get_regression(data):
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size = float(cvMethod_args), random_state = 2)
         reg.fit(X_train, y_train)
         y_predict = reg.predict(X_test)
-        train_x=[]
-        for i in X_train:
-            train_x.append(reg.predict([i])[0])
-
-        train_y=[]
-        for j in y_train:
-            train_y.append(j)
-
-        test_x=[]
-        for ii in X_test:
-            test_x.append(reg.predict([ii])[0])
-
-        test_y=[]
-        for jj in y_test:
-            test_y.append(jj)
+        train_x = reg.predict(X_train).tolist()
+        train_y = y_train.tolist()
+        test_x = y_predict.tolist()
+        test_y = y_test.tolist()
 
-        scores = cross_validate(cv_model, X_train, y_train, scoring=scoring)
+        # the folds are fitted on clones, the displayed fit is left untouched
+        scores = cross_validate(set_n_jobs(clone(reg), 1), X_train, y_train, scoring=scoring, n_jobs=get_n_jobs())
         d1[target_column] = train_y
         d1[p_name] = train_x
         d2[target_column] = test_y
@@ -116,7 +105,7 @@ def get_regression(data):
         kf = KFold(shuffle=True, random_state=0, n_splits=int(cvMethod_args))
         reg.fit(X, y)
         y_predict = reg.predict(X)
-        scores = cross_validate(cv_model, X, y, cv=kf, scoring=scoring)
+        scores = cross_validate(set_n_jobs(clone(reg), 1), X, y, cv=kf, scoring=scoring, n_jobs=get_n_jobs())
         d1[target_column] = y
         d1[p_name] = y_predict
         d2[target_column] = []
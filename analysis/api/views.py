@@ -1,7 +1,7 @@
 #=================================================================================================
 # Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 #          Hokkaido University (2018)
-#          Last Update: Q3 2023
+#          Last Update: Q4 2026
 # ________________________________________________________________________________________________
 # Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
 #          Jun Fujima (Former Lead Developer) [2018-2021]
@@ -14,12 +14,15 @@
 # ------------------------------------------------------------------------------------------------
 # References: Django platform libraries and rest framework, logging, sys libs and
 #             'analysis' folder's 'models', 'api' subfolder's 'serializers' and 'permissions'
-#             and 'utilz' folder's 'processor', 'users' folder's 'serializers'
+#             and 'utilz' folder's 'processor', 'users' folder's 'serializers', celery libs,
+#             'analysis' folder's 'tasks', 'progress', 'jobs' and 'gp_sessions', 'common' folder's
+#             'renderers' and 'datamanagement' folder's 'dataframes'
 #=================================================================================================
 
 #-------------------------------------------------------------------------------------------------
 # Import required Libraries
 #-------------------------------------------------------------------------------------------------
+from django.core.exceptions import ValidationError
 from django.db.models import Q
 import logging
 from rest_framework.generics import ( ListCreateAPIView, RetrieveUpdateDestroyAPIView )
@@ -29,14 +32,25 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.parsers import JSONParser
+from rest_framework.settings import api_settings
 from rest_framework import status
 
 from ..models import Workspace
+from datamanagement.models import DataSource
 from .serializers import WorkspaceSerializer
 from .serializers import WorkspaceSimpleSerializer
 from .permissions import IsOwnerOrReadOnly
 from .utils.processor import process_view
+from ..tasks import process_view_task
+from ..progress import request_stop, StopNotSupported
+from ..jobs import get_owner, is_job_owner, set_job_owner, supports_owners
+from .. import gp_sessions
+from datamanagement.dataframes import resolve_data_source
 from users.serializers import CustomUserDetailsSerializer
+from celery.result import AsyncResult
+from celery.utils import uuid
+from common.renderers import ColumnarRenderer
+import rules
 
 import sys
 
@@ -231,6 +245,35 @@ class WorkspaceAPIViewSet(
 #-------------------------------------------------------------------------------------------------
 
 
+#-------------------------------------------------------------------------------------------------
+def can_read_data_source(request):
+    handle = request.data.get('dataSource')
+    if not handle:
+        return True
+    try:
+        target = DataSource.objects.filter(id=handle['id']).first()
+    except (KeyError, TypeError, ValidationError):
+        return False
+    return target is not None and rules.test_rule('can_read_datasource', request.user, target)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_job(request, job_id):
+    """The job, if it belongs to the user (or session) of the request, else None."""
+    if not is_job_owner(process_view_task.app, job_id, get_owner(request)):
+        return None
+    return AsyncResult(job_id, app=process_view_task.app)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def job_not_found(job_id):
+    return Response({'job_id': job_id, 'status': 'error: the job is not found'},
+                    status=status.HTTP_404_NOT_FOUND)
+#-------------------------------------------------------------------------------------------------
+
+
 #-------------------------------------------------------------------------------------------------
 class ViewUpdateAPIs(APIView):
 
@@ -238,6 +281,8 @@ class ViewUpdateAPIs(APIView):
         permissions.AllowAny,
     )
     parser_classes = (JSONParser,)
+    # wide results (feature engineering, monte cat...) can be asked for as binary columns
+    renderer_classes = tuple(api_settings.DEFAULT_RENDERER_CLASSES) + (ColumnarRenderer,)
 
     def handle_exception(self, exc):
         try:
@@ -254,6 +299,18 @@ class ViewUpdateAPIs(APIView):
     def post(self, request):
         result = {'status': 'success' }
 
+        if not can_read_data_source(request):
+            return Response({'status': 'error: the data source is not found or access is denied'},
+                            status=status.HTTP_403_FORBIDDEN)
+
+        # Heavy components can be run by a celery worker, the client then polls the job apis
+        app = process_view_task.app
+        if request.query_params.get('mode') == 'async' and not app.conf.task_always_eager and supports_owners(app):
+            job_id = uuid()
+            set_job_owner(app, job_id, get_owner(request))
+            process_view_task.apply_async((request.data,), task_id=job_id)
+            return Response({'status': 'submitted', 'job_id': job_id}, status=status.HTTP_202_ACCEPTED)
+
         result = process_view(request.data)
 
         if ('status' in result.keys() and result['status'].startswith('error')):
@@ -263,6 +320,183 @@ class ViewUpdateAPIs(APIView):
 #-------------------------------------------------------------------------------------------------
 
 
+#-------------------------------------------------------------------------------------------------
+class ViewJobAPIs(APIView):
+    """
+    Status (GET) and cancellation (DELETE) of a view update job submitted in async mode, for
+    the user (or session) that submitted it.
+    """
+
+    permission_classes = (
+        permissions.AllowAny,
+    )
+
+    def get(self, request, job_id):
+        job = get_job(request, job_id)
+        if job is None:
+            return job_not_found(job_id)
+        content = {'job_id': job_id, 'status': job.state}
+        if job.state == 'PROGRESS':
+            content['progress'] = job.info
+        return Response(content)
+
+
+    def delete(self, request, job_id):
+        job = get_job(request, job_id)
+        if job is None:
+            return job_not_found(job_id)
+        job.revoke(terminate=True)
+        return Response({'job_id': job_id, 'status': 'REVOKED'})
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class ViewJobStopAPIs(APIView):
+    """
+    Ask a running view update job to stop early. Components that support it (Monte Cat,
+    Optimizer) then finish with the best state found so far, given by the job result api.
+    """
+
+    permission_classes = (
+        permissions.AllowAny,
+    )
+
+    def post(self, request, job_id):
+        if get_job(request, job_id) is None:
+            return job_not_found(job_id)
+        try:
+            request_stop(process_view_task.app, job_id)
+        except StopNotSupported as e:
+            return Response({'job_id': job_id, 'status': 'error', 'detail': str(e)},
+                            status=status.HTTP_501_NOT_IMPLEMENTED)
+        return Response({'job_id': job_id, 'status': 'STOPPING'}, status=status.HTTP_202_ACCEPTED)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class ViewJobResultAPIs(APIView):
+    """
+    Result of a view update job submitted in async mode. Until the job is finished only its state
+    is returned (with status 202).
+    """
+
+    permission_classes = (
+        permissions.AllowAny,
+    )
+    renderer_classes = tuple(api_settings.DEFAULT_RENDERER_CLASSES) + (ColumnarRenderer,)
+
+    def get(self, request, job_id):
+        job = get_job(request, job_id)
+        if job is None:
+            return job_not_found(job_id)
+
+        if job.state == 'REVOKED':
+            return Response({'job_id': job_id, 'status': 'error: the job was cancelled'},
+                            status=status.HTTP_410_GONE)
+
+        if job.failed():
+            content = {'job_id': job_id, 'status': 'error', 'detail': str(job.result)}
+            if isinstance(job.result, (TypeError, ValueError)):
+                return Response(content, status=status.HTTP_400_BAD_REQUEST)
+            return Response(content, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        if not job.ready():
+            return Response({'job_id': job_id, 'status': job.state}, status=status.HTTP_202_ACCEPTED)
+
+        result = job.get()
+        if ('status' in result.keys() and result['status'].startswith('error')):
+            return Response(result, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        return Response(result)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class GaussianProcessSessionsAPIs(APIView):
+    """
+    Start a bayesian optimization session (POST) from a 'gaussianProcess' view request, with an
+    optional 'batchSize' (number of suggestions per round).
+    """
+
+    permission_classes = (
+        permissions.AllowAny,
+    )
+    parser_classes = (JSONParser,)
+
+    def handle_exception(self, exc):
+        try:
+            return super(GaussianProcessSessionsAPIs, self).handle_exception(exc)
+        except (KeyError, TypeError, ValueError):
+            return Response({'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+    def post(self, request):
+        if not can_read_data_source(request):
+            return Response({'status': 'error: the data source is not found or access is denied'},
+                            status=status.HTTP_403_FORBIDDEN)
+
+        data = request.data
+        if data.get('dataSource'):
+            data['data'] = resolve_data_source(data['dataSource'])
+
+        return Response(gp_sessions.create_session(data, get_owner(request)), status=status.HTTP_201_CREATED)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class GaussianProcessSessionAPIs(APIView):
+    """
+    Current suggestions (GET) and end (DELETE) of a bayesian optimization session.
+    """
+
+    permission_classes = (
+        permissions.AllowAny,
+    )
+
+    def get(self, request, session_id):
+        content = gp_sessions.get_session(session_id, get_owner(request))
+        if content is None:
+            return Response({'status': 'error: the session is not found or expired'},
+                            status=status.HTTP_404_NOT_FOUND)
+        return Response(content)
+
+
+    def delete(self, request, session_id):
+        gp_sessions.delete_session(session_id, get_owner(request))
+        return Response(status=status.HTTP_204_NO_CONTENT)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class GaussianProcessSessionObservationsAPIs(APIView):
+    """
+    Add new observations ({'observations': [{<feature column>: value, ..., 'target': value}],
+    optional 'batchSize' and 'refit' (optimize the kernel hyperparameters again)}) to a bayesian
+    optimization session, and get the next suggestions.
+    """
+
+    permission_classes = (
+        permissions.AllowAny,
+    )
+    parser_classes = (JSONParser,)
+
+    def handle_exception(self, exc):
+        try:
+            return super(GaussianProcessSessionObservationsAPIs, self).handle_exception(exc)
+        except (TypeError, ValueError):
+            return Response({'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+    def post(self, request, session_id):
+        content = gp_sessions.add_observations(session_id, get_owner(request), request.data.get('observations'),
+                                               request.data.get('batchSize'), bool(request.data.get('refit')))
+        if content is None:
+            return Response({'status': 'error: the session is not found or expired'},
+                            status=status.HTTP_404_NOT_FOUND)
+        return Response(content)
+#-------------------------------------------------------------------------------------------------
+
+
 #-------------------------------------------------------------------------------------------------
 class CurrentUserView(APIView):
     permission_classes = (
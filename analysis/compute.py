@@ -0,0 +1,87 @@
+#=================================================================================================
+# Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
+#          Hokkaido University (2018)
+#          Last Update: Q4 2026
+# ________________________________________________________________________________________________
+# Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
+#          Jun Fujima (Former Lead Developer) [2018-2021]
+# ________________________________________________________________________________________________
+# Description: Serverside (Django) compute budget of the 'Analysis' page components
+# ------------------------------------------------------------------------------------------------
+# Notes:  The components take the number of parallel jobs they give to sklearn estimators,
+#         cross validations and joblib from get_n_jobs() (ANALYSIS_N_JOBS setting), and every
+#         view update runs in compute_budget(), which caps the BLAS/OpenMP threads of the request
+#         (ANALYSIS_THREADS setting). Unless set, both default to the share of the cores of one
+#         request, the cores divided by the number of requests computing at the same time on the
+#         host (ANALYSIS_CONCURRENCY setting, the web and celery worker processes), so that
+#         concurrent requests do not oversubscribe the host.
+#         Nested parallel work (the estimators fitted inside a parallel cross validation) is
+#         given one job, joblib limiting the threads of its worker processes by itself.
+#         The thread limit of compute_budget() is process-wide (the BLAS/OpenMP libraries have
+#         one thread pool per process): requests running in threads of the same process share
+#         it, so the web server and celery should run one request per process (sync or prefork
+#         workers) for the budget to hold per request.
+# ------------------------------------------------------------------------------------------------
+# References: Django settings, joblib, threadpoolctl, os and logging libs
+#=================================================================================================
+
+#-------------------------------------------------------------------------------------------------
+# Import required Libraries
+#-------------------------------------------------------------------------------------------------
+from django.conf import settings
+
+from joblib import effective_n_jobs
+from threadpoolctl import threadpool_limits
+
+import os
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_request_share():
+    """Number of cores of one request, when the cores are shared by the concurrent requests."""
+    return max(1, (os.cpu_count() or 1) // max(1, settings.ANALYSIS_CONCURRENCY))
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_n_jobs():
+    """Number of parallel jobs (processes or estimator jobs) a component may use."""
+    return effective_n_jobs(settings.ANALYSIS_N_JOBS or get_request_share())
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_thread_limit():
+    """Max number of BLAS/OpenMP threads of a request (its share of the cores if not set)."""
+    return settings.ANALYSIS_THREADS or get_request_share()
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def set_n_jobs(estimator, n_jobs=None):
+    """Give an sklearn estimator its jobs, if it can use them.
+
+    Arguments:
+        estimator {estimator} -- The sklearn estimator.
+        n_jobs {int} -- Number of jobs (get_n_jobs() if None).
+
+    Returns:
+        estimator -- the same estimator
+    """
+    if 'n_jobs' in estimator.get_params(deep=False):
+        estimator.set_params(n_jobs=get_n_jobs() if n_jobs is None else n_jobs)
+    return estimator
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def compute_budget():
+    """Context manager capping the BLAS/OpenMP threads of the current request (and process)."""
+    return threadpool_limits(limits=get_thread_limit())
+#-------------------------------------------------------------------------------------------------
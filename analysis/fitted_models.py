@@ -0,0 +1,131 @@
+#=================================================================================================
+# Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
+#          Hokkaido University (2018)
+#          Last Update: Q4 2026
+# ________________________________________________________________________________________________
+# Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
+#          Jun Fujima (Former Lead Developer) [2018-2021]
+# ________________________________________________________________________________________________
+# Description: Serverside (Django) store of the models fitted by the 'Analysis' page components
+# ------------------------------------------------------------------------------------------------
+# Notes:  Models fitted during an analysis run are kept for a short time (FITTED_MODEL_STORE_TTL
+#         seconds since their last use), keyed by a hash of the request data and settings, so that
+#         their validation and their saving as pretrained models do not have to fit them again.
+#         The store is on disk (FITTED_MODEL_STORE_DIR), which must be shared by the web and celery
+#         worker processes, also when they run in separate containers (the 'cache' volume of
+#         docker-compose.yml.example), for the models of the async runs to be found. The result
+#         of an analysis run also gets a 'model_token' referring to the model it fitted, which the
+#         save requests of the 'Prediction' API can give instead of training the model again.
+# ------------------------------------------------------------------------------------------------
+# References: Django platform libraries, hashlib, json, pandas, re, uuid, logging libs and
+#             common.cache
+#=================================================================================================
+
+#-------------------------------------------------------------------------------------------------
+# Import required Libraries
+#-------------------------------------------------------------------------------------------------
+from django.conf import settings
+
+import pandas as pd
+
+from common.cache import DiskLRUCache
+
+import hashlib
+import json
+import re
+import uuid
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+#-------------------------------------------------------------------------------------------------
+
+fitted_model_store = DiskLRUCache(settings.FITTED_MODEL_STORE_DIR, settings.FITTED_MODEL_STORE_SIZE,
+                                  name='fitted models', max_age=settings.FITTED_MODEL_STORE_TTL)
+
+TOKEN_PATTERN = re.compile(r'[0-9a-f]{32}')
+
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_fitted_model_key(data):
+    """Hash the data and the view settings of an analysis request into a store key.
+
+    Arguments:
+        data {dict} -- The analysis request ('data' and 'view').
+
+    Returns:
+        str -- the key
+    """
+    h = hashlib.sha256()
+    h.update(json.dumps(data['view']['settings'], sort_keys=True, default=str).encode('utf-8'))
+    df = pd.DataFrame(data['data'])
+    h.update(json.dumps([str(c) for c in df.columns]).encode('utf-8'))
+    h.update(pd.util.hash_pandas_object(df.astype(str), index=False).values.tobytes())
+    return h.hexdigest()
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def normalize_params(params):
+    # the parameters are compared as strings, as they may have been through json (or numpy) types
+    return {str(k): str(v) for k, v in (params or {}).items() if k != 'label encoding'}
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def store_fitted_model(key, model, params=None):
+    fitted_model_store.set(key, {'model': model, 'params': normalize_params(params)})
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def load_fitted_model(key, params=None):
+    """Get a stored model, None if it is missing, expired or was fitted with other parameters."""
+    entry = fitted_model_store.get(key)
+    if entry is None or entry['params'] != normalize_params(params):
+        return None
+
+    logger.info('reusing fitted model ' + key)
+    return entry['model']
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def store_model_token(data, model, data_key=None):
+    """Store the model fitted by an analysis run under a new token.
+
+    Arguments:
+        data {dict} -- The analysis request the model was fitted for.
+        model {object} -- The fitted model (estimator or pipeline).
+        data_key {str} -- The key of the request, if already computed (before it was modified).
+
+    Returns:
+        str -- the model token
+    """
+    token = uuid.uuid4().hex
+    fitted_model_store.set(token, {'model': model, 'key': data_key or get_fitted_model_key(data)})
+    return token
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def load_model_token(token, data):
+    """Get the model of a token, None if the token is unknown or expired, or if the model was
+    fitted for other data or settings than the ones of the (save) request."""
+    if not isinstance(token, str) or not TOKEN_PATTERN.fullmatch(token):
+        return None
+
+    entry = fitted_model_store.get(token)
+    if entry is None:
+        # expired, or stored by a process that does not share FITTED_MODEL_STORE_DIR
+        logger.warning('fitted model of token ' + token + ' not found, the model is trained again')
+        return None
+    if entry['key'] != get_fitted_model_key(data):
+        return None
+
+    logger.info('reusing fitted model of token ' + token)
+    return entry['model']
+#-------------------------------------------------------------------------------------------------
@@ -0,0 +1,240 @@
+#=================================================================================================
+# Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
+#          Hokkaido University (2018)
+#          Last Update: Q4 2026
+# ________________________________________________________________________________________________
+# Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
+#          Jun Fujima (Former Lead Developer) [2018-2021]
+# ________________________________________________________________________________________________
+# Description: Serverside (Django) bayesian optimization sessions of the 'Gaussian Process'
+#              component of the 'Analysis' page
+# ------------------------------------------------------------------------------------------------
+# Notes:  A session keeps the fitted gaussian process, its observations and the candidate grid
+#         on the server between the rounds of an experiment campaign. Each round adds the new
+#         observations and returns the next batch of suggestions (the grid points with the
+#         largest Expected Improvement). The model and its grid prediction are updated
+#         incrementally with the kernel hyperparameters kept (see extend_fit), and the
+#         hyperparameters are only optimized again (from the previous ones) every
+#         GP_SESSION_REFIT_ROUNDS rounds, or when a round asks for it ('refit'). Sessions are kept on disk (shared by the web and celery
+#         processes) for GP_SESSION_TTL seconds after their last round. A session belongs to the
+#         user (or the browser session of an anonymous user) that started it, see 'jobs', and is
+#         locked during a round, so that concurrent rounds do not lose each other's observations.
+# ------------------------------------------------------------------------------------------------
+# References: Django platform libraries, numpy, pandas, re, uuid, logging libs, common.cache and
+#             'analysis' folder's 'compute' and 'api/utils' subfolder's 'gaussian_process'
+#=================================================================================================
+
+#-------------------------------------------------------------------------------------------------
+# Import required Libraries
+#-------------------------------------------------------------------------------------------------
+from django.conf import settings
+
+import numpy as np
+from numpy.linalg import LinAlgError
+import pandas as pd
+
+from common.cache import DiskLRUCache
+from .api.utils.gaussian_process import expected_improvement
+from .api.utils.gaussian_process import extend_fit
+from .api.utils.gaussian_process import fit_best_model
+from .api.utils.gaussian_process import fit_restart
+from .api.utils.gaussian_process import get_grid_axes
+from .api.utils.gaussian_process import get_kernel
+from .api.utils.gaussian_process import get_optimizer_restarts
+from .api.utils.gaussian_process import get_suggestions
+from .api.utils.gaussian_process import predict_grid
+from .compute import compute_budget
+
+import re
+import uuid
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+#-------------------------------------------------------------------------------------------------
+
+gp_session_store = DiskLRUCache(settings.GP_SESSION_STORE_DIR, settings.GP_SESSION_STORE_SIZE,
+                                name='gp sessions', max_age=settings.GP_SESSION_TTL)
+
+SESSION_PATTERN = re.compile(r'[0-9a-f]{32}')
+
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_batch_size(value, axes, default=1):
+    """Number of suggestions per round, at least 1 and at most the number of grid points."""
+    batch_size = int(value) if value is not None else default
+    if batch_size < 1:
+        raise ValueError('The batch size must be at least 1')
+    grid_size = int(np.prod([len(a) for a in axes]))
+    if batch_size > grid_size:
+        raise ValueError('The batch size can not be larger than the grid (' + str(grid_size) + ' points)')
+    return batch_size
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def predict(session):
+    """Predict the whole grid of a session from its current model."""
+    pred, std = predict_grid(session['model'], session['axes'], len(session['y']))
+    session['pred'] = pred
+    session['var'] = std**2
+    session['rounds'] = 0
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def suggest(session):
+    """Update the suggestions of a session from its grid prediction."""
+    EI = expected_improvement(session['pred'], np.sqrt(session['var']), session['y'], session['target_EI'])
+    session['suggestions'] = get_suggestions(session['axes'], EI, session['batch_size'], session['columns'])
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_session_content(session_id, session):
+    return {'session_id': session_id, 'observations': len(session['y']),
+            'suggestions': session['suggestions']}
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def create_session(data, owner):
+    """Fit the gaussian process of a 'gaussianProcess' view request and start a session with it.
+
+    Arguments:
+        data {dict} -- The analysis request ('data' and 'view' with the component settings), and
+                       an optional 'batchSize' (the number of suggestions per round).
+        owner {str} -- The owner of the session (see jobs.get_owner).
+
+    Returns:
+        dict -- the session id, the number of observations and the first suggestions
+    """
+    view_settings = data['view']['settings']
+    feature_columns = view_settings['featureColumns']
+    columns = [i['column'] for i in feature_columns]
+    target_column = view_settings['targetColumn']
+
+    df = pd.DataFrame(data['data'])
+    x = df[columns].to_numpy(dtype=np.float64)
+    y = df[target_column].to_numpy(dtype=np.float64)
+
+    axes = get_grid_axes(feature_columns, view_settings['numberOfElements'])
+    batch_size = get_batch_size(data.get('batchSize'), axes)
+
+    with compute_budget():
+        kernel = get_kernel(view_settings['kernel'], len(columns))
+        session = {'owner': owner, 'columns': columns, 'target_EI': view_settings['targetEI'],
+                   'axes': axes, 'batch_size': batch_size,
+                   'x': x, 'y': y,
+                   'model': fit_best_model(kernel, x, y, get_optimizer_restarts(view_settings))}
+        predict(session)
+        suggest(session)
+
+    session_id = uuid.uuid4().hex
+    gp_session_store.set(session_id, session)
+
+    return get_session_content(session_id, session)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def is_session_id(session_id):
+    return isinstance(session_id, str) and SESSION_PATTERN.fullmatch(session_id) is not None
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def load_session(session_id, owner):
+    """Get a session, None if the id is unknown, the session expired or belongs to another owner."""
+    if not is_session_id(session_id):
+        return None
+    session = gp_session_store.get(session_id)
+    if session is None or session.get('owner') != owner:
+        return None
+    return session
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_session(session_id, owner):
+    session = load_session(session_id, owner)
+    return None if session is None else get_session_content(session_id, session)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def add_observations(session_id, owner, observations, batch_size=None, refit=False):
+    """Add new observations to a session, update its model and get the next suggestions.
+
+    Arguments:
+        session_id {str} -- The session id.
+        owner {str} -- The owner of the request (see jobs.get_owner).
+        observations {list} -- The new observations, {<feature column>: value, ..., 'target':
+                               value} dicts.
+        batch_size {int} -- Number of suggestions from now on (unchanged if None).
+        refit {bool} -- Whether to optimize the kernel hyperparameters again in this round.
+
+    Returns:
+        dict -- the session id, the number of observations and the next suggestions (None if the
+                session is unknown, expired or belongs to another owner)
+    """
+    if not is_session_id(session_id):
+        return None
+    # the rounds of a session are run one at a time, each one on the result of the previous one
+    with gp_session_store.lock(session_id):
+        return add_session_observations(session_id, owner, observations, batch_size, refit)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def add_session_observations(session_id, owner, observations, batch_size, refit):
+    session = load_session(session_id, owner)
+    if session is None:
+        return None
+
+    if not isinstance(observations, list) or not observations:
+        raise ValueError('No observations are given')
+    try:
+        x = np.array([[float(o[c]) for c in session['columns']] for o in observations])
+        y = np.array([float(o['target']) for o in observations])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError('An observation must give a number for each of ' +
+                         ', '.join(session['columns'] + ['target']))
+
+    if batch_size is not None:
+        session['batch_size'] = get_batch_size(batch_size, session['axes'])
+    session['x'] = np.vstack([session['x'], x])
+    session['y'] = np.concatenate([session['y'], y])
+
+    with compute_budget():
+        refit = refit or session['rounds'] + 1 >= settings.GP_SESSION_REFIT_ROUNDS
+        if not refit:
+            try:
+                extend_fit(session['model'], session['axes'], session['pred'], session['var'], x, y)
+                session['rounds'] += 1
+            except LinAlgError:  # e.g. an observation repeated without noise in the kernel
+                refit = True
+        if refit:
+            # the hyperparameters are optimized from the ones of the previous round
+            session['model'] = fit_restart(session['model'].kernel_, session['x'], session['y'], 0)
+            predict(session)
+        suggest(session)
+
+    gp_session_store.set(session_id, session)
+    logger.info('gp session ' + session_id + ': ' + str(len(session['y'])) + ' observations')
+
+    return get_session_content(session_id, session)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def delete_session(session_id, owner):
+    if not is_session_id(session_id):
+        return
+    with gp_session_store.lock(session_id):
+        if load_session(session_id, owner) is not None:
+            gp_session_store.delete(session_id)
+#-------------------------------------------------------------------------------------------------
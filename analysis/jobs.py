@@ -0,0 +1,74 @@
+#=================================================================================================
+# Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
+#          Hokkaido University (2018)
+#          Last Update: Q4 2026
+# ________________________________________________________________________________________________
+# Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
+#          Jun Fujima (Former Lead Developer) [2018-2021]
+# ________________________________________________________________________________________________
+# Description: Serverside (Django) owners of the 'Analysis' page jobs
+# ------------------------------------------------------------------------------------------------
+# Notes:  A view update job (async mode) belongs to the user, or for anonymous users to the
+#         browser session, that submitted it. The owner is recorded next to the job in the
+#         celery result backend when it is queued, and only the owner can get the status or
+#         result of the job, or stop or cancel it. Without a key-value result backend the owners
+#         can not be recorded, and the view updates are then run synchronously.
+# ------------------------------------------------------------------------------------------------
+# References: celery and logging libs
+#=================================================================================================
+
+#-------------------------------------------------------------------------------------------------
+# Import required Libraries
+#-------------------------------------------------------------------------------------------------
+from celery.backends.base import KeyValueStoreBackend
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+#-------------------------------------------------------------------------------------------------
+
+OWNER_KEY = 'mads-job-owner-'
+OWNER_EXPIRES = 24 * 3600
+
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def supports_owners(app):
+    return isinstance(app.backend, KeyValueStoreBackend)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_owner(request):
+    """Owner of what a request creates: the user, or the session of an anonymous user."""
+    if request.user and request.user.is_authenticated:
+        return 'user-' + str(request.user.pk)
+    if request.session.session_key is None:
+        # a non empty session, so that its cookie is sent back
+        request.session['analysis_owner'] = True
+        request.session.save()
+    return 'session-' + request.session.session_key
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def set_job_owner(app, job_id, owner):
+    key = OWNER_KEY + str(job_id)
+    app.backend.set(key, owner)
+    # kept at least as long as the result of the job
+    app.backend.expire(key, max(int(app.backend.expires or 0), OWNER_EXPIRES))
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def is_job_owner(app, job_id, owner):
+    """Whether the job (of a known owner) belongs to this owner."""
+    if not supports_owners(app):
+        return False
+    value = app.backend.get(OWNER_KEY + str(job_id))
+    if isinstance(value, bytes):
+        value = value.decode()
+    return value is not None and value == owner
+#-------------------------------------------------------------------------------------------------
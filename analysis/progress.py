@@ -0,0 +1,128 @@
+#=================================================================================================
+# Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
+#          Hokkaido University (2018)
+#          Last Update: Q4 2026
+# ________________________________________________________________________________________________
+# Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
+#          Jun Fujima (Former Lead Developer) [2018-2021]
+# ________________________________________________________________________________________________
+# Description: Serverside (Django) progress reporting and stopping of the 'Analysis' page jobs
+# ------------------------------------------------------------------------------------------------
+# Notes:  Long running components (Monte Cat, Optimizer) call report_progress() after every
+#         iteration and check stop_requested() to end early with their best state so far. Both
+#         do nothing unless the component is run by a celery job (async mode): the progress is
+#         then published as the 'PROGRESS' state of the job, and the stop requests are flags in
+#         the celery result backend.
+# ------------------------------------------------------------------------------------------------
+# References: celery, contextlib, threading, time and logging libs
+#=================================================================================================
+
+#-------------------------------------------------------------------------------------------------
+# Import required Libraries
+#-------------------------------------------------------------------------------------------------
+from celery.backends.base import KeyValueStoreBackend
+
+from contextlib import contextmanager
+import threading
+import time
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+#-------------------------------------------------------------------------------------------------
+
+STOP_KEY = 'mads-job-stop-'
+STOP_EXPIRES = 3600
+
+_current = threading.local()
+
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class StopNotSupported(Exception):
+    """The result backend of the jobs can not keep stop requests."""
+    pass
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def supports_stop(app):
+    return isinstance(app.backend, KeyValueStoreBackend)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def request_stop(app, job_id):
+    """Ask a running job to stop (and return its best result so far) at its next iteration."""
+    if not supports_stop(app):
+        raise StopNotSupported('The result backend does not support stopping jobs')
+    key = STOP_KEY + str(job_id)
+    app.backend.set(key, '1')
+    app.backend.expire(key, STOP_EXPIRES)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class JobProgress(object):
+    """
+    Progress reporter of the celery task (bound task instance) running a component.
+    """
+
+    def __init__(self, task):
+        self.task = task
+        self.started = time.time()
+
+    def report(self, event):
+        event = dict(event, elapsed=round(time.time() - self.started, 3))
+        self.task.update_state(state='PROGRESS', meta=event)
+
+    def should_stop(self):
+        if not supports_stop(self.task.app):
+            return False
+        return self.task.app.backend.get(STOP_KEY + str(self.task.request.id)) is not None
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+@contextmanager
+def job_progress(task):
+    """Make the components run within this context report their progress to the task."""
+    _current.progress = JobProgress(task)
+    try:
+        yield _current.progress
+    finally:
+        _current.progress = None
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_progress():
+    """Get the progress reporter of the running job (None outside of jobs), for example to hand it
+    over to other threads."""
+    return getattr(_current, 'progress', None)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def progress_enabled():
+    return get_progress() is not None
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def report_progress(**event):
+    """Publish a progress event (json types only) of the running job, if any."""
+    progress = get_progress()
+    if progress is not None:
+        progress.report(event)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def stop_requested():
+    """True if the client asked the running job to stop."""
+    progress = get_progress()
+    return progress is not None and progress.should_stop()
+#-------------------------------------------------------------------------------------------------
@@ -0,0 +1,52 @@
+#=================================================================================================
+# Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
+#          Hokkaido University (2018)
+#          Last Update: Q4 2026
+# ________________________________________________________________________________________________
+# Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
+#          Jun Fujima (Former Lead Developer) [2018-2021]
+# ________________________________________________________________________________________________
+# Description: Serverside (Django) celery tasks for the 'Analysis' page
+# ------------------------------------------------------------------------------------------------
+# Notes:  This allows heavy serverside components (Optimizer, Monte Cat, Gaussian Process etc.)
+#         to be processed by a celery worker instead of holding a web worker for the whole run.
+#         The components can report their progress to the job, and be asked to stop early.
+# ------------------------------------------------------------------------------------------------
+# References: celery, json and logging libs, 'api' subfolder's 'processor', 'analysis' folder's
+#             'progress' and 'common' folder's 'renderers'
+#=================================================================================================
+
+#-------------------------------------------------------------------------------------------------
+# Import required Libraries
+#-------------------------------------------------------------------------------------------------
+from celery import shared_task
+
+from .api.utils.processor import process_view
+from .progress import job_progress
+from common.renderers import encode_default
+
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def to_serializable(result):
+    """Convert a component result (numpy arrays, pandas objects etc.) into plain json types
+    so it can be stored by the celery result backend."""
+    return json.loads(json.dumps(result, default=encode_default))
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+@shared_task(bind=True)
+def process_view_task(self, data):
+    logger.info('process view job ' + str(self.request.id) + ': ' + str(data['view']['type']))
+    with job_progress(self):
+        result = process_view(data)
+
+    return to_serializable(result)
+#-------------------------------------------------------------------------------------------------
@@ -1,7 +1,7 @@
 #=================================================================================================
 # Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 #          Hokkaido University (2018)
-#          Last Update: Q3 2023
+#          Last Update: Q4 2026
 # ________________________________________________________________________________________________
 # Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
 #          Jun Fujima (Former Lead Developer) [2018-2021]
@@ -16,13 +16,434 @@
 #-------------------------------------------------------------------------------------------------
 # Import required Libraries
 #-------------------------------------------------------------------------------------------------
+import copy
+import json
+import numpy as np
+import pandas as pd
+import threading
+from unittest import mock
+
+from celery import Celery
 from django.test import TestCase
+from django.test import override_settings
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.gaussian_process import GaussianProcessRegressor
+from sklearn.gaussian_process.kernels import ConstantKernel, RBF, WhiteKernel
+from sklearn.linear_model import Lasso
+from sklearn.linear_model import LinearRegression
+from sklearn.model_selection import train_test_split
+from threadpoolctl import threadpool_info
+
+from analysis.api.utils.catalyst_gene import gene_distances, gene_strings
+from analysis.api.utils.gaussian_process import extend_fit, get_gaussian_process, get_optimizer_restarts
+from analysis.api.utils.gaussian_process import grid_columns, predict_grid, top_indices
+from analysis import gp_sessions
+from analysis.api.utils.processor import process_view
+from analysis.api.utils.histogram import bin_values
+from analysis.api.utils.monte_cat import LinearScorer, train_model
+from analysis.compute import compute_budget, get_n_jobs, get_thread_limit, set_n_jobs
+from analysis.fitted_models import load_model_token
+from analysis.tasks import to_serializable
+from datamanagement.models import DataSource
+
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class ViewUpdateAPITests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('analysis:analysis-view-update')
+        self.payload = {
+            'view': {'type': 'statistics', 'settings': {'featureColumns': ['a', 'b']}},
+            'data': {'a': [1, 2, 3, 4], 'b': [2.5, 3.5, 4.5, 5.5]},
+        }
+
+    def test_sync_update(self):
+        response = self.client.post(self.url, self.payload, format='json')
+        self.assertEquals(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEquals(data['columns'], ['Stats', 'a', 'b'])
+
+    def test_async_update_runs_inline_when_eager(self):
+        # the test settings use CELERY_TASK_ALWAYS_EAGER, so no job is queued
+        response = self.client.post(self.url + '?mode=async', self.payload, format='json')
+        self.assertEquals(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEquals(data['columns'], ['Stats', 'a', 'b'])
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class ViewJobAPITests(TestCase):
+
+    def setUp(self):
+        # a worker-less celery app, the task is only queued
+        self.app = Celery('tests', backend='cache+memory://')
+        self.app.conf.task_always_eager = False
+        self.task = mock.Mock(app=self.app)
+        patcher = mock.patch('analysis.api.views.process_view_task', self.task)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.client = APIClient()
+        self.payload = {
+            'view': {'type': 'statistics', 'settings': {'featureColumns': ['a', 'b']}},
+            'data': {'a': [1, 2, 3, 4], 'b': [2.5, 3.5, 4.5, 5.5]},
+        }
+
+    def submit(self):
+        response = self.client.post(reverse('analysis:analysis-view-update') + '?mode=async',
+                                    self.payload, format='json')
+        self.assertEquals(response.status_code, 202)
+        job_id = json.loads(response.content)['job_id']
+        self.task.apply_async.assert_called_once_with((self.payload,), task_id=job_id)
+        return job_id
+
+    def test_submit_status_and_result(self):
+        job_id = self.submit()
+        status_url = reverse('analysis:analysis-view-job', args=[job_id])
+        result_url = reverse('analysis:analysis-view-job-result', args=[job_id])
+
+        self.assertEquals(json.loads(self.client.get(status_url).content)['status'], 'PENDING')
+        self.assertEquals(self.client.get(result_url).status_code, 202)
+
+        self.app.backend.store_result(job_id, {'iteration': 3}, 'PROGRESS')
+        content = json.loads(self.client.get(status_url).content)
+        self.assertEquals(content['progress'], {'iteration': 3})
+
+        self.app.backend.store_result(job_id, {'columns': ['Stats', 'a', 'b']}, 'SUCCESS')
+        response = self.client.get(result_url)
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(json.loads(response.content)['columns'], ['Stats', 'a', 'b'])
+
+    def test_jobs_of_others_are_not_found(self):
+        job_id = self.submit()
+        other = APIClient()
+
+        self.assertEquals(other.get(reverse('analysis:analysis-view-job', args=[job_id])).status_code, 404)
+        self.assertEquals(other.get(reverse('analysis:analysis-view-job-result', args=[job_id])).status_code, 404)
+        self.assertEquals(other.post(reverse('analysis:analysis-view-job-stop', args=[job_id])).status_code, 404)
+        self.assertEquals(other.delete(reverse('analysis:analysis-view-job', args=[job_id])).status_code, 404)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class ModelTokenTests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('analysis:analysis-view-update')
+        self.payload = {
+            'view': {'type': 'regression', 'settings': {
+                'featureColumns': ['a'], 'targetColumn': 'b', 'method': 'Linear',
+                'methodArguments': {}, 'cvmethod': 'KFold', 'cvmethodArg': '2'}},
+            'data': {'a': [1, 2, 3, 4], 'b': [2.5, 3.5, 4.5, 5.5]},
+        }
+
+    def test_fitted_model_is_given_by_its_token(self):
+        response = self.client.post(self.url, self.payload, format='json')
+        self.assertEquals(response.status_code, 200)
+        token = json.loads(response.content)['model_token']
+
+        model = load_model_token(token, self.payload)
+        self.assertIsNotNone(model)
+        self.assertAlmostEquals(model.predict([[5]])[0], 6.5)
+
+    def test_token_is_not_used_for_other_data(self):
+        response = self.client.post(self.url, self.payload, format='json')
+        token = json.loads(response.content)['model_token']
+
+        self.payload['data']['b'] = [1, 1, 1, 1]
+        self.assertIsNone(load_model_token(token, self.payload))
+        self.assertIsNone(load_model_token('../' + token, self.payload))
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class BinValuesTests(TestCase):
+
+    def test_indices_per_bin_without_nan(self):
+        x = [0.0, None, 1.0, 2.0, 0.5, float('nan'), 2.0]
+
+        hist, bin_edges, indices = bin_values(x, 2)
+
+        self.assertEquals(bin_edges.tolist(), [0.0, 1.0, 2.0])
+        self.assertEquals(hist.tolist(), [2, 3])
+        self.assertEquals(indices, [[0, 4], [2, 3, 6]])
+#-------------------------------------------------------------------------------------------------
+
 
 #-------------------------------------------------------------------------------------------------
+@override_settings(ANALYSIS_N_JOBS=2, ANALYSIS_THREADS=1)
+class ComputeBudgetTests(TestCase):
+
+    def test_estimator_jobs(self):
+        self.assertEquals(set_n_jobs(RandomForestRegressor()).n_jobs, 2)
+        self.assertEquals(set_n_jobs(RandomForestRegressor(), 1).n_jobs, 1)
+        self.assertNotIn('n_jobs', set_n_jobs(Lasso()).get_params())
+
+    def test_thread_limit(self):
+        with compute_budget():
+            self.assertTrue(all(p['num_threads'] == 1 for p in threadpool_info()))
+
+    @override_settings(ANALYSIS_N_JOBS=0, ANALYSIS_THREADS=0, ANALYSIS_CONCURRENCY=4)
+    def test_request_share(self):
+        with mock.patch('analysis.compute.os.cpu_count', return_value=16):
+            self.assertEquals(get_n_jobs(), 4)
+            self.assertEquals(get_thread_limit(), 4)
+        with mock.patch('analysis.compute.os.cpu_count', return_value=2):
+            self.assertEquals(get_n_jobs(), 1)
+            self.assertEquals(get_thread_limit(), 1)
+#-------------------------------------------------------------------------------------------------
 
 
 #-------------------------------------------------------------------------------------------------
+class GaussianProcessTests(TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.x = rng.uniform(0, 10, size=(30, 2))
+        self.y = np.sin(self.x[:, 0]) + 0.1 * self.x[:, 1]
+        self.data = {'data': {'a': self.x[:, 0].tolist(), 'b': self.x[:, 1].tolist(), 'c': self.y.tolist()},
+                     'view': {'settings': {'featureColumns': ['a', 'b'], 'targetColumn': 'c', 'route': True,
+                                           'kernel': 'ConstantKernel() * RBF() + WhiteKernel()'}}}
+
+    def test_route_score(self):
+        # same as fitting each split on its training rows, one after the other
+        scores = []
+        for i in range(10):
+            X_train, X_test, y_train, y_test = train_test_split(self.x, self.y, test_size=0.2, random_state=i)
+            model = GaussianProcessRegressor(ConstantKernel() * RBF() + WhiteKernel()).fit(X_train, y_train)
+            scores.append(model.score(X_test, y_test))
+
+        result = get_gaussian_process(self.data)
+
+        self.assertAlmostEqual(result['serverReply'], sum(scores) / 10, places=10)
+
+    def test_top_indices(self):
+        values = np.array([0.5, 2.0, 1.0])
+
+        self.assertEquals(top_indices(values, 2).tolist(), [1, 2])
+        self.assertEquals(top_indices(values, 5).tolist(), [1, 2, 0])
+        self.assertEquals(top_indices(values, 0).tolist(), [])
+
+    def test_grid_columns(self):
+        axes = [np.linspace(0, 1, 3), np.linspace(0, 1, 4), np.linspace(0, 1, 5)]
+        expected = [i.reshape(-1) for i in np.meshgrid(*axes)]
+
+        for block in [None, 7]:
+            columns = grid_columns(axes, block)
+            for column, values in zip(columns, expected):
+                self.assertEquals(column.tolist(), values.tolist())
+
+    def test_extend_fit(self):
+        # conditioning on new observations is the same as fitting all of them with the same kernel
+        model = GaussianProcessRegressor(ConstantKernel() * RBF() + WhiteKernel()).fit(self.x[:20], self.y[:20])
+        axes = [np.linspace(0, 10, 30), np.linspace(0, 10, 20)]
+        pred, std = predict_grid(model, axes, 20)
+        var = std**2
+
+        extend_fit(model, axes, pred, var, self.x[20:], self.y[20:])
+
+        expected = GaussianProcessRegressor(model.kernel_, optimizer=None).fit(self.x, self.y)
+        expected_pred, expected_std = predict_grid(expected, axes, len(self.x))
+        self.assertTrue(np.allclose(pred, expected_pred, atol=1e-8))
+        self.assertTrue(np.allclose(np.sqrt(var), expected_std, atol=1e-8))
+        self.assertTrue(np.allclose(model.predict(self.x), expected.predict(self.x), atol=1e-8))
+
+    @override_settings(GP_MAX_OPTIMIZER_RESTARTS=2)
+    def test_optimizer_restarts(self):
+        self.assertEquals(get_optimizer_restarts({}), 0)
+        self.assertEquals(get_optimizer_restarts({'optimizerRestarts': 1}), 1)
+        self.assertEquals(get_optimizer_restarts({'optimizerRestarts': 100}), 2)
+        with self.assertRaises(ValueError):
+            get_optimizer_restarts({'optimizerRestarts': -1})
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class GaussianProcessSessionAPITests(TestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.payload = {
+            'view': {'type': 'gaussianProcess', 'settings': {
+                'featureColumns': [{'column': 'a', 'min': 0, 'max': 10}], 'targetColumn': 'b',
+                'kernel': 'ConstantKernel() * RBF() + WhiteKernel()', 'targetEI': 'Maximization',
+                'numberOfElements': 50}},
+            'data': {'a': [1, 3, 5, 7], 'b': [1.0, 2.5, 3.0, 2.0]},
+            'batchSize': 2,
+        }
+
+    def test_session_rounds(self):
+        response = self.client.post(reverse('analysis:analysis-gp-sessions'), self.payload, format='json')
+        self.assertEquals(response.status_code, 201)
+        content = json.loads(response.content)
+        session_id = content['session_id']
+        self.assertEquals(content['observations'], 4)
+        self.assertEquals(content['suggestions']['values'][0], [1, 2])
+
+        url = reverse('analysis:analysis-gp-session-observations', args=[session_id])
+        response = self.client.post(url, {'observations': [{'a': 4, 'target': 3.5}]}, format='json')
+        self.assertEquals(response.status_code, 200)
+        self.assertEquals(json.loads(response.content)['observations'], 5)
+
+        response = self.client.post(url, {'observations': [{'target': 3.5}]}, format='json')
+        self.assertEquals(response.status_code, 400)
+
+        url = reverse('analysis:analysis-gp-session', args=[session_id])
+        self.assertEquals(self.client.delete(url).status_code, 204)
+        self.assertEquals(self.client.get(url).status_code, 404)
+
+    def test_other_owner(self):
+        response = self.client.post(reverse('analysis:analysis-gp-sessions'), self.payload, format='json')
+        session_id = json.loads(response.content)['session_id']
+        other = APIClient()
+
+        url = reverse('analysis:analysis-gp-session', args=[session_id])
+        self.assertEquals(other.get(url).status_code, 404)
+        self.assertEquals(other.delete(url).status_code, 204)
+        self.assertEquals(self.client.get(url).status_code, 200)
+        observations_url = reverse('analysis:analysis-gp-session-observations', args=[session_id])
+        response = other.post(observations_url, {'observations': [{'a': 4, 'target': 3.5}]}, format='json')
+        self.assertEquals(response.status_code, 404)
+        self.assertEquals(json.loads(self.client.get(url).content)['observations'], 4)
+
+    def test_concurrent_rounds(self):
+        session_id = gp_sessions.create_session(self.payload, 'user-1')['session_id']
+        rounds = [threading.Thread(target=gp_sessions.add_observations,
+                                   args=(session_id, 'user-1', [{'a': a, 'target': 3.0}]))
+                  for a in [2, 4, 6, 8]]
+        for r in rounds:
+            r.start()
+        for r in rounds:
+            r.join()
+
+        self.assertEquals(gp_sessions.get_session(session_id, 'user-1')['observations'], 8)
+        self.assertIsNone(gp_sessions.get_session(session_id, 'user-2'))
+
+    def test_batch_size(self):
+        # the grid has 50 points
+        for batch_size, status_code in [(0, 400), (50, 201), (51, 400)]:
+            self.payload['batchSize'] = batch_size
+            response = self.client.post(reverse('analysis:analysis-gp-sessions'), self.payload, format='json')
+            self.assertEquals(response.status_code, status_code)
+            if status_code == 201:
+                self.assertEquals(len(json.loads(response.content)['suggestions']['values'][0]), 50)
+
+    def test_negative_optimizer_restarts(self):
+        self.payload['view']['settings']['optimizerRestarts'] = -1
+        response = self.client.post(reverse('analysis:analysis-gp-sessions'), self.payload, format='json')
+        self.assertEquals(response.status_code, 400)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class CatalystGeneTests(TestCase):
+
+    def test_root_distances(self):
+        genes = np.array([[0, 1, 2, 3], [1, 2, 3, 0], [0, 1, 2, 3], [3, 2, 1, 0]], dtype=np.uint8)
+
+        self.assertEquals(gene_strings(genes).tolist(), ['ABCD', 'BCDA', 'ABCD', 'DCBA'])
+        self.assertEquals(gene_distances(genes, genes[0]).tolist(), [0, 2, 0, 4])
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class LinearScorerTests(TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.X = rng.normal(size=(40, 5))
+        self.X[:, 3] = 2 * self.X[:, 0] - self.X[:, 1]  # collinear with the first two
+        self.y = self.X[:, 0] + 0.5 * self.X[:, 2] + rng.normal(scale=0.1, size=40)
+        self.scorer = LinearScorer(self.X, self.y)
+
+    def train(self, columns):
+        return train_model(self.X[:, columns], self.y, LinearRegression())
+
+    def test_score(self):
+        for columns in [[], [0], [0, 2], [0, 1, 3], [0, 1, 2, 3, 4]]:
+            self.assertAlmostEqual(self.scorer.score(columns), self.train(columns), places=10)
+
+    def test_score_additions(self):
+        for columns, candidates in [([], [0, 1, 2]), ([0, 1], [2, 3, 4]), ([0, 1, 3], [2, 4])]:
+            scores = self.scorer.score_additions(columns, candidates)
+            for candidate, score in zip(candidates, scores):
+                self.assertAlmostEqual(score, self.train(columns + [candidate]), places=10)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class DataSourceHandleTests(TestCase):
+
+    gp_kernel = 'ConstantKernel() * RBF() + WhiteKernel()'
+    cases = [
+        ('statistics', {'featureColumns': ['a', 'b']}),
+        ('scatter3D', {'method': 'PCA', 'featureColumns': ['a', 'b', 'c'], 'targetColumn': 't'}),
+        ('clustering', {'visType': 'Bar Chart', 'featureColumns': ['a', 'b'], 'numberOfClusters': 2,
+                        'method': 'KMeans'}),
+        ('clustering', {'visType': 'Scatter', 'featureColumns': ['a', 'b'], 'numberOfClusters': 2}),
+        ('regression', {'featureColumns': ['a', 'b'], 'targetColumn': 'c', 'method': 'Linear',
+                        'methodArguments': {}, 'cvmethod': 'KFold', 'cvmethodArg': '2'}),
+        ('classification', {'featureColumns': ['a', 'b'], 'targetColumn': 't', 'method': 'Ridge',
+                            'methodArguments': {'arg1': 1.0}}),
+        ('feature-importance', {'featureColumns': ['a', 'b', 'c'], 'targetColumn': 't'}),
+        ('pairwise-correlation', {}),
+        ('histogram', {'targetColumns': ['a', 'n'], 'bins': 3}),
+        ('gaussianProcess', {'featureColumns': ['a', 'b'], 'targetColumn': 'c', 'kernel': gp_kernel,
+                             'route': True}),
+        ('gaussianProcess', {'featureColumns': [{'column': 'a', 'min': 0, 'max': 1},
+                                                {'column': 'b', 'min': 0, 'max': 1}],
+                             'targetColumn': 'c', 'kernel': gp_kernel, 'targetEI': 'Maximization',
+                             'numberOfElements': 25}),
+        ('featureEngineering', {'targetColumns': ['c'], 'firstOrderDescriptors': ['x', '(x)^2', 'sqrt(x)'],
+                                'descriptorColumns': ['a', 'b'], 'selectedDataSource': 'Data Management'}),
+        ('monteCat', {'temperature': 300, 'iterations': 2, 'randomSeed': True, 'targetColumn': 'c',
+                      'selectedDataSource': 'Data Management', 'machineLearningModel': 'Linear',
+                      'baseDescriptors': ['a']}),
+    ]
+
+    def setUp(self):
+        x = np.linspace(0, 1, 12)
+        self.frame = pd.DataFrame({
+            'a': x, 'b': np.sin(5 * x), 'c': x ** 2 + np.cos(3 * x), 'd': np.exp(x),
+            't': [0, 1] * 6, 'label': ['p', 'q', 'r'] * 4, 'n': [1.5, None] * 6,
+        })
+        self.source = DataSource.objects.create(name='handle test')
+        patcher = mock.patch('datamanagement.dataframes.get_datasource_frame', return_value=self.frame)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def process(self, data):
+        np.random.seed(0)
+        result = to_serializable(process_view(copy.deepcopy(data)))
+        if isinstance(result, dict):
+            result.pop('model_token', None)
+            if 'process' in result:
+                result.pop('process')  # timings
+        return result
+
+    def assert_same_as_inline(self, view, handle):
+        frame = self.frame[handle['columns']]
+        inline = {'view': view, 'data': frame.astype(object).where(frame.notnull(), None).to_dict(orient='list')}
+        referred = {'view': view, 'data': [], 'dataSource': dict(handle, id=str(self.source.id))}
+        self.assertEquals(self.process(referred), self.process(inline))
 
-# Create your tests here.
+    def test_table_components(self):
+        for view_type, view_settings in self.cases:
+            with self.subTest(view_type=view_type):
+                columns = ['a', 'b', 'c', 't', 'n'] if view_type != 'monteCat' else ['a', 'b', 'c', 'd']
+                self.assert_same_as_inline({'type': view_type, 'settings': view_settings}, {'columns': columns})
 
+    def test_single_column_components(self):
+        referred = {'view': {'type': 'pie', 'settings': {'bins': 0}}, 'data': [],
+                    'dataSource': {'id': str(self.source.id), 'column': 'label'}}
+        inline = {'view': referred['view'], 'data': self.frame['label'].tolist()}
+        self.assertEquals(self.process(referred), self.process(inline))
 #-------------------------------------------------------------------------------------------------
@@ -57,6 +57,36 @@ urlpatterns = [
         view=api_views.ViewUpdateAPIs.as_view(),
         name='analysis-view-update'
     ),
+    path(
+        'api/view-jobs/<job_id>',
+        view=api_views.ViewJobAPIs.as_view(),
+        name='analysis-view-job'
+    ),
+    path(
+        'api/view-jobs/<job_id>/stop',
+        view=api_views.ViewJobStopAPIs.as_view(),
+        name='analysis-view-job-stop'
+    ),
+    path(
+        'api/view-jobs/<job_id>/result',
+        view=api_views.ViewJobResultAPIs.as_view(),
+        name='analysis-view-job-result'
+    ),
+    path(
+        'api/gp-sessions',
+        view=api_views.GaussianProcessSessionsAPIs.as_view(),
+        name='analysis-gp-sessions'
+    ),
+    path(
+        'api/gp-sessions/<session_id>',
+        view=api_views.GaussianProcessSessionAPIs.as_view(),
+        name='analysis-gp-session'
+    ),
+    path(
+        'api/gp-sessions/<session_id>/observations',
+        view=api_views.GaussianProcessSessionObservationsAPIs.as_view(),
+        name='analysis-gp-session-observations'
+    ),
 
     path('api/cuser', view=api_views.CurrentUserView.as_view(), name='cuser'),
 
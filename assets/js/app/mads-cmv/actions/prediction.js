@@ -1,7 +1,7 @@
 /*=================================================================================================
 // Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 //          Hokkaido University (2018)
-//          Last Update: Q3 2023
+//          Last Update: Q4 2026
 // ________________________________________________________________________________________________
 // Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
 //          Jun Fujima (Former Lead Developer) [2018-2021]
@@ -57,6 +57,12 @@ export const saveModel = (name, viewSettings, overwrite, id) => async (
   model.metadata = metadata;
   model.viewSettings = viewSettings;
 
+  // the model fitted by the last run of the view is reused by the server if it is still valid
+  const result = getState().dataset[viewSettings.view.id];
+  if (result && result.model_token) {
+    model.modelToken = result.model_token;
+  }
+
   if (overwrite) {
     const updatedModel = await updateModel(id, model);
     dispatch(
@@ -1,7 +1,7 @@
 /*=================================================================================================
 // Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 //          Hokkaido University (2018)
-//          Last Update: Q3 2023
+//          Last Update: Q4 2026
 // ________________________________________________________________________________________________
 // Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
 //          Jun Fujima (Former Lead Developer) [2018-2021]
@@ -35,6 +35,9 @@ export const VIEW_UPDATE_REMOTE_REQUEST = 'VIEW_UPDATE_REMOTE_REQUEST';
 export const VIEW_UPDATE_REMOTE_SUCCESS = 'VIEW_UPDATE_REMOTE_SUCCESS';
 export const VIEW_UPDATE_REMOTE_FAILURE = 'VIEW_UPDATE_REMOTE_FAILURE';
 
+// components with wide table results, which are transferred as binary columns
+const COLUMNAR_VIEW_TYPES = ['featureEngineering', 'monteCat'];
+
 //-------------------------------------------------------------------------------------------------
 
 //-------------------------------------------------------------------------------------------------
@@ -96,8 +99,11 @@ export const sendRequestViewUpdate = (view, values, data) => (dispatch) => {
   dispatch(updateView(values));
   dispatch(loadingActions.setLoadingState(true));
 
-  return api.views
-    .sendRequestViewUpdate(view, data)
+  const request = COLUMNAR_VIEW_TYPES.includes(view.type)
+    ? api.views.sendRequestViewUpdateColumnar(view, data)
+    : api.views.sendRequestViewUpdate(view, data);
+
+  return request
     .then((res) => {
       dispatch(receiveViewUpdateRemote(res.data));
       dispatch(datasetActions.addDatasetView(view.id, res.data));
@@ -0,0 +1,63 @@
+/*=================================================================================================
+// Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
+//          Hokkaido University (2018)
+//          Last Update: Q4 2026
+// ________________________________________________________________________________________________
+// Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
+//          Jun Fujima (Former Lead Developer) [2018-2021]
+// ________________________________________________________________________________________________
+// Description: This is the decoder of the binary 'columnar' format of the server side results
+// ------------------------------------------------------------------------------------------------
+// Notes: The layout is described in the server side 'common/renderers.py'. The tables are given
+//        back in the usual { header, data: { row: [values] } } form, so the components do not need
+//        to know how the result was transferred. Responses in another format (errors) are parsed
+//        as JSON.
+// ------------------------------------------------------------------------------------------------
+// References: None
+=================================================================================================*/
+
+//-------------------------------------------------------------------------------------------------
+// Export the decoder
+//-------------------------------------------------------------------------------------------------
+export const COLUMNAR_MEDIA_TYPE = 'application/x-mads-columnar';
+
+export function decodeColumnarResult(buffer) {
+  const headerLength = new DataView(buffer).getUint32(0, true);
+  const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 4, headerLength)));
+  const bodyOffset = 4 + headerLength;
+  const { result } = header;
+
+  header.tables.forEach((table) => {
+    const rows = table.index.length;
+    const columns = table.columns.map((c) => (c.values !== undefined
+      ? c.values
+      : new Float64Array(buffer, bodyOffset + c.offset, rows)));
+
+    // NaN and Inf values are null, as in the JSON results
+    const data = {};
+    table.index.forEach((key, r) => {
+      data[key] = columns.map((c) => (c instanceof Float64Array && !Number.isFinite(c[r]) ? null : c[r]));
+    });
+
+    const target = table.path.length ? result[table.path[0]] : result;
+    target.header = table.header;
+    target.data = data;
+  });
+
+  return result;
+}
+
+export function decodeColumnarResponse(buffer, headers) {
+  const contentType = (headers && headers['content-type']) || '';
+  if (contentType.startsWith(COLUMNAR_MEDIA_TYPE)) {
+    return decodeColumnarResult(buffer);
+  }
+
+  const text = new TextDecoder().decode(new Uint8Array(buffer));
+  try {
+    return JSON.parse(text);
+  } catch (e) {
+    return text;
+  }
+}
+//-------------------------------------------------------------------------------------------------
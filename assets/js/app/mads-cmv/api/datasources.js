@@ -30,6 +30,16 @@ export default function (getClient) {
 
       return fetch(url);
     },
+
+    fetchDataSourceRows(id, { offset = 0, limit, columns, filter, output = 'ndjson' } = {}) {
+      const params = new URLSearchParams({ offset, output });
+      if (limit !== undefined) params.append('limit', limit);
+      if (columns) params.append('columns', columns.join(','));
+      if (filter) params.append('filter', JSON.stringify(filter));
+      const url = `${Urls['datamanagement:datasource_contents_rest_api'](id)}?${params}`;
+
+      return fetch(url);
+    },
   };
 }
 //-------------------------------------------------------------------------------------------------
@@ -1,7 +1,7 @@
 /*=================================================================================================
 // Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 //          Hokkaido University (2018)
-//          Last Update: Q3 2023
+//          Last Update: Q4 2026
 // ________________________________________________________________________________________________
 // Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
 //          Jun Fujima (Former Lead Developer) [2018-2021]
@@ -38,6 +38,16 @@ export default function (getClient) {
 
       return client.post(url, data);
     },
+
+    predictBatch(id, file, output = 'csv') {
+      const client = getClient();
+      const url = Urls['prediction:models-api-predict-batch'](id);
+      const formData = new FormData();
+      formData.append('file', file);
+      formData.append('output', output);
+
+      return client.post(url, formData, { responseType: 'blob' });
+    },
   };
 }
 //-------------------------------------------------------------------------------------------------
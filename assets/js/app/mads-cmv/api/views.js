@@ -1,7 +1,7 @@
 /*=================================================================================================
 // Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 //          Hokkaido University (2018)
-//          Last Update: Q3 2023
+//          Last Update: Q4 2026
 // ________________________________________________________________________________________________
 // Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
 //          Jun Fujima (Former Lead Developer) [2018-2021]
@@ -10,9 +10,16 @@
 // ------------------------------------------------------------------------------------------------
 // Notes: 'Views' let us look at the data in various ways via multiple visualization components
 // ------------------------------------------------------------------------------------------------
-// References: None
+// References: internal columnar
 =================================================================================================*/
 
+//-------------------------------------------------------------------------------------------------
+// Load required libraries
+//-------------------------------------------------------------------------------------------------
+import { COLUMNAR_MEDIA_TYPE, decodeColumnarResponse } from './columnar';
+
+//-------------------------------------------------------------------------------------------------
+
 //-------------------------------------------------------------------------------------------------
 // Export feature/module methods
 //-------------------------------------------------------------------------------------------------
@@ -27,6 +34,102 @@ export default function (getClient) {
         data,
       });
     },
+
+    sendRequestViewUpdateColumnar(view, data) {
+      // wide results (feature engineering, monte cat...) are transferred as binary columns
+      const client = getClient();
+      const url = Urls['analysis:analysis-view-update']();
+
+      return client.post(url, { view, data }, {
+        headers: { Accept: COLUMNAR_MEDIA_TYPE },
+        responseType: 'arraybuffer',
+        transformResponse: [decodeColumnarResponse],
+      });
+    },
+
+    sendRequestViewUpdateWithDataSource(view, dataSourceId, columns) {
+      const client = getClient();
+      const url = Urls['analysis:analysis-view-update']();
+
+      return client.post(url, {
+        view,
+        dataSource: { id: dataSourceId, columns },
+      });
+    },
+
+    submitViewJob(view, data) {
+      const client = getClient();
+      const url = `${Urls['analysis:analysis-view-update']()}?mode=async`;
+
+      return client.post(url, {
+        view,
+        data,
+      });
+    },
+
+    getViewJobStatus(jobId) {
+      const client = getClient();
+      const url = Urls['analysis:analysis-view-job'](jobId);
+
+      return client.get(url);
+    },
+
+    getViewJobResult(jobId) {
+      const client = getClient();
+      const url = Urls['analysis:analysis-view-job-result'](jobId);
+
+      return client.get(url);
+    },
+
+    stopViewJob(jobId) {
+      const client = getClient();
+      const url = Urls['analysis:analysis-view-job-stop'](jobId);
+
+      return client.post(url);
+    },
+
+    cancelViewJob(jobId) {
+      const client = getClient();
+      const url = Urls['analysis:analysis-view-job'](jobId);
+
+      return client.delete(url);
+    },
+
+    createGpSession(view, data, batchSize) {
+      const client = getClient();
+      const url = Urls['analysis:analysis-gp-sessions']();
+
+      return client.post(url, {
+        view,
+        data,
+        batchSize,
+      });
+    },
+
+    getGpSession(sessionId) {
+      const client = getClient();
+      const url = Urls['analysis:analysis-gp-session'](sessionId);
+
+      return client.get(url);
+    },
+
+    addGpObservations(sessionId, observations, batchSize, refit = false) {
+      const client = getClient();
+      const url = Urls['analysis:analysis-gp-session-observations'](sessionId);
+
+      return client.post(url, {
+        observations,
+        batchSize,
+        refit,
+      });
+    },
+
+    deleteGpSession(sessionId) {
+      const client = getClient();
+      const url = Urls['analysis:analysis-gp-session'](sessionId);
+
+      return client.delete(url);
+    },
   };
 }
 //-------------------------------------------------------------------------------------------------
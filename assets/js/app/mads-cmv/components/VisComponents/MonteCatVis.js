@@ -95,6 +95,7 @@ export default function MonteCat({
   return (
     <div style={{width: internalOptions.extent.width, height: internalOptions.extent.height, overflow: 'hidden', boxSizing: 'border-box'}}>
       <Header as='h2' style={{margin:'15px auto 30px auto', textAlign:'center'}}>Monte Cat</Header>
+      {data['stopped'] && <Header as='h5' style={{margin:'-20px auto 15px auto', textAlign:'center'}}>Stopped early, the results are the ones of the finished iterations</Header>}
       <DataItemActions data={data['process']} content='Process Result' disabled={disabled} filename='montecat_process'/>
       <DataItemActions data={data['output']} content='Best Model' disabled={disabled} filename={`${machineLearningModel}_T${temperature}`}/>
       <CSVFileModal image={csvinput} title={'Input CSV File Data Requirements Format'} attr={'#inputcsvfile' + id}/>
@@ -0,0 +1,293 @@
+#=================================================================================================
+# Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
+#          Hokkaido University (2018)
+#          Last Update: Q4 2026
+# ________________________________________________________________________________________________
+# Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
+#          Jun Fujima (Former Lead Developer) [2018-2021]
+# ________________________________________________________________________________________________
+# Description: Serverside (Django) common folder contains all base-root reusable codes that are
+#              shared and used by all various "apps" within this web site. This file contains
+#              a process-local in-memory cache and an on-disk cache (shared by the processes),
+#              both with a size cap in bytes and LRU eviction.
+# ------------------------------------------------------------------------------------------------
+# Notes: This is 'common' code that support various apps and files with all reusable features
+#        that is needed for the different pages Django provides
+# ------------------------------------------------------------------------------------------------
+# References: collections, contextlib, fcntl, joblib, os, sys, threading, time and logging libs
+#=================================================================================================
+
+#-------------------------------------------------------------------------------------------------
+# Import required Libraries
+#-------------------------------------------------------------------------------------------------
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import joblib
+
+import fcntl
+import os
+import sys
+import threading
+import time
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def estimate_size(value):
+    """Estimate the memory footprint (in bytes) of a cached value.
+
+    Arguments:
+        value {object} -- DataFrame, Series, ndarray, sparse matrix or any other python object.
+
+    Returns:
+        int -- the estimated size in bytes
+    """
+    if hasattr(value, 'memory_usage'):  # pandas
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, 'sum') else int(usage)
+    if hasattr(value, 'nbytes'):  # numpy
+        return int(value.nbytes)
+    if hasattr(value, 'indptr'):  # scipy sparse (csr/csc)
+        return int(value.data.nbytes + value.indices.nbytes + value.indptr.nbytes)
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class LRUCache(object):
+    """
+    Thread safe, process-local cache. When the total size of the stored values exceeds
+    `max_bytes` the least recently used entries are evicted.
+    """
+
+    def __init__(self, max_bytes, name='cache'):
+        self.max_bytes = int(max_bytes)
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def total_bytes(self):
+        return self._total
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def set(self, key, value, size=None):
+        if size is None:
+            size = estimate_size(value)
+
+        with self._lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                logger.info(self.name + ': value too large to be cached (' + str(size) + ' bytes)')
+                return
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._total += size
+            while self._total > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def delete(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def delete_matching(self, predicate):
+        """Delete every entry whose key satisfies the predicate."""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._total = 0
+
+    def _remove(self, key):
+        if key in self._entries:
+            del self._entries[key]
+            self._total -= self._sizes.pop(key)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class DiskLRUCache(object):
+    """
+    Cache storing each value as a joblib file in `directory`, so that the entries are shared by
+    all the processes of the server and survive restarts. The file modification time is used as
+    last access time, and the least recently used files are removed when their total size
+    exceeds `max_bytes`. If `max_age` (seconds) is given, entries that have not been accessed for
+    that long are expired. An entry that is read, modified and written back can be locked (for
+    all the processes) with `lock`.
+    """
+
+    extension = '.joblib'
+    lock_extension = '.lock'
+
+    def __init__(self, directory, max_bytes, name='disk cache', max_age=None):
+        self.directory = directory
+        self.max_bytes = int(max_bytes)
+        self.max_age = max_age
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, str(key) + self.extension)
+
+    def _lock_path(self, key):
+        return os.path.join(self.directory, str(key) + self.lock_extension)
+
+    @contextmanager
+    def lock(self, key):
+        """
+        Hold an exclusive lock on an entry, waiting for the other holders (threads or processes).
+        A lock file is only removed by a holder of its lock, so after waiting the lock is taken
+        again if the file has been replaced meanwhile.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        lock_path = self._lock_path(key)
+        while True:
+            lock_file = open(lock_path, 'a')
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                if os.fstat(lock_file.fileno()).st_ino == os.stat(lock_path).st_ino:
+                    break
+            except FileNotFoundError:
+                pass
+            lock_file.close()
+
+        try:
+            yield
+        finally:
+            if not os.path.exists(self._path(key)):  # entry deleted while locked
+                self._remove_lock_file(lock_path, lock_file)
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+
+    def _remove_lock_file(self, lock_path, lock_file=None):
+        """
+        Remove a lock file while holding its lock, `lock_file` being the held one. Without it, the
+        file is only removed if nobody holds it, otherwise the holder removes it on release.
+        """
+        if lock_file is not None:
+            try:
+                os.remove(lock_path)
+            except FileNotFoundError:
+                pass
+            return
+
+        try:
+            fd = os.open(lock_path, os.O_WRONLY)
+        except FileNotFoundError:
+            return
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            if os.fstat(fd).st_ino == os.stat(lock_path).st_ino:
+                os.remove(lock_path)
+        except (BlockingIOError, FileNotFoundError):
+            pass
+        finally:
+            os.close(fd)
+
+    def get(self, key, default=None):
+        path = self._path(key)
+        try:
+            if self.max_age is not None and time.time() - os.path.getmtime(path) > self.max_age:
+                self.delete(key)
+                raise FileNotFoundError(path)
+            value = joblib.load(path)
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return default
+        except Exception as e:  # partially written or otherwise unreadable entry
+            logger.warning(self.name + ': could not read ' + path + ': ' + str(e))
+            self.delete(key)
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        path = self._path(key)
+        tmp_path = path + '.' + str(os.getpid()) + '-' + str(threading.get_ident()) + '.tmp'
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            joblib.dump(value, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(self.name + ': could not write ' + path + ': ' + str(e))
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self.evict()
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+        self._remove_lock_file(self._lock_path(key))
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache fits in max_bytes, and the lock
+        files left by removed entries.
+        """
+        entries = []
+        lock_paths = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.lock_extension):
+                lock_paths.append(entry.path)
+            elif entry.name.endswith(self.extension):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:  # removed by another process
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        expired = time.time() - self.max_age if self.max_age is not None else None
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_bytes and (expired is None or mtime >= expired):
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+        for lock_path in lock_paths:
+            if not os.path.exists(lock_path[:-len(self.lock_extension)] + self.extension):
+                self._remove_lock_file(lock_path)
+#-------------------------------------------------------------------------------------------------
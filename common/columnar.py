@@ -0,0 +1,161 @@
+#=================================================================================================
+# Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
+#          Hokkaido University (2018)
+#          Last Update: Q4 2026
+# ________________________________________________________________________________________________
+# Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
+#          Jun Fujima (Former Lead Developer) [2018-2021]
+# ________________________________________________________________________________________________
+# Description: Serverside (Django) common folder contains all base-root reusable codes that are
+#              shared and used by all various "apps" within this web site. This file contains
+#              code to keep a typed columnar (Arrow IPC) copy of uploaded CSV files.
+# ------------------------------------------------------------------------------------------------
+# Notes: The sidecar is written next to the uploaded file once, together with the detected
+#        delimiter and dtypes, and is memory-mapped by the readers so the text does not have to
+#        be parsed again. A sidecar that is older than its CSV file is ignored.
+# ------------------------------------------------------------------------------------------------
+# References: pyarrow, pandas, json, os and logging libs
+#=================================================================================================
+
+#-------------------------------------------------------------------------------------------------
+# Import required Libraries
+#-------------------------------------------------------------------------------------------------
+import pyarrow as pa
+import pyarrow.feather as feather
+
+import json
+import os
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+#-------------------------------------------------------------------------------------------------
+
+SIDECAR_EXTENSION = '.arrow'
+METADATA_KEY = b'mads'
+
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_sidecar_paths(file):
+    """Get the local paths of a stored file and of its columnar sidecar.
+
+    Arguments:
+        file {FieldFile} -- The file.
+
+    Returns:
+        source_path, sidecar_path  -- (None, None) if the storage has no local file system
+    """
+    if not file or not file.name:
+        return None, None
+    try:
+        source_path = file.storage.path(file.name)
+    except NotImplementedError:
+        return None, None
+    return source_path, source_path + SIDECAR_EXTENSION
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def _source_signature(source_path):
+    stat = os.stat(source_path)
+    return {'source_size': stat.st_size, 'source_mtime': stat.st_mtime_ns}
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def read_sidecar_metadata(file):
+    """Read the metadata (delimiter, dtypes, rows, ...) of a fresh sidecar, None otherwise."""
+    source_path, sidecar_path = get_sidecar_paths(file)
+    if sidecar_path is None or not os.path.exists(sidecar_path) or not os.path.exists(source_path):
+        return None
+
+    try:
+        with pa.memory_map(sidecar_path) as source:
+            schema = pa.ipc.open_file(source).schema
+        metadata = json.loads(schema.metadata[METADATA_KEY])
+    except (pa.ArrowException, OSError, KeyError, TypeError, ValueError):
+        logger.warning('unreadable columnar sidecar: ' + sidecar_path)
+        return None
+
+    signature = _source_signature(source_path)
+    if any(metadata.get(k) != v for k, v in signature.items()):
+        return None
+
+    return metadata
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def write_columnar_sidecar(file, df, delimiter):
+    """Write the typed columnar copy of a parsed CSV file.
+
+    Arguments:
+        file {FieldFile} -- The (CSV) file the frame was read from.
+        df {DataFrame} -- The parsed contents.
+        delimiter {str} -- The detected delimiter.
+
+    Returns:
+        bool -- True if the sidecar was written
+    """
+    source_path, sidecar_path = get_sidecar_paths(file)
+    if sidecar_path is None or not os.path.exists(source_path):
+        return False
+
+    metadata = _source_signature(source_path)
+    metadata['delimiter'] = delimiter
+    metadata['rows'] = int(len(df))
+    metadata['columns'] = [str(c) for c in df.columns]
+    metadata['dtypes'] = {str(c): str(t) for c, t in df.dtypes.items()}
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        schema_metadata = dict(table.schema.metadata or {})
+        schema_metadata[METADATA_KEY] = json.dumps(metadata).encode('utf-8')
+        table = table.replace_schema_metadata(schema_metadata)
+        # uncompressed, so that the readers can memory-map the columns
+        tmp_path = sidecar_path + '.tmp'
+        feather.write_feather(table, tmp_path, compression='uncompressed')
+        os.replace(tmp_path, sidecar_path)
+    except (pa.ArrowException, OSError, TypeError, ValueError) as e:
+        logger.warning('could not write columnar sidecar for ' + file.name + ': ' + str(e))
+        return False
+
+    return True
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def read_columnar_sidecar(file, columns=None):
+    """Read (memory-mapped) the columnar copy of a file if it is up to date.
+
+    Arguments:
+        file {FieldFile} -- The (CSV) file.
+        columns {list} -- Optional column projection, only these columns are read.
+
+    Returns:
+        df, metadata  -- (None, None) if there is no fresh sidecar
+    """
+    metadata = read_sidecar_metadata(file)
+    if metadata is None:
+        return None, None
+
+    _, sidecar_path = get_sidecar_paths(file)
+    try:
+        table = feather.read_table(sidecar_path, columns=columns, memory_map=True)
+    except (pa.ArrowException, OSError, KeyError) as e:
+        logger.warning('could not read columnar sidecar ' + sidecar_path + ': ' + str(e))
+        return None, None
+
+    return table.to_pandas(), metadata
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def delete_columnar_sidecar(file):
+    _, sidecar_path = get_sidecar_paths(file)
+    if sidecar_path is not None and os.path.exists(sidecar_path):
+        os.remove(sidecar_path)
+#-------------------------------------------------------------------------------------------------
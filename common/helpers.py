@@ -77,6 +77,33 @@ class OwnedResourceModelFilterHelper(FormHelper):
 #-------------------------------------------------------------------------------------------------
 
 
+#-------------------------------------------------------------------------------------------------
+def read_csv_from_file(file):
+    """Read a CSV file into a DataFrame, detecting which delimiter is used first.
+
+    Arguments:
+        file {FieldFile} -- The file.
+
+    Returns:
+        df, delimiter  -- DataFrame, the detected delimiter
+    """
+
+    # Extract which delimiter is used in this csv file
+    delimiter = '#'
+    possible_delimeters = [',', ';', '\t', '\s', '|']
+    file.seek(0)
+    df_check = pd.read_csv(file, sep=delimiter, nrows=2, encoding_errors='replace')
+    cellStr = df_check.iat[0,0]
+    cnt = [cellStr.count(','), cellStr.count(';'), cellStr.count('\t'), cellStr.count('\s'), cellStr.count('|') ]
+    delimiter = possible_delimeters[cnt.index(max(cnt))]
+    file.seek(0)
+
+    df = pd.read_csv(file, sep=delimiter, encoding_errors='replace')
+
+    return df, delimiter
+#-------------------------------------------------------------------------------------------------
+
+
 #-------------------------------------------------------------------------------------------------
 def get_contents_from_file(file):
     """Read contents from the specified file only if the type of the file is "CSV".
@@ -96,16 +123,7 @@ def get_contents_from_file(file):
     if (file_extension == '.csv'):
         file_type = 'csv'
 
-        # Extract which delimiter is used in this csv file
-        delimiter = '#'
-        possible_delimeters = [',', ';', '\t', '\s', '|']
-        df_check = pd.read_csv(file, sep=delimiter, nrows=2, encoding_errors='replace')
-        cellStr = df_check.iat[0,0]
-        cnt = [cellStr.count(','), cellStr.count(';'), cellStr.count('\t'), cellStr.count('\s'), cellStr.count('|') ]
-        delimiter = possible_delimeters[cnt.index(max(cnt))]
-        file.seek(0)
-
-        df = pd.read_csv(file, sep=delimiter, encoding_errors='replace')
+        df, delimiter = read_csv_from_file(file)
         json = df.to_json(orient='table')
         contents = json
         columns = df.columns
@@ -0,0 +1,105 @@
+#=================================================================================================
+# Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
+#          Hokkaido University (2018)
+#          Last Update: Q4 2026
+# ________________________________________________________________________________________________
+# Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
+#          Jun Fujima (Former Lead Developer) [2018-2021]
+# ________________________________________________________________________________________________
+# Description: Serverside (Django) common folder contains all base-root reusable codes that are
+#              shared and used by all various "apps" within this web site. This file contains
+#              code to support custom management commands (for the pip command line) regarding
+#              the speed of the rest api renderers.
+# ------------------------------------------------------------------------------------------------
+# Notes: Compares the rest framework JSONRenderer with the site's NumpyJSONRenderer (and the
+#        binary columnar renderer) on the outputs of real analysis components run on random data.
+#          python manage.py benchmark_renderers --rows 10000 --repeat 5
+# ------------------------------------------------------------------------------------------------
+# References: Django platform libraries, rest framework, numpy, pandas, time libs, this 'common'
+#             folder's 'renderers' and the 'analysis' components
+#=================================================================================================
+
+#-------------------------------------------------------------------------------------------------
+# Import required Libraries
+#-------------------------------------------------------------------------------------------------
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+import numpy as np
+import pandas as pd
+
+import time
+
+from analysis.api.utils.feature_engineering import get_feature_engineering
+from analysis.api.utils.histogram import get_histogram
+from analysis.api.utils.regression import get_regression
+from common.renderers import ColumnarRenderer
+from common.renderers import NumpyJSONRenderer
+
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_component_outputs(rows, columns):
+    """Run a few analysis components on random data and return their outputs by name."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.uniform(0.5, 2.0, size=(rows, columns)),
+                      columns=['x' + str(i) for i in range(columns)])
+    df['y'] = df.sum(axis=1) + rng.normal(size=rows)
+    features = [c for c in df.columns if c != 'y']
+
+    outputs = {}
+    outputs['histogram'] = get_histogram({'data': df['x0'].tolist(), 'view': {'settings': {'bins': 20}}})
+
+    regression, _ = get_regression({'data': df.to_dict(orient='list'), 'view': {'settings': {
+        'featureColumns': features, 'targetColumn': 'y', 'method': 'Linear', 'methodArguments': {},
+        'cvmethod': 'KFold', 'cvmethodArg': 5}}})
+    outputs['regression'] = regression
+
+    outputs['feature engineering'] = get_feature_engineering({
+        'data': df.to_dict(orient='records'), 'view': {'settings': {
+            'targetColumns': ['y'], 'descriptorColumns': features,
+            'firstOrderDescriptors': ['x', '1/(x)', '(x)^2', 'sqrt(x)', 'exp(x)', 'ln(x)'],
+            'selectedDataSource': 'Data Management'}}})
+
+    return outputs
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def time_render(renderer, data, repeat):
+    """Best time (in seconds) and size (in bytes) of rendering data."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        content = renderer.render(data, 'application/json', {})
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(content)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class Command(BaseCommand):
+    help = 'Compare the speed of the rest api renderers on analysis component outputs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000)
+        parser.add_argument('--columns', type=int, default=20)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        renderers = [('rest framework JSON', JSONRenderer()), ('numpy JSON', NumpyJSONRenderer()),
+                     ('columnar', ColumnarRenderer())]
+        outputs = get_component_outputs(options['rows'], options['columns'])
+
+        for name, data in outputs.items():
+            self.stdout.write(name + ':')
+            for renderer_name, renderer in renderers:
+                try:
+                    elapsed, size = time_render(renderer, data, options['repeat'])
+                except (TypeError, ValueError) as e:
+                    self.stdout.write('  {:<20} failed: {}'.format(renderer_name, e))
+                    continue
+                self.stdout.write('  {:<20} {:>10.1f} ms {:>12,d} bytes'.format(renderer_name, elapsed * 1000, size))
+#-------------------------------------------------------------------------------------------------
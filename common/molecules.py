@@ -0,0 +1,173 @@
+#=================================================================================================
+# Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
+#          Hokkaido University (2018)
+#          Last Update: Q4 2026
+# ________________________________________________________________________________________________
+# Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
+#          Jun Fujima (Former Lead Developer) [2018-2021]
+# ________________________________________________________________________________________________
+# Description: Serverside (Django) common folder contains all base-root reusable codes that are
+#              shared and used by all various "apps" within this web site. This file contains
+#              code to parse (and canonicalize) lists of SMILES strings on a process pool.
+# ------------------------------------------------------------------------------------------------
+# Notes: The values are parsed in chunks by SMILES_PARSE_WORKERS processes, and the results and
+#        errors are returned in input order. The processes are started once (spawned, not forked
+#        from the threaded web process) and reused by all the parsings of the process. Small
+#        lists, and daemonic multiprocessing processes (which are not allowed to have children),
+#        are parsed in the current process. Celery prefork (billiard) workers are not daemonic
+#        in the sense of multiprocessing and use the pool as well. Only incorrect values (the
+#        ValueError of the parser) are returned as errors, any other failure (of chython, of
+#        the parser or of the pool) is raised.
+# ------------------------------------------------------------------------------------------------
+# References: Django platform libraries, chython, concurrent.futures, multiprocessing, os and
+#             threading libs
+#=================================================================================================
+
+#-------------------------------------------------------------------------------------------------
+# Import required Libraries
+#-------------------------------------------------------------------------------------------------
+from django.conf import settings
+
+from chython import smiles
+from chython.exceptions import IncorrectSmiles, InvalidAromaticRing, ValenceError
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import os
+import threading
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+#-------------------------------------------------------------------------------------------------
+
+PARSE_CHUNK_SIZE = 500
+
+# the errors of an incorrect molecule, any other error (of the parser or the pool) is raised
+CANONICALIZE_ERRORS = (InvalidAromaticRing, ValenceError)
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def parse_molecule(value):
+    """Parse and canonicalize one SMILES string, ValueError is raised if it is not correct."""
+    try:
+        mol = smiles(value)
+    except IncorrectSmiles:
+        mol = None
+    if not mol:
+        raise ValueError("The SMILES string " + str(value) + " could not be parsed")
+
+    try:
+        mol.canonicalize(fix_tautomers=False)
+    except CANONICALIZE_ERRORS:
+        # the first canonicalization of some molecules fails in chython, the second one works
+        try:
+            mol.canonicalize(fix_tautomers=False)
+        except CANONICALIZE_ERRORS:
+            raise ValueError("The SMILES string " + str(value) + " could not be canonicalized")
+
+    return mol
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def _parse_chunk(parser, values):
+    results = []
+    for value in values:
+        try:
+            results.append((parser(value), None))
+        except ValueError as e:
+            results.append((None, str(e)))
+    return results
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_parse_workers(size, workers=None):
+    """Get the number of processes to use for parsing `size` values."""
+    workers = settings.SMILES_PARSE_WORKERS if workers is None else workers
+    if multiprocessing.current_process().daemon:
+        return 1
+    return max(1, min(workers, -(-size // PARSE_CHUNK_SIZE)))
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def _init_worker():
+    # the parsers can be defined in Django apps (e.g. prediction.models)
+    if os.environ.get('DJANGO_SETTINGS_MODULE'):
+        import django
+        django.setup()
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_parse_pool(workers):
+    """Get the parsing pool of this process, with at least `workers` processes."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers < workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                        initializer=_init_worker)
+            _pool_workers = workers
+        return _pool
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def discard_parse_pool(pool):
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+            _pool_workers = 0
+    pool.shutdown(wait=False)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def parse_values(values, parser=parse_molecule, workers=None):
+    """Parse a list of values (by default SMILES strings into canonicalized molecules).
+
+    Arguments:
+        values {list} -- The values to parse.
+        parser {function} -- Module level function parsing one value, raising ValueError if it
+                             is not correct (it must be picklable to be run in the pool).
+        workers {int} -- Number of processes (default: the SMILES_PARSE_WORKERS setting).
+
+    Returns:
+        parsed, errors  -- two lists in input order, with None as parsed value of the values in
+                           error and None as error of the correct values
+    """
+    values = list(values)
+    chunks = [values[i:i + PARSE_CHUNK_SIZE] for i in range(0, len(values), PARSE_CHUNK_SIZE)]
+    workers = get_parse_workers(len(values), workers)
+
+    if workers == 1:
+        results = [_parse_chunk(parser, chunk) for chunk in chunks]
+    else:
+        logger.info('parsing ' + str(len(values)) + ' values with ' + str(workers) + ' processes')
+        pool = get_parse_pool(workers)
+        try:
+            results = list(pool.map(_parse_chunk, [parser] * len(chunks), chunks))
+        except BrokenProcessPool:
+            # a worker died (e.g. killed for its memory), the next parsing starts a new pool
+            logger.error('a parsing process died, the parsing pool is restarted')
+            discard_parse_pool(pool)
+            raise
+
+    parsed = [p for chunk in results for p, _ in chunk]
+    errors = [e for chunk in results for _, e in chunk]
+
+    return parsed, errors
+#-------------------------------------------------------------------------------------------------
@@ -0,0 +1,225 @@
+#=================================================================================================
+# Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
+#          Hokkaido University (2018)
+#          Last Update: Q4 2026
+# ________________________________________________________________________________________________
+# Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
+#          Jun Fujima (Former Lead Developer) [2018-2021]
+# ________________________________________________________________________________________________
+# Description: Serverside (Django) common folder contains all base-root reusable codes that are
+#              shared and used by all various "apps" within this web site. This file contains
+#              the rest framework renderers of the analysis results.
+# ------------------------------------------------------------------------------------------------
+# Notes: 'NumpyJSONRenderer' is the default JSON renderer of the site (see REST_FRAMEWORK in the
+#        settings). It serializes the numpy arrays and scalars and the pandas objects the analysis
+#        components return in one pass with orjson, NaN and Inf values being given as null.
+#        The 'columnar' format is selected through content negotiation (Accept header
+#        'application/x-mads-columnar' or '?format=columnar') and sends the wide tables of a result
+#        (the {'header': [...], 'data': {row: [values]}} members, like the Feature Engineering and
+#        Monte Cat ones) as raw little-endian float64 columns instead of JSON text:
+#          uint32 (LE) length of the JSON header | JSON header (space padded to 8 bytes) | buffers
+#        The JSON header is {'result': <the result without its tables>, 'tables': [{'path': [...],
+#        'header': [...], 'index': [...row keys], 'columns': [{'offset': <byte offset of the
+#        float64 column in the buffers>} or {'values': [...]} for non-numeric columns]}]}
+#        The components give their tables as 'TableRows', so that the columns are taken from their
+#        DataFrame as they are, the JSON renderers still getting the {row: [values]} rows.
+# ------------------------------------------------------------------------------------------------
+# References: rest framework, orjson, numpy, pandas and struct libs
+#=================================================================================================
+
+#-------------------------------------------------------------------------------------------------
+# Import required Libraries
+#-------------------------------------------------------------------------------------------------
+from rest_framework.renderers import BaseRenderer
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+import numpy as np
+import orjson
+import pandas as pd
+
+import struct
+
+#-------------------------------------------------------------------------------------------------
+
+COLUMNAR_MEDIA_TYPE = 'application/x-mads-columnar'
+COLUMNAR_ALIGNMENT = 8
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class TableRows(object):
+    """
+    The rows ({row: [values]}) of the table of a result, kept as their DataFrame until the result
+    is rendered (see the file notes).
+    """
+
+    def __init__(self, df):
+        self.df = df
+
+    def to_dict(self):
+        return self.df.T.to_dict(orient='list')
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def encode_default(obj, encoder=JSONEncoder()):
+    """Convert what orjson can not serialize natively (pandas objects, non contiguous or object
+    numpy arrays, and the types handled by the rest framework encoder)."""
+    if isinstance(obj, TableRows):
+        return obj.to_dict()
+    if isinstance(obj, pd.DataFrame):
+        return obj.to_dict(orient='list')
+    if isinstance(obj, (pd.Series, pd.Index)):
+        # given back to orjson, which serializes the array natively when it can
+        return obj.to_numpy()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return encoder.default(obj)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class NumpyJSONRenderer(JSONRenderer):
+    """
+    Same as the rest framework JSONRenderer, but serializing numpy and pandas objects natively
+    (see the file notes).
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        options = ORJSON_OPTIONS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(data, default=encode_default, option=options)
+        # same as the rest framework renderer, for the responses embedded in javascript
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def is_table(value):
+    """Check if a result member is a {'header': [...], 'data': {row: [values]}} table."""
+    if not isinstance(value, dict) or 'header' not in value:
+        return False
+    if isinstance(value.get('data'), TableRows):
+        return len(value['data'].df.columns) == len(value['header'])
+    if not isinstance(value.get('data'), dict):
+        return False
+    width = len(value['header'])
+    return all(isinstance(row, (list, tuple)) and len(row) == width for row in value['data'].values())
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def find_tables(result):
+    """Get the paths of the tables of a result, at its top level or one level down."""
+    if not isinstance(result, dict):
+        return []
+    if is_table(result):
+        return [[]]
+    return [[key] for key, value in result.items() if is_table(value)]
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_table_columns(table):
+    """Get the row keys and the column arrays of a table."""
+    width = len(table['header'])
+    if isinstance(table['data'], TableRows):
+        df = table['data'].df
+        return df.index.tolist(), [df.iloc[:, i].to_numpy() for i in range(width)]
+
+    # rows given back by the celery result backend, split into columns in one pass
+    rows = np.empty((len(table['data']), width), dtype=object)
+    if len(rows):
+        rows[:] = list(table['data'].values())
+    return list(table['data'].keys()), [rows[:, i] for i in range(width)]
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def is_numeric_column(values):
+    if values.dtype.kind in 'iuf':
+        return True
+    return values.dtype.kind == 'O' and pd.api.types.infer_dtype(values, skipna=True) in (
+        'floating', 'integer', 'mixed-integer-float')
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def encode_table(table, offset):
+    """Split a table into its JSON description and its float64 column buffers.
+
+    Arguments:
+        table {dict} -- {'header': [...], 'data': TableRows or {row: [values]}}
+        offset {int} -- Byte offset of the first buffer of this table.
+
+    Returns:
+        description, buffers  -- the JSON part, the list of column buffers
+    """
+    index, columns = get_table_columns(table)
+    description = {'header': table['header'], 'index': index, 'columns': []}
+    buffers = []
+
+    for values in columns:
+        if is_numeric_column(values):
+            buffer = values.astype('<f8').tobytes()
+            description['columns'].append({'offset': offset})
+            buffers.append(buffer)
+            offset += len(buffer)
+        else:
+            values = values.astype(object)
+            values[pd.isnull(values)] = None
+            description['columns'].append({'values': values})
+
+    return description, buffers
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class ColumnarRenderer(BaseRenderer):
+    """
+    Renders a result with raw float64 columns for its tables (see the file notes for the layout).
+    """
+
+    media_type = COLUMNAR_MEDIA_TYPE
+    format = 'columnar'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        remainder = dict(data) if isinstance(data, dict) else data
+        tables = []
+        buffers = []
+        offset = 0
+        for path in find_tables(data):
+            table = data if not path else data[path[0]]
+            description, table_buffers = encode_table(table, offset)
+            description['path'] = path
+            tables.append(description)
+            buffers.extend(table_buffers)
+            offset += sum(len(b) for b in table_buffers)
+            if path:
+                remainder[path[0]] = {k: v for k, v in table.items() if k not in ('header', 'data')}
+            else:
+                remainder = {k: v for k, v in remainder.items() if k not in ('header', 'data')}
+
+        header = orjson.dumps({'result': remainder, 'tables': tables}, default=encode_default,
+                              option=ORJSON_OPTIONS)
+        # the buffers start on an 8 byte boundary, so the client can view them as Float64Arrays
+        header += b' ' * (-(4 + len(header)) % COLUMNAR_ALIGNMENT)
+
+        return b''.join([struct.pack('<I', len(header)), header] + buffers)
+#-------------------------------------------------------------------------------------------------
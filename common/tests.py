@@ -0,0 +1,222 @@
+#=================================================================================================
+# Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
+#          Hokkaido University (2018)
+#          Last Update: Q4 2026
+# ________________________________________________________________________________________________
+# Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
+#          Jun Fujima (Former Lead Developer) [2018-2021]
+# ________________________________________________________________________________________________
+# Description: Serverside (Django) common folder contains all base-root reusable codes that are
+#              shared and used by all various "apps" within this web site. This file contains
+#              code to test the common cache, value parsing and renderers.
+# ------------------------------------------------------------------------------------------------
+# Notes: This is test code for the 'common' code that support various apps and files with all
+#        reusable features that is needed for the different pages Django provides
+# ------------------------------------------------------------------------------------------------
+# References: Django platform libraries, numpy, pandas, json, struct and this 'common'-folder's 'cache',
+#             'molecules' and 'renderers'
+#=================================================================================================
+
+#-------------------------------------------------------------------------------------------------
+# Import required Libraries
+#-------------------------------------------------------------------------------------------------
+from django.test import SimpleTestCase
+
+import numpy as np
+import pandas as pd
+
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+
+from common.cache import DiskLRUCache
+from common.cache import LRUCache
+from common.molecules import PARSE_CHUNK_SIZE
+from common.molecules import parse_values
+from common.renderers import ColumnarRenderer
+from common.renderers import NumpyJSONRenderer
+from common.renderers import TableRows
+
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class LRUCacheTests(SimpleTestCase):
+
+    def test_least_recently_used_is_evicted(self):
+        cache = LRUCache(100)
+        cache.set('a', 'A', size=40)
+        cache.set('b', 'B', size=40)
+        cache.get('a')
+        cache.set('c', 'C', size=40)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        self.assertEquals(cache.total_bytes, 80)
+
+    def test_too_large_value_is_not_cached(self):
+        cache = LRUCache(100)
+        cache.set('a', 'A', size=200)
+
+        self.assertNotIn('a', cache)
+        self.assertEquals(cache.total_bytes, 0)
+
+    def test_delete_and_counters(self):
+        cache = LRUCache(100)
+        cache.set('a', 'A', size=10)
+        cache.set('a', 'A2', size=20)
+        self.assertEquals(cache.total_bytes, 20)
+        self.assertEquals(cache.get('a'), 'A2')
+
+        cache.delete('a')
+        self.assertIsNone(cache.get('a'))
+        self.assertEquals(cache.total_bytes, 0)
+        self.assertEquals((cache.hits, cache.misses), (1, 1))
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class DiskLRUCacheTests(SimpleTestCase):
+
+    def test_least_recently_used_file_is_evicted(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = DiskLRUCache(directory, 10 ** 9)
+            cache.set('a', list(range(1000)))
+            cache.set('b', list(range(1000)))
+            past = time.time() - 60
+            os.utime(os.path.join(directory, 'a' + DiskLRUCache.extension), (past, past))
+            os.utime(os.path.join(directory, 'b' + DiskLRUCache.extension), (past - 60, past - 60))
+            self.assertEquals(cache.get('a'), list(range(1000)))
+
+            cache.max_bytes = os.path.getsize(os.path.join(directory, 'a' + DiskLRUCache.extension)) * 2
+            cache.set('c', list(range(1000)))
+
+            self.assertIsNotNone(cache.get('a'))
+            self.assertIsNone(cache.get('b'))
+            self.assertIsNotNone(cache.get('c'))
+
+    def test_lock_file_removed_by_holder(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = DiskLRUCache(directory, 10 ** 9)
+            cache.set('a', 1)
+            lock_path = os.path.join(directory, 'a' + DiskLRUCache.lock_extension)
+            with cache.lock('a'):
+                cache.delete('a')
+                self.assertTrue(os.path.exists(lock_path))
+            self.assertFalse(os.path.exists(lock_path))
+
+    def test_lock_while_lock_files_are_removed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = DiskLRUCache(directory, 10 ** 9)
+
+            def increment():
+                for _ in range(5):
+                    with cache.lock('n'):  # no entry 'n', so each release removes the lock file
+                        count = cache.get('count', 0)
+                        time.sleep(0.002)
+                        cache.set('count', count + 1)
+
+            threads = [threading.Thread(target=increment) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            self.assertEquals(cache.get('count'), 30)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class ParseValuesTests(SimpleTestCase):
+
+    def test_results_and_errors_in_input_order(self):
+        values = [str(n) if n % 7 else 'x' + str(n) for n in range(3 * PARSE_CHUNK_SIZE + 5)]
+
+        for workers in [1, 3]:
+            parsed, errors = parse_values(values, float, workers=workers)
+
+            self.assertEquals(len(parsed), len(values))
+            self.assertEquals(parsed[1], 1.0)
+            self.assertEquals(parsed[-1], float(len(values) - 1))
+            self.assertIsNone(parsed[7])
+            self.assertIsNotNone(errors[7])
+            self.assertEquals(sum(e is not None for e in errors), len(range(0, len(values), 7)))
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class NumpyJSONRendererTests(SimpleTestCase):
+
+    def test_numpy_and_pandas_values(self):
+        data = {'hist': np.array([1, 2, 3]),
+                'binEdges': np.linspace(0, 1, 5)[::2],
+                'indices': [[np.int64(0), np.int64(4)], []],
+                'scores': {'test_r2': np.array([0.5, np.nan])},
+                'series': pd.Series([1.5, np.inf]),
+                'names': pd.Series(['a', None]),
+                'frame': pd.DataFrame({'a': [1, 2]}),
+                0: np.float32(0.5)}
+
+        content = NumpyJSONRenderer().render(data)
+
+        self.assertEquals(json.loads(content), {
+            'hist': [1, 2, 3], 'binEdges': [0.0, 0.5, 1.0], 'indices': [[0, 4], []],
+            'scores': {'test_r2': [0.5, None]}, 'series': [1.5, None], 'names': ['a', None],
+            'frame': {'a': [1, 2]}, '0': 0.5})
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class ColumnarRendererTests(SimpleTestCase):
+
+    def decode(self, content):
+        length = struct.unpack('<I', content[:4])[0]
+        self.assertEquals((4 + length) % 8, 0)
+        header = json.loads(content[4:4 + length])
+        body = content[4 + length:]
+        tables = {}
+        for table in header['tables']:
+            columns = [np.frombuffer(body, '<f8', len(table['index']), c['offset']).tolist()
+                       if 'offset' in c else c['values'] for c in table['columns']]
+            tables[tuple(table['path'])] = (table['header'], table['index'], columns)
+        return header['result'], tables
+
+    def test_tables_round_trip(self):
+        process = pd.DataFrame({'Descriptor': ['a', None], 'Score': [0.5, 0.25]})
+        output = pd.DataFrame({'x': [1.0, np.nan, 3.0], 'n': [1, 2, 3]})
+        result = {'status': 'success',
+                  'process': {'header': process.columns, 'data': TableRows(process)},
+                  'output': {'header': output.columns, 'data': TableRows(output)}}
+
+        content = ColumnarRenderer().render(result)
+        remainder, tables = self.decode(content)
+
+        self.assertEquals(remainder, {'status': 'success', 'process': {}, 'output': {}})
+        self.assertEquals(tables[('process',)], (['Descriptor', 'Score'], [0, 1], [['a', None], [0.5, 0.25]]))
+        header, index, columns = tables[('output',)]
+        self.assertEquals((header, index), (['x', 'n'], [0, 1, 2]))
+        np.testing.assert_array_equal(columns[0], [1.0, np.nan, 3.0])
+        self.assertEquals(columns[1], [1.0, 2.0, 3.0])
+
+        # the same rows as the JSON renderer (and as the job results from the celery backend)
+        rows = json.loads(NumpyJSONRenderer().render(result))
+        self.assertEquals(rows['process']['data'], {'0': ['a', 0.5], '1': [None, 0.25]})
+        _, job_tables = self.decode(ColumnarRenderer().render(rows))
+        self.assertEquals(job_tables[('process',)][2], [['a', None], [0.5, 0.25]])
+        self.assertEquals(job_tables[('output',)][2][1], [1.0, 2.0, 3.0])
+
+    def test_smaller_than_json(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame(rng.normal(size=(200, 50)), columns=['x' + str(i) for i in range(50)])
+        result = {'status': 'success', 'header': df.columns, 'data': TableRows(df)}
+
+        content = ColumnarRenderer().render(result)
+        _, tables = self.decode(content)
+
+        self.assertEquals(tables[()][2], [df[c].tolist() for c in df.columns])
+        self.assertLess(len(content), len(NumpyJSONRenderer().render(result)) * 0.6)
+#-------------------------------------------------------------------------------------------------
@@ -12,26 +12,34 @@
 # Notes:  This is one of the REST API part of the serverside module that allows the user to
 #         interact with the 'datamanagement' interface of the website. (DB & server Python methods)
 # ------------------------------------------------------------------------------------------------
-# References: Django platform libraries and rest framework libs and 'datamanagement' folder's
-#             'models', and api's 'serializers' and 'permissions'
+# References: Django platform libraries and rest framework, json libs and 'datamanagement' folder's
+#             'models' and 'dataframes', and api's 'serializers' and 'permissions'
 #=================================================================================================
 
 #-------------------------------------------------------------------------------------------------
 # Import required Libraries
 #-------------------------------------------------------------------------------------------------
 from django.db.models import Q
+from django.http import StreamingHttpResponse
 from rest_framework.generics import (
+    GenericAPIView,
     ListCreateAPIView,
     RetrieveUpdateDestroyAPIView
 )
 from rest_framework import permissions
+from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from ..dataframes import get_datasource_frame
+from ..dataframes import is_csv
+from ..dataframes import select_rows
 from ..models import DataSource
 from .serializers import DataSourceSerializer
 from .permissions import IsOwnerOrReadOnly
 
+import json
+
 #-------------------------------------------------------------------------------------------------
 
 
@@ -93,19 +101,78 @@ class DataSourceRetrieveUpdateDestroyAPIView(
 #-------------------------------------------------------------------------------------------------
 
 
+#-------------------------------------------------------------------------------------------------
+def stream_csv(df, chunk_size):
+    yield df.iloc[0:0].to_csv(index=False)  # header line
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start:start + chunk_size].to_csv(index=False, header=False)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def stream_ndjson(df, chunk_size):
+    for start in range(0, len(df), chunk_size):
+        lines = df.iloc[start:start + chunk_size].to_json(orient='records', lines=True)
+        yield lines if lines.endswith('\n') else lines + '\n'
+#-------------------------------------------------------------------------------------------------
+
+
 #-------------------------------------------------------------------------------------------------
 class DataSourceContentsAPIView(
-    APIView
+    DataSourceFilteredLookupMixin,
+    GenericAPIView
 ):
+    """
+    Return (a slice of) the contents of a datasource, streamed as CSV or NDJSON.
+
+    Query parameters:
+        offset -- first row to return (default 0)
+        limit -- max number of rows to return (default all)
+        columns -- comma separated list of the columns to return (default all)
+        filter -- json list of [column, operator, value] row filters, e.g. [["T", "gt", 300]]
+                  with operator one of eq, ne, lt, le, gt, ge, contains, isnull, notnull
+        output -- 'csv' (default) or 'ndjson'
+
+    The number of rows matching the filters is given in the 'X-Total-Count' header.
+    """
     permission_classes = (
         permissions.IsAuthenticatedOrReadOnly,
         IsOwnerOrReadOnly,
     )
-
-    def get(self, request, format=None):
-        """
-        Return the content of a datasource.
-        """
-        # content =
-        return ''
+    lookup_field = 'id'
+    chunk_size = 1000
+
+    def handle_exception(self, exc):
+        if isinstance(exc, (TypeError, ValueError)):
+            return Response({'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return super(DataSourceContentsAPIView, self).handle_exception(exc)
+
+    def get(self, request, id=None, format=None):
+        datasource = self.get_object()
+        if not is_csv(datasource):
+            return Response({'detail': 'The file type is not supported.'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        params = request.query_params
+        offset = int(params.get('offset', 0))
+        limit = int(params['limit']) if params.get('limit') else None
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError('offset and limit must be positive')
+        columns = [c for c in params.get('columns', '').split(',') if c] or None
+        filters = json.loads(params['filter']) if params.get('filter') else None
+        output = params.get('output', 'csv')
+        if output not in ['csv', 'ndjson']:
+            raise ValueError('Unknown output: ' + output)
+
+        df, total = select_rows(get_datasource_frame(datasource), offset, limit, columns, filters)
+
+        if output == 'ndjson':
+            response = StreamingHttpResponse(stream_ndjson(df, self.chunk_size),
+                                             content_type='application/x-ndjson')
+        else:
+            response = StreamingHttpResponse(stream_csv(df, self.chunk_size), content_type='text/csv')
+        response['X-Total-Count'] = str(total)
+        response['X-Offset'] = str(offset)
+
+        return response
 #-------------------------------------------------------------------------------------------------
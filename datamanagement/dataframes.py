@@ -0,0 +1,245 @@
+#=================================================================================================
+# Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
+#          Hokkaido University (2018)
+#          Last Update: Q4 2026
+# ________________________________________________________________________________________________
+# Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
+#          Jun Fujima (Former Lead Developer) [2018-2021]
+# ________________________________________________________________________________________________
+# Description: Serverside (Django) Provided dataframe loading for the 'datamanagement' data
+#              sources
+# ------------------------------------------------------------------------------------------------
+# Notes: This lets serverside components refer to a stored DataSource by its ID (a "handle")
+#        instead of receiving the full dataset in every request. Loaded frames are kept in a
+#        process-local cache until the data source is modified or deleted. Frames are read from
+#        the columnar sidecar of the uploaded CSV file (built at upload time) when available.
+# ------------------------------------------------------------------------------------------------
+# References: Django platform libraries, pandas, os, logging libs, common.cache, common.columnar,
+#             common.helpers and 'datamanagement'-folder's 'models'
+#=================================================================================================
+
+#-------------------------------------------------------------------------------------------------
+# Import required Libraries
+#-------------------------------------------------------------------------------------------------
+from django.conf import settings
+from django.core.exceptions import ValidationError
+
+import pandas as pd
+
+from common.cache import LRUCache
+from common.columnar import read_columnar_sidecar
+from common.columnar import read_sidecar_metadata
+from common.columnar import write_columnar_sidecar
+from common.helpers import get_contents_from_file
+from common.helpers import read_csv_from_file
+from .models import DataSource
+
+import os
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+#-------------------------------------------------------------------------------------------------
+
+frame_cache = LRUCache(settings.DATASOURCE_FRAME_CACHE_SIZE, name='datasource frames')
+
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def is_csv(datasource):
+    return bool(datasource.file) and os.path.splitext(datasource.file.name)[1] == '.csv'
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def build_datasource_sidecar(datasource):
+    """Write the columnar sidecar of a CSV data source unless an up to date one already exists."""
+    if not is_csv(datasource) or read_sidecar_metadata(datasource.file) is not None:
+        return
+
+    df, delimiter = read_csv_from_file(datasource.file)
+    write_columnar_sidecar(datasource.file, df, delimiter)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def load_datasource_frame(datasource, columns=None):
+    """Read a CSV data source from its columnar sidecar, or parse the CSV text (and write the
+    sidecar for the next time) if there is none.
+
+    Arguments:
+        datasource {DataSource} -- The data source.
+        columns {list} -- Optional column projection (only applied to the sidecar read).
+
+    Returns:
+        DataFrame -- the data source contents
+    """
+    df, _ = read_columnar_sidecar(datasource.file, columns)
+    if df is not None:
+        return df
+
+    df, delimiter = read_csv_from_file(datasource.file)
+    write_columnar_sidecar(datasource.file, df, delimiter)
+
+    return df[columns] if columns else df
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_datasource_frame(datasource):
+    """Get the full contents of a data source as a DataFrame. The returned frame is shared with
+    the cache and must not be modified.
+
+    Arguments:
+        datasource {DataSource} -- The data source.
+
+    Returns:
+        DataFrame -- the data source contents
+    """
+    stamp = (datasource.file.name, datasource.modified)
+    cached = frame_cache.get(datasource.id)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    df = load_datasource_frame(datasource)
+    frame_cache.set(datasource.id, (stamp, df), size=int(df.memory_usage(deep=True).sum()))
+
+    return df
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def invalidate_datasource_frame(datasource_id):
+    frame_cache.delete(datasource_id)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def resolve_data_source(handle):
+    """Build the 'data' of an analysis request from a data source handle.
+
+    Arguments:
+        handle {dict} -- {'id': <DataSource id>, 'columns': [...]} for a column projection
+                         (given as a dict of column lists), or {'id': ..., 'column': <name>} for
+                         a single column (given as a list). Null values are None, the data is
+                         the same as the browser sends.
+
+    Returns:
+        dict or list -- the requested data
+    """
+    try:
+        datasource = DataSource.objects.get(id=handle['id'])
+    except (DataSource.DoesNotExist, KeyError, TypeError, ValidationError):
+        raise ValueError('The data source is not found.')
+
+    df = get_datasource_frame(datasource)
+
+    if 'column' in handle:
+        if handle['column'] not in df.columns:
+            raise ValueError('Unknown column: ' + str(handle['column']))
+        column = df[handle['column']]
+        return column.astype(object).where(pd.notnull(column), None).tolist()
+
+    columns = handle.get('columns') or df.columns.tolist()
+    unknown = [c for c in columns if c not in df.columns]
+    if unknown:
+        raise ValueError('Unknown column(s): ' + ', '.join(str(c) for c in unknown))
+
+    # the components are written for (and free to modify) the dict of lists the browser sends
+    df = df[columns]
+    return df.astype(object).where(pd.notnull(df), None).to_dict(orient='list')
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def get_contents_from_datasource(datasource):
+    """Same as common.helpers.get_contents_from_file, but reading through the frame cache and the
+    columnar sidecar of the data source.
+
+    Arguments:
+        datasource {DataSource} -- The data source.
+
+    Returns:
+        contents, file_type, columns  -- contents, file_type, columns
+    """
+    if is_csv(datasource):
+        df = get_datasource_frame(datasource)
+        return df.to_json(orient='table'), 'csv', df.columns
+
+    return get_contents_from_file(datasource.file)
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+ROW_FILTER_OPERATORS = ['eq', 'ne', 'lt', 'le', 'gt', 'ge', 'contains', 'isnull', 'notnull']
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def select_rows(df, offset=0, limit=None, columns=None, filters=None):
+    """Select a slice of a data source frame.
+
+    Arguments:
+        df {DataFrame} -- The data source contents.
+        offset {int} -- First row (after filtering) to return.
+        limit {int} -- Max number of rows to return (None for all remaining rows).
+        columns {list} -- Column projection (None for all columns).
+        filters {list} -- [column, operator, value] row filters that must all match, operator
+                          being one of ROW_FILTER_OPERATORS.
+
+    Returns:
+        df, total  -- the selected rows, the number of rows matching the filters
+    """
+    columns = columns or df.columns.tolist()
+    unknown = [c for c in columns if c not in df.columns]
+    if unknown:
+        raise ValueError('Unknown column(s): ' + ', '.join(str(c) for c in unknown))
+
+    if filters:
+        mask = pd.Series(True, index=df.index)
+        for f in filters:
+            if not isinstance(f, (list, tuple)) or len(f) not in (2, 3):
+                raise ValueError('A filter must be [column, operator, value]')
+            column, op = f[0], f[1]
+            if column not in df.columns:
+                raise ValueError('Unknown column: ' + str(column))
+            if op not in ROW_FILTER_OPERATORS:
+                raise ValueError('Unknown filter operator: ' + str(op))
+
+            values = df[column]
+            if op == 'isnull':
+                mask &= values.isnull()
+                continue
+            if op == 'notnull':
+                mask &= values.notnull()
+                continue
+            if len(f) != 3:
+                raise ValueError('The filter operator ' + op + ' requires a value')
+
+            value = f[2]
+            if op == 'contains':
+                mask &= values.astype(str).str.contains(str(value), regex=False) & values.notnull()
+                continue
+            if pd.api.types.is_numeric_dtype(values):
+                value = float(value)
+            if op == 'eq':
+                mask &= values == value
+            elif op == 'ne':
+                mask &= values != value
+            elif op == 'lt':
+                mask &= values < value
+            elif op == 'le':
+                mask &= values <= value
+            elif op == 'gt':
+                mask &= values > value
+            else:
+                mask &= values >= value
+        df = df.loc[mask.values]
+
+    total = len(df)
+    end = None if limit is None else offset + limit
+
+    return df.iloc[offset:end][columns], total
+#-------------------------------------------------------------------------------------------------
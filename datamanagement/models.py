@@ -11,7 +11,8 @@
 # Notes: This is one part of the serverside module that allows the user to interact with the
 #        'datamanagement' interface of the website. (DB and server Python methods)
 # ------------------------------------------------------------------------------------------------
-# References: Django platform libraries, private-storage, uuid, common.modelsm logging, uuid libs
+# References: Django platform libraries, private-storage, uuid, common.models, common.columnar,
+#             logging, uuid libs
 #             and 'User'-folder's 'models'
 #=================================================================================================
 
@@ -33,6 +34,7 @@ import os
 import logging
 logger = logging.getLogger(__name__)
 
+from common.columnar import delete_columnar_sidecar
 from common.models import IndexedTimeStampedModel
 from common.models import OwnedResourceModel
 from users.models import User
@@ -98,6 +100,7 @@ def delete_previous_file(function):
         if previous and previous.file.name != self.file.name:
             logger.info(str(self.file))
             logger.info(str(previous.file))
+            delete_columnar_sidecar(previous.file)
             previous.file.delete(False)
         return result
     return wrapper
@@ -140,6 +143,13 @@ class DataSource(OwnedResourceModel):
     def save(self, force_insert=False, force_update=False, using=None, update_fields=None):
         super(DataSource, self).save()
 
+        # typed columnar copy of the uploaded csv, so that it is not parsed again by the readers
+        from .dataframes import build_datasource_sidecar
+        try:
+            build_datasource_sidecar(self)
+        except Exception as e:
+            logger.warning('columnar sidecar not built for ' + str(self.id) + ': ' + str(e))
+
     @delete_previous_file
     def delete(self, using=None, keep_parents=False):
         super(DataSource, self).delete()
@@ -150,5 +160,8 @@ class DataSource(OwnedResourceModel):
 # when deleting model the file is removed
 @receiver(post_delete, sender=DataSource)
 def delete_file(sender, instance, **kwargs):
+    from .dataframes import invalidate_datasource_frame
+    invalidate_datasource_frame(instance.id)
+    delete_columnar_sidecar(instance.file)
     instance.file.delete(False)
 #-------------------------------------------------------------------------------------------------
@@ -0,0 +1,55 @@
+#=================================================================================================
+# Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
+#          Hokkaido University (2018)
+#          Last Update: Q4 2026
+# ________________________________________________________________________________________________
+# Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
+#          Jun Fujima (Former Lead Developer) [2018-2021]
+# ________________________________________________________________________________________________
+# Description: Serverside (Django) datamanagement test of the dataframes code
+# ------------------------------------------------------------------------------------------------
+# Notes: This is a code test for the 'dataframes' of the serverside module that allows the user
+#        to interact with the 'datamanagement' interface of the website.
+# ------------------------------------------------------------------------------------------------
+# References: Django platform libraries, pandas libs and 'datamanagement'-folder's 'dataframes'
+#=================================================================================================
+
+#-------------------------------------------------------------------------------------------------
+# Import required Libraries
+#-------------------------------------------------------------------------------------------------
+from django.test import SimpleTestCase
+
+import pandas as pd
+
+from datamanagement.dataframes import select_rows
+
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+class SelectRowsTests(SimpleTestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'Catalyst': ['Pt', 'Pd', None, 'Rh', 'Ru'],
+            'T': [300, 350, 400, 450, 500],
+            'Yield': [0.1, 0.5, 0.2, 0.9, 0.4],
+        })
+
+    def test_slice_and_projection(self):
+        df, total = select_rows(self.df, offset=1, limit=2, columns=['T'])
+        self.assertEquals(total, 5)
+        self.assertEquals(df.columns.tolist(), ['T'])
+        self.assertEquals(df['T'].tolist(), [350, 400])
+
+    def test_filters(self):
+        df, total = select_rows(self.df, filters=[['T', 'ge', '400'], ['Catalyst', 'notnull']])
+        self.assertEquals(total, 2)
+        self.assertEquals(df['Catalyst'].tolist(), ['Rh', 'Ru'])
+
+    def test_unknown_column(self):
+        with self.assertRaises(ValueError):
+            select_rows(self.df, columns=['Nope'])
+        with self.assertRaises(ValueError):
+            select_rows(self.df, filters=[['T', 'like', 3]])
+#-------------------------------------------------------------------------------------------------
@@ -61,6 +61,11 @@ urlpatterns = [
         view=views2.DataSourceRetrieveUpdateDestroyAPIView.as_view(),
         name="datasource_rest_api",
     ),
+    url(
+        regex=r"^api/datasource/(?P<id>[-\w]+)/contents/$",
+        view=views2.DataSourceContentsAPIView.as_view(),
+        name="datasource_contents_rest_api",
+    ),
     path("datasources/<id>/content", views.get_data, name="datasource_content"),
 ]
 #-------------------------------------------------------------------------------------------------
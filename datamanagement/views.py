@@ -48,7 +48,7 @@ from django_tables2.views import SingleTableView
 from rules.contrib.views import PermissionRequiredMixin
 from rules.contrib.views import LoginRequiredMixin
 
-from common.helpers import get_contents_from_file
+from .dataframes import get_contents_from_datasource
 from .forms import DataSourceForm
 from .models import DataSource
 from .helpers import DataSourceTable
@@ -199,7 +199,7 @@ class DataSourceDetailView(PermissionRequiredMixin, DetailView):
         # read contents if the file is CSS (or EXCEL?)
         context["file"] = context["object"].file
 
-        contents, file_type, columns = get_contents_from_file(context["object"].file)
+        contents, file_type, columns = get_contents_from_datasource(context["object"])
 
         context["contents"] = contents
         context["file_type"] = file_type
@@ -266,7 +266,7 @@ def get_data(request, id):
     logger.info(request.user.id)
     logger.info(target.name)
 
-    contents, file_type, columns = get_contents_from_file(target.file)
+    contents, file_type, columns = get_contents_from_datasource(target)
 
     if file_type == "csv":
         return HttpResponse(contents)
@@ -0,0 +1,4 @@
+# This makes sure the celery app is loaded when Django starts, so that shared_task uses it
+from .celery import app as celery_app  # noqa
+
+__all__ = ('celery_app',)
@@ -161,6 +161,8 @@ WEBPACK_LOADER = {
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
+CELERY_TASK_TRACK_STARTED = True
+CELERY_RESULT_EXPIRES = 3600  # finished analysis jobs are kept for one hour
 
 
 # For django-guardian and rules
@@ -180,6 +182,11 @@ REST_FRAMEWORK = {
         "rest_framework.authentication.TokenAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    # numpy/pandas aware (see common/renderers.py)
+    "DEFAULT_RENDERER_CLASSES": (
+        "common.renderers.NumpyJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
     "DEFAULT_SCHEMA_CLASS": "rest_framework.schemas.coreapi.AutoSchema",
 }
 
@@ -196,4 +203,50 @@ MARKDOWNX_MARKDOWNIFY_FUNCTION = "markdownx.utils.markdownify"
 DISABLE_SIGNUP = config("APP_DISABLE_SIGNUP") == "True"
 
 MAX_FILE_SIZE = config("MAX_FILE_SIZE")
+
+# Memory cap (bytes) of the per-process cache of loaded data sources (256MB)
+DATASOURCE_FRAME_CACHE_SIZE = config("DATASOURCE_FRAME_CACHE_SIZE", default=268435456, cast=int)
+
+# Memory cap (bytes) of the per-process cache of loaded prediction models (512MB)
+PRETRAINED_MODEL_CACHE_SIZE = config("PRETRAINED_MODEL_CACHE_SIZE", default=536870912, cast=int)
+
+# Number of processes used to parse (and canonicalize) long lists of SMILES strings
+SMILES_PARSE_WORKERS = config("SMILES_PARSE_WORKERS", default=4, cast=int)
+
+# Location and size cap (bytes) of the on-disk cache of computed descriptor tables (1GB). The
+# caches and stores below default to the 'cache' folder of the project, which is ignored by git.
+# They must be on storage shared by the web and celery processes (in docker, the 'cache' volume
+# mounted in both the 'app' and 'celery' services)
+DESCRIPTOR_CACHE_DIR = config("DESCRIPTOR_CACHE_DIR", default=base_dir_join("cache", "descriptors"))
+DESCRIPTOR_CACHE_SIZE = config("DESCRIPTOR_CACHE_SIZE", default=1073741824, cast=int)
+
+# Location, size cap (bytes) and lifetime (seconds) of the store of models fitted by the analysis
+# components, kept for their validation and for saving them as pretrained models
+FITTED_MODEL_STORE_DIR = config("FITTED_MODEL_STORE_DIR", default=base_dir_join("cache", "models"))
+FITTED_MODEL_STORE_SIZE = config("FITTED_MODEL_STORE_SIZE", default=1073741824, cast=int)
+FITTED_MODEL_STORE_TTL = config("FITTED_MODEL_STORE_TTL", default=3600, cast=int)
+
+# Location, size cap (bytes) and lifetime (seconds since their last round, 7 days) of the bayesian
+# optimization sessions of the gaussian process component
+GP_SESSION_STORE_DIR = config("GP_SESSION_STORE_DIR", default=base_dir_join("cache", "gp_sessions"))
+GP_SESSION_STORE_SIZE = config("GP_SESSION_STORE_SIZE", default=1073741824, cast=int)
+GP_SESSION_TTL = config("GP_SESSION_TTL", default=604800, cast=int)
+
+# Number of rounds of a session after which its kernel hyperparameters are optimized again (the
+# rounds in between only condition the model on the new observations)
+GP_SESSION_REFIT_ROUNDS = config("GP_SESSION_REFIT_ROUNDS", default=5, cast=int)
+
+# Max number of optimizer restarts (from random hyperparameters) of a gaussian process fit
+GP_MAX_OPTIMIZER_RESTARTS = config("GP_MAX_OPTIMIZER_RESTARTS", default=10, cast=int)
+
+# Number of analysis requests computing at the same time on the host (web and celery worker
+# processes), which share the cores, see analysis/compute.py
+ANALYSIS_CONCURRENCY = config("ANALYSIS_CONCURRENCY", default=4, cast=int)
+
+# Number of processes (joblib n_jobs, -1 for all cores) used by parallel analysis computations of
+# one request (0 for its share of the cores)
+ANALYSIS_N_JOBS = config("ANALYSIS_N_JOBS", default=0, cast=int)
+
+# Max number of BLAS/OpenMP threads of one analysis request (0 for its share of the cores)
+ANALYSIS_THREADS = config("ANALYSIS_THREADS", default=0, cast=int)
 #-------------------------------------------------------------------------------------------------
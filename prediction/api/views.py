@@ -1,7 +1,7 @@
 #=================================================================================================
 # Project: CADS/MADS - An Integrated Web-based Visual Platform for Materials Informatics
 #          Hokkaido University (2018)
-#          Last Update: Q2 2025
+#          Last Update: Q4 2026
 # ________________________________________________________________________________________________
 # Authors: Mikael Nicander Kuwahara (Lead Developer) [2021-]
 #          Jun Fujima (Former Lead Developer) [2018-2021]
@@ -13,9 +13,10 @@
 # Notes:  This is one of the REST API part of the serverside module that allows the user to
 #         interact with the 'prediction' interface of the website. (DB and server Python methods)
 # ------------------------------------------------------------------------------------------------
-# References: Django platform libraries and rest framework, logging, joblib, tempfile libs and
-#             'prediction' folder's 'models', 'api' subfolder's 'serializers' and 'permissions'
-#             and 'analysis' folder's subfolder 'api' folder's 'utils'
+# References: Django platform libraries and rest framework, logging, joblib, pandas, os, tempfile
+#             libs and 'prediction' folder's 'models', 'api' subfolder's 'serializers' and
+#             'permissions' and 'analysis' folder's 'fitted_models' and subfolder 'api' folder's
+#             'utils'
 #=================================================================================================
 
 #-------------------------------------------------------------------------------------------------
@@ -23,6 +24,7 @@
 #-------------------------------------------------------------------------------------------------
 from django.db.models import Q
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.http import StreamingHttpResponse
 import logging
 from rest_framework.generics import (
     ListCreateAPIView,
@@ -33,18 +35,24 @@ from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from rest_framework.parsers import FormParser
 from rest_framework.parsers import JSONParser
+from rest_framework.parsers import MultiPartParser
 from rest_framework import status
 import joblib
+import pandas as pd
 from sklearn.pipeline import Pipeline
 from doptools import ComplexFragmentor
 
 from ..models import PretrainedModel
 from .serializers import PretrainedModelSerializer
 from .serializers import PretrainedModelSimpleSerializer
+from .permissions import CanReadModel
 from .permissions import IsOwnerOrReadOnly
 from analysis.api.utils.processor import get_model
+from analysis.fitted_models import load_model_token
 
+import os
 import sys
 import tempfile
 
@@ -81,6 +89,41 @@ class PretrainedModelFilteredLookupMixin(object):
 #-------------------------------------------------------------------------------------------------
 
 
+#-------------------------------------------------------------------------------------------------
+NDJSON_EXTENSIONS = ['.ndjson', '.jsonl']
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def read_input_chunks(file, chunk_size, delimiter=','):
+    """Read an uploaded CSV (with header line) or NDJSON file chunk by chunk, so that files of
+    any size can be predicted without being loaded at once."""
+    if os.path.splitext(file.name)[1].lower() in NDJSON_EXTENSIONS:
+        return pd.read_json(file, lines=True, chunksize=chunk_size, dtype=False)
+    return pd.read_csv(file, sep=delimiter, chunksize=chunk_size, dtype=str, keep_default_na=False,
+                       na_values=[''])
+#-------------------------------------------------------------------------------------------------
+
+
+#-------------------------------------------------------------------------------------------------
+def stream_predictions(pm, first, chunks, output):
+    """Yield the (already predicted) first chunk, then predict the remaining chunks one after
+    the other and yield their results as soon as they are done."""
+    result = first
+    header = True
+    while result is not None:
+        if output == 'ndjson':
+            lines = result.to_json(orient='records', lines=True)
+            if lines:
+                yield lines if lines.endswith('\n') else lines + '\n'
+        else:
+            yield result.to_csv(index=False, header=header)
+        header = False
+        chunk = next(chunks, None)
+        result = pm.predict_batch(chunk) if chunk is not None else None
+#-------------------------------------------------------------------------------------------------
+
+
 #-------------------------------------------------------------------------------------------------
 class PretrainedModelAPIViewSet(
         PretrainedModelFilteredLookupMixin,
@@ -90,7 +133,8 @@ class PretrainedModelAPIViewSet(
     This viewset automatically provides `list`, `create`, `retrieve`,
     `update` and `destroy` actions.
 
-    Additionally we also provide an extra `test` action.
+    Additionally we also provide extra `owned`, `create_with_param`, `update_with_param` and
+    `predict_batch` actions.
     """
     queryset = PretrainedModel.objects.all()
     serializer_class = PretrainedModelSerializer
@@ -98,6 +142,7 @@ class PretrainedModelAPIViewSet(
         # permissions.IsAuthenticatedOrReadOnly,
         IsOwnerOrReadOnly,
     )
+    batch_size = 1000
 
     def get_permissions(self):
         """
@@ -105,6 +150,8 @@ class PretrainedModelAPIViewSet(
         """
         if self.action == 'create_with_param':
             permission_classes = [IsOwnerOrReadOnly]
+        elif self.action == 'predict_batch':
+            permission_classes = [CanReadModel]
         else:
             permission_classes = [IsOwnerOrReadOnly]
         return [permission() for permission in permission_classes]
@@ -129,6 +176,43 @@ class PretrainedModelAPIViewSet(
         return Response(serializer.data)
 
 
+    @action(detail=True, methods=['post'], parser_classes=[MultiPartParser, FormParser])
+    def predict_batch(self, request, *args, **kwargs):
+        """
+        Predict all the rows of an uploaded 'file', a CSV file with a header line (with the
+        given 'delimiter', ',' by default) or an NDJSON file (.ndjson or .jsonl), holding the
+        input columns of the model. The rows are predicted in chunks of `batch_size` rows and
+        streamed back as CSV, or as NDJSON if 'output' is 'ndjson', with a 'Predicted' and an
+        'Error' column added.
+        """
+        pm = self.get_object()
+
+        file = request.FILES.get('file')
+        if file is None:
+            return Response({'detail': 'No file is given.'}, status=status.HTTP_400_BAD_REQUEST)
+        output = request.data.get('output', 'csv')
+        if output not in ['csv', 'ndjson']:
+            return Response({'detail': 'Unknown output: ' + str(output)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            chunks = iter(read_input_chunks(file, self.batch_size, request.data.get('delimiter', ',')))
+            # the first chunk is predicted here, so that errors in the request give a proper status
+            first = pm.predict_batch(next(chunks))
+        except StopIteration:
+            return Response({'detail': 'The file is empty.'}, status=status.HTTP_400_BAD_REQUEST)
+        except (TypeError, ValueError) as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        logger.info('batch prediction with model ' + str(pm.id))
+
+        results = stream_predictions(pm, first, chunks, output)
+        if output == 'ndjson':
+            return StreamingHttpResponse(results, content_type='application/x-ndjson')
+        response = StreamingHttpResponse(results, content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename=predictions.csv'
+        return response
+
+
     @action(detail=False, methods=['post'])
     def create_with_param(self, request, *args, **kwargs):
         logger.info('create new model')
@@ -175,7 +259,10 @@ class PretrainedModelAPIViewSet(
             description += ("\n Parameters: " +
                             ', '.join('{}={}'.format(*t) for t in viewSettings['view']['params'].items()))
             pm.description = description
-        model = get_model(arg_get_model)
+        # the model fitted by the analysis run is reused when its token is given
+        model = load_model_token(data.get('modelToken'), arg_get_model)
+        if model is None:
+            model = get_model(arg_get_model)
         if type(model) is Pipeline:
             if not isinstance(model[0], ComplexFragmentor):
                 metadata['input_spec'] = ["SMILES"]
@@ -245,7 +332,10 @@ class PretrainedModelAPIViewSet(
             description += ("\n Parameters: " +
                             ', '.join('{}={}'.format(*t) for t in viewSettings['view']['params'].items()))
             pm.description = description
-        model = get_model(arg_get_model)
+        # the model fitted by the analysis run is reused when its token is given
+        model = load_model_token(data.get('modelToken'), arg_get_model)
+        if model is None:
+            model = get_model(arg_get_model)
         if type(model) is Pipeline:
             if not isinstance(model[0], ComplexFragmentor):
                 metadata['input_spec'] = ["SMILES"]
@@ -13,6 +13,7 @@
 #        'prediction' interface of the website. (DB and server Python methods)
 # ------------------------------------------------------------------------------------------------
 # References: Django platform libraries, private-storage, json, numpy, joblib, logging and uuid libs
+#             and common.cache and common.molecules
 #=================================================================================================
 
 #-------------------------------------------------------------------------------------------------
@@ -24,6 +25,7 @@ from django.db import models
 from django.db.models.signals import post_delete
 from django.dispatch import receiver
 from django.urls import reverse
+from django.conf import settings
 
 from private_storage.fields import PrivateFileField
 from jsonfield import JSONField
@@ -35,11 +37,12 @@ import re
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.svm import SVC
-from chython import smiles
-from chython.exceptions import IncorrectSmiles
 from doptools.chem.coloratom import ColorAtom
 from doptools.chem.solvents import available_solvents
 
+from common.cache import LRUCache
+from common.molecules import parse_molecule
+from common.molecules import parse_values
 from common.models import OwnedResourceModel
 
 import os
@@ -55,6 +58,10 @@ logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
+# Deserialized model pipelines, shared by the prediction requests of this process
+model_cache = LRUCache(settings.PRETRAINED_MODEL_CACHE_SIZE, name='pretrained models')
+
+
 #-------------------------------------------------------------------------------------------------
 def get_encoded_filepath(instance, filename):
     filename, file_extension = os.path.splitext(filename)
@@ -94,6 +101,29 @@ def delete_previous_file(function):
 #-------------------------------------------------------------------------------------------------
 
 
+#-------------------------------------------------------------------------------------------------
+def parse_input_value(val):
+    """Parse one input value of a model using DOPtools: a molecule (SMILES), a number or the name
+    of a known solvent.
+
+    Arguments:
+        val {str} -- The input value.
+
+    Returns:
+        Molecule, float or str  -- the parsed value, ValueError is raised if it is none of them
+    """
+    try:
+        return parse_molecule(val)
+    except ValueError:
+        try:
+            return float(val)
+        except ValueError:
+            if val in available_solvents:
+                return val
+            raise ValueError('Incorrect value: ' + str(val))
+#-------------------------------------------------------------------------------------------------
+
+
 #-------------------------------------------------------------------------------------------------
 class PretrainedModel(OwnedResourceModel):
     shared_users = models.ManyToManyField(
@@ -129,10 +159,33 @@ class PretrainedModel(OwnedResourceModel):
     def get_public_models(self):
         return PretrainedModel.objects.filter(accessibility=PretrainedModel.ACCESSIBILITY_PUBLIC)
 
+    def get_file_stamp(self):
+        try:
+            mtime = self.file.storage.get_modified_time(self.file.name)
+        except (NotImplementedError, OSError):
+            mtime = self.modified
+        return (self.file.name, mtime)
+
+    def load_model(self):
+        """Deserialize the model file, or reuse the already loaded one if the file is unchanged."""
+        stamp = self.get_file_stamp()
+        cached = model_cache.get(self.id)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        model = joblib.load(self.file)
+        try:
+            size = self.file.size  # the pickled size is used as estimate of the memory footprint
+        except OSError:
+            size = None
+        model_cache.set(self.id, (stamp, model), size=size)
+
+        return model
+
     def predict(self, inports, coloratom:bool = False):
         outport = {}
         inputs = []
-        model = joblib.load(self.file)
+        model = self.load_model()
 
         # Model without DOPtools
         if 'input_type' not in self.metadata.keys() or not self.metadata['input_type'] or self.metadata['input_type'] == "descriptors_values":
@@ -149,35 +202,31 @@ class PretrainedModel(OwnedResourceModel):
             nb_mol_fields = len(mol_fields)
             to_pred = []
             real_props = []
-            for items in list(reader([re.sub('\s+', ' ', x) for x in inports["SMILES"].splitlines()],
-                                     delimiter=' ', quotechar='"')):
-                line_dict = {}
-                line_error = False
+            lines = list(reader([re.sub('\s+', ' ', x) for x in inports["SMILES"].splitlines()],
+                                delimiter=' ', quotechar='"'))
+            line_fields = []
+            for items in lines:
+                fields = []
                 for val, col in zip_longest(items, mol_fields):
                     if not val or not col:
                         if not val:  # required value
-                            line_error = True
+                            fields = None
                         break
-                    try:
-                        mol = smiles(val)
-                        try:
-                            mol.canonicalize(fix_tautomers=False)
-                        except:
-                            mol.canonicalize(fix_tautomers=False)
-                        line_dict[col] = mol
-                    except IncorrectSmiles:
-                        try:
-                            nbr = float(val)
-                            line_dict[col] = nbr
-                        except ValueError:
-                            if val in available_solvents:
-                                line_dict[col] = val
-                            else:
-                                line_error = True
-                                break
-                if not line_error:
-                    to_pred.append(line_dict)
+                    fields.append((col, val))
+                line_fields.append(fields)
+
+            # all the values are parsed at once (on the parsing pool), then split back per line
+            values, errors = parse_values([val for fields in line_fields if fields for _, val in fields],
+                                          parse_input_value)
+            start = 0
+            for items, fields in zip(lines, line_fields):
+                if not fields:
+                    continue
+                end = start + len(fields)
+                if not any(errors[start:end]):
+                    to_pred.append({col: value for (col, _), value in zip(fields, values[start:end])})
                     real_props.append(float(items[-1]) if len(items) > nb_mol_fields else None)
+                start = end
 
             if not to_pred:
                 return pd.DataFrame.from_records([{"ERROR": "No correct item to predict"}])
@@ -217,12 +266,73 @@ class PretrainedModel(OwnedResourceModel):
         else:
             return outport
 
+    def get_input_columns(self):
+        """Get the names of the input columns the model expects in batch predictions."""
+        if self.metadata.get('input_type') == "SMILES":
+            return self.metadata['input_spec'] if 'input_spec' in self.metadata.keys() else ["SMILES"]
+        return [p['name'] for p in self.metadata['inports']]
+
+    def predict_batch(self, df):
+        """Predict a chunk of rows in one call to the model.
+
+        Arguments:
+            df {DataFrame} -- The rows, with (at least) the input columns of the model.
+
+        Returns:
+            DataFrame  -- the input columns with a 'Predicted' and an 'Error' column, in the same
+                          row order (rows with incorrect values get an error instead of a
+                          prediction)
+        """
+        columns = self.get_input_columns()
+        missing = [c for c in columns if c not in df.columns]
+        if missing:
+            raise ValueError('Missing input column(s): ' + ', '.join(str(c) for c in missing))
+
+        model = self.load_model()
+        out = df[columns].reset_index(drop=True)
+        predicted = np.full(len(out), None, dtype=object)
+        errors = np.full(len(out), None, dtype=object)
+
+        if self.metadata.get('input_type') == "SMILES":
+            raw = out.astype(object).where(out.notnull(), '').astype(str).apply(lambda c: c.str.strip())
+            width = len(columns)
+            values, value_errors = parse_values(raw.values.ravel().tolist(), parse_input_value)
+
+            to_pred = []
+            valid = []
+            for n, items in enumerate(raw.itertuples(index=False, name=None)):
+                row_errors = value_errors[n * width:(n + 1) * width]
+                if '' in items:  # required value
+                    errors[n] = 'Missing value: ' + str(columns[items.index('')])
+                elif any(row_errors):
+                    errors[n] = next(e for e in row_errors if e)
+                else:
+                    to_pred.append(dict(zip(columns, values[n * width:(n + 1) * width])))
+                    valid.append(n)
+
+            if to_pred:
+                to_pred = pd.DataFrame.from_records(to_pred)
+                predicted[valid] = list(model.predict(to_pred['SMILES'].to_list() if len(columns) == 1 else to_pred))
+        else:
+            values = out.apply(pd.to_numeric, errors='coerce')
+            valid = values.notnull().all(axis=1).values
+            errors[~valid] = 'Missing or non numerical value'
+            if valid.any():
+                predicted[valid] = list(model.predict(values.values[valid]))
+
+        out['Predicted'] = predicted
+        out['Error'] = errors
+
+        return out
+
     @delete_previous_file
     def save(self, force_insert=False, force_update=False, using=None, update_fields=None):
+        model_cache.delete(self.id)
         super(PretrainedModel, self).save()
 
     @delete_previous_file
     def delete(self, using=None, keep_parents=False):
+        model_cache.delete(self.id)
         super(PretrainedModel, self).delete()
 #-------------------------------------------------------------------------------------------------
 
@@ -231,5 +341,6 @@ class PretrainedModel(OwnedResourceModel):
 # when deleting model the file is removed
 @receiver(post_delete, sender=PretrainedModel)
 def delete_file(sender, instance, **kwargs):
+    model_cache.delete(instance.id)
     instance.file.delete(False)
 #-------------------------------------------------------------------------------------------------